@@ -0,0 +1,275 @@
+from models.etat_appariement import EtatAppariement
+from models.moteur_appariement import MoteurAppariement
+from datetime import datetime
+from pathlib import Path
+import argparse
+import json
+import math
+import platform
+import random
+import subprocess
+import sys
+import time
+import tracemalloc
+
+# Utilisation : python -m benchmarks.benchmark_appariements [--joueurs 8,64,1000] [--tours N] [--graine 1]
+#                                                           [--sortie resultats.json] [--reference ancien.json]
+
+# Tailles de tournoi mesurées par défaut
+TAILLES_DEFAUT = "8,16,32,64,128,256,512,1000,2000,5000,10000"
+
+# Proportion de nulles dans les résultats simulés
+PROBABILITE_NULLE = 0.2
+
+# Écart de durée (ms) en dessous duquel un ralentissement est attribué au bruit de mesure
+ECART_MINIMUM_MS = 20
+
+
+def nombre_tours_defaut(p_nombre_joueurs: int) -> int:
+    """
+    Nombre de tours d'un système suisse de cette taille : log2(joueurs) + 2, sans dépasser un toutes rondes.
+
+    Args:
+        p_nombre_joueurs (int): Nombre de joueurs.
+
+    Returns:
+        int: Nombre de tours.
+    """
+
+    return max(1, min(p_nombre_joueurs - 1, math.ceil(math.log2(p_nombre_joueurs)) + 2))
+
+
+def simuler_resultat(p_aleatoire: random.Random, p_force_blanc: float, p_force_noir: float) -> tuple:
+    """
+    Tire le résultat d'une partie : le plus fort gagne plus souvent (courbe Elo), avec des nulles.
+
+    Args:
+        p_aleatoire (random.Random): Générateur du tournoi.
+        p_force_blanc (float): Force cachée du joueur blanc.
+        p_force_noir (float): Force cachée du joueur noir.
+
+    Returns:
+        tuple: (score du blanc, score du noir).
+    """
+
+    f_tirage = p_aleatoire.random()
+    if f_tirage < PROBABILITE_NULLE:
+        return 0.5, 0.5
+
+    f_esperance_blanc = 1 / (1 + 10 ** ((p_force_noir - p_force_blanc) / 400))
+    if (f_tirage - PROBABILITE_NULLE) / (1 - PROBABILITE_NULLE) < f_esperance_blanc:
+        return 1, 0
+    return 0, 1
+
+
+def mesurer_tour(p_fonction) -> tuple:
+    """
+    Exécute un appariement deux fois : une fois pour la durée, une fois sous `tracemalloc` pour le pic mémoire
+    (`tracemalloc` ralentit l'exécution et fausserait la durée).
+
+    Args:
+        p_fonction (callable): Fonction sans argument qui calcule les appariements.
+
+    Returns:
+        tuple: Le résultat de la fonction, sa durée (ms) et son pic mémoire (Ko).
+    """
+
+    f_debut = time.perf_counter()
+    resultat = p_fonction()
+    f_duree_ms = (time.perf_counter() - f_debut) * 1000
+
+    tracemalloc.start()
+    p_fonction()
+    i_pic_octets = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return resultat, f_duree_ms, i_pic_octets / 1024
+
+
+def simuler_tournoi(p_nombre_joueurs: int, p_nombre_tours: int, p_graine: int) -> dict:
+    """
+    Déroule un tournoi synthétique et mesure l'appariement de chaque tour.
+
+    Le premier tour passe par `MoteurAppariement.apparier_premier_tour`, les suivants par
+    `MoteurAppariement.depuis_etat(...).apparier(...)` avec un `EtatAppariement` mis à jour à chaque
+    tour, comme dans `TourControleur`. Les résultats sont tirés avec la graine donnée : deux exécutions
+    avec les mêmes paramètres jouent les mêmes parties tant que les appariements ne changent pas.
+
+    Args:
+        p_nombre_joueurs (int): Nombre de joueurs.
+        p_nombre_tours (int): Nombre de tours.
+        p_graine (int): Graine du générateur aléatoire.
+
+    Returns:
+        dict: Les mesures du tournoi et de chacun de ses tours.
+    """
+
+    o_aleatoire = random.Random(p_graine)
+    l_joueurs = [str(i_joueur) for i_joueur in range(1, p_nombre_joueurs + 1)]
+    d_forces = {id_joueur: o_aleatoire.gauss(1500, 300) for id_joueur in l_joueurs}
+    o_etat = EtatAppariement(l_joueurs)
+
+    l_tours = []
+    for i_tour in range(1, p_nombre_tours + 1):
+        if i_tour == 1:
+            t_etat_aleatoire = o_aleatoire.getstate()
+
+            def apparier():
+                # Même tirage pour la mesure de durée et la mesure de mémoire
+                o_aleatoire.setstate(t_etat_aleatoire)
+                return MoteurAppariement.apparier_premier_tour(l_joueurs, o_aleatoire), None
+
+        else:
+
+            def apparier():
+                o_moteur = MoteurAppariement.depuis_etat(o_etat)
+                return o_moteur.apparier(p_nombre_tours - i_tour), o_moteur
+
+        (t_appariement, o_moteur), f_duree_ms, f_pic_ko = mesurer_tour(apparier)
+        l_paires, id_exempte = t_appariement
+
+        l_matchs = []
+        for id_blanc, id_noir in l_paires:
+            f_score_blanc, f_score_noir = simuler_resultat(o_aleatoire, d_forces[id_blanc], d_forces[id_noir])
+            l_matchs.append(
+                {
+                    "joueur_blanc": id_blanc,
+                    "joueur_noir": id_noir,
+                    "score_blanc": f_score_blanc,
+                    "score_noir": f_score_noir,
+                }
+            )
+
+        i_revanches = sum(o_etat.o_paires_jouees.contient(id_blanc, id_noir) for id_blanc, id_noir in l_paires)
+        o_etat.integrer_tour(l_matchs)
+        l_soldes = [abs(i_solde) for i_solde in o_etat.d_soldes_couleurs.values()]
+
+        l_tours.append(
+            {
+                "tour": i_tour,
+                "duree_ms": round(f_duree_ms, 3),
+                "pic_memoire_ko": round(f_pic_ko, 1),
+                "revanches": i_revanches,
+                "desequilibre_couleurs_max": max(l_soldes, default=0),
+                "joueurs_desequilibres": sum(1 for i_solde in l_soldes if i_solde >= 2),
+                "exempte": id_exempte is not None,
+                "statistiques": o_moteur.d_statistiques if o_moteur is not None else {},
+            }
+        )
+
+    return {
+        "joueurs": p_nombre_joueurs,
+        "tours": p_nombre_tours,
+        "graine": p_graine,
+        "duree_totale_ms": round(sum(d_tour["duree_ms"] for d_tour in l_tours), 3),
+        "pic_memoire_max_ko": max(d_tour["pic_memoire_ko"] for d_tour in l_tours),
+        "revanches_totales": sum(d_tour["revanches"] for d_tour in l_tours),
+        "desequilibre_couleurs_max": max(d_tour["desequilibre_couleurs_max"] for d_tour in l_tours),
+        "liste_tours": l_tours,
+    }
+
+
+def decrire_environnement() -> dict:
+    """
+    Décrit l'exécution, pour pouvoir comparer des résultats entre commits.
+
+    Returns:
+        dict: Date, commit git (si disponible), version de Python et plateforme.
+    """
+
+    try:
+        s_commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        s_commit = None
+
+    return {
+        "date": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "commit": s_commit,
+        "python": platform.python_version(),
+        "plateforme": platform.platform(),
+    }
+
+
+def comparer_resultats(p_resultats: list[dict], p_reference: dict, p_tolerance: float) -> list[str]:
+    """
+    Compare des mesures à celles d'une exécution de référence.
+
+    Une régression est signalée quand la durée totale dépasse celle de la référence de plus de `p_tolerance`
+    (en proportion) et de plus de `ECART_MINIMUM_MS`, ou quand il y a plus de revanches ou un plus grand
+    déséquilibre de couleurs.
+
+    Args:
+        p_resultats (list[dict]): Les mesures de cette exécution.
+        p_reference (dict): Le contenu d'un fichier de résultats précédent.
+        p_tolerance (float): Ralentissement toléré (0.2 pour 20 %).
+
+    Returns:
+        list[str]: Les régressions constatées (vide si aucune).
+    """
+
+    d_reference = {(d_tournoi["joueurs"], d_tournoi["tours"]): d_tournoi for d_tournoi in p_reference["resultats"]}
+
+    l_regressions = []
+    for d_tournoi in p_resultats:
+        d_ancien = d_reference.get((d_tournoi["joueurs"], d_tournoi["tours"]))
+        if d_ancien is None:
+            continue
+
+        s_tournoi = f"{d_tournoi['joueurs']} joueurs"
+        f_rapport = d_tournoi["duree_totale_ms"] / max(d_ancien["duree_totale_ms"], 0.001)
+        print(f"{s_tournoi:>16} : durée x{f_rapport:.2f} par rapport à la référence", file=sys.stderr)
+
+        f_ecart_ms = d_tournoi["duree_totale_ms"] - d_ancien["duree_totale_ms"]
+        if f_rapport > 1 + p_tolerance and f_ecart_ms > ECART_MINIMUM_MS:
+            l_regressions.append(f"{s_tournoi} : durée x{f_rapport:.2f}")
+        for s_mesure in ("revanches_totales", "desequilibre_couleurs_max"):
+            if d_tournoi[s_mesure] > d_ancien[s_mesure]:
+                l_regressions.append(f"{s_tournoi} : {s_mesure} {d_ancien[s_mesure]} -> {d_tournoi[s_mesure]}")
+
+    return l_regressions
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Mesure les appariements sur des tournois synthétiques.")
+    parser.add_argument(
+        "--joueurs", default=TAILLES_DEFAUT, help=f"Tailles de tournoi, séparées par des virgules ({TAILLES_DEFAUT})."
+    )
+    parser.add_argument("--tours", type=int, default=None, help="Nombre de tours (par défaut : log2(joueurs) + 2).")
+    parser.add_argument("--graine", type=int, default=1, help="Graine des tirages (1 par défaut).")
+    parser.add_argument(
+        "--sortie", type=Path, default=None, help="Fichier JSON des résultats (sinon : sortie standard)."
+    )
+    parser.add_argument(
+        "--reference", type=Path, default=None, help="Fichier JSON d'une exécution précédente à comparer."
+    )
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Ralentissement toléré (0.2 par défaut).")
+    args = parser.parse_args()
+
+    l_resultats = []
+    for i_nombre_joueurs in (int(s_taille) for s_taille in args.joueurs.split(",")):
+        i_nombre_tours = args.tours or nombre_tours_defaut(i_nombre_joueurs)
+        d_tournoi = simuler_tournoi(i_nombre_joueurs, i_nombre_tours, args.graine)
+        l_resultats.append(d_tournoi)
+        print(
+            f"{i_nombre_joueurs:>6} joueurs, {i_nombre_tours:>2} tours : {d_tournoi['duree_totale_ms']:>10.1f} ms, "
+            f"pic {d_tournoi['pic_memoire_max_ko']:>9.1f} Ko, {d_tournoi['revanches_totales']} revanche(s), "
+            f"déséquilibre de couleurs max {d_tournoi['desequilibre_couleurs_max']}",
+            file=sys.stderr,
+        )
+
+    d_sortie = {"environnement": decrire_environnement(), "resultats": l_resultats}
+    s_json = json.dumps(d_sortie, ensure_ascii=False, indent=2)
+    if args.sortie is not None:
+        args.sortie.write_text(s_json, encoding="utf-8")
+    else:
+        print(s_json)
+
+    if args.reference is not None:
+        l_regressions = comparer_resultats(
+            l_resultats, json.loads(args.reference.read_text(encoding="utf-8")), args.tolerance
+        )
+        for s_regression in l_regressions:
+            print(f"Régression : {s_regression}", file=sys.stderr)
+        sys.exit(1 if l_regressions else 0)
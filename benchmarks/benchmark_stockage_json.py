@@ -0,0 +1,112 @@
+from tinydb import TinyDB
+from tinydb.storages import JSONStorage
+from models.stockage_json import StockageJsonRapide, orjson
+from pathlib import Path
+import argparse
+import shutil
+import tempfile
+import time
+
+# Utilisation : python -m benchmarks.benchmark_stockage_json [--joueurs 10000] [--repetitions 20]
+
+
+def generer_fichier_joueurs(p_fichier: Path, p_nombre_joueurs: int) -> None:
+    """
+    Crée un fichier `joueurs_db.json` au format du `JSONStorage` par défaut.
+
+    Args:
+        p_fichier (Path): Chemin du fichier à créer.
+        p_nombre_joueurs (int): Nombre de joueurs à générer.
+
+    Returns:
+        None
+    """
+
+    db_joueurs = TinyDB(p_fichier)
+    db_joueurs.insert_multiple(
+        {
+            "identifiant_national_echec": f"AB{i:05d}",
+            "nom_famille": f"Nom{i}",
+            "prenom": f"Prénom{i}",
+            "date_naissance": "01-01-2000",
+            "score": 0,
+        }
+        for i in range(p_nombre_joueurs)
+    )
+    db_joueurs.close()
+
+
+def mesurer(p_fonction, p_repetitions: int) -> float:
+    """
+    Mesure la durée moyenne d'un appel de fonction.
+
+    Args:
+        p_fonction (callable): Fonction sans argument à mesurer.
+        p_repetitions (int): Nombre d'appels.
+
+    Returns:
+        float: Durée moyenne d'un appel en millisecondes.
+    """
+
+    f_debut = time.perf_counter()
+    for _ in range(p_repetitions):
+        p_fonction()
+
+    return (time.perf_counter() - f_debut) * 1000 / p_repetitions
+
+
+def comparer_stockages(p_nombre_joueurs: int, p_repetitions: int) -> None:
+    """
+    Compare `JSONStorage` et `StockageJsonRapide` sur un fichier de joueurs et affiche les résultats.
+
+    Mesures : lecture complète, relecture d'un fichier inchangé, mise à jour du score d'un joueur
+    (une lecture et une écriture du fichier) et taille du fichier écrit.
+
+    Args:
+        p_nombre_joueurs (int): Nombre de joueurs du fichier.
+        p_repetitions (int): Nombre de répétitions de chaque mesure.
+
+    Returns:
+        None
+    """
+
+    dossier_temporaire = Path(tempfile.mkdtemp(prefix="benchmark_stockage_"))
+    try:
+        fichier_modele = dossier_temporaire / "modele.json"
+        generer_fichier_joueurs(fichier_modele, p_nombre_joueurs)
+
+        d_configurations = {
+            "JSONStorage (défaut)": {"storage": JSONStorage},
+            "StockageJsonRapide": {"storage": StockageJsonRapide},
+            "StockageJsonRapide (mémorisé)": {"storage": StockageJsonRapide, "p_memoriser": True},
+        }
+
+        print(f"{p_nombre_joueurs} joueurs, {p_repetitions} répétitions, orjson : {'oui' if orjson else 'non'}")
+        print(f"{'Stockage':<32}{'lecture (ms)':>14}{'relecture (ms)':>16}{'mise à jour (ms)':>18}{'taille (o)':>12}")
+
+        for s_nom, d_options in d_configurations.items():
+            fichier = dossier_temporaire / "joueurs_db.json"
+            shutil.copyfile(fichier_modele, fichier)
+            StockageJsonRapide.vider_cache()
+
+            db_joueurs = TinyDB(fichier, **d_options)
+
+            # Première lecture : le fichier est toujours décodé
+            f_lecture = mesurer(lambda: db_joueurs.storage.read(), 1)
+            f_relecture = mesurer(lambda: db_joueurs.all(), p_repetitions)
+            f_mise_a_jour = mesurer(lambda: db_joueurs.update({"score": 1}, doc_ids=[1]), p_repetitions)
+
+            db_joueurs.close()
+            i_taille = fichier.stat().st_size
+            print(f"{s_nom:<32}{f_lecture:>14.2f}{f_relecture:>16.2f}{f_mise_a_jour:>18.2f}{i_taille:>12}")
+    finally:
+        shutil.rmtree(dossier_temporaire)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare les stockages TinyDB sur un fichier de joueurs.")
+    parser.add_argument("--joueurs", type=int, default=10000, help="Nombre de joueurs (10000 par défaut).")
+    parser.add_argument("--repetitions", type=int, default=20, help="Répétitions par mesure (20 par défaut).")
+    args = parser.parse_args()
+
+    comparer_stockages(args.joueurs, args.repetitions)
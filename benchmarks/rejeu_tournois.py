@@ -0,0 +1,85 @@
+from models.fabrique_persistance import creer_gestionnaire_persistance
+from models.rejeu_tournoi import RejeuTournoi
+from pathlib import Path
+import argparse
+import cProfile
+import io
+import json
+import pstats
+import sys
+
+# Utilisation : python -m benchmarks.rejeu_tournois [--tournois 1,3] [--sortie rejeu.json] [--profil]
+# Le stockage lu est celui de l'application (variable d'environnement LETS_ROQUE_STOCKAGE).
+
+# Nombre de fonctions affichées par le profil
+NOMBRE_LIGNES_PROFIL = 25
+
+
+def rejouer_tournois(p_identifiants: list[str]) -> list[dict]:
+    """
+    Rejoue les appariements de plusieurs tournois enregistrés.
+
+    Args:
+        p_identifiants (list[str]): Identifiants des tournois à rejouer.
+
+    Returns:
+        list[dict]: Le rapport de chaque tournoi (voir `RejeuTournoi.rejouer`), avec son identifiant et son nom.
+    """
+
+    o_gestionnaire_persistance = creer_gestionnaire_persistance()
+
+    l_rapports = []
+    for s_identifiant in p_identifiants:
+        d_tournoi = o_gestionnaire_persistance.recuperer_document_tournoi(s_identifiant)
+        d_rapport = RejeuTournoi(d_tournoi).rejouer()
+        l_rapports.append({"identifiant": s_identifiant, "nom_tournoi": d_tournoi["nom_tournoi"], **d_rapport})
+
+        print(
+            f"Tournoi {s_identifiant:>4} ({d_tournoi['nom_tournoi']}) : {d_rapport['tours_identiques']}/"
+            f"{d_rapport['tours_compares']} tour(s) identique(s), {d_rapport['paires_differentes']} paire(s) "
+            f"différente(s), {d_rapport['duree_totale_ms']:.1f} ms",
+            file=sys.stderr,
+        )
+
+    return l_rapports
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Rejoue les appariements des tournois enregistrés.")
+    parser.add_argument(
+        "--tournois", default=None, help="Identifiants des tournois, séparés par des virgules (par défaut : tous)."
+    )
+    parser.add_argument("--sortie", type=Path, default=None, help="Fichier JSON du rapport (sinon : sortie standard).")
+    parser.add_argument("--profil", action="store_true", help="Affiche le profil (cProfile) des appariements.")
+    args = parser.parse_args()
+
+    l_catalogue = creer_gestionnaire_persistance().recuperer_catalogue_tournois()
+    l_existants = sorted((str(d_tournoi["identifiant"]) for d_tournoi in l_catalogue), key=int)
+
+    if args.tournois is not None:
+        l_identifiants = [s_identifiant.strip() for s_identifiant in args.tournois.split(",")]
+        l_inconnus = [s_identifiant for s_identifiant in l_identifiants if s_identifiant not in l_existants]
+        if l_inconnus:
+            print(f"Tournoi(s) introuvable(s) : {', '.join(l_inconnus)}", file=sys.stderr)
+            sys.exit(2)
+    else:
+        l_identifiants = l_existants
+
+    if args.profil:
+        o_profil = cProfile.Profile()
+        l_rapports = o_profil.runcall(rejouer_tournois, l_identifiants)
+        o_flux = io.StringIO()
+        pstats.Stats(o_profil, stream=o_flux).sort_stats("cumulative").print_stats(NOMBRE_LIGNES_PROFIL)
+        print(o_flux.getvalue(), file=sys.stderr)
+    else:
+        l_rapports = rejouer_tournois(l_identifiants)
+
+    s_json = json.dumps(l_rapports, ensure_ascii=False, indent=2)
+    if args.sortie is not None:
+        args.sortie.write_text(s_json, encoding="utf-8")
+    else:
+        print(s_json)
+
+    # Code de sortie 1 si un tour rejoué diffère du tour enregistré
+    b_differences = any(d_rapport["tours_identiques"] < d_rapport["tours_compares"] for d_rapport in l_rapports)
+    sys.exit(1 if b_differences else 0)
@@ -0,0 +1,929 @@
+from models.classement_tournoi import ClassementTournoi
+from models.fabrique_persistance import creer_gestionnaire_persistance
+from models.feuille_resultats import FeuilleResultats
+from models.generateur_tour import GenerateurTour
+from models.index_joueurs import IndexJoueurs
+from models.joueur import Joueur
+from models.tournoi import Tournoi
+from datetime import datetime
+import argparse
+import json
+import os
+import sys
+
+# Utilisation : python cli.py <commande> [options] (python cli.py <commande> --help pour le détail)
+# Interface sans menus pour les scripts : seuls les modèles sont importés (ni rich, ni questionary).
+# Le stockage utilisé est celui de l'application (variable d'environnement LETS_ROQUE_STOCKAGE).
+#
+# Chaque commande écrit un objet JSON sur la sortie standard :
+#   {"ok": true, "commande": ..., "resultat": ...} ou {"ok": false, "commande": ..., "erreur": ...}
+# Avec --json, les options sont lues dans un objet JSON sur l'entrée standard (les options de la ligne
+# de commande restent prioritaires). La commande `lot` exécute une commande par ligne JSON de l'entrée
+# standard ({"commande": "creer-tour", "tournoi": 3}), dans le même processus, et écrit un résultat par ligne.
+
+# Codes de sortie
+CODE_SUCCES = 0
+# Commande refusée ou en échec (au moins une dans un lot)
+CODE_ERREUR = 1
+# Commande ou options invalides
+CODE_USAGE = 2
+
+# Sujets de la commande `rapport`
+SUJETS_RAPPORT = ("joueurs", "tournois", "tournoi", "tours", "historique")
+# En-tête d'un tournoi repris dans son rapport
+CHAMPS_RAPPORT_TOURNOI = (
+    "nom_tournoi", "lieu_tournoi", "date_debut_tournoi", "date_fin_tournoi", "nombre_tours", "description", "graine"
+)
+# Nombre de joueurs par page du rapport des joueurs
+TAILLE_PAGE_JOUEURS = 50
+
+
+def ajouter_joueur(p_gestionnaire_persistance, p_options: dict) -> dict:
+    """
+    Ajoute un joueur, avec les règles de validation de la saisie.
+
+    Args:
+        p_gestionnaire_persistance (GestionnairePersistance): Gestionnaire de persistance.
+        p_options (dict): `ine`, `nom`, `prenom`, `naissance` (JJ-MM-AAAA).
+
+    Returns:
+        dict: Le joueur enregistré, avec son `identifiant`.
+
+    Raises:
+        ValueError: Si une information manque ou est invalide, ou si l'identifiant national est déjà enregistré.
+    """
+
+    s_identifiant_national = _option(p_options, "ine").upper()
+    if not Joueur.regex_identifiant_national.match(s_identifiant_national):
+        raise ValueError(f"Identifiant national invalide : {s_identifiant_national!r} (exemple : AB12345)")
+    l_existants = _joueurs_par_identifiant_national(p_gestionnaire_persistance).get(s_identifiant_national)
+    if l_existants:
+        raise ValueError(
+            f"Identifiant national déjà enregistré : {s_identifiant_national} (joueur {', '.join(l_existants)})"
+        )
+
+    for s_cle in ("nom", "prenom"):
+        if not Joueur.regex_nom.match(_option(p_options, s_cle)):
+            raise ValueError(f"--{s_cle} invalide : {p_options[s_cle]!r} (lettres, tirets et espaces)")
+
+    o_joueur = Joueur(
+        s_identifiant_national,
+        p_options["nom"],
+        p_options["prenom"],
+        _date(p_options, "naissance", Joueur.format_date_naissance),
+    )
+    i_identifiant = p_gestionnaire_persistance.sauvegarder_joueur(o_joueur)
+
+    return {
+        "identifiant": str(i_identifiant),
+        "identifiant_national_echec": o_joueur.identifiant_national_echec,
+        "nom_famille": o_joueur.nom_famille,
+        "prenom": o_joueur.prenom,
+        "date_naissance": o_joueur.date_naissance,
+    }
+
+
+def importer_joueurs(p_gestionnaire_persistance, p_options: dict) -> dict:
+    """
+    Importe les joueurs d'un fichier CSV ou d'un export de la fédération (voir `ImportJoueurs`).
+
+    Args:
+        p_gestionnaire_persistance (GestionnairePersistance): Gestionnaire de persistance.
+        p_options (dict): `fichier`.
+
+    Returns:
+        dict: Le bilan de l'import (voir `importer_fichier_joueurs`).
+    """
+
+    return p_gestionnaire_persistance.importer_fichier_joueurs(_option(p_options, "fichier"))
+
+
+def creer_tournoi(p_gestionnaire_persistance, p_options: dict) -> dict:
+    """
+    Crée un tournoi. Son nombre de tours est fixé à l'inscription des joueurs, comme dans les menus.
+
+    Args:
+        p_gestionnaire_persistance (GestionnairePersistance): Gestionnaire de persistance.
+        p_options (dict): `nom`, `lieu`, `debut`, `fin` (JJ-MM-AAAA) et `description` (facultative).
+
+    Returns:
+        dict: Le tournoi créé, avec son `identifiant`.
+
+    Raises:
+        ValueError: Si une information manque ou est invalide.
+    """
+
+    for s_cle in ("nom", "lieu"):
+        if not Tournoi.regex_nom.match(_option(p_options, s_cle)):
+            raise ValueError(f"--{s_cle} invalide : {p_options[s_cle]!r} (lettres, chiffres, tirets et espaces)")
+
+    s_description = p_options.get("description")
+    if s_description is not None and not Tournoi.regex_nom.match(s_description):
+        raise ValueError(f"--description invalide : {s_description!r} (lettres, chiffres, tirets et espaces)")
+
+    s_debut = _date(p_options, "debut", Tournoi.format_date)
+    s_fin = _date(p_options, "fin", Tournoi.format_date)
+    if datetime.strptime(s_fin, Tournoi.format_date) < datetime.strptime(s_debut, Tournoi.format_date):
+        raise ValueError("La date de fin doit être égale ou postérieure à la date de début.")
+
+    o_tournoi = Tournoi(
+        None,  # identifiant attribué à l'enregistrement
+        p_options["nom"],
+        p_options["lieu"],
+        s_debut,
+        s_fin,
+        "A déterminer",
+        s_description,
+        [],  # initialise à liste tour vide
+        [],  # initialise à liste joueur vide
+        Tournoi.generer_graine(),  # graine des tirages aléatoires, pour pouvoir rejouer le tournoi
+    )
+    i_identifiant_tournoi = p_gestionnaire_persistance.sauvegarder_tournoi(o_tournoi)
+
+    return {
+        "identifiant": str(i_identifiant_tournoi),
+        "nom_tournoi": o_tournoi.nom_tournoi,
+        "lieu_tournoi": o_tournoi.lieu_tournoi,
+        "date_debut_tournoi": o_tournoi.date_debut_tournoi,
+        "date_fin_tournoi": o_tournoi.date_fin_tournoi,
+        "description": o_tournoi.description,
+    }
+
+
+def inscrire_joueurs(p_gestionnaire_persistance, p_options: dict) -> dict:
+    """
+    Inscrit les joueurs d'un tournoi qui n'a pas commencé et fixe son nombre de tours.
+
+    Les joueurs inscrits remplacent ceux déjà inscrits, comme dans les menus.
+
+    Args:
+        p_gestionnaire_persistance (GestionnairePersistance): Gestionnaire de persistance.
+        p_options (dict): `tournoi`, `joueurs` (identifiants ou identifiants nationaux, en nombre pair)
+                          et `tours` (facultatif, `Tournoi.nombre_tours_defaut` par défaut).
+
+    Returns:
+        dict: Le tournoi, ses joueurs inscrits et son nombre de tours.
+
+    Raises:
+        ValueError: Si le tournoi a commencé, ou si un joueur est inconnu, en double ou en nombre impair.
+    """
+
+    s_identifiant_tournoi = _identifiant_tournoi(p_gestionnaire_persistance, p_options)
+    i_nombre_tours = _entier(p_options.get("tours", Tournoi.nombre_tours_defaut), "tours")
+
+    l_designations = _option(p_options, "joueurs")
+    if isinstance(l_designations, str):
+        l_designations = l_designations.replace(",", " ").split()
+    if len(l_designations) < 2 or len(l_designations) % 2 != 0:
+        raise ValueError(f"Il faut un nombre pair de joueurs, au moins 2 ({len(l_designations)} indiqué(s)).")
+    l_joueurs = _identifiants_joueurs(p_gestionnaire_persistance, l_designations)
+    if len(set(l_joueurs)) != len(l_joueurs):
+        raise ValueError("Un même joueur est indiqué plusieurs fois.")
+
+    o_tournoi = p_gestionnaire_persistance.recuperer_objet_tournoi(s_identifiant_tournoi)
+    if o_tournoi.liste_tours:
+        raise ValueError(f"Le tournoi {o_tournoi.nom_tournoi} a déjà commencé : les inscriptions sont closes.")
+
+    o_tournoi.liste_joueurs = {id_joueur: 0 for id_joueur in l_joueurs}
+    o_tournoi.nombre_tours = i_nombre_tours
+    p_gestionnaire_persistance.enregister_nombres_tours_tournoi(o_tournoi, i_nombre_tours)
+    p_gestionnaire_persistance.sauvegarder_joueurs_tournoi(o_tournoi)
+
+    return {"tournoi": s_identifiant_tournoi, "joueurs": l_joueurs, "nombre_tours": i_nombre_tours}
+
+
+def creer_tour(p_gestionnaire_persistance, p_options: dict) -> dict:
+    """
+    Crée et apparie le tour suivant d'un tournoi (voir `GenerateurTour`).
+
+    Args:
+        p_gestionnaire_persistance (GestionnairePersistance): Gestionnaire de persistance.
+        p_options (dict): `tournoi`.
+
+    Returns:
+        dict: Le tour créé : `tour`, `nom`, `matchs` (échiquier, joueurs blanc et noir, avec leurs identifiants
+              nationaux), `exempte`, `tours_restants` et `tours_sans_revanche`.
+
+    Raises:
+        ValueError: Si le tournoi ne peut pas accueillir de nouveau tour.
+    """
+
+    s_identifiant_tournoi = _identifiant_tournoi(p_gestionnaire_persistance, p_options)
+
+    o_generateur_tour = GenerateurTour(p_gestionnaire_persistance)
+    o_tour = o_generateur_tour.generer(s_identifiant_tournoi)
+
+    return {
+        "tournoi": s_identifiant_tournoi,
+        "tour": o_tour.identifiant,
+        "nom": o_tour.nom,
+        "matchs": [
+            {
+                "echiquier": o_match.identifiant,
+                "blanc": str(o_match.joueur_blanc.identifiant_tinydb),
+                "noir": str(o_match.joueur_noir.identifiant_tinydb),
+                "ine_blanc": o_match.joueur_blanc.identifiant_national_echec,
+                "ine_noir": o_match.joueur_noir.identifiant_national_echec,
+            }
+            for o_match in o_tour.liste_matchs
+        ],
+        "exempte": o_generateur_tour.id_joueur_exempte,
+        "tours_restants": o_generateur_tour.i_tours_restants,
+        "tours_sans_revanche": o_generateur_tour.i_tours_sans_revanche,
+    }
+
+
+def terminer_tour(p_gestionnaire_persistance, p_options: dict) -> dict:
+    """
+    Enregistre tous les résultats du tour en cours d'un tournoi et le clôt.
+
+    Les résultats sont validés ensemble par la `FeuilleResultats` : la moindre erreur fait tout refuser.
+    Ils viennent d'une feuille de résultats (`fichier`), d'une saisie en grille (`saisie` : "1-0 0-1 5=1/2-1/2")
+    ou, en JSON, de `resultats` : liste des résultats dans l'ordre des échiquiers, ou échiquier -> résultat.
+
+    Args:
+        p_gestionnaire_persistance (GestionnairePersistance): Gestionnaire de persistance.
+        p_options (dict): `tournoi` et l'une des options `fichier`, `saisie` ou `resultats`.
+
+    Returns:
+        dict: Le tour clôturé, son nombre de résultats et le bilan des écritures.
+
+    Raises:
+        ValueError: Si le tournoi n'a pas de tour en cours ou si les résultats sont refusés
+                    (le second argument de l'erreur donne alors la liste des erreurs).
+    """
+
+    s_identifiant_tournoi = _identifiant_tournoi(p_gestionnaire_persistance, p_options)
+    l_sources = [s_cle for s_cle in ("fichier", "saisie", "resultats") if p_options.get(s_cle) is not None]
+    if len(l_sources) != 1:
+        raise ValueError("Indiquez les résultats par une seule des options --fichier, --saisie ou resultats (JSON).")
+
+    d_tournoi = p_gestionnaire_persistance.recuperer_document_tournoi(s_identifiant_tournoi)
+    if not d_tournoi["liste_tours"] or d_tournoi["liste_tours"][-1]["statut"] != "En cours":
+        raise ValueError(f"Le tournoi {d_tournoi['nom_tournoi']} n'a pas de tour en cours.")
+    d_dernier_tour = d_tournoi["liste_tours"][-1]
+
+    o_feuille = FeuilleResultats(p_gestionnaire_persistance.recuperer_liste_objets_matchs(d_dernier_tour))
+    if l_sources[0] == "fichier":
+        o_feuille.lire_fichier(p_options["fichier"])
+    elif l_sources[0] == "saisie":
+        o_feuille.lire_saisie(p_options["saisie"])
+    elif isinstance(p_options["resultats"], dict):
+        o_feuille.lire_saisie(
+            " ".join(f"{s_echiquier}={s_resultat}" for s_echiquier, s_resultat in p_options["resultats"].items())
+        )
+    else:
+        o_feuille.lire_saisie(" ".join(str(s_resultat) for s_resultat in p_options["resultats"]))
+
+    l_erreurs = o_feuille.erreurs()
+    if l_erreurs:
+        raise ValueError(
+            f"Résultats refusés : {len(l_erreurs)} erreur(s), rien n'a été enregistré.",
+            [{o_feuille.s_origine: i_origine, "message": s_message} for i_origine, s_message in l_erreurs],
+        )
+
+    l_resultats = o_feuille.resultats_matchs()
+    d_bilan_ecriture = p_gestionnaire_persistance.enregistrer_resultat_match(l_resultats, s_identifiant_tournoi)
+
+    return {
+        "tournoi": s_identifiant_tournoi,
+        "tour": d_dernier_tour["identifiant"],
+        "nom": d_dernier_tour["nom"],
+        "resultats": len(l_resultats),
+        "ecriture": d_bilan_ecriture,
+    }
+
+
+def rapport(p_gestionnaire_persistance, p_options: dict):
+    """
+    Produit un rapport : joueurs (par page), tournois, détail et classement d'un tournoi, tours et matchs
+    d'un tournoi, ou historique des parties d'un joueur.
+
+    Args:
+        p_gestionnaire_persistance (GestionnairePersistance): Gestionnaire de persistance.
+        p_options (dict): `sujet` (voir `SUJETS_RAPPORT`), puis selon le sujet : `tri`, `page` et `taille`
+                          (joueurs), `tournoi` (tournoi, tours) ou `joueur` (historique).
+
+    Returns:
+        dict | list: Le rapport.
+
+    Raises:
+        ValueError: Si le sujet est inconnu ou si une option manque.
+    """
+
+    s_sujet = _option(p_options, "sujet")
+
+    if s_sujet == "joueurs":
+        s_tri = p_options.get("tri", "nom")
+        if s_tri not in IndexJoueurs.tris:
+            raise ValueError(f"Tri inconnu : {s_tri!r} ({', '.join(IndexJoueurs.tris)})")
+        i_page = _entier(p_options.get("page", 1), "page")
+        i_taille_page = _entier(p_options.get("taille", TAILLE_PAGE_JOUEURS), "taille")
+        l_joueurs, i_nombre_joueurs = p_gestionnaire_persistance.charger_page_joueurs(s_tri, i_page - 1, i_taille_page)
+        return {
+            "page": i_page,
+            "nombre_pages": max(1, -(-i_nombre_joueurs // i_taille_page)),
+            "nombre_joueurs": i_nombre_joueurs,
+            "joueurs": [{"identifiant": str(d_joueur.pop("id_tinydb")), **d_joueur} for d_joueur in l_joueurs],
+        }
+
+    if s_sujet == "tournois":
+        return p_gestionnaire_persistance.recuperer_catalogue_tournois()
+
+    if s_sujet == "historique":
+        s_identifiant_joueur = _identifiants_joueurs(p_gestionnaire_persistance, [_option(p_options, "joueur")])[0]
+        return {
+            "joueur": s_identifiant_joueur,
+            "parties": p_gestionnaire_persistance.recuperer_historique_joueur(s_identifiant_joueur),
+        }
+
+    if s_sujet not in SUJETS_RAPPORT:
+        raise ValueError(f"Sujet de rapport inconnu : {s_sujet!r} ({', '.join(SUJETS_RAPPORT)})")
+
+    s_identifiant_tournoi = _identifiant_tournoi(p_gestionnaire_persistance, p_options)
+    d_tournoi = p_gestionnaire_persistance.recuperer_document_tournoi(s_identifiant_tournoi)
+
+    if s_sujet == "tours":
+        return {"tournoi": s_identifiant_tournoi, "tours": d_tournoi["liste_tours"]}
+
+    l_classement = ClassementTournoi(d_tournoi).classer() if d_tournoi["liste_joueurs"] else []
+    for d_ligne in l_classement:
+        o_joueur = p_gestionnaire_persistance.recuperer_objet_joueur(d_ligne["identifiant"])
+        d_ligne["identifiant_national_echec"] = o_joueur.identifiant_national_echec
+        d_ligne["nom"] = f"{o_joueur.nom_famille} {o_joueur.prenom}"
+
+    return {
+        "identifiant": s_identifiant_tournoi,
+        **{s_cle: d_tournoi.get(s_cle) for s_cle in CHAMPS_RAPPORT_TOURNOI},
+        "nombre_tours_joues": len(d_tournoi["liste_tours"]),
+        "classement": l_classement,
+    }
+
+
+def sauvegarder(p_gestionnaire_persistance, p_options: dict) -> dict:
+    """
+    Sauvegarde les données (voir `effectuer_sauvegarde`).
+
+    Args:
+        p_gestionnaire_persistance (GestionnairePersistance): Gestionnaire de persistance.
+        p_options (dict): Aucune option.
+
+    Returns:
+        dict: Le nom de la sauvegarde créée et le message du gestionnaire.
+
+    Raises:
+        ValueError: Si la sauvegarde échoue.
+    """
+
+    s_message, s_type = p_gestionnaire_persistance.effectuer_sauvegarde()
+    if s_type != "success":
+        raise ValueError(_nettoyer_message(s_message))
+
+    return {"sauvegarde": _lister_sauvegardes(p_gestionnaire_persistance)[-1], "message": _nettoyer_message(s_message)}
+
+
+def lister_sauvegardes(p_gestionnaire_persistance, p_options: dict) -> list[dict]:
+    """
+    Liste les sauvegardes, de la plus ancienne à la plus récente, avec les éléments restaurables seuls.
+
+    Args:
+        p_gestionnaire_persistance (GestionnairePersistance): Gestionnaire de persistance.
+        p_options (dict): Aucune option.
+
+    Returns:
+        list[dict]: `sauvegarde` et `elements` de chaque sauvegarde.
+    """
+
+    return [
+        {"sauvegarde": s_nom, "elements": p_gestionnaire_persistance.lister_elements_sauvegarde(s_nom)}
+        for s_nom in _lister_sauvegardes(p_gestionnaire_persistance)
+    ]
+
+
+def restaurer(p_gestionnaire_persistance, p_options: dict) -> dict:
+    """
+    Restaure une sauvegarde entière, ou un seul de ses éléments (voir `lister_sauvegardes`).
+
+    Comme dans les menus, la restauration doit être confirmée (`confirmer`).
+
+    Args:
+        p_gestionnaire_persistance (GestionnairePersistance): Gestionnaire de persistance.
+        p_options (dict): `sauvegarde`, `element` (facultatif) et `confirmer`.
+
+    Returns:
+        dict: La sauvegarde et l'élément restaurés, et le message du gestionnaire.
+
+    Raises:
+        ValueError: Si la restauration n'est pas confirmée ou échoue.
+    """
+
+    s_sauvegarde = _option(p_options, "sauvegarde")
+    s_element = p_options.get("element")
+    if not p_options.get("confirmer"):
+        raise ValueError("La restauration remplace les données actuelles : ajoutez --confirmer.")
+
+    if s_element is None:
+        s_message, s_type = p_gestionnaire_persistance.restaurer_sauvegarde(s_sauvegarde)
+    else:
+        s_message, s_type = p_gestionnaire_persistance.restaurer_element_sauvegarde(s_sauvegarde, s_element)
+    if s_type != "success":
+        raise ValueError(_nettoyer_message(s_message))
+
+    return {"sauvegarde": s_sauvegarde, "element": s_element, "message": _nettoyer_message(s_message)}
+
+
+# Commande -> (fonction, description, options : (noms, paramètres argparse))
+COMMANDES = {
+    "ajouter-joueur": (
+        ajouter_joueur,
+        "Ajoute un joueur.",
+        [
+            (("--ine",), {"help": "Identifiant national d'échecs (AB12345)."}),
+            (("--nom",), {"help": "Nom de famille."}),
+            (("--prenom",), {"help": "Prénom."}),
+            (("--naissance",), {"help": "Date de naissance (JJ-MM-AAAA)."}),
+        ],
+    ),
+    "importer-joueurs": (
+        importer_joueurs,
+        "Importe les joueurs d'un fichier CSV ou d'un export de la fédération.",
+        [(("--fichier",), {"help": "Chemin du fichier."})],
+    ),
+    "creer-tournoi": (
+        creer_tournoi,
+        "Crée un tournoi.",
+        [
+            (("--nom",), {"help": "Nom du tournoi."}),
+            (("--lieu",), {"help": "Lieu du tournoi."}),
+            (("--debut",), {"help": "Date de début (JJ-MM-AAAA)."}),
+            (("--fin",), {"help": "Date de fin (JJ-MM-AAAA)."}),
+            (("--description",), {"help": "Description (facultative)."}),
+        ],
+    ),
+    "inscrire": (
+        inscrire_joueurs,
+        "Inscrit les joueurs d'un tournoi qui n'a pas commencé et fixe son nombre de tours.",
+        [
+            (("--tournoi",), {"help": "Identifiant du tournoi."}),
+            (("--joueurs",), {"nargs": "+", "help": "Identifiants ou identifiants nationaux des joueurs."}),
+            (("--tours",), {"type": int, "help": f"Nombre de tours ({Tournoi.nombre_tours_defaut} par défaut)."}),
+        ],
+    ),
+    "creer-tour": (
+        creer_tour,
+        "Crée et apparie le tour suivant d'un tournoi.",
+        [(("--tournoi",), {"help": "Identifiant du tournoi."})],
+    ),
+    "terminer-tour": (
+        terminer_tour,
+        "Enregistre tous les résultats du tour en cours d'un tournoi et le clôt.",
+        [
+            (("--tournoi",), {"help": "Identifiant du tournoi."}),
+            (("--fichier",), {"help": "Feuille de résultats (CSV ou TSV)."}),
+            (("--saisie",), {"help": "Résultats dans l'ordre des échiquiers (\"1-0 0-1 5=1/2-1/2\")."}),
+        ],
+    ),
+    "rapport": (
+        rapport,
+        "Produit un rapport sur les joueurs, les tournois, un tournoi, ses tours ou l'historique d'un joueur.",
+        [
+            (("sujet",), {"nargs": "?", "choices": SUJETS_RAPPORT, "help": "Sujet du rapport."}),
+            (("--tournoi",), {"help": "Identifiant du tournoi (tournoi, tours)."}),
+            (("--joueur",), {"help": "Identifiant ou identifiant national du joueur (historique)."}),
+            (("--tri",), {"choices": IndexJoueurs.tris, "help": "Ordre des joueurs (nom par défaut)."}),
+            (("--page",), {"type": int, "help": "Page des joueurs (1 par défaut)."}),
+            (("--taille",), {"type": int, "help": f"Joueurs par page ({TAILLE_PAGE_JOUEURS} par défaut)."}),
+        ],
+    ),
+    "sauvegarder": (sauvegarder, "Sauvegarde les données.", []),
+    "sauvegardes": (lister_sauvegardes, "Liste les sauvegardes et leurs éléments.", []),
+    "restaurer": (
+        restaurer,
+        "Restaure une sauvegarde, ou un seul de ses éléments.",
+        [
+            (("--sauvegarde",), {"help": "Nom de la sauvegarde."}),
+            (("--element",), {"help": "Élément à restaurer seul (voir la commande sauvegardes)."}),
+            (("--confirmer",), {"action": "store_true", "default": None, "help": "Confirme la restauration."}),
+        ],
+    ),
+}
+
+# Options reçues par chaque commande (clés acceptées dans le JSON), déduites de `COMMANDES`
+OPTIONS_COMMANDES = {
+    s_commande: {t_noms[0].lstrip("-").replace("-", "_") for t_noms, d_parametres in l_options}
+    for s_commande, (fonction, s_description, l_options) in COMMANDES.items()
+}
+# Options propres aux résultats JSON, sans équivalent sur la ligne de commande
+OPTIONS_COMMANDES["terminer-tour"].add("resultats")
+
+
+def executer(p_gestionnaire_persistance, p_commande: str, p_options: dict) -> dict:
+    """
+    Exécute une commande et retourne sa réponse, sans jamais lever d'exception.
+
+    Args:
+        p_gestionnaire_persistance (GestionnairePersistance): Gestionnaire de persistance.
+        p_commande (str): Nom de la commande (voir `COMMANDES`).
+        p_options (dict): Options de la commande.
+
+    Returns:
+        dict: {"ok": True, "commande", "resultat"} ou {"ok": False, "commande", "erreur"[, "details"]}.
+    """
+
+    try:
+        if p_commande not in COMMANDES:
+            raise ValueError(f"Commande inconnue : {p_commande!r} ({', '.join(COMMANDES)})")
+        l_inconnues = sorted(set(p_options) - OPTIONS_COMMANDES[p_commande])
+        if l_inconnues:
+            raise ValueError(f"Option(s) inconnue(s) pour {p_commande} : {', '.join(l_inconnues)}")
+
+        fonction = COMMANDES[p_commande][0]
+        return {"ok": True, "commande": p_commande, "resultat": fonction(p_gestionnaire_persistance, p_options)}
+    except ValueError as erreur:
+        d_reponse = {"ok": False, "commande": p_commande, "erreur": str(erreur.args[0]) if erreur.args else ""}
+        if len(erreur.args) > 1:
+            d_reponse["details"] = erreur.args[1]
+        return d_reponse
+    except OSError as erreur:
+        return {"ok": False, "commande": p_commande, "erreur": str(erreur)}
+    except Exception as erreur:
+        # Erreur inattendue : son type aide à la diagnostiquer
+        return {"ok": False, "commande": p_commande, "erreur": f"{type(erreur).__name__} : {erreur}"}
+
+
+def executer_lot(p_gestionnaire_persistance, p_entree, p_sortie, p_indentation: int | None) -> int:
+    """
+    Exécute une commande par ligne JSON de l'entrée et écrit la réponse de chacune sur une ligne de la sortie.
+
+    Les lignes vides et celles qui commencent par # sont ignorées. Une commande en échec n'arrête pas le lot.
+
+    Args:
+        p_gestionnaire_persistance (GestionnairePersistance): Gestionnaire de persistance, partagé par le lot.
+        p_entree (TextIO): Commandes : {"commande": ..., options...} par ligne.
+        p_sortie (TextIO): Réponses, dans l'ordre des commandes.
+        p_indentation (int | None): Indentation du JSON écrit.
+
+    Returns:
+        int: `CODE_SUCCES` si toutes les commandes ont réussi, sinon `CODE_ERREUR`.
+
+    Raises:
+        BrokenPipeError: Si le lecteur de la sortie s'est arrêté : le lot s'interrompt.
+    """
+
+    i_code = CODE_SUCCES
+
+    for i_ligne, s_ligne in enumerate(p_entree, start=1):
+        s_ligne = s_ligne.strip()
+        if not s_ligne or s_ligne.startswith("#"):
+            continue
+
+        try:
+            d_options = json.loads(s_ligne)
+            if not isinstance(d_options, dict):
+                raise ValueError("la ligne doit être un objet JSON")
+        except ValueError as erreur:
+            d_reponse = {"ok": False, "commande": None, "erreur": f"Ligne {i_ligne} illisible : {erreur}"}
+        else:
+            d_reponse = executer(p_gestionnaire_persistance, d_options.pop("commande", None), d_options)
+        d_reponse["ligne"] = i_ligne
+
+        if not d_reponse["ok"]:
+            i_code = CODE_ERREUR
+        _ecrire_reponse(d_reponse, p_sortie, p_indentation)
+
+    return i_code
+
+
+def creer_analyseur() -> argparse.ArgumentParser:
+    """
+    Construit l'analyseur de la ligne de commande à partir de `COMMANDES`.
+
+    Returns:
+        argparse.ArgumentParser: L'analyseur.
+    """
+
+    parser = argparse.ArgumentParser(
+        description="Let's Roque sans menus : chaque commande écrit sa réponse en JSON sur la sortie standard."
+    )
+    parser.add_argument("--lisible", action="store_true", help="Indente le JSON écrit.")
+    parser.add_argument(
+        "--json", action="store_true", help="Lit les options de la commande dans un objet JSON sur l'entrée standard."
+    )
+    sous_parsers = parser.add_subparsers(dest="commande", required=True, metavar="commande")
+
+    for s_commande, (fonction, s_description, l_options) in COMMANDES.items():
+        sous_parser = sous_parsers.add_parser(s_commande, help=s_description, description=s_description)
+        for t_noms, d_parametres in l_options:
+            sous_parser.add_argument(*t_noms, **d_parametres)
+
+    sous_parsers.add_parser(
+        "lot",
+        help="Exécute une commande par ligne JSON de l'entrée standard.",
+        description='Exécute une commande par ligne JSON de l\'entrée standard ({"commande": "creer-tour", '
+        '"tournoi": 3}) et écrit une réponse par ligne.',
+    )
+
+    return parser
+
+
+def main(p_arguments: list[str] | None = None) -> int:
+    """
+    Point d'entrée de la ligne de commande.
+
+    Args:
+        p_arguments (list[str] | None, optional): Arguments (par défaut, ceux du processus).
+
+    Returns:
+        int: Le code de sortie.
+    """
+
+    args = creer_analyseur().parse_args(p_arguments)
+
+    try:
+        return _executer_arguments(args)
+    except BrokenPipeError:
+        # Le lecteur de la sortie s'est arrêté avant la fin (par exemple `| head`) : la suite de la sortie
+        # est jetée, pour que Python ne signale pas de nouveau l'erreur en fermant la sortie standard
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return CODE_ERREUR
+
+
+#
+# FONCTIONS PRIVEES
+#
+def _executer_arguments(p_arguments: argparse.Namespace) -> int:
+    """
+    Exécute la commande de la ligne de commande analysée et écrit sa réponse (ou celles du lot).
+
+    Args:
+        p_arguments (argparse.Namespace): Les arguments analysés par `creer_analyseur`.
+
+    Returns:
+        int: Le code de sortie.
+
+    Raises:
+        BrokenPipeError: Si le lecteur de la sortie standard s'est arrêté.
+    """
+
+    i_indentation = 2 if p_arguments.lisible else None
+
+    # Un stockage mal configuré (LETS_ROQUE_STOCKAGE) ou inaccessible donne aussi une réponse JSON
+    try:
+        o_gestionnaire_persistance = creer_gestionnaire_persistance()
+    except ValueError as erreur:
+        _ecrire_reponse(
+            {"ok": False, "commande": p_arguments.commande, "erreur": str(erreur)}, sys.stdout, i_indentation
+        )
+        return CODE_USAGE
+    except Exception as erreur:
+        _ecrire_reponse(
+            {"ok": False, "commande": p_arguments.commande, "erreur": f"Stockage inaccessible : {erreur}"},
+            sys.stdout,
+            i_indentation,
+        )
+        return CODE_ERREUR
+
+    if p_arguments.commande == "lot":
+        return executer_lot(o_gestionnaire_persistance, sys.stdin, sys.stdout, i_indentation)
+
+    d_options = {}
+    if p_arguments.json:
+        try:
+            d_options = json.load(sys.stdin)
+        except ValueError as erreur:
+            print(f"Entrée JSON illisible : {erreur}", file=sys.stderr)
+            return CODE_USAGE
+        if not isinstance(d_options, dict):
+            print("L'entrée JSON doit être un objet.", file=sys.stderr)
+            return CODE_USAGE
+
+    # Les options de la ligne de commande complètent et remplacent celles lues en JSON
+    d_options.update(
+        {
+            s_cle: valeur
+            for s_cle, valeur in vars(p_arguments).items()
+            if s_cle not in ("lisible", "json", "commande") and valeur is not None
+        }
+    )
+
+    d_reponse = executer(o_gestionnaire_persistance, p_arguments.commande, d_options)
+    _ecrire_reponse(d_reponse, sys.stdout, i_indentation)
+
+    return CODE_SUCCES if d_reponse["ok"] else CODE_ERREUR
+
+
+def _ecrire_reponse(p_reponse: dict, p_sortie, p_indentation: int | None) -> None:
+    """
+    Écrit une réponse en JSON sur la sortie, suivie d'un saut de ligne, et la vide aussitôt.
+
+    Args:
+        p_reponse (dict): La réponse (voir `executer`).
+        p_sortie (TextIO): La sortie.
+        p_indentation (int | None): Indentation du JSON écrit.
+
+    Returns:
+        None
+    """
+
+    p_sortie.write(json.dumps(p_reponse, ensure_ascii=False, indent=p_indentation) + "\n")
+    p_sortie.flush()
+
+
+def _option(p_options: dict, p_cle: str):
+    """
+    Retourne une option obligatoire.
+
+    Args:
+        p_options (dict): Options de la commande.
+        p_cle (str): Nom de l'option.
+
+    Returns:
+        La valeur de l'option.
+
+    Raises:
+        ValueError: Si l'option est absente ou vide.
+    """
+
+    valeur = p_options.get(p_cle)
+    if valeur is None or valeur == "" or valeur == []:
+        raise ValueError(f"Option obligatoire : --{p_cle.replace('_', '-')}")
+
+    return valeur
+
+
+def _entier(p_valeur, p_cle: str) -> int:
+    """
+    Convertit une option en entier strictement positif.
+
+    Args:
+        p_valeur (int | str): Valeur de l'option.
+        p_cle (str): Nom de l'option, pour le message d'erreur.
+
+    Returns:
+        int: La valeur.
+
+    Raises:
+        ValueError: Si la valeur n'est pas un entier strictement positif.
+    """
+
+    try:
+        i_valeur = int(p_valeur)
+    except (TypeError, ValueError):
+        i_valeur = 0
+    if i_valeur < 1:
+        raise ValueError(f"--{p_cle} doit être un entier supérieur à 0 : {p_valeur!r}")
+
+    return i_valeur
+
+
+def _date(p_options: dict, p_cle: str, p_format: str) -> str:
+    """
+    Vérifie une date obligatoire et la retourne au format attendu (avec les zéros initiaux).
+
+    Args:
+        p_options (dict): Options de la commande.
+        p_cle (str): Nom de l'option.
+        p_format (str): Format de la date (JJ-MM-AAAA).
+
+    Returns:
+        str: La date.
+
+    Raises:
+        ValueError: Si la date est absente, mal formée ou n'existe pas.
+    """
+
+    s_date = str(_option(p_options, p_cle))
+    try:
+        return datetime.strptime(s_date, p_format).strftime(p_format)
+    except ValueError:
+        raise ValueError(f"--{p_cle} invalide : {s_date!r} (JJ-MM-AAAA)") from None
+
+
+def _identifiant_tournoi(p_gestionnaire_persistance, p_options: dict) -> str:
+    """
+    Retourne l'identifiant du tournoi indiqué, après avoir vérifié qu'il existe.
+
+    Args:
+        p_gestionnaire_persistance (GestionnairePersistance): Gestionnaire de persistance.
+        p_options (dict): Options de la commande, avec `tournoi`.
+
+    Returns:
+        str: L'identifiant du tournoi.
+
+    Raises:
+        ValueError: Si le tournoi n'existe pas.
+    """
+
+    s_identifiant_tournoi = str(_option(p_options, "tournoi"))
+    try:
+        p_gestionnaire_persistance.recuperer_entete_tournoi(s_identifiant_tournoi)
+    except ValueError:
+        raise ValueError(f"Tournoi introuvable : {s_identifiant_tournoi}") from None
+
+    return s_identifiant_tournoi
+
+
+def _identifiants_joueurs(p_gestionnaire_persistance, p_designations: list) -> list[str]:
+    """
+    Retrouve des joueurs enregistrés par leur identifiant ou par leur identifiant national.
+
+    Args:
+        p_gestionnaire_persistance (GestionnairePersistance): Gestionnaire de persistance.
+        p_designations (list): Identifiants ou identifiants nationaux (sans tenir compte des majuscules).
+
+    Returns:
+        list[str]: Les identifiants des joueurs, dans l'ordre des désignations.
+
+    Raises:
+        ValueError: Si un joueur est introuvable, ou si un identifiant national est partagé par plusieurs joueurs
+                    (le second argument de l'erreur donne alors les identifiants candidats).
+    """
+
+    # Identifiant (ou identifiant national) -> identifiants des joueurs qu'il désigne
+    d_identifiants = _joueurs_par_identifiant_national(p_gestionnaire_persistance)
+    for l_candidats in list(d_identifiants.values()):
+        for s_identifiant in l_candidats:
+            d_identifiants[s_identifiant] = [s_identifiant]
+
+    l_identifiants = []
+    l_inconnus = []
+    d_ambigus = {}
+    for designation in p_designations:
+        l_candidats = d_identifiants.get(str(designation).strip().upper())
+        if not l_candidats:
+            l_inconnus.append(str(designation))
+        elif len(l_candidats) > 1:
+            d_ambigus[str(designation)] = l_candidats
+        else:
+            l_identifiants.append(l_candidats[0])
+
+    if l_inconnus:
+        raise ValueError(f"Joueur(s) introuvable(s) : {', '.join(l_inconnus)}")
+    if d_ambigus:
+        l_details = [
+            {"designation": s_designation, "candidats": l_candidats}
+            for s_designation, l_candidats in d_ambigus.items()
+        ]
+        raise ValueError(
+            "Identifiant(s) national(aux) partagé(s) par plusieurs joueurs, indiquez leur identifiant : "
+            + ", ".join(f"{d_detail['designation']} ({', '.join(d_detail['candidats'])})" for d_detail in l_details),
+            l_details,
+        )
+
+    return l_identifiants
+
+
+def _joueurs_par_identifiant_national(p_gestionnaire_persistance) -> dict:
+    """
+    Regroupe les joueurs enregistrés par identifiant national.
+
+    Args:
+        p_gestionnaire_persistance (GestionnairePersistance): Gestionnaire de persistance.
+
+    Returns:
+        dict: Identifiant national (majuscules) -> identifiants des joueurs qui le portent,
+              dans l'ordre d'enregistrement.
+    """
+
+    d_joueurs = {}
+    for d_joueur in p_gestionnaire_persistance.charger_joueurs():
+        s_identifiant_national = str(d_joueur["identifiant_national_echec"]).upper()
+        d_joueurs.setdefault(s_identifiant_national, []).append(str(d_joueur["id_tinydb"]))
+
+    return d_joueurs
+
+
+def _lister_sauvegardes(p_gestionnaire_persistance) -> list[str]:
+    """
+    Liste les noms des sauvegardes, de la plus ancienne à la plus récente.
+
+    Args:
+        p_gestionnaire_persistance (GestionnairePersistance): Gestionnaire de persistance.
+
+    Returns:
+        list[str]: Les noms des dossiers de sauvegarde (les dossiers cachés, en cours de création, sont ignorés).
+    """
+
+    return sorted(
+        dossier.name
+        for dossier in p_gestionnaire_persistance.dossier_sauvegarde.iterdir()
+        if dossier.is_dir() and not dossier.name.startswith(".")
+    )
+
+
+def _nettoyer_message(p_message: str) -> str:
+    """
+    Retire d'un message du gestionnaire les symboles et retours à la ligne prévus pour la console.
+
+    Args:
+        p_message (str): Message du gestionnaire.
+
+    Returns:
+        str: Le message, sur une ligne.
+    """
+
+    return " ".join(p_message.replace("✅", "").replace("❌", "").split())
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,5 +1,5 @@
 from models.joueur import Joueur
-from models.gestionnaire_persistance import GestionnairePersistance
+from models.fabrique_persistance import creer_gestionnaire_persistance
 from views.joueur_vue import JoueurVue
 
 
@@ -9,13 +9,19 @@ class JoueurControleur:
 
     Ce contrôleur permet :
     - D'ajouter un joueur en recueillant ses informations et en les enregistrant.
+    - D'importer en une fois les joueurs d'un fichier CSV ou d'un export de la fédération.
     - D'afficher la liste des joueurs enregistrés.
+    - De recalculer les classements Elo de tous les joueurs.
+    - D'afficher l'historique des parties d'un joueur dans tous les tournois.
     """
 
+    # Nombre de joueurs affichés par page dans la liste des joueurs
+    taille_page: int = 25
+
     def __init__(self):
         """Initialise le contrôleur des joueurs avec la vue et le gestionnaire de persistance."""
         self.o_joueur_vue = JoueurVue()
-        self.o_gestionnaire_persistance = GestionnairePersistance()
+        self.o_gestionnaire_persistance = creer_gestionnaire_persistance()
 
     #
     def ajouter_joueur(self) -> None:
@@ -49,29 +55,122 @@ class JoueurControleur:
             self.o_gestionnaire_persistance.sauvegarder_joueur(o_joueur_modele)
             self.o_joueur_vue.render_confirm_ajout_joueur(**d_infos_joueur)
 
+    #
+    def importer_joueurs(self) -> None:
+        """Importe les joueurs d'un fichier CSV ou d'un export de la fédération, puis affiche le bilan.
+
+        Chaque ligne est validée avec les règles de la saisie d'un joueur ; les joueurs dont l'identifiant
+        national est déjà enregistré (ou déjà lu dans le fichier) sont écartés.
+
+        Returns:
+            None: Affiche le bilan de l'import.
+        """
+
+        s_fichier = self.o_joueur_vue.render_saisie_fichier_import()
+        if s_fichier is None:
+            self.o_joueur_vue.afficher_message("Opération annulée", "error")
+            return
+
+        try:
+            d_bilan = self.o_gestionnaire_persistance.importer_fichier_joueurs(s_fichier)
+        except (OSError, ValueError) as erreur:
+            self.o_joueur_vue.afficher_message(f"Import impossible : {erreur}", "error")
+            return
+
+        self.o_joueur_vue.render_bilan_import(d_bilan)
+
 #
     def lister_joueurs(self) -> None:
-        """Affiche la liste des joueurs enregistrés dans la base de données JSON.
+        """Affiche la liste des joueurs enregistrés, page par page.
 
-        Cette méthode récupère les données des joueurs stockées dans le JSON,
-        les convertit en objets Joueur, puis les affiche via la vue.
+        Seuls les joueurs de la page affichée sont chargés et convertis en objets Joueur, dans l'ordre
+        de tri choisi (nom, score ou identifiant national) : le temps d'affichage d'une page ne dépend pas
+        du nombre de joueurs. L'utilisateur passe ensuite à la page suivante ou précédente, change de tri
+        ou revient au menu.
 
         Returns:
             None: Affiche la liste des joueurs, mais ne retourne pas de valeur.
         """
 
-        joueurs_data = self.o_gestionnaire_persistance.charger_joueurs()
-
-        # Convertir chaque document en une instance de Joueur
-        joueurs = []
-        for joueur_datum in joueurs_data:
-            o_joueur = Joueur(
-                p_identifiant_national_echec=joueur_datum["identifiant_national_echec"],
-                p_nom_famille=joueur_datum["nom_famille"],
-                p_prenom=joueur_datum["prenom"],
-                p_date_naissance=joueur_datum["date_naissance"],
-                p_score=joueur_datum["score"],
+        s_tri = "nom"
+        i_page = 0
+
+        while True:
+            joueurs_data, i_nombre_joueurs = self.o_gestionnaire_persistance.charger_page_joueurs(
+                s_tri, i_page, self.taille_page
             )
-            joueurs.append(o_joueur)
+            i_nombre_pages = max(1, -(-i_nombre_joueurs // self.taille_page))
+
+            # Convertir chaque document de la page en une instance de Joueur
+            joueurs = []
+            for joueur_datum in joueurs_data:
+                o_joueur = Joueur(
+                    p_identifiant_national_echec=joueur_datum["identifiant_national_echec"],
+                    p_nom_famille=joueur_datum["nom_famille"],
+                    p_prenom=joueur_datum["prenom"],
+                    p_date_naissance=joueur_datum["date_naissance"],
+                    p_score=joueur_datum["score"],
+                    p_elo=joueur_datum.get("elo"),
+                    p_parties_classees=joueur_datum.get("parties_classees", 0),
+                )
+                joueurs.append(o_joueur)
+
+            self.o_joueur_vue.render_lister_joueur(joueurs, i_page, i_nombre_pages, i_nombre_joueurs, s_tri)
+
+            s_action = self.o_joueur_vue.render_navigation_joueurs(i_page, i_nombre_pages, s_tri)
+            if s_action is None or s_action == "retour":
+                return
+            if s_action == "suivante":
+                i_page += 1
+            elif s_action == "precedente":
+                i_page -= 1
+            else:
+                s_tri = s_action
+                i_page = 0
+
+    #
+    def recalculer_elos(self) -> None:
+        """Recalcule les classements Elo de tous les joueurs à partir de tous les tournois enregistrés.
+
+        Les classements sont normalement mis à jour à chaque fin de tour : ce recalcul complet sert après
+        un changement des règles de calcul (coefficient K), une restauration ou une migration.
+
+        Returns:
+            None: Affiche le bilan du calcul.
+        """
+
+        d_bilan = self.o_gestionnaire_persistance.recalculer_elos()
+        self.o_joueur_vue.afficher_message(
+            f"Classements Elo recalculés : {d_bilan['joueurs']} joueur(s), {d_bilan['parties']} partie(s) "
+            f"dans {d_bilan['tournois']} tournoi(s).",
+            "success",
+        )
+
+    #
+    def visualiser_historique_joueur(self) -> None:
+        """Affiche les parties d'un joueur choisi dans tous les tournois, avec ses adversaires et ses résultats.
+
+        L'historique est lu dans l'index des parties des joueurs, sans ouvrir les fichiers des tournois.
+
+        Returns:
+            None: Affiche l'historique du joueur.
+        """
+
+        l_joueurs = self.o_gestionnaire_persistance.charger_objets_joueurs()
+        if not l_joueurs:
+            self.o_joueur_vue.afficher_message("Aucun joueur enregistré.", "error")
+            return
+
+        o_joueur = self.o_joueur_vue.render_choix_joueur(l_joueurs)
+        if o_joueur is None:
+            self.o_joueur_vue.afficher_message("Opération annulée", "error")
+            return
+
+        l_parties = self.o_gestionnaire_persistance.recuperer_historique_joueur(o_joueur.identifiant_tinydb)
+        d_noms_tournois = {
+            d_tournoi["identifiant"]: d_tournoi["nom_tournoi"]
+            for d_tournoi in self.o_gestionnaire_persistance.recuperer_catalogue_tournois()
+        }
+        d_joueurs = {str(o_autre_joueur.identifiant_tinydb): o_autre_joueur for o_autre_joueur in l_joueurs}
 
-        self.o_joueur_vue.render_lister_joueur(joueurs)
+        self.o_joueur_vue.render_historique_joueur(o_joueur, l_parties, d_joueurs, d_noms_tournois)
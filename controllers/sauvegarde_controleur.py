@@ -1,4 +1,4 @@
-from models.gestionnaire_persistance import GestionnairePersistance
+from models.fabrique_persistance import creer_gestionnaire_persistance
 from views.sauvegarde_vue import SauvegardeVue
 from pathlib import Path
 
@@ -19,7 +19,7 @@ class SauvegardeControleur:
         """
 
         self.o_sauvegarde_vue = SauvegardeVue()
-        self.o_gestionnaire_persistance = GestionnairePersistance()
+        self.o_gestionnaire_persistance = creer_gestionnaire_persistance()
 
     #
     def sauvegarder_donnees(self) -> None:
@@ -42,7 +42,8 @@ class SauvegardeControleur:
          Affiche les sauvegardes disponibles et permet de restaurer une sauvegarde choisie par l'utilisateur.
 
         Cette méthode récupère la liste des sauvegardes disponibles, demande à l'utilisateur d'en choisir une via
-        la vue et demande confirmation avant de la restaurer. Elle affiche ensuite un message de confirmation
+        la vue, puis de choisir entre toute la sauvegarde et un seul élément (joueurs, un tournoi),
+        et demande confirmation avant de la restaurer. Elle affiche ensuite un message de confirmation
         ou d'erreur.
 
         Returns:
@@ -52,7 +53,8 @@ class SauvegardeControleur:
         dossier_sauvegarde = Path(__file__).parent.parent / "sauvegarde"
         sauvegardes = []
         for dossier in dossier_sauvegarde.iterdir():
-            if dossier.is_dir():
+            # Les dossiers cachés sont des sauvegardes en cours de création
+            if dossier.is_dir() and not dossier.name.startswith("."):
                 sauvegardes.append(dossier.name)
 
         if not sauvegardes:
@@ -68,6 +70,14 @@ class SauvegardeControleur:
         if choix_sauvegarde is None:
             return  # L'utilisateur a annulé
 
+        # Propose de restaurer toute la sauvegarde ou un seul élément (joueurs, un tournoi)
+        choix_element = self.o_sauvegarde_vue.demander_element_a_restaurer(
+            self.o_gestionnaire_persistance.lister_elements_sauvegarde(choix_sauvegarde)
+        )
+
+        if choix_element is None:
+            return  # L'utilisateur a annulé
+
         # Demande confirmation avant de restaurer
         confirmation = self.o_sauvegarde_vue.confirmer_restaurer_sauvegarde()
 
@@ -77,8 +87,13 @@ class SauvegardeControleur:
             self.o_sauvegarde_vue.afficher_message(message, message_type)
             return
 
-        # Restaure la sauvegarde si l'utilisateur a confirmé
-        message, message_type = self.o_gestionnaire_persistance.restaurer_sauvegarde(
-            choix_sauvegarde
-        )
+        # Restaure la sauvegarde (ou l'élément choisi) si l'utilisateur a confirmé
+        if choix_element == "Toute la sauvegarde":
+            message, message_type = self.o_gestionnaire_persistance.restaurer_sauvegarde(
+                choix_sauvegarde
+            )
+        else:
+            message, message_type = self.o_gestionnaire_persistance.restaurer_element_sauvegarde(
+                choix_sauvegarde, choix_element
+            )
         self.o_sauvegarde_vue.afficher_message(message, message_type)
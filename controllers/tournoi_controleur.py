@@ -1,7 +1,7 @@
 from models.tournoi import Tournoi
-from models.gestionnaire_persistance import GestionnairePersistance
+from models.classement_tournoi import ClassementTournoi
+from models.fabrique_persistance import creer_gestionnaire_persistance
 from views.tournoi_vue import TournoiVue
-import re
 
 
 class TournoiControleur:
@@ -29,17 +29,16 @@ class TournoiControleur:
         """
 
         self.o_tournoi_vue = TournoiVue()
-        self.o_gestionnaire_persistance = GestionnairePersistance()
+        self.o_gestionnaire_persistance = creer_gestionnaire_persistance()
 
     #
     def ajouter_tournoi(self) -> None:
         """
         Gère l'ajout d'un nouveau tournoi en collectant les informations et en les sauvegardant.
 
-        Cette méthode génère un identifiant unique pour le tournoi.
-        Demande à l'utilisateur de saisir les informations via la vue puis
+        Cette méthode demande à l'utilisateur de saisir les informations via la vue puis
         Crée un objet `Tournoi` avec ces informations.
-        Ensuite, elle Sauvegarde le tournoi dans la base de données et
+        Ensuite, elle Sauvegarde le tournoi dans la base de données, qui lui attribue un identifiant unique, et
         affiche un message de confirmation avec les détails du tournoi.
         Un traitement permet de ne pas créer de fichier tournoi si l'utilisateur ne le saisi pas entièrement.
 
@@ -50,9 +49,6 @@ class TournoiControleur:
                 None
         """
 
-        # Génère un identifiant unique pour le tournoi.
-        identifiant_tournoi = Tournoi.generer_identifiant()
-
         # Demande à l'utilisateur de saisir les informations du tournoi via la vue.
         d_infos_tournoi = self.o_tournoi_vue.render_saisie_tournoi()
 
@@ -65,7 +61,7 @@ class TournoiControleur:
         else:
             # Crée un objet `Tournoi` avec ces informations.
             o_tournoi_modele = Tournoi(
-                identifiant_tournoi,
+                None,  # identifiant attribué à l'enregistrement
                 d_infos_tournoi["p_nom_tournoi"],
                 d_infos_tournoi["p_lieu_tournoi"],
                 d_infos_tournoi["p_date_debut_tournoi"],
@@ -74,9 +70,10 @@ class TournoiControleur:
                 d_infos_tournoi["p_description_tournoi"],
                 [],  # initialise à liste tour vide
                 [],  # initialise à liste joueur vide
+                Tournoi.generer_graine(),  # graine des tirages aléatoires, pour pouvoir rejouer le tournoi
             )
 
-            # Sauvegarde le tournoi dans le gestionnaire de persistance.
+            # Sauvegarde le tournoi dans le gestionnaire de persistance, qui lui attribue son identifiant.
             self.o_gestionnaire_persistance.sauvegarder_tournoi(o_tournoi_modele)
 
             # Affiche un message de confirmation avec les informations du tournoi.
@@ -154,8 +151,8 @@ class TournoiControleur:
         """
         Affiche la liste des tournois enregistrés dans la base de données (JSON).
 
-        Cette méthode charge la liste des fichiers de tournois existants.
-        Extrait les informations de chaque tournoi et
+        Cette méthode lit le catalogue des tournois (l'en-tête de chaque tournoi conservé dans l'index)
+        en une seule lecture, sans recharger les tours et les matchs de chaque tournoi, et
         affiche ces informations sous forme de tableau via la vue.
 
         Args:
@@ -165,23 +162,11 @@ class TournoiControleur:
             None
         """
 
-        # Charge la liste des tournois existants
-        l_liste_tournois = self.o_gestionnaire_persistance.recuperer_fichiers_tournois()
-
-        regex = r"tournoi_(\d+)_"
-        l_objets_tournoi = []
-        for s_tournoi in l_liste_tournois:
-            match = re.match(regex, s_tournoi)
-            if match:
-                i_identifiant_tournoi = match.group(1)
-                l_objets_tournoi.append(
-                    self.o_gestionnaire_persistance.recuperer_objet_tournoi(
-                        i_identifiant_tournoi
-                    )
-                )
+        # Charge l'en-tête des tournois existants
+        l_catalogue_tournois = self.o_gestionnaire_persistance.recuperer_catalogue_tournois()
 
         # Affiche les informations de chaque tournoi dans la console
-        self.o_tournoi_vue.render_lister_tournois(l_objets_tournoi)
+        self.o_tournoi_vue.render_lister_tournois(l_catalogue_tournois)
 
     #
     def visualiser_tournoi(self) -> None:
@@ -190,7 +175,8 @@ class TournoiControleur:
 
         Cette méthode charge la liste des tournois existants et demande à l'utilisateur d'en choisir un.
         Récupère les détails du tournoi sélectionné, y compris les scores des joueurs et
-        affiche ces informations de manière détaillée via la vue.
+        affiche ces informations de manière détaillée via la vue, puis le classement avec ses
+        départages (`ClassementTournoi`).
 
         Args:
             None
@@ -218,6 +204,11 @@ class TournoiControleur:
         # Affiche les informations détaillées du tournoi, y compris les joueurs inscrits àce tournoi.
         self.o_tournoi_vue.render_visualiser_tournoi(o_tournoi, d_scores_joueurs)
 
+        # Classement : score, puis départages (Buchholz, Sonneborn-Berger...) calculés sur les tours terminés
+        d_document_tournoi = self.o_gestionnaire_persistance.recuperer_document_tournoi(i_identifiant_tournoi)
+        l_classement = ClassementTournoi(d_document_tournoi).classer()
+        self.o_tournoi_vue.render_classement_tournoi(o_tournoi, l_classement)
+
     #
     def visualiser_tour_match_tournoi(self) -> None:
         """
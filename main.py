@@ -13,7 +13,10 @@ MENU_GESTION_JOUEUR = "Gestion des joueurs"
 MENU_GESTION_TOURNOI = "Gestion des tournois"
 MENU_GESTION_RAPPORTS = "Gestion des rapports"
 MENU_AJOUTER_JOUEUR = "Ajouter un joueur"
+MENU_IMPORTER_JOUEURS = "Importer des joueurs depuis un fichier (CSV, export de la fédération)"
 MENU_LISTER_JOUEURS = "Lister les joueurs"
+MENU_HISTORIQUE_JOUEUR = "Visualiser l'historique d'un joueur"
+MENU_RECALCULER_ELO = "Recalculer les classements Elo"
 MENU_CREER_TOURNOI = "Créer un tournoi"
 MENU_INSCRIRE_JOUEUR_DEFINIR_TOURS = "Inscrire les joueurs et définir les tours"
 MENU_LISTER_TOURNOI = "Lister les tournois"
@@ -71,6 +74,8 @@ def menu_joueur():
         "Que souhaitez-vous faire ?",
         choices=[
             MENU_AJOUTER_JOUEUR,
+            MENU_IMPORTER_JOUEURS,
+            MENU_RECALCULER_ELO,
             RETOUR_MENU_PRINCIPAL,
         ],
     ).ask()
@@ -109,6 +114,7 @@ def menu_rapports():
         "Que souhaitez-vous faire ?",
         choices=[
             MENU_LISTER_JOUEURS,
+            MENU_HISTORIQUE_JOUEUR,
             MENU_LISTER_TOURNOI,
             MENU_VISUALISER_TOURNOI,
             MENU_VISUALISER_TOUR_MATCH_TOURNOI,
@@ -152,6 +158,10 @@ if __name__ == "__main__":
                     choix_joueur = menu_joueur()
                     if choix_joueur == MENU_AJOUTER_JOUEUR:
                         joueur_controleur.ajouter_joueur()
+                    elif choix_joueur == MENU_IMPORTER_JOUEURS:
+                        joueur_controleur.importer_joueurs()
+                    elif choix_joueur == MENU_RECALCULER_ELO:
+                        joueur_controleur.recalculer_elos()
                     elif choix_joueur == RETOUR_MENU_PRINCIPAL:
                         break
             elif choix == MENU_GESTION_TOURNOI:
@@ -172,6 +182,8 @@ if __name__ == "__main__":
                     choix_rapports = menu_rapports()
                     if choix_rapports == MENU_LISTER_JOUEURS:
                         joueur_controleur.lister_joueurs()
+                    elif choix_rapports == MENU_HISTORIQUE_JOUEUR:
+                        joueur_controleur.visualiser_historique_joueur()
                     elif choix_rapports == MENU_LISTER_TOURNOI:
                         tournoi_controleur.lister_tournois()
                     elif choix_rapports == MENU_VISUALISER_TOURNOI:
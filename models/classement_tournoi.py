@@ -0,0 +1,127 @@
+import numpy as np
+
+
+class ClassementTournoi:
+    """
+    Classement d'un tournoi avec ses départages, calculé sur des tableaux NumPy.
+
+    Les tours terminés sont convertis en deux tableaux denses (joueurs x tours) :
+    - `adversaires` : indice de l'adversaire de chaque joueur à chaque tour (-1 : exempté ou absent) ;
+    - `points` : points marqués par chaque joueur à chaque tour.
+
+    Tous les départages sont ensuite calculés par opérations vectorisées, sans boucle Python par joueur :
+    - Buchholz : somme des scores des adversaires ;
+    - Buchholz tronqué : Buchholz moins la plus faible contribution (un tour sans adversaire compte 0) ;
+    - Sonneborn-Berger : somme des scores des adversaires, pondérés par le résultat obtenu contre eux ;
+    - progressif : somme des scores cumulés après chaque tour ;
+    - confrontation directe : points marqués contre les joueurs à égalité de points.
+
+    Un joueur exempté ne marque pas de point et son tour ne compte pour aucun adversaire.
+    """
+
+    # Ordre des départages, après le score. L'identifiant du joueur départage en dernier recours.
+    ordre_departages: tuple = (
+        "confrontation_directe",
+        "buchholz_tronque",
+        "buchholz",
+        "sonneborn_berger",
+        "progressif",
+    )
+
+    def __init__(self, p_tournoi: dict) -> None:
+        """
+        Construit les tableaux des résultats d'un tournoi.
+
+        Args:
+            p_tournoi (dict): Document du tournoi (`liste_joueurs` : identifiant -> score,
+                              `liste_tours` avec leurs matchs). Seuls les tours terminés sont comptés.
+        """
+        self.l_joueurs = [str(id_joueur) for id_joueur in p_tournoi["liste_joueurs"]]
+        d_indices = {id_joueur: i_indice for i_indice, id_joueur in enumerate(self.l_joueurs)}
+
+        l_tours = [d_tour for d_tour in p_tournoi.get("liste_tours", []) if d_tour["statut"] == "Terminé"]
+
+        self.adversaires = np.full((len(self.l_joueurs), len(l_tours)), -1, dtype=np.int32)
+        self.points = np.zeros((len(self.l_joueurs), len(l_tours)))
+
+        for i_tour, d_tour in enumerate(l_tours):
+            l_matchs = d_tour["liste_matchs"]
+            i_matchs = len(l_matchs)
+
+            a_blancs = np.fromiter(
+                (d_indices[str(d_match["joueur_blanc"])] for d_match in l_matchs), np.int32, i_matchs
+            )
+            a_noirs = np.fromiter(
+                (d_indices[str(d_match["joueur_noir"])] for d_match in l_matchs), np.int32, i_matchs
+            )
+
+            self.adversaires[a_blancs, i_tour] = a_noirs
+            self.adversaires[a_noirs, i_tour] = a_blancs
+            self.points[a_blancs, i_tour] = np.fromiter(
+                (d_match.get("score_blanc", 0) for d_match in l_matchs), float, i_matchs
+            )
+            self.points[a_noirs, i_tour] = np.fromiter(
+                (d_match.get("score_noir", 0) for d_match in l_matchs), float, i_matchs
+            )
+
+    #
+    def calculer_departages(self) -> dict:
+        """
+        Calcule le score et les départages de tous les joueurs.
+
+        Returns:
+            dict: Nom du critère (`score`, `buchholz`, `buchholz_tronque`, `sonneborn_berger`, `progressif`,
+                  `confrontation_directe`) -> tableau des valeurs, dans l'ordre d'inscription des joueurs.
+        """
+
+        b_joue = self.adversaires >= 0
+        # Indice valide partout : les tours sans adversaire sont ensuite masqués
+        a_adversaires = np.where(b_joue, self.adversaires, 0)
+
+        a_scores = self.points.sum(axis=1)
+        a_scores_adversaires = np.where(b_joue, a_scores[a_adversaires], 0.0)
+
+        a_buchholz = a_scores_adversaires.sum(axis=1)
+        if self.points.shape[1] > 0:
+            a_buchholz_tronque = a_buchholz - a_scores_adversaires.min(axis=1)
+        else:
+            a_buchholz_tronque = a_buchholz
+
+        b_egalite = b_joue & (a_scores[a_adversaires] == a_scores[:, np.newaxis])
+
+        return {
+            "score": a_scores,
+            "buchholz": a_buchholz,
+            "buchholz_tronque": a_buchholz_tronque,
+            "sonneborn_berger": (a_scores_adversaires * self.points).sum(axis=1),
+            "progressif": np.cumsum(self.points, axis=1).sum(axis=1),
+            "confrontation_directe": np.where(b_egalite, self.points, 0.0).sum(axis=1),
+        }
+
+    #
+    def classer(self) -> list[dict]:
+        """
+        Classe les joueurs : score, puis départages dans l'ordre de `ordre_departages`, puis identifiant.
+
+        Returns:
+            list[dict]: Un dictionnaire par joueur, du premier au dernier : `rang`, `identifiant`, `score`
+                        et la valeur de chaque départage.
+        """
+
+        d_departages = self.calculer_departages()
+        l_criteres = ["score", *self.ordre_departages]
+
+        # `np.lexsort` trie sur la dernière clé d'abord : les critères sont donc donnés à l'envers
+        a_identifiants = np.array([int(id_joueur) for id_joueur in self.l_joueurs], dtype=np.int64)
+        a_ordre = np.lexsort([a_identifiants] + [-d_departages[s_critere] for s_critere in reversed(l_criteres)])
+
+        d_valeurs = {s_critere: d_departages[s_critere][a_ordre].tolist() for s_critere in l_criteres}
+
+        return [
+            {
+                "rang": i_position + 1,
+                "identifiant": self.l_joueurs[i_indice],
+                **{s_critere: d_valeurs[s_critere][i_position] for s_critere in l_criteres},
+            }
+            for i_position, i_indice in enumerate(a_ordre.tolist())
+        ]
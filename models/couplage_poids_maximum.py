@@ -0,0 +1,444 @@
+"""
+Couplage de poids maximum dans un graphe quelconque (algorithme d'Edmonds, dit « des fleurs »).
+
+Implémentation en O(n³) de l'algorithme primal-dual d'Edmonds, dans la version décrite par
+Z. Galil (« Efficient algorithms for finding maximum matching in graphs », 1986) et popularisée
+par l'implémentation de référence de J. van Rantwijk.
+
+Les variables duales sont doublées pour que tous les calculs restent entiers quand les poids
+sont entiers : la marge (« slack ») d'une arête (i, j) vaut `dual[i] + dual[j] - 2 * poids`.
+"""
+
+
+def couplage_poids_maximum(p_aretes: list[tuple[int, int, int]], p_cardinalite_maximale: bool = False) -> list[int]:
+    """
+    Calcule un couplage de poids total maximum.
+
+    Args:
+        p_aretes (list[tuple[int, int, int]]): Arêtes (i, j, poids), les sommets étant numérotés à partir de 0.
+                                              Une seule arête par paire de sommets, sans boucle.
+        p_cardinalite_maximale (bool, optional): Si True, cherche le couplage de poids maximum parmi
+                                                 ceux qui ont le plus grand nombre d'arêtes. Par défaut, False.
+
+    Returns:
+        list[int]: `partenaire[i]` est le sommet couplé à i, ou -1 si i n'est pas couplé.
+    """
+
+    if not p_aretes:
+        return []
+
+    aretes = p_aretes
+    i_nombre_aretes = len(aretes)
+    i_nombre_sommets = 0
+    for i, j, poids in aretes:
+        i_nombre_sommets = max(i_nombre_sommets, i + 1, j + 1)
+    n = i_nombre_sommets
+
+    poids_maximum = max(0, max(poids for i, j, poids in aretes))
+
+    # extremite[p] : sommet à l'extrémité p ; l'arête k a pour extrémités 2k et 2k + 1
+    extremite = [aretes[p // 2][p % 2] for p in range(2 * i_nombre_aretes)]
+
+    # voisins[v] : extrémités « distantes » des arêtes incidentes à v
+    voisins = [[] for _ in range(n)]
+    for k, (i, j, poids) in enumerate(aretes):
+        voisins[i].append(2 * k + 1)
+        voisins[j].append(2 * k)
+
+    # partenaire[v] : extrémité distante de l'arête de couplage de v (puis le sommet lui-même à la fin)
+    partenaire = n * [-1]
+
+    # Étiquette d'un sommet ou d'une fleur de plus haut niveau : 0 (libre), 1 (S) ou 2 (T)
+    etiquette = (2 * n) * [0]
+    # Extrémité par laquelle le sommet ou la fleur a reçu son étiquette
+    fin_etiquette = (2 * n) * [-1]
+    # Fleur de plus haut niveau contenant chaque sommet
+    dans_fleur = list(range(n))
+    parent_fleur = (2 * n) * [-1]
+    enfants_fleur = (2 * n) * [None]
+    base_fleur = list(range(n)) + n * [-1]
+    # Extrémités des arêtes reliant les enfants successifs d'une fleur
+    extremites_fleur = (2 * n) * [None]
+    # Arête de marge minimale vers un sommet S (voir Galil)
+    meilleure_arete = (2 * n) * [-1]
+    meilleures_aretes_fleur = (2 * n) * [None]
+    fleurs_libres = list(range(n, 2 * n))
+    dual = n * [poids_maximum] + n * [0]
+    arete_autorisee = i_nombre_aretes * [False]
+    file = []
+
+    def marge(k):
+        i, j, poids = aretes[k]
+        return dual[i] + dual[j] - 2 * poids
+
+    def feuilles(b):
+        # Sommets contenus dans la fleur b (parcours itératif : les fleurs peuvent être très imbriquées)
+        if b < n:
+            return [b]
+        l_feuilles = []
+        pile = [b]
+        while pile:
+            t = pile.pop()
+            if t < n:
+                l_feuilles.append(t)
+            else:
+                pile.extend(enfants_fleur[t])
+        return l_feuilles
+
+    def etiqueter(w, t, p):
+        # Donne l'étiquette t au sommet w (et à sa fleur), atteint par l'extrémité p
+        b = dans_fleur[w]
+        etiquette[w] = etiquette[b] = t
+        fin_etiquette[w] = fin_etiquette[b] = p
+        meilleure_arete[w] = meilleure_arete[b] = -1
+        if t == 1:
+            file.extend(feuilles(b))
+        elif t == 2:
+            base = base_fleur[b]
+            etiqueter(extremite[partenaire[base]], 1, partenaire[base] ^ 1)
+
+    def chercher_fleur(v, w):
+        # Remonte les arbres alternés depuis v et w : retourne la base de la nouvelle fleur, ou -1 (chemin augmentant)
+        chemin = []
+        base = -1
+        while v != -1 or w != -1:
+            b = dans_fleur[v]
+            if etiquette[b] & 4:
+                base = base_fleur[b]
+                break
+            chemin.append(b)
+            etiquette[b] = 5
+            if fin_etiquette[b] == -1:
+                v = -1
+            else:
+                v = extremite[fin_etiquette[b]]
+                b = dans_fleur[v]
+                v = extremite[fin_etiquette[b]]
+            if w != -1:
+                v, w = w, v
+        for b in chemin:
+            etiquette[b] = 1
+        return base
+
+    def ajouter_fleur(base, k):
+        # Contracte en une nouvelle fleur le cycle formé par l'arête k et les arbres alternés
+        v, w, poids = aretes[k]
+        bb = dans_fleur[base]
+        bv = dans_fleur[v]
+        bw = dans_fleur[w]
+        b = fleurs_libres.pop()
+        base_fleur[b] = base
+        parent_fleur[b] = -1
+        parent_fleur[bb] = b
+        enfants_fleur[b] = chemin = []
+        extremites_fleur[b] = extremites = []
+        while bv != bb:
+            parent_fleur[bv] = b
+            chemin.append(bv)
+            extremites.append(fin_etiquette[bv])
+            v = extremite[fin_etiquette[bv]]
+            bv = dans_fleur[v]
+        chemin.append(bb)
+        chemin.reverse()
+        extremites.reverse()
+        extremites.append(2 * k)
+        while bw != bb:
+            parent_fleur[bw] = b
+            chemin.append(bw)
+            extremites.append(fin_etiquette[bw] ^ 1)
+            w = extremite[fin_etiquette[bw]]
+            bw = dans_fleur[w]
+        etiquette[b] = 1
+        fin_etiquette[b] = fin_etiquette[bb]
+        dual[b] = 0
+        for v in feuilles(b):
+            if etiquette[dans_fleur[v]] == 2:
+                # Les anciens sommets T deviennent S dans la fleur
+                file.append(v)
+            dans_fleur[v] = b
+        # Meilleures arêtes de la fleur vers chaque fleur S voisine
+        meilleure_vers = (2 * n) * [-1]
+        for bv in chemin:
+            if meilleures_aretes_fleur[bv] is None:
+                listes_voisins = [[p // 2 for p in voisins[v]] for v in feuilles(bv)]
+            else:
+                listes_voisins = [meilleures_aretes_fleur[bv]]
+            for liste_voisins in listes_voisins:
+                for k in liste_voisins:
+                    i, j, poids = aretes[k]
+                    if dans_fleur[j] == b:
+                        i, j = j, i
+                    bj = dans_fleur[j]
+                    if (
+                        bj != b
+                        and etiquette[bj] == 1
+                        and (meilleure_vers[bj] == -1 or marge(k) < marge(meilleure_vers[bj]))
+                    ):
+                        meilleure_vers[bj] = k
+            meilleures_aretes_fleur[bv] = None
+            meilleure_arete[bv] = -1
+        meilleures_aretes_fleur[b] = [k for k in meilleure_vers if k != -1]
+        meilleure_arete[b] = -1
+        for k in meilleures_aretes_fleur[b]:
+            if meilleure_arete[b] == -1 or marge(k) < marge(meilleure_arete[b]):
+                meilleure_arete[b] = k
+
+    def executer_sans_recursion(etapes, *args):
+        # Exécute un générateur d'étapes qui produit ses appels récursifs au lieu de les faire :
+        # la profondeur d'imbrication des fleurs n'est plus limitée par la pile de Python
+        pile = [etapes(*args)]
+        while pile:
+            for args_appel in pile[-1]:
+                pile.append(etapes(*args_appel))
+                break
+            else:
+                pile.pop()
+
+    def developper_fleur(b, b_fin_etape):
+        executer_sans_recursion(etapes_developper_fleur, b, b_fin_etape)
+
+    def etapes_developper_fleur(b, b_fin_etape):
+        # Défait la fleur b ; en cours d'étape, ré-étiquette ses enfants le long du chemin alterné
+        for s in enfants_fleur[b]:
+            parent_fleur[s] = -1
+            if s < n:
+                dans_fleur[s] = s
+            elif b_fin_etape and dual[s] == 0:
+                yield s, b_fin_etape
+            else:
+                for v in feuilles(s):
+                    dans_fleur[v] = s
+        if not b_fin_etape and etiquette[b] == 2:
+            enfant_entree = dans_fleur[extremite[fin_etiquette[b] ^ 1]]
+            j = enfants_fleur[b].index(enfant_entree)
+            if j & 1:
+                j -= len(enfants_fleur[b])
+                pas = 1
+                decalage = 0
+            else:
+                pas = -1
+                decalage = 1
+            p = fin_etiquette[b]
+            while j != 0:
+                etiquette[extremite[p ^ 1]] = 0
+                etiquette[extremite[extremites_fleur[b][j - decalage] ^ decalage ^ 1]] = 0
+                etiqueter(extremite[p ^ 1], 2, p)
+                arete_autorisee[extremites_fleur[b][j - decalage] // 2] = True
+                j += pas
+                p = extremites_fleur[b][j - decalage] ^ decalage
+                arete_autorisee[p // 2] = True
+                j += pas
+            bv = enfants_fleur[b][j]
+            etiquette[extremite[p ^ 1]] = etiquette[bv] = 2
+            fin_etiquette[extremite[p ^ 1]] = fin_etiquette[bv] = p
+            meilleure_arete[bv] = -1
+            j += pas
+            while enfants_fleur[b][j] != enfant_entree:
+                bv = enfants_fleur[b][j]
+                if etiquette[bv] == 1:
+                    j += pas
+                    continue
+                v = -1
+                for v in feuilles(bv):
+                    if etiquette[v] != 0:
+                        break
+                if etiquette[v] != 0:
+                    etiquette[v] = 0
+                    etiquette[extremite[partenaire[base_fleur[bv]]]] = 0
+                    etiqueter(v, 2, fin_etiquette[v])
+                j += pas
+        etiquette[b] = fin_etiquette[b] = -1
+        enfants_fleur[b] = extremites_fleur[b] = None
+        base_fleur[b] = -1
+        meilleures_aretes_fleur[b] = None
+        meilleure_arete[b] = -1
+        fleurs_libres.append(b)
+
+    def augmenter_fleur(b, v):
+        executer_sans_recursion(etapes_augmenter_fleur, b, v)
+
+    def etapes_augmenter_fleur(b, v):
+        # Inverse le couplage le long du chemin pair de la fleur b, de v jusqu'à sa base
+        t = v
+        while parent_fleur[t] != b:
+            t = parent_fleur[t]
+        if t >= n:
+            yield t, v
+        i = j = enfants_fleur[b].index(t)
+        if i & 1:
+            j -= len(enfants_fleur[b])
+            pas = 1
+            decalage = 0
+        else:
+            pas = -1
+            decalage = 1
+        while j != 0:
+            j += pas
+            t = enfants_fleur[b][j]
+            p = extremites_fleur[b][j - decalage] ^ decalage
+            if t >= n:
+                yield t, extremite[p]
+            j += pas
+            t = enfants_fleur[b][j]
+            if t >= n:
+                yield t, extremite[p ^ 1]
+            partenaire[extremite[p]] = p ^ 1
+            partenaire[extremite[p ^ 1]] = p
+        # v devient la base de la fleur
+        enfants_fleur[b] = enfants_fleur[b][i:] + enfants_fleur[b][:i]
+        extremites_fleur[b] = extremites_fleur[b][i:] + extremites_fleur[b][:i]
+        base_fleur[b] = base_fleur[enfants_fleur[b][0]]
+
+    def augmenter_couplage(k):
+        # Inverse le couplage le long du chemin augmentant passant par l'arête k
+        v, w, poids = aretes[k]
+        for s, p in ((v, 2 * k + 1), (w, 2 * k)):
+            while True:
+                bs = dans_fleur[s]
+                if bs >= n:
+                    augmenter_fleur(bs, s)
+                partenaire[s] = p
+                if fin_etiquette[bs] == -1:
+                    break
+                t = extremite[fin_etiquette[bs]]
+                bt = dans_fleur[t]
+                s = extremite[fin_etiquette[bt]]
+                j = extremite[fin_etiquette[bt] ^ 1]
+                if bt >= n:
+                    augmenter_fleur(bt, j)
+                partenaire[j] = fin_etiquette[bt]
+                p = fin_etiquette[bt] ^ 1
+
+    # Chaque étape cherche un chemin augmentant ; il y a au plus n étapes
+    for _ in range(n):
+        etiquette[:] = (2 * n) * [0]
+        meilleure_arete[:] = (2 * n) * [-1]
+        meilleures_aretes_fleur[n:] = n * [None]
+        arete_autorisee[:] = i_nombre_aretes * [False]
+        file[:] = []
+
+        for v in range(n):
+            if partenaire[v] == -1 and etiquette[dans_fleur[v]] == 0:
+                etiqueter(v, 1, -1)
+
+        b_augmente = False
+        while True:
+            # Exploration des arêtes de marge nulle depuis les sommets S
+            while file and not b_augmente:
+                v = file.pop()
+                for p in voisins[v]:
+                    k = p // 2
+                    w = extremite[p]
+                    if dans_fleur[v] == dans_fleur[w]:
+                        continue
+                    if not arete_autorisee[k]:
+                        marge_k = marge(k)
+                        if marge_k <= 0:
+                            arete_autorisee[k] = True
+                    if arete_autorisee[k]:
+                        if etiquette[dans_fleur[w]] == 0:
+                            etiqueter(w, 2, p ^ 1)
+                        elif etiquette[dans_fleur[w]] == 1:
+                            base = chercher_fleur(v, w)
+                            if base >= 0:
+                                ajouter_fleur(base, k)
+                            else:
+                                augmenter_couplage(k)
+                                b_augmente = True
+                                break
+                        elif etiquette[w] == 0:
+                            etiquette[w] = 2
+                            fin_etiquette[w] = p ^ 1
+                    elif etiquette[dans_fleur[w]] == 1:
+                        b = dans_fleur[v]
+                        if meilleure_arete[b] == -1 or marge_k < marge(meilleure_arete[b]):
+                            meilleure_arete[b] = k
+                    elif etiquette[w] == 0:
+                        if meilleure_arete[w] == -1 or marge_k < marge(meilleure_arete[w]):
+                            meilleure_arete[w] = k
+
+            if b_augmente:
+                break
+
+            # Mise à jour des variables duales : plus petite variation delta parmi 4 cas
+            type_delta = -1
+            delta = arete_delta = fleur_delta = None
+
+            if not p_cardinalite_maximale:
+                type_delta = 1
+                delta = min(dual[:n])
+
+            for v in range(n):
+                if etiquette[dans_fleur[v]] == 0 and meilleure_arete[v] != -1:
+                    d = marge(meilleure_arete[v])
+                    if type_delta == -1 or d < delta:
+                        delta = d
+                        type_delta = 2
+                        arete_delta = meilleure_arete[v]
+
+            for b in range(2 * n):
+                if parent_fleur[b] == -1 and etiquette[b] == 1 and meilleure_arete[b] != -1:
+                    marge_b = marge(meilleure_arete[b])
+                    d = marge_b // 2 if isinstance(marge_b, int) else marge_b / 2.0
+                    if type_delta == -1 or d < delta:
+                        delta = d
+                        type_delta = 3
+                        arete_delta = meilleure_arete[b]
+
+            for b in range(n, 2 * n):
+                if (
+                    base_fleur[b] >= 0
+                    and parent_fleur[b] == -1
+                    and etiquette[b] == 2
+                    and (type_delta == -1 or dual[b] < delta)
+                ):
+                    delta = dual[b]
+                    type_delta = 4
+                    fleur_delta = b
+
+            if type_delta == -1:
+                # Plus aucune amélioration possible (cardinalité maximale) : dernière mise à jour
+                type_delta = 1
+                delta = max(0, min(dual[:n]))
+
+            for v in range(n):
+                if etiquette[dans_fleur[v]] == 1:
+                    dual[v] -= delta
+                elif etiquette[dans_fleur[v]] == 2:
+                    dual[v] += delta
+            for b in range(n, 2 * n):
+                if base_fleur[b] >= 0 and parent_fleur[b] == -1:
+                    if etiquette[b] == 1:
+                        dual[b] += delta
+                    elif etiquette[b] == 2:
+                        dual[b] -= delta
+
+            if type_delta == 1:
+                # Optimum atteint
+                break
+            elif type_delta == 2:
+                arete_autorisee[arete_delta] = True
+                i, j, poids = aretes[arete_delta]
+                if etiquette[dans_fleur[i]] == 0:
+                    i, j = j, i
+                file.append(i)
+            elif type_delta == 3:
+                arete_autorisee[arete_delta] = True
+                i, j, poids = aretes[arete_delta]
+                file.append(i)
+            else:
+                developper_fleur(fleur_delta, False)
+
+        if not b_augmente:
+            break
+
+        # Fin d'étape : les fleurs S de variable duale nulle sont défaites
+        for b in range(n, 2 * n):
+            if parent_fleur[b] == -1 and base_fleur[b] >= 0 and etiquette[b] == 1 and dual[b] == 0:
+                developper_fleur(b, True)
+
+    for v in range(n):
+        if partenaire[v] >= 0:
+            partenaire[v] = extremite[partenaire[v]]
+
+    return partenaire
@@ -0,0 +1,195 @@
+from models.paires_jouees import PairesJouees
+
+
+class EtatAppariement:
+    """
+    État d'appariement d'un tournoi, tenu à jour tour après tour.
+
+    Il contient tout ce dont le `MoteurAppariement` a besoin pour apparier le tour suivant, sans
+    reparcourir l'historique des tours et des matchs :
+    - les scores des joueurs (et donc leurs groupes de score, voir `groupes_de_score`) ;
+    - les paires déjà jouées (`PairesJouees`) ;
+    - le solde de couleurs (blancs - noirs) et la dernière couleur de chaque joueur ;
+    - l'historique des flottements de chaque joueur, un caractère par tour : "B" s'il a rencontré un
+      joueur de score inférieur (flottant vers le bas), "H" de score supérieur, "X" s'il a été exempté,
+      "=" sinon ;
+    - les joueurs déjà exemptés.
+
+    Chaque tour terminé y est intégré par `integrer_tour`, en un temps proportionnel au nombre de
+    joueurs. L'état est enregistré à côté du tournoi (`data/appariements/tournoi_<id>.json`, ou une
+    table de la base SQLite) et reconstruit à partir du tournoi s'il est absent ou périmé.
+    """
+
+    # Version du format enregistré : un état d'une autre version est reconstruit
+    version_format: int = 1
+
+    def __init__(self, p_joueurs=()) -> None:
+        """
+        Initialise un état vide (aucun tour joué) pour les joueurs inscrits.
+
+        Args:
+            p_joueurs (iterable, optional): Identifiants des joueurs inscrits (convertis en str).
+        """
+        self.d_scores = {str(id_joueur): 0 for id_joueur in p_joueurs}
+        self.o_paires_jouees = PairesJouees(self.d_scores)
+        self.d_soldes_couleurs = dict.fromkeys(self.d_scores, 0)
+        self.d_dernieres_couleurs = {}
+        self.d_flottements = dict.fromkeys(self.d_scores, "")
+        self.s_exemptes = set()
+        self.i_tours_integres = 0
+
+    #
+    @classmethod
+    def depuis_document(cls, p_tournoi: dict) -> "EtatAppariement":
+        """
+        Reconstruit l'état à partir du document d'un tournoi, en rejouant ses tours terminés.
+
+        Args:
+            p_tournoi (dict): Document du tournoi (`liste_joueurs` : identifiant -> score, `liste_tours`).
+
+        Returns:
+            EtatAppariement: L'état après le dernier tour terminé.
+        """
+
+        o_etat = cls(p_tournoi["liste_joueurs"])
+
+        for d_tour in p_tournoi.get("liste_tours", []):
+            if d_tour["statut"] == "Terminé":
+                o_etat.integrer_tour(d_tour["liste_matchs"])
+
+        # Les scores du tournoi font foi
+        o_etat.d_scores = {str(id_joueur): score for id_joueur, score in p_tournoi["liste_joueurs"].items()}
+
+        return o_etat
+
+    #
+    def integrer_tour(self, p_matchs: list[dict]) -> None:
+        """
+        Intègre un tour terminé : rencontres, couleurs, flottements, exemptions et scores.
+
+        Args:
+            p_matchs (list[dict]): Matchs du tour, avec `joueur_blanc`, `joueur_noir`,
+                                   `score_blanc` et `score_noir`.
+
+        Returns:
+            None
+        """
+
+        s_joueurs_tour = set()
+
+        for d_match in p_matchs:
+            id_blanc, id_noir = str(d_match["joueur_blanc"]), str(d_match["joueur_noir"])
+            s_joueurs_tour.update((id_blanc, id_noir))
+
+            self.o_paires_jouees.ajouter(id_blanc, id_noir)
+            self.d_soldes_couleurs[id_blanc] = self.d_soldes_couleurs.get(id_blanc, 0) + 1
+            self.d_soldes_couleurs[id_noir] = self.d_soldes_couleurs.get(id_noir, 0) - 1
+            self.d_dernieres_couleurs[id_blanc] = "blanc"
+            self.d_dernieres_couleurs[id_noir] = "noir"
+
+            # Flottements, d'après les scores avant le tour
+            f_score_blanc = self.d_scores.get(id_blanc, 0)
+            f_score_noir = self.d_scores.get(id_noir, 0)
+            if f_score_blanc > f_score_noir:
+                s_flottement_blanc, s_flottement_noir = "B", "H"
+            elif f_score_blanc < f_score_noir:
+                s_flottement_blanc, s_flottement_noir = "H", "B"
+            else:
+                s_flottement_blanc = s_flottement_noir = "="
+            self.d_flottements[id_blanc] = self.d_flottements.get(id_blanc, "") + s_flottement_blanc
+            self.d_flottements[id_noir] = self.d_flottements.get(id_noir, "") + s_flottement_noir
+
+        for d_match in p_matchs:
+            id_blanc, id_noir = str(d_match["joueur_blanc"]), str(d_match["joueur_noir"])
+            self.d_scores[id_blanc] = self.d_scores.get(id_blanc, 0) + d_match.get("score_blanc", 0)
+            self.d_scores[id_noir] = self.d_scores.get(id_noir, 0) + d_match.get("score_noir", 0)
+
+        # Un joueur inscrit absent du tour a été exempté
+        for id_joueur in self.d_scores:
+            if id_joueur not in s_joueurs_tour:
+                self.s_exemptes.add(id_joueur)
+                self.d_flottements[id_joueur] = self.d_flottements.get(id_joueur, "") + "X"
+
+        self.i_tours_integres += 1
+
+    #
+    def est_a_jour(self, p_tours_termines: int, p_nombre_joueurs: int) -> bool:
+        """
+        Indique si l'état correspond au tournoi : même nombre de tours terminés et de joueurs inscrits.
+
+        Les inscriptions sont closes dès le premier tour : le nombre de joueurs suffit à les vérifier.
+
+        Args:
+            p_tours_termines (int): Nombre de tours terminés du tournoi.
+            p_nombre_joueurs (int): Nombre de joueurs inscrits.
+
+        Returns:
+            bool: True si l'état peut être utilisé tel quel.
+        """
+
+        return self.i_tours_integres == p_tours_termines and len(self.d_scores) == p_nombre_joueurs
+
+    #
+    def groupes_de_score(self) -> dict:
+        """
+        Regroupe les joueurs par score.
+
+        Returns:
+            dict: Score -> identifiants des joueurs ayant ce score, du meilleur score au plus faible.
+        """
+
+        d_groupes = {}
+        for id_joueur, score in sorted(self.d_scores.items(), key=lambda t_score: (-t_score[1], int(t_score[0]))):
+            d_groupes.setdefault(score, []).append(id_joueur)
+
+        return d_groupes
+
+    #
+    def vers_dict(self) -> dict:
+        """
+        Exporte l'état dans un dictionnaire sérialisable en JSON.
+
+        Returns:
+            dict: L'état, avec sa version de format.
+        """
+
+        return {
+            "version": self.version_format,
+            "tours_integres": self.i_tours_integres,
+            "scores": self.d_scores,
+            "paires_jouees": self.o_paires_jouees.vers_dict(),
+            "soldes_couleurs": self.d_soldes_couleurs,
+            "dernieres_couleurs": self.d_dernieres_couleurs,
+            "flottements": self.d_flottements,
+            "exemptes": sorted(self.s_exemptes, key=int),
+            "groupes_de_score": [
+                {"score": score, "joueurs": l_joueurs} for score, l_joueurs in self.groupes_de_score().items()
+            ],
+        }
+
+    #
+    @classmethod
+    def depuis_dict(cls, p_donnees: dict) -> "EtatAppariement | None":
+        """
+        Recrée un état exporté par `vers_dict`.
+
+        Args:
+            p_donnees (dict): Les données exportées.
+
+        Returns:
+            EtatAppariement | None: L'état, ou None si les données sont d'une autre version.
+        """
+
+        if not p_donnees or p_donnees.get("version") != cls.version_format:
+            return None
+
+        o_etat = cls()
+        o_etat.i_tours_integres = p_donnees["tours_integres"]
+        o_etat.d_scores = p_donnees["scores"]
+        o_etat.o_paires_jouees = PairesJouees.depuis_dict(p_donnees["paires_jouees"])
+        o_etat.d_soldes_couleurs = p_donnees["soldes_couleurs"]
+        o_etat.d_dernieres_couleurs = p_donnees["dernieres_couleurs"]
+        o_etat.d_flottements = p_donnees["flottements"]
+        o_etat.s_exemptes = set(p_donnees["exemptes"])
+
+        return o_etat
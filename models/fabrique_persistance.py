@@ -0,0 +1,35 @@
+from models.gestionnaire_persistance import GestionnairePersistance
+from models.gestionnaire_persistance_sqlite import GestionnairePersistanceSqlite
+import os
+
+# Variable d'environnement qui choisit le stockage : "json" (TinyDB, par défaut) ou "sqlite"
+VARIABLE_STOCKAGE = "LETS_ROQUE_STOCKAGE"
+
+GESTIONNAIRES_PERSISTANCE = {
+    "json": GestionnairePersistance,
+    "sqlite": GestionnairePersistanceSqlite,
+}
+
+
+def creer_gestionnaire_persistance() -> GestionnairePersistance:
+    """
+    Crée le gestionnaire de persistance correspondant au stockage configuré.
+
+    Le stockage est choisi par la variable d'environnement `LETS_ROQUE_STOCKAGE`
+    ("json" par défaut, ou "sqlite").
+
+    Returns:
+        GestionnairePersistance: Le gestionnaire de persistance (TinyDB ou SQLite).
+
+    Raises:
+        ValueError: Si le stockage configuré n'existe pas.
+    """
+
+    s_stockage = os.environ.get(VARIABLE_STOCKAGE, "json").strip().lower()
+
+    if s_stockage not in GESTIONNAIRES_PERSISTANCE:
+        raise ValueError(
+            f"Stockage inconnu : {s_stockage} (valeurs possibles : {', '.join(GESTIONNAIRES_PERSISTANCE)})"
+        )
+
+    return GESTIONNAIRES_PERSISTANCE[s_stockage]()
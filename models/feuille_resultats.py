@@ -0,0 +1,290 @@
+from models.lecteur_csv import LecteurCsv
+from models.match import Match
+from pathlib import Path
+import re
+
+
+class FeuilleResultats:
+    """
+    Rassemble et valide en une seule passe tous les résultats d'un tour, lus dans un fichier ou saisis d'un bloc.
+
+    Chaque résultat désigne son match :
+    - par le numéro de l'échiquier (numéro du match dans le tour) ;
+    - ou par l'identifiant national d'un joueur : celui du joueur blanc, du joueur noir, ou de l'un des deux.
+
+    Un résultat se note toujours du point de vue des blancs : "1-0", "0-1", "1/2-1/2" (ou "½-½", "0.5-0.5", "=").
+    La saisie d'un bloc accepte aussi les codes de la saisie match par match : "1" (victoire des blancs),
+    "2" (victoire des noirs), "0" (nulle) ; une feuille de résultats ne les accepte pas, un score isolé
+    (1 ou 0) y étant ambigu.
+
+    Toutes les erreurs sont relevées (échiquier ou joueur inconnu, joueur à la mauvaise couleur,
+    match donné deux fois, résultat illisible, match sans résultat) : les résultats ne sont enregistrés
+    que si la feuille n'en contient aucune.
+    """
+
+    # Résultat noté -> (score des blancs, score des noirs)
+    resultats: dict = {
+        "1-0": (1, 0),
+        "0-1": (0, 1),
+        "1/2-1/2": (0.5, 0.5),
+        "½-½": (0.5, 0.5),
+        "0.5-0.5": (0.5, 0.5),
+        "0,5-0,5": (0.5, 0.5),
+        "=": (0.5, 0.5),
+    }
+    # Codes de la saisie match par match, acceptés seulement dans la saisie d'un bloc -> (score blanc, score noir)
+    codes_saisie: dict = {
+        "1": (1, 0),
+        "2": (0, 1),
+        "0": (0.5, 0.5),
+    }
+    # En-têtes reconnus (normalisés par `LecteurCsv.normaliser_entete`) -> champ de la feuille
+    colonnes: dict = {
+        "echiquier": "echiquier",
+        "table": "echiquier",
+        "board": "echiquier",
+        "match": "echiquier",
+        "numero": "echiquier",
+        "n": "echiquier",
+        "no": "echiquier",
+        "ine blanc": "ine_blanc",
+        "blanc": "ine_blanc",
+        "blancs": "ine_blanc",
+        "white": "ine_blanc",
+        "ine noir": "ine_noir",
+        "noir": "ine_noir",
+        "noirs": "ine_noir",
+        "black": "ine_noir",
+        "ine": "ine",
+        "joueur": "ine",
+        "identifiant national": "ine",
+        "resultat": "resultat",
+        "result": "resultat",
+    }
+    # Champs qui désignent le match d'une ligne (au moins un doit figurer dans l'en-tête)
+    champs_match: frozenset = frozenset({"echiquier", "ine_blanc", "ine_noir", "ine"})
+    # Saisie groupée : "5=1-0" (échiquier 5) ou un résultat seul, attribué à l'échiquier suivant
+    regex_saisie = re.compile(r"^(?:(\d+)=)?(.+)$")
+
+    def __init__(self, p_matchs: list[Match]) -> None:
+        """
+        Prépare la feuille des résultats d'un tour.
+
+        Args:
+            p_matchs (list[Match]): Matchs du tour en cours, dans l'ordre du tour, avec leurs joueurs.
+        """
+        self.l_matchs = p_matchs
+        # Numéro de l'échiquier -> position du match dans le tour
+        self.d_echiquiers = {int(o_match.identifiant): i_position for i_position, o_match in enumerate(p_matchs)}
+        # Identifiant national (majuscules) -> (position du match, couleur)
+        self.d_joueurs = {}
+        for i_position, o_match in enumerate(p_matchs):
+            self.d_joueurs[o_match.joueur_blanc.identifiant_national_echec.upper()] = (i_position, "blanc")
+            self.d_joueurs[o_match.joueur_noir.identifiant_national_echec.upper()] = (i_position, "noir")
+
+        # Scores (blanc, noir) de chaque match, None tant qu'il n'a pas de résultat
+        self.l_scores = [None] * len(p_matchs)
+        # Ligne (ou position dans la saisie) qui a donné le résultat de chaque match
+        self.l_origines = [None] * len(p_matchs)
+        # (ligne ou position, message) de chaque erreur relevée
+        self.l_erreurs = []
+        # Ce que désigne l'origine d'un résultat : "ligne" (fichier) ou "position" (saisie)
+        self.s_origine = "ligne"
+
+    #
+    def lire_fichier(self, p_fichier: str | Path) -> None:
+        """
+        Lit une feuille de résultats CSV ou TSV, avec un en-tête (voir `colonnes`).
+
+        Args:
+            p_fichier (str | Path): Chemin du fichier.
+
+        Returns:
+            None
+
+        Raises:
+            FileNotFoundError: Si le fichier n'existe pas.
+            ValueError: Si le fichier est vide, illisible, ou s'il lui manque la colonne des résultats
+                        ou une colonne qui désigne le match.
+        """
+
+        self.s_origine = "ligne"
+        o_lecteur = LecteurCsv(p_fichier)
+        for i_numero, l_valeurs in o_lecteur.lignes(self.colonnes, ("resultat",)):
+            if not self.champs_match.intersection(o_lecteur.l_champs):
+                raise ValueError(
+                    f"Le fichier {Path(p_fichier).name} doit désigner chaque match par une colonne Échiquier "
+                    "ou par l'identifiant national d'un joueur (Blanc, Noir ou INE)."
+                )
+            if l_valeurs is None:
+                self.l_erreurs.append((i_numero, "Ligne incomplète"))
+                continue
+
+            d_ligne = dict(zip(o_lecteur.l_champs, l_valeurs))
+            i_position = self._trouver_match(i_numero, d_ligne)
+            if i_position is not None:
+                self._noter(i_numero, i_position, d_ligne["resultat"])
+
+    #
+    def lire_saisie(self, p_saisie: str) -> None:
+        """
+        Lit tous les résultats d'un tour saisis sur une ligne (écran de saisie en grille).
+
+        Les résultats sont séparés par des espaces, virgules ou points-virgules. Un résultat seul va à
+        l'échiquier suivant (le premier au départ) ; "N=résultat" va à l'échiquier N et la suite reprend
+        après lui. Une suite de codes 1, 2 et 0 ("1021") donne un résultat par échiquier, si elle constitue
+        toute la saisie et compte exactement un code par échiquier ; ailleurs, "10" ou "01" est refusé.
+
+        Args:
+            p_saisie (str): Résultats saisis.
+
+        Returns:
+            None
+        """
+
+        self.s_origine = "position"
+        l_numeros = sorted(self.d_echiquiers)
+        i_suivant = 0
+
+        # "1021" : un code par échiquier, à la suite, seulement s'il y en a autant que d'échiquiers
+        s_saisie = p_saisie.strip()
+        if len(s_saisie) > 1 and len(s_saisie) == len(l_numeros) and set(s_saisie) <= set(self.codes_saisie):
+            for i_position, s_code in enumerate(s_saisie, start=1):
+                self._noter(i_position, self.d_echiquiers[l_numeros[i_position - 1]], s_code)
+            return
+
+        for i_element, s_element in enumerate(re.split(r"[\s,;]+", s_saisie), start=1):
+            if not s_element:
+                continue
+            s_numero, s_resultat = self.regex_saisie.match(s_element).groups()
+
+            if s_numero is not None:
+                if int(s_numero) not in self.d_echiquiers:
+                    self.l_erreurs.append((i_element, f"Échiquier {s_numero} inconnu"))
+                    continue
+                i_suivant = l_numeros.index(int(s_numero))
+
+            if len(s_resultat) > 1 and set(s_resultat) <= set(self.codes_saisie):
+                self.l_erreurs.append(
+                    (i_element, f"Suite de codes {s_resultat!r} refusée : seule, elle doit compter "
+                                f"un code par échiquier ({len(l_numeros)})")
+                )
+                i_suivant += 1
+                continue
+            if i_suivant >= len(l_numeros):
+                self.l_erreurs.append((i_element, f"Trop de résultats : le tour n'a que {len(l_numeros)} matchs"))
+                break
+            self._noter(i_element, self.d_echiquiers[l_numeros[i_suivant]], s_resultat)
+            i_suivant += 1
+
+    #
+    def erreurs(self) -> list[tuple]:
+        """
+        Retourne toutes les erreurs de la feuille, y compris les matchs restés sans résultat.
+
+        Returns:
+            list[tuple]: (ligne ou position dans la saisie, message) ; la ligne vaut None pour un match sans résultat.
+        """
+
+        return self.l_erreurs + [
+            (None, f"Échiquier {o_match.identifiant} sans résultat")
+            for o_match, t_scores in zip(self.l_matchs, self.l_scores)
+            if t_scores is None
+        ]
+
+    #
+    def resultats_matchs(self) -> list[dict]:
+        """
+        Retourne les résultats de tous les matchs, dans l'ordre du tour, pour `enregistrer_resultat_match`.
+
+        À n'appeler que si `erreurs` ne retourne aucune erreur.
+
+        Returns:
+            list[dict]: Pour chaque match, "score_blanc", "score_noir" et "statut" ("Terminé").
+        """
+
+        return [
+            {"score_blanc": f_score_blanc, "score_noir": f_score_noir, "statut": "Terminé"}
+            for f_score_blanc, f_score_noir in self.l_scores
+        ]
+
+    #
+    # METHODES PRIVEES
+    #
+    def _trouver_match(self, p_ligne: int, p_valeurs: dict) -> int | None:
+        """
+        Retrouve le match désigné par une ligne du fichier et vérifie la cohérence des colonnes remplies.
+
+        Args:
+            p_ligne (int): Numéro de la ligne.
+            p_valeurs (dict): Champ -> valeur de la ligne.
+
+        Returns:
+            int | None: La position du match dans le tour, ou None si la ligne est en erreur.
+        """
+
+        l_positions = []
+
+        s_echiquier = p_valeurs.get("echiquier", "")
+        if s_echiquier:
+            if not s_echiquier.isdigit() or int(s_echiquier) not in self.d_echiquiers:
+                self.l_erreurs.append((p_ligne, f"Échiquier {s_echiquier} inconnu"))
+                return None
+            l_positions.append(self.d_echiquiers[int(s_echiquier)])
+
+        for s_champ, s_couleur in (("ine_blanc", "blanc"), ("ine_noir", "noir"), ("ine", None)):
+            s_identifiant = p_valeurs.get(s_champ, "").upper()
+            if not s_identifiant:
+                continue
+            t_joueur = self.d_joueurs.get(s_identifiant)
+            if t_joueur is None:
+                self.l_erreurs.append((p_ligne, f"Le joueur {s_identifiant} ne joue pas ce tour"))
+                return None
+            if s_couleur is not None and t_joueur[1] != s_couleur:
+                self.l_erreurs.append(
+                    (p_ligne, f"Le joueur {s_identifiant} a les {t_joueur[1]}s, pas les {s_couleur}s")
+                )
+                return None
+            l_positions.append(t_joueur[0])
+
+        if not l_positions:
+            self.l_erreurs.append((p_ligne, "Aucun échiquier ni joueur indiqué"))
+            return None
+        if len(set(l_positions)) > 1:
+            self.l_erreurs.append((p_ligne, "L'échiquier et les joueurs indiqués ne désignent pas le même match"))
+            return None
+
+        return l_positions[0]
+
+    #
+    def _noter(self, p_origine: int, p_position: int, p_resultat: str) -> None:
+        """
+        Note le résultat d'un match, s'il est lisible et si le match n'en a pas déjà un.
+
+        Args:
+            p_origine (int): Ligne du fichier ou position dans la saisie.
+            p_position (int): Position du match dans le tour.
+            p_resultat (str): Résultat noté.
+
+        Returns:
+            None
+        """
+
+        i_echiquier = self.l_matchs[p_position].identifiant
+
+        s_resultat = p_resultat.replace(" ", "")
+        t_scores = self.resultats.get(s_resultat)
+        if t_scores is None and self.s_origine == "position":
+            t_scores = self.codes_saisie.get(s_resultat)
+        if t_scores is None:
+            self.l_erreurs.append((p_origine, f"Résultat illisible pour l'échiquier {i_echiquier} : {p_resultat!r}"))
+            return
+
+        if self.l_scores[p_position] is not None:
+            self.l_erreurs.append(
+                (p_origine, f"Échiquier {i_echiquier} déjà noté ({self.s_origine} {self.l_origines[p_position]})")
+            )
+            return
+
+        self.l_scores[p_position] = t_scores
+        self.l_origines[p_position] = p_origine
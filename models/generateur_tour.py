@@ -0,0 +1,190 @@
+from models.match import Match
+from models.moteur_appariement import MoteurAppariement
+from models.tour import Tour
+from models.tournoi import Tournoi
+from datetime import datetime
+
+
+class GenerateurTour:
+    """
+    Crée le tour suivant d'un tournoi, l'apparie et l'enregistre, sans interface.
+
+    - Le premier tour est tiré au sort avec le générateur tiré de la graine du tournoi : le même tournoi
+      donne toujours le même premier tour (voir `RejeuTournoi`).
+    - Les tours suivants sont appariés par le `MoteurAppariement` à partir de l'état d'appariement du tournoi
+      (scores, adversaires déjà rencontrés, couleurs, flottements, exemptions), tenu à jour à chaque fin de tour.
+
+    Seuls l'en-tête du tournoi (`recuperer_entete_tournoi`), l'état d'appariement et les joueurs appariés sont lus :
+    les tours déjà joués ne sont pas reconstruits, la création d'un tour dépend du nombre de joueurs
+    et non du nombre de tours déjà joués.
+
+    Utilisé par `TourControleur` (qui affiche ensuite les matchs) et par l'interface en ligne de commande.
+    Après `generer`, `id_joueur_exempte`, `i_tours_restants` et `i_tours_sans_revanche` décrivent l'appariement.
+    """
+
+    def __init__(self, p_gestionnaire_persistance) -> None:
+        """
+        Prépare la création des tours.
+
+        Args:
+            p_gestionnaire_persistance (GestionnairePersistance): Gestionnaire où lire et enregistrer les tournois.
+        """
+        self.o_gestionnaire_persistance = p_gestionnaire_persistance
+        # Identifiant du joueur exempté du dernier tour créé (nombre impair de joueurs), ou None
+        self.id_joueur_exempte = None
+        # Tours restant à apparier, celui-ci compris
+        self.i_tours_restants = 0
+        # Tours restants qui peuvent être appariés sans revanche, selon le moteur
+        self.i_tours_sans_revanche = 0
+
+    #
+    def numero_tour_suivant(self, p_entete_tournoi: dict) -> int:
+        """
+        Vérifie qu'un nouveau tour peut être créé et retourne son numéro.
+
+        Args:
+            p_entete_tournoi (dict): L'en-tête du tournoi, tel que retourné par `recuperer_entete_tournoi`.
+
+        Returns:
+            int: Le numéro du nouveau tour (1 pour le premier).
+
+        Raises:
+            ValueError: Si le tournoi a atteint son nombre de tours, n'a pas de joueurs
+                        ou a encore un tour en cours.
+        """
+
+        # Sans joueurs inscrits, le nombre de tours n'est pas encore défini
+        if p_entete_tournoi["nombre_joueurs"] == 0:
+            raise ValueError("Ce tournoi n'a pas encore de joueurs, veuillez inscrire des joueurs avant.")
+
+        if p_entete_tournoi["tours_joues"] >= int(p_entete_tournoi["nombre_tours"]):
+            raise ValueError("Ce tournoi a atteint son nombre maximal de tours.")
+
+        if p_entete_tournoi["tours_termines"] < p_entete_tournoi["tours_joues"]:
+            raise ValueError(
+                f"Le tournoi {p_entete_tournoi['nom_tournoi']} a encore un tour en cours : "
+                f"{p_entete_tournoi['tour_courant']}. Veuillez d'abord saisir les résultats des matchs."
+            )
+
+        return p_entete_tournoi["tours_joues"] + 1
+
+    #
+    def generer(self, p_identifiant_tournoi: str) -> Tour:
+        """
+        Crée le tour suivant du tournoi, génère ses matchs et l'enregistre.
+
+        Args:
+            p_identifiant_tournoi (str): L'identifiant du tournoi.
+
+        Returns:
+            Tour: Le tour créé, avec ses matchs dans l'ordre des échiquiers ; son attribut `tournoi`
+                  ne porte que l'en-tête du tournoi (sans joueurs ni tours).
+
+        Raises:
+            ValueError: Si le tournoi n'existe pas ou ne peut pas accueillir de nouveau tour
+                        (voir `numero_tour_suivant`).
+        """
+
+        d_entete = self.o_gestionnaire_persistance.recuperer_entete_tournoi(p_identifiant_tournoi)
+        i_numero_tour = self.numero_tour_suivant(d_entete)
+
+        o_tournoi = Tournoi(
+            p_identifiant=d_entete["identifiant"],
+            p_nom_tournoi=d_entete["nom_tournoi"],
+            p_lieu_tournoi=d_entete["lieu_tournoi"],
+            p_date_debut_tournoi=d_entete["date_debut_tournoi"],
+            p_date_fin_tournoi=d_entete["date_fin_tournoi"],
+            p_nombre_tours=d_entete["nombre_tours"],
+            p_liste_tours=[],
+            p_liste_joueurs=[],
+        )
+        o_tour = Tour(
+            p_identifiant=i_numero_tour,
+            p_nom=f"Round {i_numero_tour}",
+            p_tournoi=o_tournoi,
+            p_date_heure_debut=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        )
+
+        # Tours qui suivront celui-ci : le moteur évite les appariements qui les rendraient impossibles sans revanche
+        i_tours_suivants = max(int(d_entete["nombre_tours"]) - i_numero_tour, 0)
+        self.i_tours_restants = i_tours_suivants + 1
+
+        if i_numero_tour == 1:
+            l_paires = self._apparier_premier_tour(o_tournoi)
+        else:
+            l_paires = self._apparier_tour_suivant(o_tournoi, i_tours_suivants)
+
+        for i_identifiant_match, (o_joueur_blanc, o_joueur_noir) in enumerate(l_paires, start=1):
+            o_tour.liste_matchs.append(Match(i_identifiant_match, o_joueur_blanc, o_joueur_noir))
+
+        o_tournoi.liste_tours.append(o_tour)
+        self.o_gestionnaire_persistance.enregistrer_tour_tournoi(o_tour, o_tournoi)
+
+        return o_tour
+
+    #
+    # METHODES PRIVEES
+    #
+    def _apparier_premier_tour(self, p_tournoi: Tournoi) -> list[tuple]:
+        """
+        Tire au sort les paires du premier tour avec le générateur du premier tour, tiré de la graine du tournoi.
+
+        Les joueurs inscrits et la graine sont lus dans le document du tournoi, qui n'a encore aucun tour.
+
+        Args:
+            p_tournoi (Tournoi): L'en-tête du tournoi (sa graine y est renseignée).
+
+        Returns:
+            list[tuple]: Les paires (joueur blanc, joueur noir) d'objets `Joueur`.
+        """
+
+        d_tournoi = self.o_gestionnaire_persistance.recuperer_document_tournoi(p_tournoi.identifiant)
+        p_tournoi.graine = d_tournoi.get("graine")
+
+        # Tournoi créé avant l'enregistrement des graines : sa graine est tirée et enregistrée maintenant
+        if p_tournoi.graine is None:
+            p_tournoi.graine = Tournoi.generer_graine()
+            self.o_gestionnaire_persistance.enregistrer_graine_tournoi(p_tournoi)
+
+        l_joueurs = [
+            self.o_gestionnaire_persistance.recuperer_objet_joueur(id_joueur)
+            for id_joueur in d_tournoi["liste_joueurs"]
+        ]
+        l_paires, o_joueur_exempte = MoteurAppariement.apparier_premier_tour(
+            l_joueurs, Tournoi.generateur_aleatoire(p_tournoi.graine, 1)
+        )
+        self.id_joueur_exempte = o_joueur_exempte.identifiant_tinydb if o_joueur_exempte is not None else None
+        # Le tirage au sort ne crée aucune revanche
+        self.i_tours_sans_revanche = self.i_tours_restants
+
+        return l_paires
+
+    #
+    def _apparier_tour_suivant(self, p_tournoi: Tournoi, p_tours_suivants: int) -> list[tuple]:
+        """
+        Apparie un tour suivant avec le `MoteurAppariement`, à partir de l'état d'appariement du tournoi.
+
+        Le moteur cherche un couplage parfait de poids maximum (scores proches, couleurs équilibrées), sans revanche
+        dès qu'un tel appariement existe, et vérifie que les tours suivants pourront encore être appariés.
+
+        Args:
+            p_tournoi (Tournoi): L'en-tête du tournoi.
+            p_tours_suivants (int): Nombre de tours qui suivront celui-ci.
+
+        Returns:
+            list[tuple]: Les paires (joueur blanc, joueur noir) d'objets `Joueur`.
+        """
+
+        o_etat_appariement = self.o_gestionnaire_persistance.recuperer_etat_appariement(p_tournoi.identifiant)
+
+        o_moteur_appariement = MoteurAppariement.depuis_etat(o_etat_appariement)
+        l_paires, self.id_joueur_exempte = o_moteur_appariement.apparier(p_tours_suivants)
+        self.i_tours_sans_revanche = o_moteur_appariement.i_tours_sans_revanche
+
+        return [
+            (
+                self.o_gestionnaire_persistance.recuperer_objet_joueur(id_joueur_blanc),
+                self.o_gestionnaire_persistance.recuperer_objet_joueur(id_joueur_noir),
+            )
+            for id_joueur_blanc, id_joueur_noir in l_paires
+        ]
@@ -3,9 +3,21 @@ from models.tournoi import Tournoi
 from models.joueur import Joueur
 from models.tour import Tour
 from models.match import Match
+from models.index_tournois import IndexTournois
+from models.index_joueurs import IndexJoueurs
+from models.import_joueurs import ImportJoueurs
+from models.journal_tournoi import JournalTournoi
+from models.etat_appariement import EtatAppariement
+from models.historique_joueurs import HistoriqueJoueurs
+from models.moteur_elo import MoteurElo
+from models.stockage_json import StockageJsonRapide
 from datetime import datetime
 from pathlib import Path
+import json
+import os
+import re
 import shutil
+import time
 
 
 class GestionnairePersistance:
@@ -17,8 +29,20 @@ class GestionnairePersistance:
     Cette classe permet d'enregistrer, de charger et de gérer les données
     des joueurs et des tournois dans des fichiers JSON. Elle assure également
     la création et la gestion des dossiers de stockage.
+
+    Les objets `Joueur` déjà reconstruits sont conservés dans une table d'identité
+    partagée par toutes les instances (attribut de classe), indexée par `identifiant_tinydb`.
     """
 
+    # Table d'identité des joueurs : identifiant TinyDB (str) -> objet Joueur
+    # Attributs de classe pour que les différents contrôleurs partagent le même cache
+    d_cache_joueurs: dict = {}
+    i_cache_joueurs_succes: int = 0
+    i_cache_joueurs_echecs: int = 0
+
+    # Nom des dossiers de sauvegarde : data_backup_YYYYMMDD_HHMMSS
+    regex_dossier_sauvegarde = re.compile(r"^data_backup_\d{8}_\d{6}$")
+
     def __init__(self):
         """
         Initialise le gestionnaire de persistance et crée les dossiers nécessaires.
@@ -28,14 +52,45 @@ class GestionnairePersistance:
         Si les dossiers n'existent pas, ils sont créés automatiquement.
 
         Attributs créés:
-            db_joueurs (TinyDB): Base de données TinyDB stockant les informations des joueurs.
+            fichier_joueurs (str): Chemin du fichier JSON des joueurs.
+            db_joueurs (TinyDB): Base de données TinyDB stockant les informations des joueurs
+                                 (stockage `StockageJsonRapide`, contenu gardé en mémoire entre deux lectures).
+            o_index_joueurs (IndexJoueurs): Index triés des joueurs, pour les lister page par page.
             dossier_projet (Path): Chemin racine du projet.
             dossier_source (Path): Dossier contenant toutes les données du projet.
             dossier_tournois (Path): Dossier dédié au stockage des fichiers des tournois.
             dossier_joueurs (Path): Dossier dédié au stockage des fichiers des joueurs.
             dossier_sauvegarde (Path): Dossier utilisé pour stocker les sauvegardes.
+            dossier_journaux (Path): Dossier des journaux de modifications des tournois.
+            dossier_appariements (Path): Dossier des états d'appariement des tournois.
+            o_index_tournois (IndexTournois): Index persistant identifiant de tournoi -> fichier.
+            o_historique_joueurs (HistoriqueJoueurs): Index persistant identifiant de joueur -> parties jouées.
+        """
+        # Les dossiers sont situés à partir de la racine du projet, quel que soit le dossier courant
+        self._initialiser_dossiers()
+
+        self.fichier_joueurs = str(self.dossier_joueurs / "joueurs_db.json")
+        self.db_joueurs = TinyDB(self.fichier_joueurs, storage=StockageJsonRapide, p_memoriser=True)
+        self.o_index_joueurs = IndexJoueurs(self.fichier_joueurs)
+
+        self.o_index_tournois = IndexTournois(
+            self.dossier_tournois,
+            self.dossier_source / "index_tournois.json",
+            self._lire_document_tournoi,
+        )
+        self.o_historique_joueurs = HistoriqueJoueurs(
+            self.dossier_source / "historique_joueurs.json",
+            self.dossier_journaux / "historique_joueurs.jsonl",
+        )
+
+    #
+    def _initialiser_dossiers(self) -> None:
+        """
+        Initialise les chemins des dossiers de stockage et les crée s'ils n'existent pas.
+
+        Returns:
+            None
         """
-        self.db_joueurs = TinyDB("data/players/joueurs_db.json")
 
         """Initialise les chemins des fichiers"""
         self.dossier_projet = Path(__file__).parent.parent  # Racine du projet
@@ -45,6 +100,10 @@ class GestionnairePersistance:
         self.dossier_tournois = self.dossier_source / "tournaments"
         self.dossier_joueurs = self.dossier_source / "players"
         self.dossier_sauvegarde = self.dossier_projet / "sauvegarde"
+        self.dossier_journaux = self.dossier_source / "journaux"
+        self.dossier_appariements = self.dossier_source / "appariements"
+        # Fichiers temporaires des écritures de tournois, hors du dossier surveillé par l'index des tournois
+        self.dossier_temporaire = self.dossier_source / ".tmp"
 
         # S'assure que les dossiers existent
         self.dossier_source.mkdir(parents=True, exist_ok=True)
@@ -55,7 +114,7 @@ class GestionnairePersistance:
     #
     # SAUVEGARDE ET CHARGEMENT DES JOUEURS
 
-    def sauvegarder_joueur(self, p_joueur_modele: Joueur) -> None:
+    def sauvegarder_joueur(self, p_joueur_modele: Joueur) -> int:
         """
         Enregistre un joueur dans la base de données JSON avec TinyDB.
 
@@ -66,7 +125,7 @@ class GestionnairePersistance:
             p_joueur_modele (Joueur): Instance de la classe `Joueur` contenant les informations du joueur.
 
         Returns:
-            None: Met à jour la base de données mais ne retourne pas de valeur.
+            int: L'identifiant TinyDB du joueur enregistré.
         """
 
         d_donnees_joueur = {
@@ -75,8 +134,66 @@ class GestionnairePersistance:
             "prenom": p_joueur_modele.prenom,
             "date_naissance": p_joueur_modele.date_naissance,
             "score": p_joueur_modele.score,
+            "elo": p_joueur_modele.elo,
+            "parties_classees": p_joueur_modele.parties_classees,
+        }
+        # Un index trié à jour avant l'ajout le reste en y insérant le joueur
+        b_index_a_jour = self.o_index_joueurs.est_a_jour()
+
+        i_identifiant_tinydb = self.db_joueurs.insert(d_donnees_joueur)
+        self._invalider_cache_joueur(i_identifiant_tinydb)
+
+        if b_index_a_jour:
+            self.o_index_joueurs.ajouter(i_identifiant_tinydb, d_donnees_joueur)
+
+        return i_identifiant_tinydb
+
+    #
+    def importer_fichier_joueurs(self, p_fichier: str | Path) -> dict:
+        """
+        Importe les joueurs d'un fichier CSV ou d'un export de la fédération.
+
+        Le fichier est lu au fil de l'eau par `ImportJoueurs` (validation, doublons) et les joueurs
+        retenus sont enregistrés par lots : une écriture de la base par lot, et non par joueur.
+
+        Args:
+            p_fichier (str | Path): Chemin du fichier à importer.
+
+        Returns:
+            dict: Bilan de l'import :
+                - "lignes" (int) : Nombre de lignes de joueurs lues.
+                - "importes" (int) : Nombre de joueurs enregistrés.
+                - "doublons" (int) : Nombre de lignes rejetées car le joueur existe déjà.
+                - "rejets" (list[tuple]) : (numéro de ligne, motif) de chaque ligne rejetée, doublons compris.
+                - "lots" (int) : Nombre d'écritures de la base.
+                - "duree" (float) : Durée de l'import, en secondes.
+                - "debit" (float) : Nombre de lignes traitées par seconde.
+
+        Raises:
+            FileNotFoundError: Si le fichier n'existe pas.
+            ValueError: Si le fichier est vide, illisible ou s'il lui manque une colonne obligatoire.
+        """
+
+        f_debut = time.perf_counter()
+
+        o_import = ImportJoueurs(self._identifiants_nationaux_enregistres())
+        i_importes = 0
+        i_lots = 0
+        for l_lot in o_import.lots(p_fichier):
+            i_importes += self._inserer_lot_joueurs(l_lot)
+            i_lots += 1
+
+        f_duree = time.perf_counter() - f_debut
+
+        return {
+            "lignes": o_import.i_lignes,
+            "importes": i_importes,
+            "doublons": o_import.i_doublons,
+            "rejets": o_import.l_rejets,
+            "lots": i_lots,
+            "duree": f_duree,
+            "debit": o_import.i_lignes / f_duree if f_duree > 0 else 0.0,
         }
-        self.db_joueurs.insert(d_donnees_joueur)
 
     #
     def charger_joueurs(self) -> list[dict]:
@@ -105,6 +222,35 @@ class GestionnairePersistance:
             )
         return joueurs_avec_ids
 
+    #
+    def charger_page_joueurs(self, p_tri: str = "nom", p_numero_page: int = 0, p_taille_page: int = 50) -> tuple:
+        """
+        Charge une seule page de joueurs, dans l'ordre de tri demandé.
+
+        L'ordre est lu dans les index triés des joueurs (`IndexJoueurs`), reconstruits seulement si
+        le fichier des joueurs a changé, à partir de sa table décodée (sans créer de document TinyDB
+        par joueur) : seuls les joueurs de la page sont ensuite lus.
+
+        Args:
+            p_tri (str, optional): Ordre de tri : "nom", "score" ou "ine". Par défaut, "nom".
+            p_numero_page (int, optional): Numéro de la page, à partir de 0. Par défaut, 0.
+            p_taille_page (int, optional): Nombre de joueurs par page. Par défaut, 50.
+
+        Returns:
+            tuple:
+                - Les joueurs de la page (list[dict]), au format de `charger_joueurs`.
+                - Le nombre total de joueurs (int).
+        """
+
+        if not self.o_index_joueurs.est_a_jour():
+            self.o_index_joueurs.reconstruire((self.db_joueurs.storage.read() or {}).get("_default", {}))
+
+        l_joueurs = []
+        for i_identifiant_tinydb in self.o_index_joueurs.page(p_tri, p_numero_page, p_taille_page):
+            l_joueurs.append({"id_tinydb": i_identifiant_tinydb, **self.db_joueurs.get(doc_id=i_identifiant_tinydb)})
+
+        return l_joueurs, self.o_index_joueurs.nombre_joueurs()
+
 #
     def charger_objets_joueurs(self) -> list[Joueur]:
         """Charge tous les joueurs depuis la base de données TinyDB et en fait une liste d'objets joueurs
@@ -129,6 +275,8 @@ class GestionnairePersistance:
         Cette fonction recherche un joueur dans la base de données en fonction de son
         identifiant TinyDB, puis reconstruit un objet `Joueur` à partir des informations
         trouvées.
+        Le joueur est d'abord cherché dans la table d'identité : s'il y est, le même objet
+        est retourné sans relire le fichier JSON.
 
         Args:
             p_identifiant_joueur (str): Identifiant du joueur dans la base de données TinyDB.
@@ -137,6 +285,16 @@ class GestionnairePersistance:
             Joueur: L'objet `Joueur` correspondant aux données stockées.
         """
 
+        # Les clés du cache sont des chaînes, comme les clés de `liste_joueurs` dans les fichiers tournoi
+        s_identifiant_joueur = str(p_identifiant_joueur)
+
+        o_joueur = GestionnairePersistance.d_cache_joueurs.get(s_identifiant_joueur)
+        if o_joueur is not None:
+            GestionnairePersistance.i_cache_joueurs_succes += 1
+            return o_joueur
+
+        GestionnairePersistance.i_cache_joueurs_echecs += 1
+
         d_joueurs = self.db_joueurs.get(
             doc_id=int(p_identifiant_joueur)
         )  # Récupérer les données
@@ -146,28 +304,69 @@ class GestionnairePersistance:
             p_nom_famille=d_joueurs["nom_famille"],
             p_prenom=d_joueurs["prenom"],
             p_date_naissance=d_joueurs["date_naissance"],
-            p_identifiant_tinydb=p_identifiant_joueur,
+            p_identifiant_tinydb=s_identifiant_joueur,
             p_score=d_joueurs["score"],
+            p_elo=d_joueurs.get("elo"),
+            p_parties_classees=d_joueurs.get("parties_classees", 0),
         )
+        GestionnairePersistance.d_cache_joueurs[s_identifiant_joueur] = o_joueur
+
         return o_joueur
 
+    #
+    def statistiques_cache_joueurs(self) -> dict:
+        """
+        Retourne les compteurs de la table d'identité des joueurs.
+
+        Returns:
+            dict: Un dictionnaire contenant :
+                - "succes" (int) : Nombre de joueurs servis depuis le cache.
+                - "echecs" (int) : Nombre de joueurs relus dans le fichier JSON.
+                - "taille" (int) : Nombre de joueurs actuellement en cache.
+        """
+
+        return {
+            "succes": GestionnairePersistance.i_cache_joueurs_succes,
+            "echecs": GestionnairePersistance.i_cache_joueurs_echecs,
+            "taille": len(GestionnairePersistance.d_cache_joueurs),
+        }
+
+    #
+    def vider_cache_joueurs(self) -> None:
+        """
+        Vide entièrement la table d'identité des joueurs.
+
+        Utilisé lorsque le fichier des joueurs est remplacé en bloc (restauration d'une sauvegarde).
+
+        Returns:
+            None
+        """
+
+        GestionnairePersistance.d_cache_joueurs.clear()
+
     #
     # SAUVEGARDE ET CHARGEMENT DES TOURNOIS
 
-    def sauvegarder_tournoi(self, p_tournoi_modele: Tournoi) -> None:
+    def sauvegarder_tournoi(self, p_tournoi_modele: Tournoi) -> int:
         """
         Sauvegarde un tournoi dans un fichier JSON spécifique.
 
         Cette fonction stocke toutes les informations du tournoi dans un fichier
         JSON unique sous `data/tournaments/`.
+        Un tournoi sans identifiant en reçoit un de la séquence des tournois à ce moment-là :
+        une saisie abandonnée avant l'enregistrement ne consomme pas d'identifiant.
 
         Args:
             p_tournoi_modele (Tournoi): Objet `Tournoi` contenant les informations du tournoi.
+                                        Son attribut `identifiant` est renseigné s'il vaut None.
 
         Returns:
-            None: Met à jour la base de données mais ne retourne pas de valeur.
+            int: L'identifiant du tournoi.
         """
 
+        if p_tournoi_modele.identifiant is None:
+            p_tournoi_modele.identifiant = Tournoi.generer_identifiant()
+
         d_donnees_tournoi = {
             "nom_tournoi": p_tournoi_modele.nom_tournoi,
             "lieu_tournoi": p_tournoi_modele.lieu_tournoi,
@@ -177,6 +376,7 @@ class GestionnairePersistance:
             "description": p_tournoi_modele.description,
             "liste_joueurs": p_tournoi_modele.liste_joueurs,
             "liste_tours": p_tournoi_modele.liste_tours,
+            "graine": p_tournoi_modele.graine,
         }
 
         # Utilisation de variables intermédiaire pour réduire la taille de la fstring
@@ -188,9 +388,14 @@ class GestionnairePersistance:
             self.dossier_tournois / f"tournoi_{identifiant}_{nom}_{date_debut}.json"
         )
 
-        self.db_tournois = TinyDB(str(fichier_tournoi))
+        self.db_tournois = self._ouvrir_tournoi(fichier_tournoi)
         self.db_tournois.insert(d_donnees_tournoi)
 
+        # Référence le nouveau fichier dans l'index des tournois
+        self.o_index_tournois.enregistrer(identifiant, fichier_tournoi, d_donnees_tournoi)
+
+        return identifiant
+
     #
     def sauvegarder_joueurs_tournoi(self, p_tournoi_modele: Tournoi) -> None:
         """
@@ -216,11 +421,11 @@ class GestionnairePersistance:
         nom = p_tournoi_modele.nom_tournoi
         date_debut = p_tournoi_modele.date_debut_tournoi
 
-        self.db_tournois = TinyDB(
-            f"data/tournaments/tournoi_{identifiant}_{nom}_{date_debut}.json"
-        )
+        fichier_tournoi = str(self.dossier_tournois / f"tournoi_{identifiant}_{nom}_{date_debut}.json")
+        self.db_tournois = self._ouvrir_tournoi(fichier_tournoi)
 
         self.db_tournois.update(d_liste_joueurs_db_tournoi, doc_ids=[int(1)])
+        self._mettre_a_jour_catalogue(identifiant, fichier_tournoi)
 
     def enregister_nombres_tours_tournoi(self, p_objet_tournoi: Tournoi, p_nombre_tour: int) -> None:
         """
@@ -246,16 +451,36 @@ class GestionnairePersistance:
         nom = p_objet_tournoi.nom_tournoi
         date_debut = p_objet_tournoi.date_debut_tournoi
 
-        self.db_tournois = TinyDB(
-            f"data/tournaments/tournoi_{identifiant}_{nom}_{date_debut}.json"
-        )
+        fichier_tournoi = str(self.dossier_tournois / f"tournoi_{identifiant}_{nom}_{date_debut}.json")
+        self.db_tournois = self._ouvrir_tournoi(fichier_tournoi)
 
         self.db_tournois.update(nombres_tours_tournoi, doc_ids=[int(1)])
+        self._mettre_a_jour_catalogue(identifiant, fichier_tournoi)
+
+    #
+    def enregistrer_graine_tournoi(self, p_objet_tournoi: Tournoi) -> None:
+        """
+        Enregistre la graine des tirages aléatoires d'un tournoi.
+
+        Utilisé pour les tournois créés avant l'enregistrement des graines : la graine leur est
+        attribuée au premier tirage.
+
+        Args:
+            p_objet_tournoi (Tournoi): L'objet tournoi, dont l'attribut `graine` est renseigné.
+
+        Returns:
+            None
+        """
+
+        fichier_tournoi = self._trouver_fichier_par_identifiant(p_objet_tournoi.identifiant)
+        self.db_tournois = self._ouvrir_tournoi(fichier_tournoi)
+
+        self.db_tournois.update({"graine": p_objet_tournoi.graine}, doc_ids=[1])
 
     #
     def recuperer_objet_tournoi(self, p_identifiant_tournoi: str) -> Tournoi:
         """Récupère un tournoi sous forme d'objet Tournoi à partir de TinyDB.
-        Cette fonction charge les informations du tournoi depuis son fichier JSON,
+        Cette fonction charge les informations du tournoi depuis son fichier JSON (journal compris),
         reconstruit un objet `Tournoi` et y associe les objets `Tour`, `Match` et `Joueur`.
 
         Args:
@@ -265,11 +490,10 @@ class GestionnairePersistance:
             Tournoi: L'objet Tournoi recontruit avec tous ses tours et ses matchs associés.
         """
 
-        fichier_tournoi = self._trouver_fichier_par_identifiant(p_identifiant_tournoi)
-
-        self.db_tournois = TinyDB(fichier_tournoi)
-
-        d_tournoi = self.db_tournois.all()[0]  # Récupérer les données
+        # Récupérer les données
+        fichier_tournoi, d_tournoi, i_operations_en_attente = self._charger_document_tournoi(
+            p_identifiant_tournoi
+        )
 
         o_tournoi = Tournoi(
             p_identifiant=p_identifiant_tournoi,
@@ -280,6 +504,7 @@ class GestionnairePersistance:
             p_nombre_tours=d_tournoi["nombre_tours"],
             p_description=d_tournoi["description"],
             p_liste_joueurs=d_tournoi["liste_joueurs"],
+            p_graine=d_tournoi.get("graine"),
         )
         o_tournoi.liste_tours = []
         for d_tour in d_tournoi["liste_tours"]:
@@ -315,6 +540,23 @@ class GestionnairePersistance:
 
         return o_tournoi
 
+    #
+    def recuperer_document_tournoi(self, p_identifiant_tournoi: str) -> dict:
+        """
+        Retourne le document d'un tournoi (journal compris), sans construire d'objets.
+
+        Args:
+            p_identifiant_tournoi (str): L'identifiant du tournoi.
+
+        Returns:
+            dict: Le document du tournoi : en-tête, `graine`, `liste_joueurs` (identifiant -> score)
+                  et `liste_tours` (avec leurs matchs).
+        """
+
+        fichier_tournoi, d_tournoi, i_operations_en_attente = self._charger_document_tournoi(p_identifiant_tournoi)
+
+        return d_tournoi
+
     #
     def recuperer_fichiers_tournois(self) -> list[str]:
         """Liste tous les fichiers JSON présents dans le dossier des tournois.
@@ -331,37 +573,68 @@ class GestionnairePersistance:
 
         return fichiers_tournois
 
+    #
+    def recuperer_catalogue_tournois(self) -> list[dict]:
+        """Retourne l'en-tête de tous les tournois enregistrés, lu en une seule fois depuis l'index.
+
+        Aucun fichier tournoi n'est ouvert : les tours, matchs et joueurs ne sont pas rechargés.
+
+        Returns:
+            list[dict]: Liste des en-têtes de tournois, chacun contenant `identifiant`, `nom_tournoi`,
+                        `lieu_tournoi`, `date_debut_tournoi`, `date_fin_tournoi`, `nombre_tours`,
+                        `nombre_joueurs`, `tours_joues`, `tours_termines`, `tour_courant` et `statut`.
+        """
+
+        l_catalogue = []
+        for s_identifiant, d_entree in self.o_index_tournois.entrees().items():
+            # Les fichiers illisibles sont indexés sans en-tête : ils ne sont pas listés
+            if d_entree.get("nom_tournoi") is not None:
+                l_catalogue.append({"identifiant": s_identifiant, **d_entree})
+
+        return l_catalogue
+
+    #
+    def recuperer_entete_tournoi(self, p_identifiant_tournoi: str) -> dict:
+        """
+        Retourne l'en-tête d'un tournoi, lu dans l'index, sans ouvrir son fichier.
+
+        Args:
+            p_identifiant_tournoi (str): L'identifiant du tournoi.
+
+        Returns:
+            dict: L'en-tête du tournoi, avec les clés de `recuperer_catalogue_tournois`.
+
+        Raises:
+            ValueError: Si le tournoi n'existe pas.
+        """
+
+        d_entree = self.o_index_tournois.entrees().get(str(p_identifiant_tournoi))
+        if d_entree is None or d_entree.get("nom_tournoi") is None:
+            raise ValueError(f"Aucun tournoi avec l'identifiant {p_identifiant_tournoi}.")
+
+        return {"identifiant": str(p_identifiant_tournoi), **d_entree}
+
     #
     def enregistrer_tour_tournoi(
         self, p_objet_tour: Tour, p_objet_tournoi: Tournoi
     ) -> None:
-        """Ajoute un tour à un tournoi existant et met à jour le fichier JSON.
+        """Ajoute un tour à un tournoi existant et l'écrit dans le journal du tournoi.
+
+        Seul le nouveau tour et ses appariements sont écrits (ajout à la fin du journal) :
+        le fichier JSON du tournoi n'est réécrit que lors du compactage du journal.
 
         Args:
             p_objet_tour (Tour): L'objet Tour à ajouter.
             p_objet_tournoi (Tournoi): L'objet Tournoi dans lequel ajouter le tour.
 
         Returns:
-            None: Met à jour le fichier JSON mais ne retourne pas de valeur.
+            None: Met à jour le journal du tournoi mais ne retourne pas de valeur.
         """
 
-        # Utilisation de variables intermédiaire pour réduire la taille de la fstring
-        identifiant = p_objet_tournoi.identifiant
-        nom = p_objet_tournoi.nom_tournoi
-        date_debut = p_objet_tournoi.date_debut_tournoi
-
-        fichierTournoi = (
-            self.dossier_tournois
-            / f"tournoi_{identifiant}_{nom}_{date_debut}.json"
-        )
-        self.db_tournois = TinyDB(str(fichierTournoi))
-
         # Charge les données actuelles du tournoi
-        d_tournoi = self.db_tournois.all()[0]
-
-        # Vérifie si "liste_tours" existe, sinon l'initialise
-        if "liste_tours" not in d_tournoi:
-            d_tournoi["liste_tours"] = []
+        fichier_tournoi, d_tournoi, i_operations_en_attente = self._charger_document_tournoi(
+            p_objet_tournoi.identifiant
+        )
 
         # Transforme chaque match en dictionnaire
         l_matchs_dictionnaire = []
@@ -385,11 +658,14 @@ class GestionnairePersistance:
             "date_heure_fin": p_objet_tour.date_heure_fin,
         }
 
-        # Ajoute ce tour aux données du tournoi
-        d_tournoi["liste_tours"].append(d_nouveau_tour)
-
-        # Met à jour le tournoi dans TinyDB
-        self.db_tournois.update(d_tournoi, doc_ids=[1])
+        # Ajoute ce tour aux données du tournoi via le journal
+        self._enregistrer_operation_tournoi(
+            p_objet_tournoi.identifiant,
+            fichier_tournoi,
+            d_tournoi,
+            {"operation": "ajout_tour", "tour": d_nouveau_tour},
+            i_operations_en_attente,
+        )
 
     #
     def recuperer_dernier_tour(self, p_identifiant_tournoi: str) -> dict:
@@ -404,10 +680,9 @@ class GestionnairePersistance:
                   y compris la liste des matchs joués.
         """
 
-        fichier_tournoi = self._trouver_fichier_par_identifiant(p_identifiant_tournoi)
-        self.db_tournois = TinyDB(fichier_tournoi)
-
-        d_tournoi = self.db_tournois.all()[0]
+        fichier_tournoi, d_tournoi, i_operations_en_attente = self._charger_document_tournoi(
+            p_identifiant_tournoi
+        )
         d_dernier_tour = d_tournoi.get("liste_tours")[-1]
 
         return d_dernier_tour
@@ -437,20 +712,24 @@ class GestionnairePersistance:
                 p_statut=d_match["statut"],
             )
             l_objets_matchs.append(o_match)
-            print(o_match)
 
         return l_objets_matchs
 
     #
     def enregistrer_resultat_match(
         self, p_resultats: list[dict], p_identifiant_tournoi: str
-    ) -> None:
+    ) -> dict:
         """
         Enregistre les résultats des matchs d'un tour et met à jour les scores des joueurs.
 
         Cette fonction met à jour les informations du dernier tour d'un tournoi en enregistrant
         les résultats des matchs, en mettant à jour les scores des joueurs, et en clôturant le tour
         en ajoutant la date et l'heure de fin.
+        Les points gagnés sont d'abord cumulés en mémoire pour tout le tour, puis appliqués
+        en une seule écriture du fichier des joueurs, avec les nouveaux classements Elo calculés
+        par le `MoteurElo` pour toutes les parties du tour. Les résultats sont ensuite ajoutés
+        au journal du tournoi, et le tour est intégré à l'état d'appariement du tournoi
+        et à l'historique des joueurs.
 
         Args:
             p_resultats (list[dict]): Liste des résultats des matchs sous forme de dictionnaires,
@@ -458,53 +737,69 @@ class GestionnairePersistance:
             p_identifiant_tournoi (str): Identifiant unique du tournoi concerné.
 
         Returns:
-            None: Met à jour la base de données, mais ne retourne pas de valeur.
+            dict: Le bilan des écritures du tour :
+                - "octets_joueurs" (int) : Nombre d'octets écrits dans le fichier des joueurs.
+                - "octets_tournoi" (int) : Nombre d'octets écrits pour le tournoi (journal, compactage éventuel,
+                  état d'appariement et historique des joueurs).
+                - "octets_total" (int) : Somme des deux.
         """
 
-        fichier_tournoi = self._trouver_fichier_par_identifiant(p_identifiant_tournoi)
-
-        self.db_tournois = TinyDB(fichier_tournoi)
-
         # Charge les données actuelles du tournoi
-        d_tournoi = self.db_tournois.all()[0]
+        fichier_tournoi, d_tournoi, i_operations_en_attente = self._charger_document_tournoi(
+            p_identifiant_tournoi
+        )
 
-        # Met à jour les informations des matchs (scores et statut).
-        # Transforme chaque match en dictionnaire
+        # Points gagnés par joueur sur ce tour, appliqués en une fois à la fin
+        d_points_gagnes = {}
+        # Parties du tour, pour le calcul des classements Elo
+        l_parties = []
+
+        # Ne garde que les scores et le statut de chaque match
+        l_resultats_matchs = []
         for i, d_resultat in enumerate(p_resultats):
-            d_match = {
-                "score_blanc": d_resultat["score_blanc"],
-                "score_noir": d_resultat["score_noir"],
-                "statut": d_resultat["statut"],
-            }
-            d_liste_match = d_tournoi["liste_tours"][-1]["liste_matchs"][i]
-            # Pour insérer les données au bon endroit dans le JSON, fusion des 2 dictionnaires
-            # avec ** pour déballer les informations
-            d_nouvelle_liste_match = {**d_liste_match, **d_match}
-            d_tournoi["liste_tours"][-1]["liste_matchs"][i] = d_nouvelle_liste_match
-
-            # Met à jour les scores des joueurs dans la base de données.
-            self._mettre_a_jour_joueur(
-                d_liste_match["joueur_blanc"], d_resultat["score_blanc"]
-            )
-            self._mettre_a_jour_joueur(
-                d_liste_match["joueur_noir"], d_resultat["score_noir"]
+            l_resultats_matchs.append(
+                {
+                    "score_blanc": d_resultat["score_blanc"],
+                    "score_noir": d_resultat["score_noir"],
+                    "statut": d_resultat["statut"],
+                }
             )
 
-            d_tournoi["liste_joueurs"][d_liste_match["joueur_blanc"]] += d_resultat[
-                "score_blanc"
-            ]
-            d_tournoi["liste_joueurs"][d_liste_match["joueur_noir"]] += d_resultat[
-                "score_noir"
-            ]
-
-        # Marque le tour comme "Terminé" et enregistre l'heure de fin.
-        d_tournoi["liste_tours"][-1]["statut"] = "Terminé"
-        d_tournoi["liste_tours"][-1]["date_heure_fin"] = datetime.now().strftime(
-            "%Y-%m-%d %H:%M:%S"
+            # Cumule les points des joueurs en mémoire
+            d_liste_match = d_tournoi["liste_tours"][-1]["liste_matchs"][i]
+            s_joueur_blanc = d_liste_match["joueur_blanc"]
+            s_joueur_noir = d_liste_match["joueur_noir"]
+            d_points_gagnes[s_joueur_blanc] = d_points_gagnes.get(s_joueur_blanc, 0) + d_resultat["score_blanc"]
+            d_points_gagnes[s_joueur_noir] = d_points_gagnes.get(s_joueur_noir, 0) + d_resultat["score_noir"]
+            l_parties.append({**d_liste_match, **l_resultats_matchs[-1]})
+
+        # Étape de validation : une écriture pour tous les joueurs, puis une pour le tournoi
+        i_octets_joueurs = self._appliquer_resultats_joueurs(d_points_gagnes, l_parties)
+
+        # Marque le tour comme "Terminé" avec l'heure de fin, et met à jour les scores du tournoi.
+        i_octets_tournoi = self._enregistrer_operation_tournoi(
+            p_identifiant_tournoi,
+            fichier_tournoi,
+            d_tournoi,
+            {
+                "operation": "resultats_tour",
+                "resultats": l_resultats_matchs,
+                "date_heure_fin": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            },
+            i_operations_en_attente,
+        )
+
+        i_tours_termines = sum(1 for d_tour in d_tournoi["liste_tours"] if d_tour["statut"] == "Terminé")
+        i_octets_tournoi += self._mettre_a_jour_etat_appariement(
+            p_identifiant_tournoi, d_tournoi["liste_tours"][-1]["liste_matchs"], i_tours_termines
         )
+        i_octets_tournoi += self._mettre_a_jour_historique_joueurs(p_identifiant_tournoi, d_tournoi, i_tours_termines)
 
-        # Sauvegarde les modifications dans TinyDB.
-        self.db_tournois.update(d_tournoi, doc_ids=[1])
+        return {
+            "octets_joueurs": i_octets_joueurs,
+            "octets_tournoi": i_octets_tournoi,
+            "octets_total": i_octets_joueurs + i_octets_tournoi,
+        }
 
     #
     def recuepere_score_joueurs(self, p_identifiant_tournoi: str) -> dict:
@@ -512,7 +807,7 @@ class GestionnairePersistance:
         Récupère les scores des joueurs d'un tournoi donné.
 
         Cette fonction recherche le fichier du tournoi correspondant à l'identifiant fourni,
-        charge les données du tournoi depuis TinyDB et extrait les scores des joueurs.
+        charge les données du tournoi depuis TinyDB (journal compris) et extrait les scores des joueurs.
 
         Args:
             p_identifiant_tournoi (str): Identifiant du tournoi dont on veut récupérer les scores.
@@ -522,22 +817,163 @@ class GestionnairePersistance:
                   où la clé est l'identifiant du joueur et la valeur est son score.
         """
 
-        fichier_tournoi = self._trouver_fichier_par_identifiant(p_identifiant_tournoi)
-        self.db_tournois = TinyDB(fichier_tournoi)
-        d_tournoi = self.db_tournois.all()[0]
+        fichier_tournoi, d_tournoi, i_operations_en_attente = self._charger_document_tournoi(
+            p_identifiant_tournoi
+        )
 
         d_scores = d_tournoi["liste_joueurs"]
 
         return d_scores
 
+    #
+    def recuperer_etat_appariement(self, p_identifiant_tournoi: str) -> EtatAppariement:
+        """
+        Récupère l'état d'appariement d'un tournoi après son dernier tour terminé.
+
+        L'état enregistré est vérifié contre l'en-tête du tournoi (nombre de tours terminés et de joueurs
+        inscrits) : le tournoi n'est relu, pour reconstruire l'état puis l'enregistrer, que s'il est périmé.
+
+        Args:
+            p_identifiant_tournoi (str): L'identifiant du tournoi.
+
+        Returns:
+            EtatAppariement: L'état d'appariement du tournoi.
+        """
+
+        d_entete = self.recuperer_entete_tournoi(p_identifiant_tournoi)
+
+        o_etat = self._lire_etat_appariement(p_identifiant_tournoi)
+        if o_etat is None or not o_etat.est_a_jour(d_entete["tours_termines"], d_entete["nombre_joueurs"]):
+            o_etat = EtatAppariement.depuis_document(self._document_etat_appariement(p_identifiant_tournoi))
+            self._enregistrer_etat_appariement(p_identifiant_tournoi, o_etat)
+
+        return o_etat
+
+    #
+    def recalculer_elos(self) -> dict:
+        """
+        Recalcule les classements Elo de tous les joueurs à partir de tous les tournois enregistrés.
+
+        Les classements repartent de `Joueur.elo_initial` ; les tours terminés de tous les tournois sont
+        rejoués par le `MoteurElo` dans l'ordre de leur clôture. Les nouveaux classements sont appliqués
+        en une seule écriture du fichier des joueurs.
+
+        Returns:
+            dict: Le bilan du calcul : "joueurs", "tournois", "parties" et "octets_joueurs".
+        """
+
+        l_tournois = [
+            {"identifiant": d_entree["identifiant"], **self.recuperer_document_tournoi(d_entree["identifiant"])}
+            for d_entree in self.recuperer_catalogue_tournois()
+        ]
+
+        l_joueurs = [str(d_joueur["id_tinydb"]) for d_joueur in self.charger_joueurs()]
+        d_classements = MoteurElo().recalculer_archive(l_tournois, l_joueurs)
+
+        i_octets_joueurs = self._enregistrer_classements_elo(
+            {id_joueur: d_classements[id_joueur] for id_joueur in l_joueurs}
+        )
+
+        return {
+            "joueurs": len(l_joueurs),
+            "tournois": len(l_tournois),
+            "parties": sum(i_parties for f_elo, i_parties in d_classements.values()) // 2,
+            "octets_joueurs": i_octets_joueurs,
+        }
+
+    #
+    def recuperer_historique_joueur(self, p_identifiant_joueur: str, p_tournois=None) -> list[dict]:
+        """
+        Retourne les parties d'un joueur dans tous les tournois, lues dans l'historique des joueurs.
+
+        Aucun fichier tournoi n'est ouvert (sauf à la construction de l'historique, s'il n'existe pas encore).
+
+        Args:
+            p_identifiant_joueur (str): Identifiant TinyDB du joueur.
+            p_tournois (iterable, optional): Identifiants des tournois à retenir (par défaut : tous).
+
+        Returns:
+            list[dict]: Les parties des tours terminés, par tournoi puis par tour : `tournoi`, `tour`,
+                        `adversaire`, `couleur` ("blanc" ou "noir") et `resultat`.
+        """
+
+        return self._historique_joueurs().parties_joueur(p_identifiant_joueur, p_tournois)
+
+    #
+    def recuperer_confrontations(self, p_identifiant_joueur: str, p_identifiant_adversaire: str) -> list[dict]:
+        """
+        Retourne les parties jouées entre deux joueurs, tous tournois confondus, du point de vue du premier.
+
+        Args:
+            p_identifiant_joueur (str): Identifiant TinyDB du joueur.
+            p_identifiant_adversaire (str): Identifiant TinyDB de son adversaire.
+
+        Returns:
+            list[dict]: Les parties, au format de `recuperer_historique_joueur`.
+        """
+
+        return [
+            d_partie
+            for d_partie in self.recuperer_historique_joueur(p_identifiant_joueur)
+            if d_partie["adversaire"] == str(p_identifiant_adversaire)
+        ]
+
+    #
+    def recuperer_adversaires(self, p_identifiant_joueur: str, p_tournois=None) -> set[str]:
+        """
+        Retourne les adversaires déjà rencontrés par un joueur, par exemple sur les tournois d'une série,
+        pour éviter de les lui opposer de nouveau.
+
+        Args:
+            p_identifiant_joueur (str): Identifiant TinyDB du joueur.
+            p_tournois (iterable, optional): Identifiants des tournois à retenir (par défaut : tous).
+
+        Returns:
+            set[str]: Les identifiants des adversaires.
+        """
+
+        return {
+            d_partie["adversaire"] for d_partie in self.recuperer_historique_joueur(p_identifiant_joueur, p_tournois)
+        }
+
+    #
+    def reconstruire_historique_joueurs(self) -> dict:
+        """
+        Reconstruit l'historique des joueurs à partir de tous les tournois enregistrés.
+
+        L'historique est normalement tenu à jour à chaque fin de tour : la reconstruction sert après
+        une restauration complète, une migration ou la perte de son fichier. Les tournois sont lus
+        par lots dans des processus séparés.
+
+        Returns:
+            dict: Le bilan : "tournois", "joueurs", "parties" et "octets".
+        """
+
+        l_sources = [
+            (
+                s_identifiant,
+                str(self.dossier_tournois / d_entree["fichier"]),
+                str(self._journal_tournoi(s_identifiant).fichier_journal),
+            )
+            for s_identifiant, d_entree in self.o_index_tournois.entrees().items()
+            if d_entree.get("nom_tournoi") is not None
+        ]
+
+        return self.o_historique_joueurs.reconstruire(l_sources, GestionnairePersistance._lire_archive_tournoi)
+
     #
     def effectuer_sauvegarde(self) -> tuple:
         """
-        Effectue une sauvegarde complète des données du projet.
+        Effectue une sauvegarde complète et incrémentale des données du projet.
 
-        Cette fonction copie le dossier `data/` dans un dossier de sauvegarde unique
+        Cette fonction crée un instantané du dossier `data/` dans un dossier de sauvegarde unique
         nommé `data_backup_YYYYMMDD_HHMMSS` sous `sauvegarde/`. Elle vérifie également
         l'existence du dossier `data/` avant de procéder.
+        Les fichiers inchangés depuis la sauvegarde précédente (même taille et même date de modification)
+        sont des liens physiques vers les fichiers de cette sauvegarde : seuls les fichiers modifiés
+        sont copiés. Chaque sauvegarde reste une arborescence complète, restaurable seule.
+        L'instantané est construit dans un dossier temporaire renommé à la fin : une sauvegarde
+        interrompue n'apparaît jamais dans la liste des sauvegardes.
 
         Returns:
             tuple:
@@ -545,6 +981,7 @@ class GestionnairePersistance:
                 - Une chaîne "success" si la sauvegarde réussit, sinon "error".
         """
 
+        dossier_temporaire = None
         try:
             if not self.dossier_source.exists():
                 message = (
@@ -557,14 +994,28 @@ class GestionnairePersistance:
             dossier_sauvegarde_unique = (
                 self.dossier_sauvegarde / f"data_backup_{timestamp}"
             )
-
-            # Copier `data/` dans `sauvegarde/`
-            shutil.copytree(self.dossier_source, dossier_sauvegarde_unique)
-
-            message = f"\n ✅ Sauvegarde réussie dans : {dossier_sauvegarde_unique }\n "
+            if dossier_sauvegarde_unique.exists():
+                raise FileExistsError(f"La sauvegarde {dossier_sauvegarde_unique.name} existe déjà")
+
+            dossier_precedent = self._derniere_sauvegarde()
+
+            # Construire l'instantané de `data/` à côté, puis le renommer
+            dossier_temporaire = self.dossier_sauvegarde / f".{dossier_sauvegarde_unique.name}.tmp"
+            if dossier_temporaire.exists():
+                shutil.rmtree(dossier_temporaire)
+            i_fichiers_lies, i_fichiers_copies = self._creer_instantane(dossier_temporaire, dossier_precedent)
+            dossier_temporaire.rename(dossier_sauvegarde_unique)
+
+            message = (
+                f"\n ✅ Sauvegarde réussie dans : {dossier_sauvegarde_unique }\n "
+                f"{i_fichiers_copies} fichier(s) copié(s), {i_fichiers_lies} fichier(s) inchangé(s) lié(s) "
+                "à la sauvegarde précédente\n "
+            )
             return message, "success"
 
         except Exception as e:
+            if dossier_temporaire is not None and dossier_temporaire.exists():
+                shutil.rmtree(dossier_temporaire, ignore_errors=True)
             message = f"\n ❌ Erreur lors de la sauvegarde : {e}\n "
             return message, "error"
 
@@ -574,6 +1025,10 @@ class GestionnairePersistance:
         Restaure une sauvegarde précédemment créée.
 
         Cette fonction remplace le dossier `data/` actuel par une sauvegarde choisie.
+        La sauvegarde est d'abord copiée (jamais liée) dans un dossier temporaire voisin de `data/`,
+        puis vérifiée. Le dossier `data/` actuel est ensuite renommé en `data_avant_restauration/`
+        et le dossier temporaire renommé en `data/` : la bascule est immédiate et, si la copie échoue,
+        les données actuelles ne sont pas touchées.
         Si le dossier de sauvegarde n'existe pas, elle retourne un message d'erreur.
 
         Args:
@@ -585,21 +1040,137 @@ class GestionnairePersistance:
                 - Une chaîne "success" si la restauration réussit, sinon "error".
         """
 
+        dossier_temporaire = self.dossier_projet / ".data_restauration.tmp"
+        dossier_precedent = self.dossier_projet / "data_avant_restauration"
+
         try:
             dossier_sauvegarde_cible = self.dossier_sauvegarde / p_nom_sauvegarde
 
             if not dossier_sauvegarde_cible.exists():
                 return "\n ❌ La sauvegarde choisie n'existe pas.\n ", "error"
 
-            # Supprimer `data/` s'il existe
+            # Copier la sauvegarde à côté de `data/`, puis vérifier la copie
+            if dossier_temporaire.exists():
+                shutil.rmtree(dossier_temporaire)
+            shutil.copytree(dossier_sauvegarde_cible, dossier_temporaire)
+            self._verifier_copie_sauvegarde(dossier_sauvegarde_cible, dossier_temporaire)
+
+            # Garder les données actuelles comme point de retour, puis basculer
+            if dossier_precedent.exists():
+                shutil.rmtree(dossier_precedent)
             if self.dossier_source.exists():
-                shutil.rmtree(self.dossier_source)
+                self.dossier_source.rename(dossier_precedent)
+            try:
+                dossier_temporaire.rename(self.dossier_source)
+            except OSError:
+                if dossier_precedent.exists():
+                    dossier_precedent.rename(self.dossier_source)
+                raise
+
+            # Les joueurs et les fichiers en cache ne correspondent plus aux données restaurées
+            self.vider_cache_joueurs()
+            StockageJsonRapide.vider_cache()
 
-            # Copier la sauvegarde dans `data/`
-            shutil.copytree(dossier_sauvegarde_cible, self.dossier_source)
+            return (
+                f"\n ✅ Restauration réussie depuis : {p_nom_sauvegarde}\n "
+                f"Les données remplacées sont conservées dans : {dossier_precedent}\n ",
+                "success",
+            )
+
+        except Exception as e:
+            if dossier_temporaire.exists():
+                shutil.rmtree(dossier_temporaire, ignore_errors=True)
+            return f"\n ❌ Erreur lors de la restauration : {e}\n ", "error"
+
+    #
+    def lister_elements_sauvegarde(self, p_nom_sauvegarde: str) -> list[str]:
+        """
+        Liste les éléments d'une sauvegarde qui peuvent être restaurés seuls.
+
+        Args:
+            p_nom_sauvegarde (str): Nom du dossier de sauvegarde.
+
+        Returns:
+            list[str]: Chemins relatifs au dossier de sauvegarde : la base des joueurs,
+                       puis les fichiers des tournois (et la base SQLite si elle existe).
+        """
+
+        dossier_sauvegarde_cible = self.dossier_sauvegarde / p_nom_sauvegarde
+        l_elements = []
+
+        if (dossier_sauvegarde_cible / "players" / "joueurs_db.json").is_file():
+            l_elements.append("players/joueurs_db.json")
+
+        dossier_tournois_sauvegarde = dossier_sauvegarde_cible / "tournaments"
+        if dossier_tournois_sauvegarde.is_dir():
+            for fichier in sorted(dossier_tournois_sauvegarde.iterdir()):
+                if fichier.is_file() and IndexTournois.regex_fichier_tournoi.match(fichier.name):
+                    l_elements.append(f"tournaments/{fichier.name}")
+
+        if (dossier_sauvegarde_cible / "lets_roque.sqlite3").is_file():
+            l_elements.append("lets_roque.sqlite3")
+
+        return l_elements
+
+    #
+    def restaurer_element_sauvegarde(self, p_nom_sauvegarde: str, p_element: str) -> tuple:
+        """
+        Restaure un seul élément d'une sauvegarde sans toucher au reste de `data/`.
+
+        Le fichier est copié à côté de sa destination puis renommé par-dessus (remplacement atomique).
+        Pour un tournoi, son journal et son état d'appariement sont restaurés avec lui (ou supprimés s'ils
+        n'existaient pas dans la sauvegarde) et ses entrées sont mises à jour dans l'index des tournois
+        et dans l'historique des joueurs.
+
+        Args:
+            p_nom_sauvegarde (str): Nom du dossier de sauvegarde.
+            p_element (str): Élément à restaurer, tel que retourné par `lister_elements_sauvegarde`.
+
+        Returns:
+            tuple:
+                - Un message de succès ou d'erreur.
+                - Une chaîne "success" si la restauration réussit, sinon "error".
+        """
+
+        try:
+            dossier_sauvegarde_cible = self.dossier_sauvegarde / p_nom_sauvegarde
+
+            if p_element not in self.lister_elements_sauvegarde(p_nom_sauvegarde):
+                return "\n ❌ L'élément choisi n'existe pas dans cette sauvegarde.\n ", "error"
+
+            l_fichiers = [p_element]
+            match = IndexTournois.regex_fichier_tournoi.match(Path(p_element).name)
+            if match:
+                l_fichiers.append(f"journaux/tournoi_{match.group(1)}.jsonl")
+                l_fichiers.append(f"appariements/tournoi_{match.group(1)}.json")
+
+            for s_fichier in l_fichiers:
+                fichier_sauvegarde = dossier_sauvegarde_cible / s_fichier
+                fichier_destination = self.dossier_source / s_fichier
+
+                if not fichier_sauvegarde.is_file():
+                    # Journal vide ou état d'appariement pas encore créé au moment de la sauvegarde
+                    fichier_destination.unlink(missing_ok=True)
+                    continue
+
+                fichier_destination.parent.mkdir(parents=True, exist_ok=True)
+                fichier_temporaire = fichier_destination.with_name(fichier_destination.name + ".tmp")
+                shutil.copy2(fichier_sauvegarde, fichier_temporaire)
+                os.replace(fichier_temporaire, fichier_destination)
+
+            if match:
+                self._mettre_a_jour_catalogue(match.group(1), str(self.dossier_source / p_element))
+                if self.o_historique_joueurs.existe():
+                    self.o_historique_joueurs.remplacer_tournoi(
+                        match.group(1), self.recuperer_document_tournoi(match.group(1))
+                    )
+
+            # Les joueurs et les fichiers en cache ne correspondent plus aux données restaurées
+            self.vider_cache_joueurs()
+            StockageJsonRapide.vider_cache()
 
             return (
-                f"\n ✅ Restauration réussie depuis : {p_nom_sauvegarde}\n ",
+                f"\n ✅ Restauration de {p_element} réussie depuis : {p_nom_sauvegarde}\n ",
                 "success",
             )
 
@@ -615,9 +1186,9 @@ class GestionnairePersistance:
         """
         Recherche un fichier tournoi correspondant à l'identifiant fourni.
 
-        Cette fonction parcourt le dossier des tournois et cherche un fichier
-        dont le nom commence par "tournoi_{p_identifiant_tournoi}_".
-        Si un fichier correspondant est trouvé, son chemin est retourné sous forme de chaîne de caractère.
+        La recherche passe par l'index persistant des tournois (`data/index_tournois.json`),
+        qui associe l'identifiant exact au nom du fichier : l'identifiant 1 ne peut donc plus
+        correspondre au fichier "tournoi_12_...".
 
         Args:
             p_identifiant_tournoi (str): Identifiant unique du tournoi à rechercher.
@@ -626,14 +1197,422 @@ class GestionnairePersistance:
             str | None: Le chemin du fichier tournoi trouvé, ou None si aucun fichier correspondant n'est trouvé.
         """
 
-        for fichier in self.dossier_tournois.iterdir():
-            if fichier.is_file() and fichier.name.startswith(
-                f"tournoi_{p_identifiant_tournoi}_"
-            ):
-                return str(fichier)
+        return self.o_index_tournois.chemin(p_identifiant_tournoi)
+
+    #
+    def _mettre_a_jour_catalogue(self, p_identifiant_tournoi: str, p_fichier_tournoi: str) -> None:
+        """
+        Relit le document du tournoi qui vient d'être modifié et met à jour son entrée dans l'index.
+
+        Args:
+            p_identifiant_tournoi (str): Identifiant du tournoi modifié.
+            p_fichier_tournoi (str): Chemin du fichier JSON du tournoi.
+
+        Returns:
+            None
+        """
+
+        d_tournoi = self._lire_document_tournoi(p_fichier_tournoi, p_identifiant_tournoi)
+        self.o_index_tournois.enregistrer(p_identifiant_tournoi, p_fichier_tournoi, d_tournoi)
+
+    #
+    def _derniere_sauvegarde(self) -> Path | None:
+        """
+        Retourne le dossier de la sauvegarde la plus récente.
+
+        Returns:
+            Path | None: Le dossier `data_backup_YYYYMMDD_HHMMSS` le plus récent, ou None s'il n'y en a pas.
+        """
+
+        if not self.dossier_sauvegarde.is_dir():
+            return None
+
+        l_sauvegardes = []
+        for dossier in self.dossier_sauvegarde.iterdir():
+            if dossier.is_dir() and self.regex_dossier_sauvegarde.match(dossier.name):
+                l_sauvegardes.append(dossier)
+
+        # L'horodatage YYYYMMDD_HHMMSS se trie dans l'ordre chronologique
+        return max(l_sauvegardes, key=lambda dossier: dossier.name, default=None)
+
+    #
+    def _creer_instantane(self, p_dossier_cible: Path, p_dossier_precedent: Path | None) -> tuple:
+        """
+        Recrée l'arborescence de `data/` dans `p_dossier_cible`, en liant les fichiers inchangés.
+
+        Un fichier est considéré inchangé s'il a la même taille et la même date de modification
+        que dans la sauvegarde précédente (`shutil.copy2` conserve la date de modification).
+        Si le lien physique est impossible (autre système de fichiers, nombre de liens maximal atteint...),
+        le fichier est copié. Les fichiers temporaires et les verrous (`.tmp`, `.lock`) ne sont pas sauvegardés.
+
+        Args:
+            p_dossier_cible (Path): Dossier de l'instantané à créer.
+            p_dossier_precedent (Path | None): Sauvegarde précédente, ou None pour tout copier.
+
+        Returns:
+            tuple: Le nombre de fichiers liés et le nombre de fichiers copiés.
+        """
+
+        i_fichiers_lies = 0
+        i_fichiers_copies = 0
+
+        for dossier, l_sous_dossiers, l_fichiers in os.walk(self.dossier_source):
+            chemin_relatif = Path(dossier).relative_to(self.dossier_source)
+            (p_dossier_cible / chemin_relatif).mkdir(parents=True, exist_ok=True)
+
+            for nom_fichier in l_fichiers:
+                if nom_fichier.endswith((".tmp", ".lock")):
+                    continue
+
+                fichier_source = Path(dossier) / nom_fichier
+                fichier_cible = p_dossier_cible / chemin_relatif / nom_fichier
+
+                if p_dossier_precedent is not None:
+                    fichier_precedent = p_dossier_precedent / chemin_relatif / nom_fichier
+                    try:
+                        stat_source = fichier_source.stat()
+                        stat_precedent = fichier_precedent.stat()
+                        if (
+                            stat_source.st_size == stat_precedent.st_size
+                            and stat_source.st_mtime_ns == stat_precedent.st_mtime_ns
+                        ):
+                            os.link(fichier_precedent, fichier_cible)
+                            i_fichiers_lies += 1
+                            continue
+                    except OSError:
+                        # Fichier absent de la sauvegarde précédente ou lien impossible : copie
+                        pass
+
+                shutil.copy2(fichier_source, fichier_cible)
+                i_fichiers_copies += 1
+
+        return i_fichiers_lies, i_fichiers_copies
+
+    #
+    def _verifier_copie_sauvegarde(self, p_dossier_sauvegarde: Path, p_dossier_copie: Path) -> None:
+        """
+        Vérifie qu'une sauvegarde a été entièrement copiée avant de la mettre en place.
+
+        Chaque fichier de la sauvegarde doit exister dans la copie avec la même taille,
+        et chaque fichier JSON de la copie doit être lisible.
+
+        Args:
+            p_dossier_sauvegarde (Path): Dossier de la sauvegarde.
+            p_dossier_copie (Path): Copie de la sauvegarde à vérifier.
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: Si un fichier manque, est incomplet ou n'est pas un JSON valide.
+        """
+
+        for dossier, l_sous_dossiers, l_fichiers in os.walk(p_dossier_sauvegarde):
+            chemin_relatif = Path(dossier).relative_to(p_dossier_sauvegarde)
+
+            for nom_fichier in l_fichiers:
+                fichier_copie = p_dossier_copie / chemin_relatif / nom_fichier
+
+                if (
+                    not fichier_copie.is_file()
+                    or fichier_copie.stat().st_size != (Path(dossier) / nom_fichier).stat().st_size
+                ):
+                    raise ValueError(f"Copie incomplète de {chemin_relatif / nom_fichier}")
+
+                if nom_fichier.endswith(".json") and fichier_copie.stat().st_size > 0:
+                    try:
+                        json.loads(fichier_copie.read_bytes())
+                    except ValueError:
+                        raise ValueError(f"Fichier JSON illisible : {chemin_relatif / nom_fichier}")
+
+    #
+    def _ouvrir_tournoi(self, p_fichier_tournoi: str | Path) -> TinyDB:
+        """
+        Ouvre la base TinyDB d'un fichier tournoi.
+
+        Les écritures passent par un fichier temporaire créé dans `data/.tmp`, et chaque réécriture est signalée
+        à l'index des tournois : le renommage qui remplace le fichier change la date du dossier des tournois,
+        sans qu'un tournoi ait été ajouté ou supprimé.
+
+        Args:
+            p_fichier_tournoi (str | Path): Chemin du fichier JSON du tournoi.
+
+        Returns:
+            TinyDB: La base du tournoi.
+        """
+
+        return TinyDB(
+            str(p_fichier_tournoi),
+            storage=StockageJsonRapide,
+            p_dossier_temporaire=self.dossier_temporaire,
+            p_apres_ecriture=self.o_index_tournois.noter_ecriture,
+        )
+
+    #
+    def _charger_document_tournoi(self, p_identifiant_tournoi: str) -> tuple:
+        """
+        Charge le document d'un tournoi et lui applique les opérations en attente dans son journal.
+
+        Args:
+            p_identifiant_tournoi (str): Identifiant du tournoi.
+
+        Returns:
+            tuple:
+                - Le chemin du fichier du tournoi (str).
+                - Le document du tournoi à jour (dict).
+                - Le nombre d'opérations du journal pas encore compactées (int).
+        """
+
+        fichier_tournoi = self._trouver_fichier_par_identifiant(p_identifiant_tournoi)
+
+        self.db_tournois = self._ouvrir_tournoi(fichier_tournoi)
+        d_tournoi = self.db_tournois.all()[0]
+
+        i_operations_en_attente = self._journal_tournoi(p_identifiant_tournoi).rejouer(d_tournoi)
+
+        return fichier_tournoi, d_tournoi, i_operations_en_attente
+
+    #
+    def _lire_document_tournoi(self, p_fichier_tournoi: str | Path, p_identifiant_tournoi: str) -> dict:
+        """
+        Lit le document d'un tournoi à partir de son fichier, journal compris.
+
+        Utilisé par l'index des tournois, qui connaît déjà le chemin du fichier.
+
+        Args:
+            p_fichier_tournoi (str | Path): Chemin du fichier JSON du tournoi.
+            p_identifiant_tournoi (str): Identifiant du tournoi.
+
+        Returns:
+            dict: Le document du tournoi à jour (vide si le fichier ne contient pas encore de tournoi).
+        """
+
+        l_documents = TinyDB(str(p_fichier_tournoi), storage=StockageJsonRapide).all()
+        if not l_documents:
+            return {}
+
+        d_tournoi = l_documents[0]
+        self._journal_tournoi(p_identifiant_tournoi).rejouer(d_tournoi)
+
+        return d_tournoi
+
+    #
+    def _journal_tournoi(self, p_identifiant_tournoi: str) -> JournalTournoi:
+        """
+        Retourne le journal des modifications d'un tournoi.
+
+        Args:
+            p_identifiant_tournoi (str): Identifiant du tournoi.
+
+        Returns:
+            JournalTournoi: Journal stocké dans `data/journaux/tournoi_<id>.jsonl`.
+        """
+
+        return JournalTournoi(self.dossier_journaux / f"tournoi_{p_identifiant_tournoi}.jsonl")
+
+    #
+    def _enregistrer_operation_tournoi(
+        self,
+        p_identifiant_tournoi: str,
+        p_fichier_tournoi: str,
+        p_tournoi: dict,
+        p_operation: dict,
+        p_operations_en_attente: int,
+    ) -> int:
+        """
+        Ajoute une opération au journal d'un tournoi, l'applique au document en mémoire
+        et compacte le journal dans le fichier du tournoi quand il devient trop long.
+
+        Args:
+            p_identifiant_tournoi (str): Identifiant du tournoi.
+            p_fichier_tournoi (str): Chemin du fichier JSON du tournoi.
+            p_tournoi (dict): Document du tournoi à jour, tel que retourné par `_charger_document_tournoi`.
+            p_operation (dict): Opération à enregistrer (sans numéro, il est attribué ici).
+            p_operations_en_attente (int): Nombre d'opérations du journal pas encore compactées.
+
+        Returns:
+            int: Nombre d'octets écrits (journal et, le cas échéant, fichier du tournoi).
+        """
+
+        o_journal = self._journal_tournoi(p_identifiant_tournoi)
+
+        p_operation["numero"] = p_tournoi.get("numero_journal", 0) + 1
+        i_octets_ecrits = o_journal.ajouter(p_operation)
+        o_journal.appliquer(p_tournoi, p_operation)
+
+        # Compactage : le document principal intègre tout le journal, qui peut alors être vidé
+        if p_operations_en_attente + 1 >= o_journal.nombre_operations_compactage:
+            self.db_tournois = self._ouvrir_tournoi(p_fichier_tournoi)
+            self.db_tournois.update(p_tournoi, doc_ids=[1])
+            o_journal.vider()
+            i_octets_ecrits += Path(p_fichier_tournoi).stat().st_size
+
+        self.o_index_tournois.enregistrer(p_identifiant_tournoi, p_fichier_tournoi, p_tournoi)
+
+        return i_octets_ecrits
+
+    #
+    def _fichier_etat_appariement(self, p_identifiant_tournoi: str) -> Path:
+        """
+        Retourne le chemin du fichier d'état d'appariement d'un tournoi.
+
+        Args:
+            p_identifiant_tournoi (str): Identifiant du tournoi.
+
+        Returns:
+            Path: Le fichier `data/appariements/tournoi_<id>.json`.
+        """
+
+        return self.dossier_appariements / f"tournoi_{p_identifiant_tournoi}.json"
+
+    #
+    def _lire_etat_appariement(self, p_identifiant_tournoi: str) -> EtatAppariement | None:
+        """
+        Lit l'état d'appariement enregistré d'un tournoi.
+
+        Args:
+            p_identifiant_tournoi (str): Identifiant du tournoi.
+
+        Returns:
+            EtatAppariement | None: L'état enregistré, ou None s'il n'existe pas ou n'est pas lisible.
+        """
+
+        fichier_etat = self._fichier_etat_appariement(p_identifiant_tournoi)
+        if not fichier_etat.is_file():
+            return None
+
+        try:
+            return EtatAppariement.depuis_dict(StockageJsonRapide(str(fichier_etat)).read())
+        except (ValueError, KeyError, TypeError):
+            return None
+
+    #
+    def _enregistrer_etat_appariement(self, p_identifiant_tournoi: str, p_etat: EtatAppariement) -> int:
+        """
+        Enregistre l'état d'appariement d'un tournoi (écriture atomique).
+
+        Args:
+            p_identifiant_tournoi (str): Identifiant du tournoi.
+            p_etat (EtatAppariement): L'état à enregistrer.
+
+        Returns:
+            int: Nombre d'octets écrits.
+        """
+
+        fichier_etat = self._fichier_etat_appariement(p_identifiant_tournoi)
+        StockageJsonRapide(str(fichier_etat), create_dirs=True).write(p_etat.vers_dict())
+
+        return fichier_etat.stat().st_size
+
+    #
+    def _document_etat_appariement(self, p_identifiant_tournoi: str) -> dict:
+        """
+        Retourne les données du tournoi nécessaires pour reconstruire son état d'appariement.
+
+        Args:
+            p_identifiant_tournoi (str): Identifiant du tournoi.
+
+        Returns:
+            dict: `liste_joueurs` (identifiant -> score) et `liste_tours` (avec leurs matchs).
+        """
+
+        fichier_tournoi, d_tournoi, i_operations_en_attente = self._charger_document_tournoi(p_identifiant_tournoi)
+
+        return d_tournoi
+
+    #
+    def _mettre_a_jour_etat_appariement(
+        self, p_identifiant_tournoi: str, p_matchs_tour: list[dict], p_tours_termines: int
+    ) -> int:
+        """
+        Intègre un tour qui vient de se terminer à l'état d'appariement du tournoi, puis l'enregistre.
+
+        Si l'état enregistré n'est pas celui du tour précédent, il est reconstruit à partir du tournoi.
+
+        Args:
+            p_identifiant_tournoi (str): Identifiant du tournoi.
+            p_matchs_tour (list[dict]): Matchs du tour terminé, avec leurs résultats.
+            p_tours_termines (int): Nombre de tours terminés, celui-ci compris.
+
+        Returns:
+            int: Nombre d'octets écrits.
+        """
+
+        o_etat = self._lire_etat_appariement(p_identifiant_tournoi)
+        if o_etat is not None and o_etat.i_tours_integres == p_tours_termines - 1:
+            o_etat.integrer_tour(p_matchs_tour)
+        else:
+            o_etat = EtatAppariement.depuis_document(self._document_etat_appariement(p_identifiant_tournoi))
+
+        return self._enregistrer_etat_appariement(p_identifiant_tournoi, o_etat)
+
+    #
+    def _historique_joueurs(self) -> HistoriqueJoueurs:
+        """
+        Retourne l'historique des joueurs, en le construisant à partir des tournois s'il n'existe pas encore.
+
+        Returns:
+            HistoriqueJoueurs: L'historique des joueurs.
+        """
+
+        if not self.o_historique_joueurs.existe():
+            self.reconstruire_historique_joueurs()
+
+        return self.o_historique_joueurs
+
+    #
+    def _mettre_a_jour_historique_joueurs(
+        self, p_identifiant_tournoi: str, p_tournoi: dict, p_tours_termines: int
+    ) -> int:
+        """
+        Ajoute le tour qui vient de se terminer à l'historique des joueurs.
+
+        Si l'historique ne contient pas le tour précédent du tournoi, toutes les parties du tournoi y sont remplacées.
+
+        Args:
+            p_identifiant_tournoi (str): Identifiant du tournoi.
+            p_tournoi (dict): Document du tournoi à jour, le tour terminé compris.
+            p_tours_termines (int): Nombre de tours terminés, celui-ci compris.
+
+        Returns:
+            int: Nombre d'octets écrits.
+        """
+
+        # Historique pas encore construit : la construction lit le tournoi avec ce tour
+        if not self.o_historique_joueurs.existe():
+            return self.reconstruire_historique_joueurs()["octets"]
+
+        if self.o_historique_joueurs.tours_integres(p_identifiant_tournoi) == p_tours_termines - 1:
+            d_dernier_tour = p_tournoi["liste_tours"][-1]
+            return self.o_historique_joueurs.integrer_tour(
+                p_identifiant_tournoi, d_dernier_tour["identifiant"], d_dernier_tour["liste_matchs"]
+            )
+
+        return self.o_historique_joueurs.remplacer_tournoi(p_identifiant_tournoi, p_tournoi)
+
+    #
+    @staticmethod
+    def _lire_archive_tournoi(p_source: tuple) -> tuple:
+        """
+        Lit un tournoi pour la reconstruction de l'historique des joueurs, dans un processus séparé.
+
+        Args:
+            p_source (tuple): (identifiant du tournoi, chemin de son fichier, chemin de son journal).
+
+        Returns:
+            tuple: (identifiant du tournoi, document du tournoi journal compris, vide si le fichier est vide).
+        """
+
+        s_identifiant, s_fichier_tournoi, s_fichier_journal = p_source
+
+        l_documents = TinyDB(s_fichier_tournoi, storage=StockageJsonRapide).all()
+        if not l_documents:
+            return s_identifiant, {}
 
-        # Explicite le retour si aucun fichier n'est trouvé
-        return None
+        d_tournoi = l_documents[0]
+        JournalTournoi(Path(s_fichier_journal)).rejouer(d_tournoi)
+
+        return s_identifiant, d_tournoi
 
     #
     def _mettre_a_jour_joueur(self, p_id_tinydb: int, p_score_gagne: float) -> None:
@@ -659,3 +1638,136 @@ class GestionnairePersistance:
 
             # Mettre à jour le score du joueur dans TinyDB
             self.db_joueurs.update({"score": score_final}, doc_ids=[int(p_id_tinydb)])
+            self._invalider_cache_joueur(p_id_tinydb)
+
+    #
+    def _appliquer_resultats_joueurs(self, p_points_gagnes: dict, p_parties: list[dict] | None = None) -> int:
+        """
+        Applique en une seule transaction les résultats d'un tour aux joueurs du fichier JSON Joueur :
+        points gagnés et nouveaux classements Elo.
+
+        Le contenu de la base est lu une fois, tous les scores et classements sont modifiés en mémoire,
+        puis le fichier est réécrit une seule fois.
+
+        Args:
+            p_points_gagnes (dict): Dictionnaire associant l'identifiant TinyDB d'un joueur
+                                    aux points à ajouter à son score.
+            p_parties (list[dict] | None, optional): Parties du tour (`joueur_blanc`, `joueur_noir`, `score_blanc`,
+                                                     `score_noir`), dont le `MoteurElo` calcule les classements.
+                                                     Par défaut, aucune : seuls les points sont appliqués.
+
+        Returns:
+            int: Nombre d'octets écrits dans le fichier des joueurs (0 si rien n'a été écrit).
+        """
+
+        if not p_points_gagnes:
+            return 0
+        if p_parties is None:
+            p_parties = []
+
+        d_tables = self.db_joueurs.storage.read() or {}
+        d_table_joueurs = d_tables.get("_default", {})
+
+        for id_tinydb, f_points in p_points_gagnes.items():
+            d_joueur = d_table_joueurs.get(str(id_tinydb))
+            # Ignore les joueurs qui n'existent plus dans la base
+            if d_joueur is not None:
+                d_joueur["score"] = d_joueur["score"] + f_points
+                self._invalider_cache_joueur(id_tinydb)
+
+        # Classements Elo d'avant le tour, puis calcul de toutes les parties du tour en une fois
+        d_classements = {}
+        for d_partie in p_parties:
+            for id_joueur in (str(d_partie["joueur_blanc"]), str(d_partie["joueur_noir"])):
+                d_joueur = d_table_joueurs.get(id_joueur, {})
+                d_classements[id_joueur] = (
+                    d_joueur.get("elo", Joueur.elo_initial),
+                    d_joueur.get("parties_classees", 0),
+                )
+        for id_tinydb, (f_elo, i_parties) in MoteurElo().calculer_tour(d_classements, p_parties).items():
+            d_joueur = d_table_joueurs.get(id_tinydb)
+            if d_joueur is not None:
+                d_joueur["elo"] = f_elo
+                d_joueur["parties_classees"] = i_parties
+
+        self.db_joueurs.storage.write(d_tables)
+        # Le cache de requêtes TinyDB ne connaît pas cette écriture directe
+        self.db_joueurs.clear_cache()
+
+        return Path(self.fichier_joueurs).stat().st_size
+
+    #
+    def _enregistrer_classements_elo(self, p_classements: dict) -> int:
+        """
+        Remplace les classements Elo de plusieurs joueurs, en une seule écriture du fichier JSON Joueur.
+
+        Args:
+            p_classements (dict): Identifiant TinyDB du joueur (str) -> (Elo, parties classées).
+
+        Returns:
+            int: Nombre d'octets écrits dans le fichier des joueurs.
+        """
+
+        d_tables = self.db_joueurs.storage.read() or {}
+        d_table_joueurs = d_tables.get("_default", {})
+
+        for id_tinydb, (f_elo, i_parties) in p_classements.items():
+            d_joueur = d_table_joueurs.get(id_tinydb)
+            if d_joueur is not None:
+                d_joueur["elo"] = f_elo
+                d_joueur["parties_classees"] = i_parties
+                self._invalider_cache_joueur(id_tinydb)
+
+        self.db_joueurs.storage.write(d_tables)
+        # Le cache de requêtes TinyDB ne connaît pas cette écriture directe
+        self.db_joueurs.clear_cache()
+
+        return Path(self.fichier_joueurs).stat().st_size
+
+    #
+    def _identifiants_nationaux_enregistres(self):
+        """
+        Parcourt les identifiants nationaux des joueurs enregistrés, sans créer de document TinyDB.
+
+        Returns:
+            Iterator[str]: Les identifiants nationaux d'échecs.
+        """
+
+        d_joueurs = (self.db_joueurs.storage.read() or {}).get("_default", {})
+
+        return (d_joueur["identifiant_national_echec"] for d_joueur in d_joueurs.values())
+
+    #
+    def _inserer_lot_joueurs(self, p_joueurs: list[dict]) -> int:
+        """
+        Enregistre un lot de nouveaux joueurs en une seule écriture du fichier JSON Joueur.
+
+        L'index trié des joueurs n'est pas complété joueur par joueur : le fichier ayant changé,
+        il sera reconstruit à la prochaine consultation de la liste.
+
+        Args:
+            p_joueurs (list[dict]): Documents des joueurs, au format de `sauvegarder_joueur`.
+
+        Returns:
+            int: Le nombre de joueurs enregistrés.
+        """
+
+        l_identifiants = self.db_joueurs.insert_multiple(p_joueurs)
+        for i_identifiant_tinydb in l_identifiants:
+            self._invalider_cache_joueur(i_identifiant_tinydb)
+
+        return len(l_identifiants)
+
+    #
+    def _invalider_cache_joueur(self, p_id_tinydb: int | str) -> None:
+        """
+        Retire un joueur de la table d'identité après une écriture dans le fichier JSON Joueur.
+
+        Args:
+            p_id_tinydb (int | str): Identifiant du joueur dans la base de données TinyDB.
+
+        Returns:
+            None
+        """
+
+        GestionnairePersistance.d_cache_joueurs.pop(str(p_id_tinydb), None)
@@ -0,0 +1,1224 @@
+from models.gestionnaire_persistance import GestionnairePersistance
+from models.index_tournois import IndexTournois
+from models.etat_appariement import EtatAppariement
+from models.moteur_elo import MoteurElo
+from models.tournoi import Tournoi
+from models.joueur import Joueur
+from models.tour import Tour
+from models.match import Match
+from datetime import datetime
+import json
+import sqlite3
+
+
+class GestionnairePersistanceSqlite(GestionnairePersistance):
+    """
+    Gère la persistance des données des joueurs et des tournois dans une base SQLite.
+
+    Cette classe expose les mêmes méthodes publiques que `GestionnairePersistance` (stockage TinyDB),
+    ce qui permet aux contrôleurs de l'utiliser sans modification. Les données sont réparties
+    dans des tables indexées (joueurs, tournois, inscriptions, tours, matchs, états d'appariement) du fichier
+    `data/lets_roque.sqlite3` : les rapports et l'appariement s'appuient sur des requêtes
+    indexées au lieu de relire des fichiers JSON complets.
+
+    Les sauvegardes et la table d'identité des joueurs sont héritées de `GestionnairePersistance`.
+    """
+
+    # Schéma de la base. `nombre_tours` n'a pas de type pour conserver "A déterminer" ou un entier.
+    schema_sql = """
+        CREATE TABLE IF NOT EXISTS joueurs (
+            identifiant INTEGER PRIMARY KEY,
+            identifiant_national_echec TEXT NOT NULL,
+            nom_famille TEXT NOT NULL,
+            prenom TEXT NOT NULL,
+            date_naissance TEXT NOT NULL,
+            score REAL NOT NULL DEFAULT 0,
+            elo REAL,
+            parties_classees INTEGER NOT NULL DEFAULT 0
+        );
+        CREATE INDEX IF NOT EXISTS idx_joueurs_identifiant_national
+            ON joueurs (identifiant_national_echec);
+        CREATE INDEX IF NOT EXISTS idx_joueurs_nom_prenom ON joueurs (nom_famille, prenom);
+        CREATE INDEX IF NOT EXISTS idx_joueurs_score ON joueurs (score DESC, nom_famille, prenom);
+
+        CREATE TABLE IF NOT EXISTS tournois (
+            identifiant INTEGER PRIMARY KEY,
+            nom_tournoi TEXT NOT NULL,
+            lieu_tournoi TEXT NOT NULL,
+            date_debut_tournoi TEXT NOT NULL,
+            date_fin_tournoi TEXT NOT NULL,
+            nombre_tours,
+            description TEXT,
+            graine INTEGER
+        );
+
+        CREATE TABLE IF NOT EXISTS inscriptions (
+            tournoi INTEGER NOT NULL REFERENCES tournois (identifiant),
+            joueur INTEGER NOT NULL REFERENCES joueurs (identifiant),
+            rang INTEGER NOT NULL,
+            score REAL NOT NULL DEFAULT 0,
+            PRIMARY KEY (tournoi, joueur)
+        );
+        CREATE INDEX IF NOT EXISTS idx_inscriptions_joueur ON inscriptions (joueur);
+
+        CREATE TABLE IF NOT EXISTS tours (
+            tournoi INTEGER NOT NULL REFERENCES tournois (identifiant),
+            numero INTEGER NOT NULL,
+            nom TEXT NOT NULL,
+            statut TEXT NOT NULL,
+            date_heure_debut TEXT,
+            date_heure_fin TEXT,
+            PRIMARY KEY (tournoi, numero)
+        );
+
+        CREATE TABLE IF NOT EXISTS matchs (
+            tournoi INTEGER NOT NULL,
+            tour INTEGER NOT NULL,
+            numero INTEGER NOT NULL,
+            nom_match TEXT,
+            joueur_blanc INTEGER NOT NULL REFERENCES joueurs (identifiant),
+            joueur_noir INTEGER NOT NULL REFERENCES joueurs (identifiant),
+            score_blanc REAL NOT NULL DEFAULT 0,
+            score_noir REAL NOT NULL DEFAULT 0,
+            statut TEXT NOT NULL,
+            PRIMARY KEY (tournoi, tour, numero),
+            FOREIGN KEY (tournoi, tour) REFERENCES tours (tournoi, numero)
+        );
+        CREATE INDEX IF NOT EXISTS idx_matchs_joueur_blanc ON matchs (joueur_blanc);
+        CREATE INDEX IF NOT EXISTS idx_matchs_joueur_noir ON matchs (joueur_noir);
+
+        CREATE TABLE IF NOT EXISTS etats_appariement (
+            tournoi INTEGER PRIMARY KEY REFERENCES tournois (identifiant),
+            etat TEXT NOT NULL
+        );
+    """
+
+    # Colonnes ajoutées au schéma depuis sa création : (table, colonne, définition).
+    # Elles sont ajoutées aux bases existantes à l'ouverture.
+    colonnes_ajoutees: tuple = (
+        ("tournois", "graine", "INTEGER"),
+        ("joueurs", "elo", "REAL"),
+        ("joueurs", "parties_classees", "INTEGER NOT NULL DEFAULT 0"),
+    )
+
+    # Clause ORDER BY de chaque ordre de tri des joueurs (mêmes ordres que `IndexJoueurs`),
+    # chacune servie par un index de la table `joueurs`
+    ordres_tri_joueurs: dict = {
+        "nom": "nom_famille, prenom, identifiant",
+        "score": "score DESC, nom_famille, prenom, identifiant",
+        "ine": "identifiant_national_echec, identifiant",
+    }
+
+    def __init__(self):
+        """
+        Initialise le gestionnaire SQLite : crée les dossiers, ouvre la base et crée les tables si besoin.
+
+        Attributs créés:
+            fichier_base (Path): Chemin du fichier SQLite.
+            connexion (sqlite3.Connection): Connexion à la base.
+        """
+        self._initialiser_dossiers()
+
+        self.fichier_base = self.dossier_source / "lets_roque.sqlite3"
+        self._ouvrir_connexion()
+
+    #
+    # SAUVEGARDE ET CHARGEMENT DES JOUEURS
+
+    def sauvegarder_joueur(self, p_joueur_modele: Joueur) -> int:
+        """
+        Enregistre un nouveau joueur dans la table `joueurs`.
+
+        Args:
+            p_joueur_modele (Joueur): Instance de la classe `Joueur` contenant les informations du joueur.
+
+        Returns:
+            int: L'identifiant du joueur dans la table `joueurs`.
+        """
+
+        with self.connexion:
+            curseur = self.connexion.execute(
+                "INSERT INTO joueurs (identifiant_national_echec, nom_famille, prenom, date_naissance, score, elo, "
+                "parties_classees) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    p_joueur_modele.identifiant_national_echec,
+                    p_joueur_modele.nom_famille,
+                    p_joueur_modele.prenom,
+                    p_joueur_modele.date_naissance,
+                    p_joueur_modele.score,
+                    p_joueur_modele.elo,
+                    p_joueur_modele.parties_classees,
+                ),
+            )
+        self._invalider_cache_joueur(curseur.lastrowid)
+
+        return curseur.lastrowid
+
+    #
+    def charger_joueurs(self) -> list[dict]:
+        """
+        Charge tous les joueurs et les retourne sous forme de liste de dictionnaires.
+
+        La clé `id_tinydb` est conservée pour rester compatible avec le stockage TinyDB :
+        elle contient l'identifiant du joueur dans la table `joueurs`.
+
+        Returns:
+            list[dict]: Une liste de dictionnaires, un par joueur.
+        """
+
+        l_joueurs = []
+        for ligne in self.connexion.execute("SELECT * FROM joueurs ORDER BY identifiant"):
+            d_joueur = dict(ligne)
+            d_joueur["id_tinydb"] = d_joueur.pop("identifiant")
+            l_joueurs.append(d_joueur)
+
+        return l_joueurs
+
+    #
+    def charger_page_joueurs(self, p_tri: str = "nom", p_numero_page: int = 0, p_taille_page: int = 50) -> tuple:
+        """
+        Charge une seule page de joueurs, dans l'ordre de tri demandé.
+
+        Chaque ordre de tri suit un index de la table `joueurs` : la page est lue directement
+        dans l'index, sans trier la table.
+
+        Args:
+            p_tri (str, optional): Ordre de tri : "nom", "score" ou "ine". Par défaut, "nom".
+            p_numero_page (int, optional): Numéro de la page, à partir de 0. Par défaut, 0.
+            p_taille_page (int, optional): Nombre de joueurs par page. Par défaut, 50.
+
+        Returns:
+            tuple:
+                - Les joueurs de la page (list[dict]), au format de `charger_joueurs`.
+                - Le nombre total de joueurs (int).
+        """
+
+        if p_tri not in self.ordres_tri_joueurs:
+            raise ValueError(f"Ordre de tri inconnu : {p_tri}")
+
+        l_joueurs = []
+        for ligne in self.connexion.execute(
+            f"SELECT * FROM joueurs ORDER BY {self.ordres_tri_joueurs[p_tri]} LIMIT ? OFFSET ?",
+            (p_taille_page, p_numero_page * p_taille_page),
+        ):
+            d_joueur = dict(ligne)
+            d_joueur["id_tinydb"] = d_joueur.pop("identifiant")
+            l_joueurs.append(d_joueur)
+
+        i_nombre_joueurs = self.connexion.execute("SELECT COUNT(*) FROM joueurs").fetchone()[0]
+
+        return l_joueurs, i_nombre_joueurs
+
+    #
+    def charger_objets_joueurs(self) -> list[Joueur]:
+        """
+        Charge tous les joueurs en une seule requête et en fait une liste d'objets joueurs.
+
+        Returns:
+            list[Joueur]: Liste d'objets joueurs
+        """
+
+        l_objets_joueurs = []
+        for ligne in self.connexion.execute("SELECT * FROM joueurs ORDER BY identifiant"):
+            l_objets_joueurs.append(self._creer_objet_joueur(ligne))
+
+        return l_objets_joueurs
+
+    #
+    def recuperer_objet_joueur(self, p_identifiant_joueur: str) -> Joueur:
+        """
+        Récupère un joueur sous forme d'objet `Joueur`, depuis la table d'identité ou la base.
+
+        Args:
+            p_identifiant_joueur (str): Identifiant du joueur.
+
+        Returns:
+            Joueur: L'objet `Joueur` correspondant aux données stockées.
+        """
+
+        o_joueur = GestionnairePersistance.d_cache_joueurs.get(str(p_identifiant_joueur))
+        if o_joueur is not None:
+            GestionnairePersistance.i_cache_joueurs_succes += 1
+            return o_joueur
+
+        GestionnairePersistance.i_cache_joueurs_echecs += 1
+
+        ligne = self.connexion.execute(
+            "SELECT * FROM joueurs WHERE identifiant = ?", (int(p_identifiant_joueur),)
+        ).fetchone()
+
+        return self._creer_objet_joueur(ligne)
+
+    #
+    # SAUVEGARDE ET CHARGEMENT DES TOURNOIS
+
+    def sauvegarder_tournoi(self, p_tournoi_modele: Tournoi) -> int:
+        """
+        Enregistre un nouveau tournoi (sans tours) dans la table `tournois`.
+
+        Un tournoi sans identifiant reçoit celui que SQLite attribue à la ligne insérée (le plus grand
+        identifiant plus un), dans la même transaction : la base ne dépend d'aucun fichier compteur.
+
+        Args:
+            p_tournoi_modele (Tournoi): Objet `Tournoi` contenant les informations du tournoi.
+                                        Son attribut `identifiant` est renseigné s'il vaut None.
+
+        Returns:
+            int: L'identifiant du tournoi.
+        """
+
+        i_identifiant = int(p_tournoi_modele.identifiant) if p_tournoi_modele.identifiant is not None else None
+
+        with self.connexion:
+            curseur = self.connexion.execute(
+                "INSERT INTO tournois VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    i_identifiant,
+                    p_tournoi_modele.nom_tournoi,
+                    p_tournoi_modele.lieu_tournoi,
+                    p_tournoi_modele.date_debut_tournoi,
+                    p_tournoi_modele.date_fin_tournoi,
+                    p_tournoi_modele.nombre_tours,
+                    p_tournoi_modele.description,
+                    p_tournoi_modele.graine,
+                ),
+            )
+            self._enregistrer_inscriptions(curseur.lastrowid, p_tournoi_modele.liste_joueurs)
+
+        p_tournoi_modele.identifiant = curseur.lastrowid
+
+        return curseur.lastrowid
+
+    #
+    def sauvegarder_joueurs_tournoi(self, p_tournoi_modele: Tournoi) -> None:
+        """
+        Remplace la liste des joueurs inscrits à un tournoi.
+
+        Args:
+            p_tournoi_modele (Tournoi): Objet `Tournoi` dont `liste_joueurs` est un dictionnaire
+                                        identifiant du joueur -> score dans le tournoi.
+
+        Returns:
+            None
+        """
+
+        with self.connexion:
+            self.connexion.execute(
+                "DELETE FROM inscriptions WHERE tournoi = ?", (int(p_tournoi_modele.identifiant),)
+            )
+            self._enregistrer_inscriptions(p_tournoi_modele.identifiant, p_tournoi_modele.liste_joueurs)
+
+    #
+    def enregister_nombres_tours_tournoi(self, p_objet_tournoi: Tournoi, p_nombre_tour: int) -> None:
+        """
+        Met à jour le nombre de tours d'un tournoi.
+
+        Args:
+            p_objet_tournoi (Tournoi): L'objet tournoi dont on souhaite modifier le nombre de tours.
+            p_nombre_tour (int): Le nombre de tours à enregistrer.
+
+        Returns:
+            None
+        """
+
+        with self.connexion:
+            self.connexion.execute(
+                "UPDATE tournois SET nombre_tours = ? WHERE identifiant = ?",
+                (p_nombre_tour, int(p_objet_tournoi.identifiant)),
+            )
+
+    #
+    def enregistrer_graine_tournoi(self, p_objet_tournoi: Tournoi) -> None:
+        """
+        Enregistre la graine des tirages aléatoires d'un tournoi.
+
+        Args:
+            p_objet_tournoi (Tournoi): L'objet tournoi, dont l'attribut `graine` est renseigné.
+
+        Returns:
+            None
+        """
+
+        with self.connexion:
+            self.connexion.execute(
+                "UPDATE tournois SET graine = ? WHERE identifiant = ?",
+                (p_objet_tournoi.graine, int(p_objet_tournoi.identifiant)),
+            )
+
+    #
+    def recuperer_objet_tournoi(self, p_identifiant_tournoi: str) -> Tournoi:
+        """
+        Reconstruit un objet `Tournoi` avec ses objets `Tour`, `Match` et `Joueur`.
+
+        Args:
+            p_identifiant_tournoi (str): L'identifiant du tournoi à recupérer.
+
+        Returns:
+            Tournoi: L'objet Tournoi recontruit avec tous ses tours et ses matchs associés.
+        """
+
+        i_identifiant = int(p_identifiant_tournoi)
+        ligne_tournoi = self.connexion.execute(
+            "SELECT * FROM tournois WHERE identifiant = ?", (i_identifiant,)
+        ).fetchone()
+
+        o_tournoi = Tournoi(
+            p_identifiant=p_identifiant_tournoi,
+            p_nom_tournoi=ligne_tournoi["nom_tournoi"],
+            p_lieu_tournoi=ligne_tournoi["lieu_tournoi"],
+            p_date_debut_tournoi=ligne_tournoi["date_debut_tournoi"],
+            p_date_fin_tournoi=ligne_tournoi["date_fin_tournoi"],
+            p_nombre_tours=ligne_tournoi["nombre_tours"],
+            p_description=ligne_tournoi["description"],
+            p_graine=ligne_tournoi["graine"],
+        )
+
+        o_tournoi.liste_tours = []
+        for d_tour in self._charger_tours(i_identifiant):
+            o_tour = Tour(
+                p_identifiant=d_tour["identifiant"],
+                p_nom=d_tour["nom"],
+                p_tournoi=o_tournoi,
+                p_statut=d_tour["statut"],
+                p_date_heure_debut=d_tour["date_heure_debut"],
+                p_date_heure_fin=d_tour["date_heure_fin"],
+            )
+            for d_match in d_tour["liste_matchs"]:
+                o_match = Match(
+                    p_identifiant=d_match["identifiant"],
+                    p_joueur_blanc=self.recuperer_objet_joueur(d_match["joueur_blanc"]),
+                    p_joueur_noir=self.recuperer_objet_joueur(d_match["joueur_noir"]),
+                    p_score_blanc=d_match["score_blanc"],
+                    p_score_noir=d_match["score_noir"],
+                    p_statut=d_match["statut"],
+                )
+                o_tour.liste_matchs.append(o_match)
+
+            o_tournoi.liste_tours.append(o_tour)
+
+        o_tournoi.liste_joueurs = []
+        for s_identifiant_joueur in self.recuepere_score_joueurs(p_identifiant_tournoi):
+            o_tournoi.liste_joueurs.append(self.recuperer_objet_joueur(s_identifiant_joueur))
+
+        return o_tournoi
+
+    #
+    def recuperer_document_tournoi(self, p_identifiant_tournoi: str) -> dict:
+        """
+        Retourne un tournoi au format des documents TinyDB, sans construire d'objets.
+
+        Args:
+            p_identifiant_tournoi (str): L'identifiant du tournoi.
+
+        Returns:
+            dict: Le document du tournoi : en-tête, `graine`, `liste_joueurs` (identifiant -> score)
+                  et `liste_tours` (avec leurs matchs).
+        """
+
+        i_identifiant = int(p_identifiant_tournoi)
+        ligne_tournoi = self.connexion.execute(
+            "SELECT * FROM tournois WHERE identifiant = ?", (i_identifiant,)
+        ).fetchone()
+
+        d_tournoi = dict(ligne_tournoi)
+        del d_tournoi["identifiant"]
+        d_tournoi["liste_joueurs"] = self.recuepere_score_joueurs(p_identifiant_tournoi)
+        d_tournoi["liste_tours"] = self._charger_tours(i_identifiant)
+
+        return d_tournoi
+
+    #
+    def recuperer_fichiers_tournois(self) -> list[str]:
+        """
+        Liste les tournois sous la forme des noms de fichiers utilisés par le stockage TinyDB.
+
+        Les vues extraient l'identifiant, le nom et la date du tournoi de ces noms
+        ("tournoi_<id>_<nom>_<date>.json") : ce format est donc conservé.
+
+        Returns:
+            list[str]: Liste des noms logiques des tournois.
+        """
+
+        l_noms = []
+        for ligne in self.connexion.execute("SELECT identifiant, nom_tournoi, date_debut_tournoi FROM tournois"):
+            l_noms.append(f"tournoi_{ligne[0]}_{ligne[1]}_{ligne[2]}.json")
+
+        return sorted(l_noms)
+
+    #
+    def recuperer_catalogue_tournois(self) -> list[dict]:
+        """
+        Retourne l'en-tête de tous les tournois en une seule requête.
+
+        Returns:
+            list[dict]: Liste des en-têtes de tournois (mêmes clés que le stockage TinyDB).
+        """
+
+        return self._lire_entetes_tournois()
+
+    #
+    def recuperer_entete_tournoi(self, p_identifiant_tournoi: str) -> dict:
+        """
+        Retourne l'en-tête d'un tournoi, sans lire ses tours ni ses matchs.
+
+        Args:
+            p_identifiant_tournoi (str): L'identifiant du tournoi.
+
+        Returns:
+            dict: L'en-tête du tournoi, avec les clés de `recuperer_catalogue_tournois`.
+
+        Raises:
+            ValueError: Si le tournoi n'existe pas.
+        """
+
+        l_entetes = self._lire_entetes_tournois(p_identifiant_tournoi)
+        if not l_entetes:
+            raise ValueError(f"Aucun tournoi avec l'identifiant {p_identifiant_tournoi}.")
+
+        return l_entetes[0]
+
+    #
+    def enregistrer_tour_tournoi(self, p_objet_tour: Tour, p_objet_tournoi: Tournoi) -> None:
+        """
+        Ajoute un tour et ses matchs à un tournoi existant.
+
+        Args:
+            p_objet_tour (Tour): L'objet Tour à ajouter.
+            p_objet_tournoi (Tournoi): L'objet Tournoi dans lequel ajouter le tour.
+
+        Returns:
+            None
+        """
+
+        i_identifiant_tournoi = int(p_objet_tournoi.identifiant)
+
+        with self.connexion:
+            self.connexion.execute(
+                "INSERT INTO tours VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    i_identifiant_tournoi,
+                    p_objet_tour.identifiant,
+                    p_objet_tour.nom,
+                    p_objet_tour.statut,
+                    p_objet_tour.date_heure_debut,
+                    p_objet_tour.date_heure_fin,
+                ),
+            )
+            self.connexion.executemany(
+                "INSERT INTO matchs VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        i_identifiant_tournoi,
+                        p_objet_tour.identifiant,
+                        o_match.identifiant,
+                        o_match.nom_match,
+                        int(o_match.joueur_blanc.identifiant_tinydb),
+                        int(o_match.joueur_noir.identifiant_tinydb),
+                        o_match.score_blanc,
+                        o_match.score_noir,
+                        o_match.statut,
+                    )
+                    for o_match in p_objet_tour.liste_matchs
+                ],
+            )
+
+    #
+    def recuperer_dernier_tour(self, p_identifiant_tournoi: str) -> dict:
+        """
+        Récupère le dernier tour d'un tournoi, dans le même format que le stockage TinyDB.
+
+        Args:
+            p_identifiant_tournoi (str): L'identifiant du tournoi dont on veut récupérer le dernier tour.
+
+        Returns:
+            dict: Un dictionnaire contenant les informations du dernier tour du tournoi
+                  y compris la liste des matchs joués.
+        """
+
+        return self._charger_tours(int(p_identifiant_tournoi), p_dernier_seulement=True)[-1]
+
+    #
+    def enregistrer_resultat_match(self, p_resultats: list[dict], p_identifiant_tournoi: str) -> dict:
+        """
+        Enregistre les résultats des matchs du dernier tour, met à jour les scores et clôture le tour.
+
+        Toutes les écritures (matchs, scores du tournoi, scores et classements Elo des joueurs, statut
+        du tour) sont faites dans une seule transaction ; le tour est ensuite intégré à l'état d'appariement.
+
+        SQLite ne donne pas le volume écrit sur le disque : le bilan compte les lignes modifiées,
+        mesurées par `total_changes` (une ligne par joueur, par match, par inscrit, le tour et l'état d'appariement).
+
+        Args:
+            p_resultats (list[dict]): Liste des résultats des matchs sous forme de dictionnaires,
+                                    contenant `score_blanc` (float), `score_noir` (float), et `statut` (str).
+            p_identifiant_tournoi (str): Identifiant unique du tournoi concerné.
+
+        Returns:
+            dict: Le bilan des écritures du tour :
+                - "lignes_joueurs" (int) : Nombre de lignes modifiées dans la table `joueurs`.
+                - "lignes_tournoi" (int) : Nombre de lignes modifiées pour le tournoi (matchs, inscriptions,
+                  tour et état d'appariement).
+                - "lignes_total" (int) : Somme des deux.
+        """
+
+        i_identifiant_tournoi = int(p_identifiant_tournoi)
+        d_dernier_tour = self.recuperer_dernier_tour(p_identifiant_tournoi)
+
+        # Points gagnés par joueur sur ce tour, appliqués en une fois
+        d_points_gagnes = {}
+        l_lignes_matchs = []
+        for d_match, d_resultat in zip(d_dernier_tour["liste_matchs"], p_resultats):
+            i_joueur_blanc = int(d_match["joueur_blanc"])
+            i_joueur_noir = int(d_match["joueur_noir"])
+            d_points_gagnes[i_joueur_blanc] = d_points_gagnes.get(i_joueur_blanc, 0) + d_resultat["score_blanc"]
+            d_points_gagnes[i_joueur_noir] = d_points_gagnes.get(i_joueur_noir, 0) + d_resultat["score_noir"]
+            l_lignes_matchs.append(
+                (
+                    d_resultat["score_blanc"],
+                    d_resultat["score_noir"],
+                    d_resultat["statut"],
+                    i_identifiant_tournoi,
+                    d_dernier_tour["identifiant"],
+                    d_match["identifiant"],
+                )
+            )
+
+        l_lignes_inscriptions = [
+            (f_points, i_identifiant_tournoi, i_joueur) for i_joueur, f_points in d_points_gagnes.items()
+        ]
+        s_date_heure_fin = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+        # Classements Elo d'avant le tour, puis calcul de toutes les parties du tour en une fois
+        l_parties = [
+            {**d_match, **d_resultat} for d_match, d_resultat in zip(d_dernier_tour["liste_matchs"], p_resultats)
+        ]
+        d_classements = {
+            str(ligne["identifiant"]): (
+                ligne["elo"] if ligne["elo"] is not None else Joueur.elo_initial,
+                ligne["parties_classees"],
+            )
+            for ligne in self.connexion.execute(
+                "SELECT identifiant, elo, parties_classees FROM joueurs "
+                "WHERE identifiant IN (SELECT value FROM json_each(?))",
+                (json.dumps(list(d_points_gagnes)),),
+            )
+        }
+        d_elos = MoteurElo().calculer_tour(d_classements, l_parties)
+        # Points, Elo et parties classées de chaque joueur du tour, en une seule mise à jour de sa ligne
+        l_lignes_joueurs = [
+            (f_points, *d_elos[str(i_joueur)], i_joueur) for i_joueur, f_points in d_points_gagnes.items()
+        ]
+
+        i_changements = self.connexion.total_changes
+        with self.connexion:
+            self.connexion.executemany(
+                "UPDATE matchs SET score_blanc = ?, score_noir = ?, statut = ? "
+                "WHERE tournoi = ? AND tour = ? AND numero = ?",
+                l_lignes_matchs,
+            )
+            self.connexion.executemany(
+                "UPDATE inscriptions SET score = score + ? WHERE tournoi = ? AND joueur = ?", l_lignes_inscriptions
+            )
+            self.connexion.execute(
+                "UPDATE tours SET statut = 'Terminé', date_heure_fin = ? WHERE tournoi = ? AND numero = ?",
+                (s_date_heure_fin, i_identifiant_tournoi, d_dernier_tour["identifiant"]),
+            )
+            i_lignes_tournoi = self.connexion.total_changes - i_changements
+
+            self.connexion.executemany(
+                "UPDATE joueurs SET score = score + ?, elo = ?, parties_classees = ? WHERE identifiant = ?",
+                l_lignes_joueurs,
+            )
+            i_lignes_joueurs = self.connexion.total_changes - i_changements - i_lignes_tournoi
+
+        for i_joueur in d_points_gagnes:
+            self._invalider_cache_joueur(i_joueur)
+
+        i_tours_termines = self.connexion.execute(
+            "SELECT COUNT(*) FROM tours WHERE tournoi = ? AND statut = 'Terminé'", (i_identifiant_tournoi,)
+        ).fetchone()[0]
+        i_changements = self.connexion.total_changes
+        self._mettre_a_jour_etat_appariement(p_identifiant_tournoi, l_parties, i_tours_termines)
+        i_lignes_tournoi += self.connexion.total_changes - i_changements
+
+        return {
+            "lignes_joueurs": i_lignes_joueurs,
+            "lignes_tournoi": i_lignes_tournoi,
+            "lignes_total": i_lignes_joueurs + i_lignes_tournoi,
+        }
+
+    #
+    def recuepere_score_joueurs(self, p_identifiant_tournoi: str) -> dict:
+        """
+        Récupère les scores des joueurs d'un tournoi, dans l'ordre d'inscription.
+
+        Args:
+            p_identifiant_tournoi (str): Identifiant du tournoi dont on veut récupérer les scores.
+
+        Returns:
+            dict: Un dictionnaire identifiant du joueur (str) -> score dans le tournoi.
+        """
+
+        d_scores = {}
+        for ligne in self.connexion.execute(
+            "SELECT joueur, score FROM inscriptions WHERE tournoi = ? ORDER BY rang", (int(p_identifiant_tournoi),)
+        ):
+            d_scores[str(ligne["joueur"])] = ligne["score"]
+
+        return d_scores
+
+    #
+    def recuperer_historique_joueur(self, p_identifiant_joueur: str, p_tournois=None) -> list[dict]:
+        """
+        Retourne les parties d'un joueur dans tous les tournois.
+
+        La table `matchs`, indexée par joueur blanc et par joueur noir, sert ici d'historique des joueurs :
+        elle est tenue à jour dans la transaction de chaque fin de tour, sans index séparé.
+
+        Args:
+            p_identifiant_joueur (str): Identifiant du joueur.
+            p_tournois (iterable, optional): Identifiants des tournois à retenir (par défaut : tous).
+
+        Returns:
+            list[dict]: Les parties des tours terminés, par tournoi puis par tour : `tournoi`, `tour`,
+                        `adversaire`, `couleur` ("blanc" ou "noir") et `resultat`.
+        """
+
+        i_identifiant_joueur = int(p_identifiant_joueur)
+        l_tournois = None if p_tournois is None else [int(id_tournoi) for id_tournoi in p_tournois]
+
+        l_parties = []
+        for ligne in self.connexion.execute(
+            "SELECT m.tournoi, m.tour, m.joueur_noir AS adversaire, 'blanc' AS couleur, m.score_blanc AS resultat "
+            "FROM matchs m JOIN tours t ON t.tournoi = m.tournoi AND t.numero = m.tour "
+            "WHERE m.joueur_blanc = ? AND t.statut = 'Terminé' "
+            "UNION ALL "
+            "SELECT m.tournoi, m.tour, m.joueur_blanc, 'noir', m.score_noir "
+            "FROM matchs m JOIN tours t ON t.tournoi = m.tournoi AND t.numero = m.tour "
+            "WHERE m.joueur_noir = ? AND t.statut = 'Terminé' "
+            "ORDER BY 1, 2",
+            (i_identifiant_joueur, i_identifiant_joueur),
+        ):
+            if l_tournois is not None and ligne["tournoi"] not in l_tournois:
+                continue
+            l_parties.append(
+                {
+                    "tournoi": str(ligne["tournoi"]),
+                    "tour": ligne["tour"],
+                    "adversaire": str(ligne["adversaire"]),
+                    "couleur": ligne["couleur"],
+                    "resultat": ligne["resultat"],
+                }
+            )
+
+        return l_parties
+
+    #
+    def reconstruire_historique_joueurs(self) -> dict:
+        """
+        Retourne le bilan de l'historique des joueurs : avec SQLite, il n'y a rien à reconstruire,
+        l'historique étant lu directement dans la table `matchs`.
+
+        Returns:
+            dict: Le bilan : "tournois", "joueurs", "parties" et "octets" (toujours 0).
+        """
+
+        ligne = self.connexion.execute(
+            "WITH parties AS (SELECT m.* FROM matchs m "
+            "JOIN tours t ON t.tournoi = m.tournoi AND t.numero = m.tour WHERE t.statut = 'Terminé') "
+            "SELECT COUNT(DISTINCT tournoi), COUNT(*), "
+            "(SELECT COUNT(*) FROM (SELECT joueur_blanc FROM parties UNION SELECT joueur_noir FROM parties)) "
+            "FROM parties"
+        ).fetchone()
+
+        return {"tournois": ligne[0], "joueurs": ligne[2], "parties": ligne[1], "octets": 0}
+
+    #
+    def restaurer_sauvegarde(self, p_nom_sauvegarde: str) -> tuple:
+        """
+        Restaure une sauvegarde en refermant la base le temps du remplacement du dossier `data/`.
+
+        Args:
+            p_nom_sauvegarde (str): Nom du dossier de sauvegarde à restaurer.
+
+        Returns:
+            tuple: Un message de succès ou d'erreur, et "success" ou "error".
+        """
+
+        self.connexion.close()
+        try:
+            return super().restaurer_sauvegarde(p_nom_sauvegarde)
+        finally:
+            self._ouvrir_connexion()
+
+    #
+    def lister_elements_sauvegarde(self, p_nom_sauvegarde: str) -> list[str]:
+        """
+        Liste les éléments d'une sauvegarde qui peuvent être restaurés seuls : ici, la base SQLite.
+
+        Args:
+            p_nom_sauvegarde (str): Nom du dossier de sauvegarde.
+
+        Returns:
+            list[str]: ["lets_roque.sqlite3"] si la sauvegarde contient une base SQLite, sinon une liste vide.
+        """
+
+        if (self.dossier_sauvegarde / p_nom_sauvegarde / self.fichier_base.name).is_file():
+            return [self.fichier_base.name]
+
+        return []
+
+    #
+    def restaurer_element_sauvegarde(self, p_nom_sauvegarde: str, p_element: str) -> tuple:
+        """
+        Restaure un seul élément d'une sauvegarde en refermant la base le temps du remplacement.
+
+        Args:
+            p_nom_sauvegarde (str): Nom du dossier de sauvegarde.
+            p_element (str): Élément à restaurer, tel que retourné par `lister_elements_sauvegarde`.
+
+        Returns:
+            tuple: Un message de succès ou d'erreur, et "success" ou "error".
+        """
+
+        self.connexion.close()
+        try:
+            return super().restaurer_element_sauvegarde(p_nom_sauvegarde, p_element)
+        finally:
+            self._ouvrir_connexion()
+
+    #
+    # IMPORT DEPUIS LE STOCKAGE TINYDB
+
+    def est_vide(self) -> bool:
+        """
+        Indique si la base ne contient encore aucun joueur ni aucun tournoi.
+
+        Returns:
+            bool: True si la base est vide.
+        """
+
+        i_joueurs = self.connexion.execute("SELECT COUNT(*) FROM joueurs").fetchone()[0]
+        i_tournois = self.connexion.execute("SELECT COUNT(*) FROM tournois").fetchone()[0]
+
+        return i_joueurs == 0 and i_tournois == 0
+
+    #
+    def importer_joueurs(self, p_joueurs: list[dict]) -> None:
+        """
+        Importe des joueurs en conservant leur identifiant (clé `id_tinydb`).
+
+        Args:
+            p_joueurs (list[dict]): Joueurs au format de `GestionnairePersistance.charger_joueurs`.
+
+        Returns:
+            None
+        """
+
+        with self.connexion:
+            self.connexion.executemany(
+                "INSERT INTO joueurs (identifiant, identifiant_national_echec, nom_famille, prenom, date_naissance, "
+                "score, elo, parties_classees) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        int(d_joueur["id_tinydb"]),
+                        d_joueur["identifiant_national_echec"],
+                        d_joueur["nom_famille"],
+                        d_joueur["prenom"],
+                        d_joueur["date_naissance"],
+                        d_joueur["score"],
+                        d_joueur.get("elo"),
+                        d_joueur.get("parties_classees", 0),
+                    )
+                    for d_joueur in p_joueurs
+                ],
+            )
+
+    #
+    def importer_document_tournoi(self, p_identifiant_tournoi: str, p_tournoi: dict) -> None:
+        """
+        Importe un tournoi complet (inscriptions, tours et matchs) à partir de son document JSON.
+
+        Args:
+            p_identifiant_tournoi (str): Identifiant du tournoi.
+            p_tournoi (dict): Document du tournoi tel que stocké par TinyDB (journal compris).
+
+        Returns:
+            None
+        """
+
+        i_identifiant = int(p_identifiant_tournoi)
+
+        with self.connexion:
+            self.connexion.execute(
+                "INSERT INTO tournois VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    i_identifiant,
+                    p_tournoi["nom_tournoi"],
+                    p_tournoi["lieu_tournoi"],
+                    p_tournoi["date_debut_tournoi"],
+                    p_tournoi["date_fin_tournoi"],
+                    p_tournoi["nombre_tours"],
+                    p_tournoi["description"],
+                    p_tournoi.get("graine"),
+                ),
+            )
+            self._enregistrer_inscriptions(i_identifiant, p_tournoi["liste_joueurs"])
+
+            for d_tour in p_tournoi.get("liste_tours", []):
+                self.connexion.execute(
+                    "INSERT INTO tours VALUES (?, ?, ?, ?, ?, ?)",
+                    (
+                        i_identifiant,
+                        d_tour["identifiant"],
+                        d_tour["nom"],
+                        d_tour["statut"],
+                        d_tour["date_heure_debut"],
+                        d_tour["date_heure_fin"],
+                    ),
+                )
+                self.connexion.executemany(
+                    "INSERT INTO matchs VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    [
+                        (
+                            i_identifiant,
+                            d_tour["identifiant"],
+                            d_match["identifiant"],
+                            d_match.get("nom_match"),
+                            int(d_match["joueur_blanc"]),
+                            int(d_match["joueur_noir"]),
+                            d_match.get("score_blanc", 0.0),
+                            d_match.get("score_noir", 0.0),
+                            d_match["statut"],
+                        )
+                        for d_match in d_tour["liste_matchs"]
+                    ],
+                )
+
+    #
+    # METHODES PRIVEES
+    #
+    def _ouvrir_connexion(self) -> None:
+        """
+        Ouvre la connexion à la base SQLite et crée les tables si elles n'existent pas.
+
+        Returns:
+            None
+        """
+
+        self.connexion = sqlite3.connect(self.fichier_base)
+        self.connexion.row_factory = sqlite3.Row
+        self.connexion.execute("PRAGMA foreign_keys = ON")
+        self.connexion.executescript(self.schema_sql)
+
+        # Bases créées avant l'ajout de colonnes au schéma
+        for s_table, s_colonne, s_definition in self.colonnes_ajoutees:
+            l_colonnes = [ligne["name"] for ligne in self.connexion.execute(f"PRAGMA table_info({s_table})")]
+            if s_colonne not in l_colonnes:
+                with self.connexion:
+                    self.connexion.execute(f"ALTER TABLE {s_table} ADD COLUMN {s_colonne} {s_definition}")
+
+    #
+    def _lire_etat_appariement(self, p_identifiant_tournoi: str) -> EtatAppariement | None:
+        """
+        Lit l'état d'appariement enregistré d'un tournoi dans la table `etats_appariement`.
+
+        Args:
+            p_identifiant_tournoi (str): Identifiant du tournoi.
+
+        Returns:
+            EtatAppariement | None: L'état enregistré, ou None s'il n'existe pas ou n'est pas lisible.
+        """
+
+        ligne = self.connexion.execute(
+            "SELECT etat FROM etats_appariement WHERE tournoi = ?", (int(p_identifiant_tournoi),)
+        ).fetchone()
+        if ligne is None:
+            return None
+
+        try:
+            return EtatAppariement.depuis_dict(json.loads(ligne["etat"]))
+        except (ValueError, KeyError, TypeError):
+            return None
+
+    #
+    def _enregistrer_etat_appariement(self, p_identifiant_tournoi: str, p_etat: EtatAppariement) -> int:
+        """
+        Enregistre l'état d'appariement d'un tournoi dans la table `etats_appariement`.
+
+        Args:
+            p_identifiant_tournoi (str): Identifiant du tournoi.
+            p_etat (EtatAppariement): L'état à enregistrer.
+
+        Returns:
+            int: Taille de l'état enregistré, en octets.
+        """
+
+        s_etat = json.dumps(p_etat.vers_dict(), separators=(",", ":"))
+        with self.connexion:
+            self.connexion.execute(
+                "INSERT OR REPLACE INTO etats_appariement (tournoi, etat) VALUES (?, ?)",
+                (int(p_identifiant_tournoi), s_etat),
+            )
+
+        return len(s_etat)
+
+    #
+    def _document_etat_appariement(self, p_identifiant_tournoi: str) -> dict:
+        """
+        Retourne les données du tournoi nécessaires pour reconstruire son état d'appariement.
+
+        Args:
+            p_identifiant_tournoi (str): Identifiant du tournoi.
+
+        Returns:
+            dict: `liste_joueurs` (identifiant -> score) et `liste_tours` (avec leurs matchs).
+        """
+
+        return {
+            "liste_joueurs": self.recuepere_score_joueurs(p_identifiant_tournoi),
+            "liste_tours": self._charger_tours(int(p_identifiant_tournoi)),
+        }
+
+    #
+    def _enregistrer_classements_elo(self, p_classements: dict) -> int:
+        """
+        Remplace les classements Elo de plusieurs joueurs, en une seule transaction.
+
+        Args:
+            p_classements (dict): Identifiant du joueur (str) -> (Elo, parties classées).
+
+        Returns:
+            int: Volume des valeurs modifiées, en octets.
+        """
+
+        l_lignes_elos = [
+            (f_elo, i_parties, int(id_joueur)) for id_joueur, (f_elo, i_parties) in p_classements.items()
+        ]
+        with self.connexion:
+            self.connexion.executemany(
+                "UPDATE joueurs SET elo = ?, parties_classees = ? WHERE identifiant = ?", l_lignes_elos
+            )
+
+        for id_joueur in p_classements:
+            self._invalider_cache_joueur(id_joueur)
+
+        return len(json.dumps(l_lignes_elos))
+
+    #
+    def _identifiants_nationaux_enregistres(self):
+        """
+        Parcourt les identifiants nationaux des joueurs enregistrés.
+
+        Returns:
+            Iterator[str]: Les identifiants nationaux d'échecs.
+        """
+
+        return (ligne[0] for ligne in self.connexion.execute("SELECT identifiant_national_echec FROM joueurs"))
+
+    #
+    def _inserer_lot_joueurs(self, p_joueurs: list[dict]) -> int:
+        """
+        Enregistre un lot de nouveaux joueurs dans une seule transaction.
+
+        Args:
+            p_joueurs (list[dict]): Documents des joueurs, au format de `sauvegarder_joueur`.
+
+        Returns:
+            int: Le nombre de joueurs enregistrés.
+        """
+
+        with self.connexion:
+            curseur = self.connexion.executemany(
+                "INSERT INTO joueurs (identifiant_national_echec, nom_famille, prenom, date_naissance, score, elo, "
+                "parties_classees) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        d_joueur["identifiant_national_echec"],
+                        d_joueur["nom_famille"],
+                        d_joueur["prenom"],
+                        d_joueur["date_naissance"],
+                        d_joueur["score"],
+                        d_joueur["elo"],
+                        d_joueur["parties_classees"],
+                    )
+                    for d_joueur in p_joueurs
+                ],
+            )
+
+        return curseur.rowcount
+
+    #
+    def _creer_objet_joueur(self, p_ligne: sqlite3.Row) -> Joueur:
+        """
+        Construit (ou retrouve dans la table d'identité) l'objet `Joueur` d'une ligne de la table `joueurs`.
+
+        Args:
+            p_ligne (sqlite3.Row): Ligne de la table `joueurs`.
+
+        Returns:
+            Joueur: L'objet joueur correspondant.
+        """
+
+        s_identifiant_joueur = str(p_ligne["identifiant"])
+
+        o_joueur = GestionnairePersistance.d_cache_joueurs.get(s_identifiant_joueur)
+        if o_joueur is None:
+            o_joueur = Joueur(
+                p_identifiant_national_echec=p_ligne["identifiant_national_echec"],
+                p_nom_famille=p_ligne["nom_famille"],
+                p_prenom=p_ligne["prenom"],
+                p_date_naissance=p_ligne["date_naissance"],
+                p_identifiant_tinydb=s_identifiant_joueur,
+                p_score=p_ligne["score"],
+                p_elo=p_ligne["elo"],
+                p_parties_classees=p_ligne["parties_classees"],
+            )
+            GestionnairePersistance.d_cache_joueurs[s_identifiant_joueur] = o_joueur
+
+        return o_joueur
+
+    #
+    def _enregistrer_inscriptions(self, p_identifiant_tournoi: str, p_liste_joueurs) -> None:
+        """
+        Enregistre les inscriptions d'un tournoi (à appeler dans une transaction ouverte).
+
+        Args:
+            p_identifiant_tournoi (str): Identifiant du tournoi.
+            p_liste_joueurs (dict | list): Dictionnaire identifiant du joueur -> score, ou liste d'identifiants.
+
+        Returns:
+            None
+        """
+
+        if isinstance(p_liste_joueurs, dict):
+            l_inscriptions = list(p_liste_joueurs.items())
+        else:
+            l_inscriptions = [(id_joueur, 0) for id_joueur in p_liste_joueurs]
+
+        self.connexion.executemany(
+            "INSERT INTO inscriptions VALUES (?, ?, ?, ?)",
+            [
+                (int(p_identifiant_tournoi), int(id_joueur), i_rang, f_score)
+                for i_rang, (id_joueur, f_score) in enumerate(l_inscriptions)
+            ],
+        )
+
+    #
+    def _charger_tours(self, p_identifiant_tournoi: int, p_dernier_seulement: bool = False) -> list[dict]:
+        """
+        Charge les tours d'un tournoi et leurs matchs, au format des documents TinyDB.
+
+        Args:
+            p_identifiant_tournoi (int): Identifiant du tournoi.
+            p_dernier_seulement (bool, optional): Ne charger que le dernier tour. Par défaut, False.
+
+        Returns:
+            list[dict]: Les tours du tournoi, chacun avec sa `liste_matchs`.
+        """
+
+        requete_tours = "SELECT * FROM tours WHERE tournoi = ? ORDER BY numero"
+        if p_dernier_seulement:
+            requete_tours = "SELECT * FROM tours WHERE tournoi = ? ORDER BY numero DESC LIMIT 1"
+
+        l_tours = []
+        for ligne_tour in self.connexion.execute(requete_tours, (p_identifiant_tournoi,)):
+            l_matchs = []
+            for ligne_match in self.connexion.execute(
+                "SELECT * FROM matchs WHERE tournoi = ? AND tour = ? ORDER BY numero",
+                (p_identifiant_tournoi, ligne_tour["numero"]),
+            ):
+                l_matchs.append(
+                    {
+                        "identifiant": ligne_match["numero"],
+                        "nom_match": ligne_match["nom_match"],
+                        "joueur_blanc": str(ligne_match["joueur_blanc"]),
+                        "joueur_noir": str(ligne_match["joueur_noir"]),
+                        "score_blanc": ligne_match["score_blanc"],
+                        "score_noir": ligne_match["score_noir"],
+                        "statut": ligne_match["statut"],
+                    }
+                )
+
+            l_tours.append(
+                {
+                    "identifiant": ligne_tour["numero"],
+                    "nom": ligne_tour["nom"],
+                    "statut": ligne_tour["statut"],
+                    "liste_matchs": l_matchs,
+                    "date_heure_debut": ligne_tour["date_heure_debut"],
+                    "date_heure_fin": ligne_tour["date_heure_fin"],
+                }
+            )
+
+        return l_tours
+
+    #
+    def _lire_entetes_tournois(self, p_identifiant_tournoi: str | None = None) -> list[dict]:
+        """
+        Lit l'en-tête des tournois en une seule requête : tous, ou un seul.
+
+        Args:
+            p_identifiant_tournoi (str | None, optional): L'identifiant du tournoi à lire (par défaut : tous).
+
+        Returns:
+            list[dict]: Les en-têtes des tournois (mêmes clés que le stockage TinyDB).
+        """
+
+        requete = """
+            SELECT t.identifiant, t.nom_tournoi, t.lieu_tournoi, t.date_debut_tournoi, t.date_fin_tournoi,
+                   t.nombre_tours,
+                   (SELECT COUNT(*) FROM inscriptions i WHERE i.tournoi = t.identifiant) AS nombre_joueurs,
+                   (SELECT COUNT(*) FROM tours r WHERE r.tournoi = t.identifiant) AS tours_joues,
+                   (SELECT COUNT(*) FROM tours r WHERE r.tournoi = t.identifiant
+                    AND r.statut = 'Terminé') AS tours_termines,
+                   (SELECT r.nom FROM tours r WHERE r.tournoi = t.identifiant
+                    ORDER BY r.numero DESC LIMIT 1) AS tour_courant,
+                   (SELECT r.statut FROM tours r WHERE r.tournoi = t.identifiant
+                    ORDER BY r.numero DESC LIMIT 1) AS statut_tour_courant
+            FROM tournois t
+        """
+        t_parametres = ()
+        if p_identifiant_tournoi is not None:
+            if not str(p_identifiant_tournoi).isdigit():
+                return []
+            requete += " WHERE t.identifiant = ?"
+            t_parametres = (int(p_identifiant_tournoi),)
+
+        l_entetes = []
+        for ligne in self.connexion.execute(requete, t_parametres):
+            d_entree = dict(ligne)
+            d_entree["identifiant"] = str(d_entree["identifiant"])
+            d_entree["nombre_tours"] = IndexTournois.normaliser_nombre_tours(d_entree["nombre_tours"])
+            d_entree["statut"] = self._calculer_statut(
+                d_entree["tours_joues"], d_entree.pop("statut_tour_courant"), d_entree["nombre_tours"]
+            )
+            l_entetes.append(d_entree)
+
+        return l_entetes
+
+    #
+    def _calculer_statut(self, p_nombre_tours_joues: int, p_statut_dernier_tour: str | None, p_nombre_tours) -> str:
+        """
+        Déduit le statut d'un tournoi à partir de ses tours.
+
+        Args:
+            p_nombre_tours_joues (int): Nombre de tours créés.
+            p_statut_dernier_tour (str | None): Statut du dernier tour créé.
+            p_nombre_tours: Nombre de tours prévu ("A déterminer" tant que les joueurs ne sont pas inscrits).
+
+        Returns:
+            str: "Non commencé", "En cours" ou "Terminé".
+        """
+
+        if p_nombre_tours_joues == 0:
+            return "Non commencé"
+
+        if (
+            p_statut_dernier_tour == "Terminé"
+            and str(p_nombre_tours).isdigit()
+            and p_nombre_tours_joues >= int(p_nombre_tours)
+        ):
+            return "Terminé"
+
+        return "En cours"
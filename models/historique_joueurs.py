@@ -0,0 +1,477 @@
+from concurrent.futures import ProcessPoolExecutor
+from models.journal_tournoi import JournalTournoi
+from models.stockage_json import StockageJsonRapide
+from pathlib import Path
+import multiprocessing
+import os
+
+
+class HistoriqueJoueurs:
+    """
+    Index inversé de l'historique des joueurs : identifiant du joueur -> ses parties dans tous les tournois.
+
+    Chaque partie d'un tour terminé y figure deux fois, une fois par joueur, sous la forme compacte
+    `[tournoi, tour, adversaire, couleur, résultat]` (couleur "B" ou "N", résultat 1, 0.5 ou 0).
+    Les rapports d'un joueur, les confrontations directes et la liste des adversaires déjà rencontrés
+    sur une série de tournois se lisent ainsi dans l'index, sans ouvrir aucun fichier tournoi.
+
+    L'index est enregistré dans `data/historique_joueurs.json`, avec le nombre de tours intégrés de
+    chaque tournoi. Chaque tour terminé y est ajouté par une ligne de journal (`journaux/historique_joueurs.jsonl`,
+    même format que `JournalTournoi`) : le coût d'une fin de tour ne dépend pas de la taille de l'archive.
+    Le journal est compacté dans le fichier principal toutes les `nombre_operations_compactage` opérations.
+
+    L'index peut être reconstruit à partir de tous les tournois : les tournois sont lus et indexés par
+    lots dans des processus séparés (`ProcessPoolExecutor`), puis les index partiels sont fusionnés.
+    """
+
+    # Version du format enregistré : un index d'une autre version est reconstruit
+    version_format: int = 1
+    # Nombre d'opérations en attente au-delà duquel le journal est compacté dans le fichier principal
+    nombre_operations_compactage: int = 64
+    # Nombre de tournois lus et indexés par tâche lors d'une reconstruction
+    taille_lot_reconstruction: int = 32
+    # Nombre de processus de la reconstruction (None : un par processeur)
+    nombre_processus: int | None = None
+
+    def __init__(self, p_fichier_historique: Path, p_fichier_journal: Path) -> None:
+        """
+        Initialise l'index sans le charger : le chargement est fait à la première consultation.
+
+        Args:
+            p_fichier_historique (Path): Chemin du fichier de l'index (`data/historique_joueurs.json`).
+            p_fichier_journal (Path): Chemin du journal des tours ajoutés depuis le dernier compactage.
+        """
+        self.fichier_historique = Path(p_fichier_historique)
+        self.o_journal = JournalTournoi(p_fichier_journal)
+        self.d_parties = {}
+        self.d_tours_integres = {}
+        self.i_numero_journal = 0
+        self.i_operations_en_attente = 0
+        self.t_empreinte = None
+
+    #
+    def existe(self) -> bool:
+        """
+        Indique si l'index a déjà été construit.
+
+        Returns:
+            bool: True si le fichier de l'index existe dans un format connu.
+        """
+
+        self._charger()
+
+        return self.t_empreinte is not None and self.t_empreinte[0] is not None
+
+    #
+    def tours_integres(self, p_identifiant_tournoi: str) -> int:
+        """
+        Retourne le nombre de tours d'un tournoi déjà intégrés à l'index.
+
+        Args:
+            p_identifiant_tournoi (str): Identifiant du tournoi.
+
+        Returns:
+            int: Le nombre de tours intégrés (0 si le tournoi est inconnu).
+        """
+
+        self._charger()
+
+        return self.d_tours_integres.get(str(p_identifiant_tournoi), 0)
+
+    #
+    def integrer_tour(self, p_identifiant_tournoi: str, p_numero_tour: int, p_matchs: list[dict]) -> int:
+        """
+        Ajoute les parties d'un tour terminé à l'index.
+
+        Args:
+            p_identifiant_tournoi (str): Identifiant du tournoi.
+            p_numero_tour (int): Numéro du tour.
+            p_matchs (list[dict]): Matchs du tour, avec `joueur_blanc`, `joueur_noir`, `score_blanc`
+                                   et `score_noir`.
+
+        Returns:
+            int: Nombre d'octets écrits.
+        """
+
+        return self._enregistrer_operation(
+            {
+                "operation": "ajout_tour",
+                "tournoi": str(p_identifiant_tournoi),
+                "tours": [[p_numero_tour, self._matchs_compacts(p_matchs)]],
+            }
+        )
+
+    #
+    def remplacer_tournoi(self, p_identifiant_tournoi: str, p_tournoi: dict) -> int:
+        """
+        Remplace toutes les parties d'un tournoi par celles de ses tours terminés.
+
+        Utilisé quand l'index ne correspond plus au tournoi (tour manqué, tournoi restauré).
+
+        Args:
+            p_identifiant_tournoi (str): Identifiant du tournoi.
+            p_tournoi (dict): Document du tournoi (`liste_tours` avec leurs matchs).
+
+        Returns:
+            int: Nombre d'octets écrits.
+        """
+
+        return self._enregistrer_operation(
+            {
+                "operation": "remplacement_tournoi",
+                "tournoi": str(p_identifiant_tournoi),
+                "tours": self._tours_compacts(p_tournoi),
+            }
+        )
+
+    #
+    def parties_joueur(self, p_identifiant_joueur: str, p_tournois=None) -> list[dict]:
+        """
+        Retourne les parties d'un joueur, par tournoi puis par tour.
+
+        Args:
+            p_identifiant_joueur (str): Identifiant du joueur.
+            p_tournois (iterable, optional): Identifiants des tournois à retenir (par défaut : tous).
+
+        Returns:
+            list[dict]: Une partie par dictionnaire : `tournoi`, `tour`, `adversaire`, `couleur`
+                        ("blanc" ou "noir") et `resultat`.
+        """
+
+        self._charger()
+
+        l_parties = self.d_parties.get(str(p_identifiant_joueur), [])
+        if p_tournois is not None:
+            s_tournois = {str(id_tournoi) for id_tournoi in p_tournois}
+            l_parties = [l_partie for l_partie in l_parties if l_partie[0] in s_tournois]
+
+        return [
+            {
+                "tournoi": id_tournoi,
+                "tour": i_tour,
+                "adversaire": id_adversaire,
+                "couleur": "blanc" if s_couleur == "B" else "noir",
+                "resultat": f_resultat,
+            }
+            for id_tournoi, i_tour, id_adversaire, s_couleur, f_resultat in sorted(
+                l_parties, key=lambda l_partie: (int(l_partie[0]), l_partie[1])
+            )
+        ]
+
+    #
+    def confrontations(self, p_identifiant_joueur: str, p_identifiant_adversaire: str) -> list[dict]:
+        """
+        Retourne les parties jouées entre deux joueurs, du point de vue du premier.
+
+        Args:
+            p_identifiant_joueur (str): Identifiant du joueur.
+            p_identifiant_adversaire (str): Identifiant de son adversaire.
+
+        Returns:
+            list[dict]: Les parties, au format de `parties_joueur`.
+        """
+
+        return [
+            d_partie
+            for d_partie in self.parties_joueur(p_identifiant_joueur)
+            if d_partie["adversaire"] == str(p_identifiant_adversaire)
+        ]
+
+    #
+    def adversaires(self, p_identifiant_joueur: str, p_tournois=None) -> set[str]:
+        """
+        Retourne les adversaires déjà rencontrés par un joueur, par exemple sur les tournois d'une série.
+
+        Args:
+            p_identifiant_joueur (str): Identifiant du joueur.
+            p_tournois (iterable, optional): Identifiants des tournois à retenir (par défaut : tous).
+
+        Returns:
+            set[str]: Les identifiants des adversaires.
+        """
+
+        return {d_partie["adversaire"] for d_partie in self.parties_joueur(p_identifiant_joueur, p_tournois)}
+
+    #
+    def reconstruire(self, p_sources: list, p_lire_tournoi) -> dict:
+        """
+        Reconstruit entièrement l'index à partir des tournois, lus et indexés par lots en parallèle.
+
+        Les processus sont créés par duplication (« fork ») : sans cette méthode (Windows), ou avec
+        un seul processeur, tous les lots sont indexés dans le processus courant.
+
+        Args:
+            p_sources (list): Une source par tournoi, passée telle quelle à `p_lire_tournoi`.
+            p_lire_tournoi (callable): Fonction source -> (identifiant du tournoi, document du tournoi).
+                                       Elle doit pouvoir être transmise à un autre processus (fonction
+                                       définie au niveau d'un module ou d'une classe).
+
+        Returns:
+            dict: Le bilan : "tournois", "joueurs", "parties" et "octets".
+        """
+
+        l_lots = [
+            p_sources[i_debut:i_debut + self.taille_lot_reconstruction]
+            for i_debut in range(0, len(p_sources), self.taille_lot_reconstruction)
+        ]
+        i_nombre_processus = min(self.nombre_processus or os.cpu_count() or 1, len(l_lots))
+
+        if i_nombre_processus < 2 or "fork" not in multiprocessing.get_all_start_methods():
+            l_index_partiels = [_indexer_tournois(p_lire_tournoi, l_lot) for l_lot in l_lots]
+        else:
+            with ProcessPoolExecutor(
+                max_workers=i_nombre_processus, mp_context=multiprocessing.get_context("fork")
+            ) as executeur:
+                l_taches = [executeur.submit(_indexer_tournois, p_lire_tournoi, l_lot) for l_lot in l_lots]
+                l_index_partiels = [tache.result() for tache in l_taches]
+
+        self.d_parties = {}
+        self.d_tours_integres = {}
+        for d_parties, d_tours_integres in l_index_partiels:
+            for id_joueur, l_parties in d_parties.items():
+                self.d_parties.setdefault(id_joueur, []).extend(l_parties)
+            self.d_tours_integres.update(d_tours_integres)
+
+        i_octets = self._compacter()
+
+        return {
+            "tournois": len(self.d_tours_integres),
+            "joueurs": len(self.d_parties),
+            "parties": sum(len(l_parties) for l_parties in self.d_parties.values()) // 2,
+            "octets": i_octets,
+        }
+
+    #
+    def vers_dict(self) -> dict:
+        """
+        Convertit l'index en dictionnaire sérialisable en JSON.
+
+        Returns:
+            dict: L'index, avec sa version de format et le numéro de la dernière opération de journal intégrée.
+        """
+
+        return {
+            "version": self.version_format,
+            "numero_journal": self.i_numero_journal,
+            "tours_integres": self.d_tours_integres,
+            "parties": self.d_parties,
+        }
+
+    #
+    # METHODES PRIVEES
+    #
+    def _charger(self) -> None:
+        """
+        Charge l'index et rejoue son journal, si le fichier ou le journal ont changé depuis le dernier chargement.
+
+        Returns:
+            None
+        """
+
+        t_empreinte = (self._empreinte(self.fichier_historique), self._empreinte(self.o_journal.fichier_journal))
+        if t_empreinte == self.t_empreinte:
+            return
+
+        d_index = None
+        if t_empreinte[0] is not None:
+            try:
+                d_index = StockageJsonRapide(str(self.fichier_historique)).read()
+            except ValueError:
+                d_index = None
+
+        if d_index is None or d_index.get("version") != self.version_format:
+            # Index absent ou d'un autre format : il devra être reconstruit, le journal n'a plus de sens
+            self.d_parties = {}
+            self.d_tours_integres = {}
+            self.i_numero_journal = 0
+            self.i_operations_en_attente = 0
+            self.t_empreinte = (None, t_empreinte[1])
+            return
+
+        self.d_parties = d_index["parties"]
+        self.d_tours_integres = d_index["tours_integres"]
+        self.i_numero_journal = d_index["numero_journal"]
+        self.i_operations_en_attente = 0
+
+        for d_operation in self.o_journal.lire():
+            if d_operation["numero"] > self.i_numero_journal:
+                self._appliquer(d_operation)
+                self.i_operations_en_attente += 1
+
+        self.t_empreinte = t_empreinte
+
+    #
+    def _enregistrer_operation(self, p_operation: dict) -> int:
+        """
+        Ajoute une opération au journal, l'applique à l'index en mémoire et compacte le journal s'il est trop long.
+
+        Args:
+            p_operation (dict): Opération à enregistrer (sans numéro, il est attribué ici).
+
+        Returns:
+            int: Nombre d'octets écrits.
+        """
+
+        self._charger()
+
+        p_operation["numero"] = self.i_numero_journal + 1
+        i_octets_ecrits = self.o_journal.ajouter(p_operation)
+        self._appliquer(p_operation)
+        self.i_operations_en_attente += 1
+
+        if self.i_operations_en_attente >= self.nombre_operations_compactage or self.t_empreinte[0] is None:
+            i_octets_ecrits += self._compacter()
+        else:
+            self.t_empreinte = (self.t_empreinte[0], self._empreinte(self.o_journal.fichier_journal))
+
+        return i_octets_ecrits
+
+    #
+    def _appliquer(self, p_operation: dict) -> None:
+        """
+        Applique une opération de journal à l'index en mémoire.
+
+        Opérations connues :
+            - "ajout_tour" : ajoute les parties des `tours` au tournoi.
+            - "remplacement_tournoi" : retire toutes les parties du tournoi, puis ajoute celles des `tours`.
+
+        Args:
+            p_operation (dict): Opération à appliquer.
+
+        Returns:
+            None
+        """
+
+        id_tournoi = p_operation["tournoi"]
+
+        if p_operation["operation"] == "remplacement_tournoi":
+            for id_joueur in list(self.d_parties):
+                l_parties = [l_partie for l_partie in self.d_parties[id_joueur] if l_partie[0] != id_tournoi]
+                if l_parties:
+                    self.d_parties[id_joueur] = l_parties
+                else:
+                    del self.d_parties[id_joueur]
+            self.d_tours_integres.pop(id_tournoi, None)
+
+        elif p_operation["operation"] != "ajout_tour":
+            raise ValueError(f"Opération de journal inconnue : {p_operation['operation']}")
+
+        _ajouter_tours(self.d_parties, self.d_tours_integres, id_tournoi, p_operation["tours"])
+        self.i_numero_journal = p_operation["numero"]
+
+    #
+    def _compacter(self) -> int:
+        """
+        Écrit l'index complet dans son fichier (écriture atomique), puis vide le journal.
+
+        Returns:
+            int: Nombre d'octets écrits.
+        """
+
+        StockageJsonRapide(str(self.fichier_historique), create_dirs=True).write(self.vers_dict())
+        self.o_journal.vider()
+        self.i_operations_en_attente = 0
+        self.t_empreinte = (self._empreinte(self.fichier_historique), None)
+
+        return self.fichier_historique.stat().st_size
+
+    #
+    @staticmethod
+    def _matchs_compacts(p_matchs: list[dict]) -> list[list]:
+        """
+        Réduit les matchs d'un tour à `[blanc, noir, score blanc, score noir]`.
+
+        Args:
+            p_matchs (list[dict]): Matchs du tour.
+
+        Returns:
+            list[list]: Les matchs compacts.
+        """
+
+        return [
+            [str(d_match["joueur_blanc"]), str(d_match["joueur_noir"]), d_match["score_blanc"], d_match["score_noir"]]
+            for d_match in p_matchs
+        ]
+
+    #
+    @staticmethod
+    def _tours_compacts(p_tournoi: dict) -> list[list]:
+        """
+        Retourne les tours terminés d'un tournoi sous la forme `[numéro, matchs compacts]`.
+
+        Args:
+            p_tournoi (dict): Document du tournoi.
+
+        Returns:
+            list[list]: Les tours terminés.
+        """
+
+        return [
+            [d_tour["identifiant"], HistoriqueJoueurs._matchs_compacts(d_tour["liste_matchs"])]
+            for d_tour in p_tournoi.get("liste_tours", [])
+            if d_tour["statut"] == "Terminé"
+        ]
+
+    #
+    @staticmethod
+    def _empreinte(p_fichier: Path) -> tuple | None:
+        """
+        Retourne l'empreinte d'un fichier, pour savoir s'il a été réécrit depuis le dernier chargement.
+
+        Args:
+            p_fichier (Path): Le fichier.
+
+        Returns:
+            tuple | None: (inode, date de modification, taille) ou None si le fichier n'existe pas.
+        """
+
+        try:
+            stat_fichier = p_fichier.stat()
+        except OSError:
+            return None
+
+        return (stat_fichier.st_ino, stat_fichier.st_mtime_ns, stat_fichier.st_size)
+
+
+def _ajouter_tours(p_parties: dict, p_tours_integres: dict, p_identifiant_tournoi: str, p_tours: list) -> None:
+    """
+    Ajoute à un index les parties de tours compacts d'un tournoi.
+
+    Args:
+        p_parties (dict): Index identifiant du joueur -> parties, modifié sur place.
+        p_tours_integres (dict): Identifiant du tournoi -> nombre de tours intégrés, modifié sur place.
+        p_identifiant_tournoi (str): Identifiant du tournoi.
+        p_tours (list): Tours `[numéro, matchs compacts]`.
+
+    Returns:
+        None
+    """
+
+    for i_tour, l_matchs in p_tours:
+        for id_blanc, id_noir, f_score_blanc, f_score_noir in l_matchs:
+            p_parties.setdefault(id_blanc, []).append([p_identifiant_tournoi, i_tour, id_noir, "B", f_score_blanc])
+            p_parties.setdefault(id_noir, []).append([p_identifiant_tournoi, i_tour, id_blanc, "N", f_score_noir])
+
+    p_tours_integres[p_identifiant_tournoi] = p_tours_integres.get(p_identifiant_tournoi, 0) + len(p_tours)
+
+
+def _indexer_tournois(p_lire_tournoi, p_sources: list) -> tuple:
+    """
+    Lit un lot de tournois et construit leur index partiel (exécuté dans un processus de la reconstruction).
+
+    Args:
+        p_lire_tournoi (callable): Fonction source -> (identifiant du tournoi, document du tournoi).
+        p_sources (list): Sources des tournois du lot.
+
+    Returns:
+        tuple: (identifiant du joueur -> parties, identifiant du tournoi -> nombre de tours intégrés).
+    """
+
+    d_parties = {}
+    d_tours_integres = {}
+
+    for source in p_sources:
+        id_tournoi, d_tournoi = p_lire_tournoi(source)
+        _ajouter_tours(d_parties, d_tours_integres, str(id_tournoi), HistoriqueJoueurs._tours_compacts(d_tournoi))
+
+    return d_parties, d_tours_integres
@@ -0,0 +1,204 @@
+from models.joueur import Joueur
+from models.lecteur_csv import LecteurCsv
+from datetime import datetime
+from itertools import islice
+from pathlib import Path
+
+
+class ImportJoueurs:
+    """
+    Lit un fichier de joueurs (CSV, ou export de la fédération) ligne par ligne et le prépare pour l'import.
+
+    Le fichier n'est jamais chargé en entier : les lignes traversent une chaîne de générateurs
+    (lecture CSV par `LecteurCsv` -> validation -> élimination des doublons -> lots) et seuls les lots
+    à écrire sont gardés en mémoire.
+
+    - Les colonnes sont reconnues par leur en-tête, sans tenir compte des accents ni des majuscules
+      (voir `colonnes`) ; les colonnes inconnues sont ignorées.
+    - Chaque ligne est validée avec les règles de la saisie d'un joueur (`Joueur.regex_identifiant_national`,
+      `Joueur.regex_nom`, date JJ-MM-AAAA). Les dates JJ/MM/AAAA et AAAA-MM-JJ sont converties.
+    - Un identifiant national déjà enregistré, ou déjà lu plus haut dans le fichier, est un doublon :
+      la ligne est rejetée (table de hachage des identifiants).
+
+    Les lignes rejetées sont gardées dans `l_rejets` avec leur numéro et le motif du rejet.
+    """
+
+    # Nombre de joueurs écrits à la fois
+    taille_lot: int = 10000
+    # En-têtes reconnus (normalisés) -> champ du joueur
+    colonnes: dict = {
+        "identifiant national echec": "identifiant_national_echec",
+        "identifiant national": "identifiant_national_echec",
+        "identifiant": "identifiant_national_echec",
+        "ine": "identifiant_national_echec",
+        "nr ffe": "identifiant_national_echec",
+        "nrffe": "identifiant_national_echec",
+        "numero ffe": "identifiant_national_echec",
+        "code ffe": "identifiant_national_echec",
+        "nom famille": "nom_famille",
+        "nom de famille": "nom_famille",
+        "nom": "nom_famille",
+        "prenom": "prenom",
+        "date naissance": "date_naissance",
+        "date de naissance": "date_naissance",
+        "naissance": "date_naissance",
+        "ne le": "date_naissance",
+        "ne e le": "date_naissance",
+        "elo": "elo",
+        "classement elo": "elo",
+    }
+    # Champs sans lesquels un fichier ne peut pas être importé
+    champs_obligatoires: tuple = ("identifiant_national_echec", "nom_famille", "prenom", "date_naissance")
+
+    def __init__(self, p_identifiants_enregistres=()) -> None:
+        """
+        Prépare un import.
+
+        Args:
+            p_identifiants_enregistres (iterable, optional): Identifiants nationaux des joueurs déjà enregistrés.
+        """
+        # Identifiant national (majuscules) -> numéro de la ligne qui l'a importé (0 : déjà enregistré)
+        self.d_identifiants = {str(s_identifiant).upper(): 0 for s_identifiant in p_identifiants_enregistres}
+        self.l_rejets = []
+        self.i_lignes = 0
+        self.i_doublons = 0
+        # Date lue -> date au format JJ-MM-AAAA (None si invalide)
+        self.d_dates = {}
+
+    #
+    def lots(self, p_fichier: str | Path):
+        """
+        Parcourt les joueurs valides du fichier, par lots de `taille_lot`.
+
+        Args:
+            p_fichier (str | Path): Chemin du fichier à importer.
+
+        Returns:
+            Iterator[list[dict]]: Les lots de documents de joueurs, prêts à être enregistrés.
+
+        Raises:
+            FileNotFoundError: Si le fichier n'existe pas.
+            ValueError: Si le fichier est vide, illisible ou s'il lui manque une colonne obligatoire.
+        """
+
+        o_lecteur = LecteurCsv(p_fichier)
+        g_joueurs = self._valider(o_lecteur, o_lecteur.lignes(self.colonnes, self.champs_obligatoires))
+        while True:
+            l_lot = list(islice(g_joueurs, self.taille_lot))
+            if not l_lot:
+                return
+            yield l_lot
+
+    #
+    # METHODES PRIVEES
+    #
+    def _valider(self, p_lecteur: LecteurCsv, p_lignes):
+        """
+        Valide les lignes lues et écarte les doublons.
+
+        Args:
+            p_lecteur (LecteurCsv): Lecteur du fichier, qui donne l'ordre des champs des lignes.
+            p_lignes (Iterator[tuple[int, list[str] | None]]): Lignes produites par `p_lecteur.lignes`.
+
+        Returns:
+            Iterator[dict]: Les documents des joueurs valides, au format du stockage des joueurs.
+        """
+
+        for i_numero, l_valeurs in p_lignes:
+            self.i_lignes += 1
+            if l_valeurs is None:
+                self.l_rejets.append((i_numero, "Ligne incomplète"))
+                continue
+            d_ligne = dict(zip(p_lecteur.l_champs, l_valeurs))
+
+            s_motif = self._motif_rejet(d_ligne)
+            if s_motif is not None:
+                self.l_rejets.append((i_numero, s_motif))
+                continue
+
+            s_identifiant = d_ligne["identifiant_national_echec"].upper()
+            i_ligne_precedente = self.d_identifiants.get(s_identifiant)
+            if i_ligne_precedente is not None:
+                self.i_doublons += 1
+                self.l_rejets.append(
+                    (
+                        i_numero,
+                        f"Identifiant national {s_identifiant} déjà enregistré"
+                        if i_ligne_precedente == 0
+                        else f"Identifiant national {s_identifiant} en double (ligne {i_ligne_precedente})",
+                    )
+                )
+                continue
+            self.d_identifiants[s_identifiant] = i_numero
+
+            s_elo = d_ligne.get("elo", "")
+            yield {
+                "identifiant_national_echec": s_identifiant,
+                "nom_famille": d_ligne["nom_famille"],
+                "prenom": d_ligne["prenom"],
+                "date_naissance": self.d_dates[d_ligne["date_naissance"]],
+                "score": 0,
+                "elo": float(s_elo.replace(",", ".")) if s_elo else Joueur.elo_initial,
+                "parties_classees": 0,
+            }
+
+    #
+    def _motif_rejet(self, p_ligne: dict) -> str | None:
+        """
+        Vérifie une ligne avec les règles de la saisie d'un joueur.
+
+        Args:
+            p_ligne (dict): Champ -> valeur lue.
+
+        Returns:
+            str | None: Le motif du rejet, ou None si la ligne est valide.
+        """
+
+        if not Joueur.regex_identifiant_national.match(p_ligne["identifiant_national_echec"]):
+            return f"Identifiant national invalide : {p_ligne['identifiant_national_echec']!r}"
+
+        for s_champ, s_libelle in (("nom_famille", "Nom"), ("prenom", "Prénom")):
+            if not p_ligne[s_champ] or not Joueur.regex_nom.match(p_ligne[s_champ]):
+                return f"{s_libelle} invalide : {p_ligne[s_champ]!r}"
+
+        if self._convertir_date(p_ligne["date_naissance"]) is None:
+            return f"Date de naissance invalide : {p_ligne['date_naissance']!r}"
+
+        s_elo = p_ligne.get("elo", "")
+        if s_elo:
+            try:
+                f_elo = float(s_elo.replace(",", "."))
+            except ValueError:
+                return f"Elo invalide : {s_elo!r}"
+            if not 0 < f_elo < 4000:
+                return f"Elo invalide : {s_elo!r}"
+
+        return None
+
+    #
+    def _convertir_date(self, p_date: str) -> str | None:
+        """
+        Convertit une date de naissance au format JJ-MM-AAAA, en gardant les dates déjà converties.
+
+        Beaucoup de joueurs partagent une date de naissance : chaque date n'est analysée qu'une fois.
+
+        Args:
+            p_date (str): Date lue (JJ-MM-AAAA, JJ/MM/AAAA, JJ.MM.AAAA ou AAAA-MM-JJ).
+
+        Returns:
+            str | None: La date au format JJ-MM-AAAA, ou None si elle est invalide.
+        """
+
+        if p_date in self.d_dates:
+            return self.d_dates[p_date]
+
+        s_date = p_date.replace("/", "-").replace(".", "-")
+        s_format = "%Y-%m-%d" if s_date[4:5] == "-" else Joueur.format_date_naissance
+        try:
+            s_convertie = datetime.strptime(s_date, s_format).strftime(Joueur.format_date_naissance)
+        except ValueError:
+            s_convertie = None
+
+        self.d_dates[p_date] = s_convertie
+
+        return s_convertie
@@ -0,0 +1,158 @@
+from pathlib import Path
+import bisect
+
+
+class IndexJoueurs:
+    """
+    Index triés des joueurs, pour lister la base page par page sans trier ni charger tous les joueurs.
+
+    Pour chaque ordre de tri (`tris`), l'index garde la liste triée des clés `(critères..., identifiant)` :
+    une page est une simple tranche de cette liste, dont seuls les joueurs sont ensuite lus.
+    - "nom" : nom de famille, prénom ;
+    - "score" : score décroissant, puis nom de famille et prénom ;
+    - "ine" : identifiant national d'échecs.
+    L'identifiant TinyDB départage en dernier recours.
+
+    Chaque index n'est trié qu'à la première demande d'une page dans son ordre. Les index sont gardés
+    en mémoire et associés à l'empreinte du fichier des joueurs : ils sont reconstruits à la consultation
+    suivante si le fichier a changé (résultats d'un tour, restauration). Un joueur ajouté par
+    l'application y est inséré directement, sans reconstruction.
+    """
+
+    # Ordres de tri proposés
+    tris: tuple = ("nom", "score", "ine")
+
+    def __init__(self, p_fichier_joueurs: Path) -> None:
+        """
+        Initialise un index vide, construit à la première consultation.
+
+        Args:
+            p_fichier_joueurs (Path): Chemin du fichier JSON des joueurs.
+        """
+        self.fichier_joueurs = Path(p_fichier_joueurs)
+        self.d_joueurs = {}
+        self.d_index = {}
+        self.t_empreinte = None
+
+    #
+    def est_a_jour(self) -> bool:
+        """
+        Indique si l'index correspond au fichier des joueurs actuel.
+
+        Returns:
+            bool: True si l'index a été construit sur la version actuelle du fichier.
+        """
+
+        return self.t_empreinte is not None and self.t_empreinte == self._empreinte_fichier()
+
+    #
+    def reconstruire(self, p_joueurs: dict) -> None:
+        """
+        Associe l'index aux joueurs actuels : les index triés seront construits à la demande.
+
+        Args:
+            p_joueurs (dict): Table des joueurs telle qu'enregistrée : identifiant TinyDB (str) -> données.
+
+        Returns:
+            None
+        """
+
+        self.d_joueurs = p_joueurs
+        self.d_index = {}
+        self.t_empreinte = self._empreinte_fichier()
+
+    #
+    def ajouter(self, p_identifiant_tinydb: int, p_joueur: dict) -> None:
+        """
+        Insère à sa place, dans chaque index, un joueur qui vient d'être enregistré.
+
+        À n'appeler que si l'index était à jour avant l'enregistrement : il est alors encore à jour après.
+
+        Args:
+            p_identifiant_tinydb (int): Identifiant TinyDB du joueur.
+            p_joueur (dict): Données du joueur.
+
+        Returns:
+            None
+        """
+
+        self.d_joueurs[str(p_identifiant_tinydb)] = p_joueur
+        for s_tri, l_cles in self.d_index.items():
+            bisect.insort(l_cles, self._cle(s_tri, p_identifiant_tinydb, p_joueur))
+
+        self.t_empreinte = self._empreinte_fichier()
+
+    #
+    def page(self, p_tri: str, p_numero_page: int, p_taille_page: int) -> list[int]:
+        """
+        Retourne les identifiants des joueurs d'une page.
+
+        Args:
+            p_tri (str): Ordre de tri (une valeur de `tris`).
+            p_numero_page (int): Numéro de la page, à partir de 0.
+            p_taille_page (int): Nombre de joueurs par page.
+
+        Returns:
+            list[int]: Les identifiants TinyDB des joueurs de la page, dans l'ordre.
+        """
+
+        if p_tri not in self.d_index:
+            self.d_index[p_tri] = sorted(
+                self._cle(p_tri, id_joueur, d_joueur) for id_joueur, d_joueur in self.d_joueurs.items()
+            )
+
+        i_debut = p_numero_page * p_taille_page
+
+        return [t_cle[-1] for t_cle in self.d_index[p_tri][i_debut:i_debut + p_taille_page]]
+
+    #
+    def nombre_joueurs(self) -> int:
+        """
+        Retourne le nombre de joueurs indexés.
+
+        Returns:
+            int: Le nombre de joueurs.
+        """
+
+        return len(self.d_joueurs)
+
+    #
+    # METHODES PRIVEES
+    #
+    def _cle(self, p_tri: str, p_identifiant_tinydb: int, p_joueur: dict) -> tuple:
+        """
+        Retourne la clé de tri d'un joueur.
+
+        Args:
+            p_tri (str): Ordre de tri.
+            p_identifiant_tinydb (int): Identifiant TinyDB du joueur (dernier élément de la clé).
+            p_joueur (dict): Données du joueur.
+
+        Returns:
+            tuple: La clé de tri.
+        """
+
+        if p_tri == "nom":
+            return (p_joueur["nom_famille"], p_joueur["prenom"], int(p_identifiant_tinydb))
+        if p_tri == "score":
+            return (-p_joueur["score"], p_joueur["nom_famille"], p_joueur["prenom"], int(p_identifiant_tinydb))
+        if p_tri == "ine":
+            return (p_joueur["identifiant_national_echec"], int(p_identifiant_tinydb))
+
+        raise ValueError(f"Ordre de tri inconnu : {p_tri}")
+
+    #
+    def _empreinte_fichier(self) -> tuple | None:
+        """
+        Retourne l'empreinte du fichier des joueurs, pour savoir s'il a été réécrit depuis la construction de l'index.
+
+        Returns:
+            tuple | None: (inode, date de modification, taille) ou None si le fichier n'existe pas.
+        """
+
+        try:
+            stat_fichier = self.fichier_joueurs.stat()
+        except OSError:
+            return None
+
+        return (stat_fichier.st_ino, stat_fichier.st_mtime_ns, stat_fichier.st_size)
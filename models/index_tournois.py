@@ -0,0 +1,409 @@
+from pathlib import Path
+import json
+import os
+import re
+
+
+class IndexTournois:
+    """
+    Index persistant associant l'identifiant d'un tournoi à son fichier JSON.
+
+    L'index est stocké dans un petit fichier JSON (`data/index_tournois.json`) qui contient,
+    pour chaque tournoi, le nom de son fichier et son en-tête : nom, lieu, dates, nombre de tours,
+    nombre de joueurs, tour courant et statut. Il sert ainsi de catalogue pour lister les tournois
+    en une seule lecture, sans recharger chaque fichier tournoi.
+    Il est gardé en mémoire et n'est relu que si le fichier d'index a changé sur le disque.
+    Il est reconstruit automatiquement à partir du dossier des tournois s'il est absent ou illisible.
+    Si le dossier des tournois a changé sans passer par l'index (fichier ajouté ou supprimé par un autre
+    processus ou à la main), ses noms de fichiers sont comparés à l'index : seuls les fichiers inconnus
+    de l'index sont lus.
+    """
+
+    # Regex pour extraire l'identifiant exact du tournoi à partir du nom du fichier
+    regex_fichier_tournoi = re.compile(r"^tournoi_(\d+)_.*\.json$")
+
+    # Version du format des entrées : un index d'une autre version est reconstruit
+    version_format: int = 4
+
+    def __init__(self, p_dossier_tournois: Path, p_fichier_index: Path, p_lire_tournoi=None) -> None:
+        """
+        Initialise l'index sans le charger : le chargement est fait à la première consultation.
+
+        Args:
+            p_dossier_tournois (Path): Dossier contenant les fichiers des tournois.
+            p_fichier_index (Path): Chemin du fichier d'index.
+            p_lire_tournoi (callable, optional): Fonction (chemin du fichier, identifiant) -> document du tournoi,
+                                                 utilisée pour reconstruire l'index. Par défaut, le fichier JSON
+                                                 est lu directement.
+        """
+        self.dossier_tournois = p_dossier_tournois
+        self.fichier_index = p_fichier_index
+        self.lire_tournoi = p_lire_tournoi if p_lire_tournoi is not None else self._lire_fichier_tournoi
+        self.d_tournois = {}
+        self.t_empreinte_index = None
+        self.i_signature_dossier = None
+
+    #
+    def chemin(self, p_identifiant_tournoi: str) -> str | None:
+        """
+        Retourne le chemin du fichier d'un tournoi à partir de son identifiant.
+
+        Args:
+            p_identifiant_tournoi (str): Identifiant du tournoi.
+
+        Returns:
+            str | None: Le chemin du fichier tournoi, ou None si le tournoi n'existe pas.
+        """
+
+        d_entree = self.entrees().get(str(p_identifiant_tournoi))
+
+        if d_entree is not None:
+            chemin_fichier = self.dossier_tournois / d_entree["fichier"]
+            if chemin_fichier.is_file():
+                return str(chemin_fichier)
+
+        # Entrée absente ou fichier disparu : l'index est comparé au contenu du dossier
+        d_entree = self._synchroniser(self.d_tournois).get(str(p_identifiant_tournoi))
+        if d_entree is None:
+            return None
+
+        return str(self.dossier_tournois / d_entree["fichier"])
+
+    #
+    def entrees(self) -> dict:
+        """
+        Retourne toutes les entrées de l'index, en le rechargeant ou le reconstruisant si nécessaire.
+
+        Returns:
+            dict: Dictionnaire associant l'identifiant du tournoi (str) à son entrée d'index.
+        """
+
+        d_tournois = self._charger()
+        if d_tournois is None:
+            return self.reconstruire()
+
+        # Le dossier a changé depuis la dernière écriture de l'index : un fichier a été ajouté ou supprimé ailleurs
+        if self._signature_dossier() != self.i_signature_dossier:
+            return self._synchroniser(d_tournois)
+
+        return d_tournois
+
+    #
+    def enregistrer(self, p_identifiant_tournoi: str, p_chemin_fichier: str | Path, p_tournoi: dict) -> None:
+        """
+        Ajoute ou met à jour l'entrée d'un tournoi et réécrit le fichier d'index.
+
+        Appelé juste après l'écriture du fichier du tournoi : la signature du dossier enregistrée avec l'index
+        tient compte de ce fichier, sans comparer le dossier à l'index ni relire les autres tournois.
+
+        Args:
+            p_identifiant_tournoi (str): Identifiant du tournoi.
+            p_chemin_fichier (str | Path): Chemin du fichier JSON du tournoi.
+            p_tournoi (dict): Données du tournoi telles qu'enregistrées dans son fichier.
+
+        Returns:
+            None
+        """
+
+        d_tournois = self._charger()
+        if d_tournois is None:
+            d_tournois = self.reconstruire()
+
+        d_tournois[str(p_identifiant_tournoi)] = self._creer_entree(Path(p_chemin_fichier).name, p_tournoi)
+        self._ecrire(d_tournois)
+
+    #
+    def noter_ecriture(self, p_chemin_fichier: str | Path) -> None:
+        """
+        Retient la date du dossier des tournois après la réécriture, par ce processus, d'un tournoi déjà indexé.
+
+        Remplacer un fichier (renommage du fichier temporaire) change la date du dossier sans ajouter
+        ni supprimer de tournoi : la consultation suivante n'a pas à comparer le dossier à l'index.
+
+        Args:
+            p_chemin_fichier (str | Path): Chemin du fichier JSON du tournoi réécrit.
+
+        Returns:
+            None
+        """
+
+        s_nom_fichier = Path(p_chemin_fichier).name
+        match = self.regex_fichier_tournoi.match(s_nom_fichier)
+        if match and self.d_tournois.get(match.group(1), {}).get("fichier") == s_nom_fichier:
+            self.i_signature_dossier = self._signature_dossier()
+
+    #
+    def reconstruire(self) -> dict:
+        """
+        Reconstruit entièrement l'index en parcourant le dossier des tournois.
+
+        Returns:
+            dict: Les entrées de l'index reconstruit.
+        """
+
+        d_tournois = {
+            s_identifiant: self._indexer_fichier(s_nom_fichier, s_identifiant)
+            for s_nom_fichier, s_identifiant in self._fichiers_tournois().items()
+        }
+
+        self._ecrire(d_tournois)
+        return d_tournois
+
+    #
+    @staticmethod
+    def normaliser_nombre_tours(p_nombre_tours) -> int | str | None:
+        """
+        Retourne le nombre de tours d'un tournoi en entier, quelle que soit la façon dont il a été enregistré.
+
+        Le nombre de tours est enregistré en texte à la création du tournoi ("4", ou "A déterminer"
+        tant que les joueurs ne sont pas inscrits), et en entier à l'inscription des joueurs.
+
+        Args:
+            p_nombre_tours (int | str | None): Le nombre de tours enregistré.
+
+        Returns:
+            int | str | None: Le nombre de tours en entier, ou la valeur inchangée si ce n'est pas un nombre.
+        """
+
+        if isinstance(p_nombre_tours, str) and p_nombre_tours.strip().isdigit():
+            return int(p_nombre_tours)
+
+        return p_nombre_tours
+
+    #
+    # METHODES PRIVEES
+    #
+    def _charger(self) -> dict | None:
+        """
+        Retourne les entrées de l'index, relues seulement si le fichier d'index a changé sur le disque.
+
+        Le dossier des tournois n'est pas consulté : voir `entrees`.
+
+        Returns:
+            dict | None: Les entrées de l'index, ou None si le fichier d'index est absent, illisible
+                         ou d'une autre version.
+        """
+
+        t_empreinte = self._empreinte_fichier_index()
+        if t_empreinte is None:
+            return None
+
+        if t_empreinte != self.t_empreinte_index:
+            try:
+                with open(self.fichier_index, encoding="utf-8") as fichier:
+                    d_index = json.load(fichier)
+            except (OSError, ValueError):
+                return None
+
+            if d_index.get("version") != self.version_format:
+                return None
+
+            self.d_tournois = d_index.get("tournois", {})
+            self.i_signature_dossier = d_index.get("signature_dossier")
+            self.t_empreinte_index = t_empreinte
+
+        return self.d_tournois
+
+    #
+    def _synchroniser(self, p_tournois: dict) -> dict:
+        """
+        Met l'index en accord avec les fichiers du dossier des tournois, sans relire les tournois déjà indexés.
+
+        Les entrées dont le fichier a disparu sont retirées ; seuls les fichiers absents de l'index sont lus.
+        L'index n'est réécrit que s'il a changé.
+
+        Args:
+            p_tournois (dict): Entrées actuelles de l'index.
+
+        Returns:
+            dict: Les entrées de l'index synchronisé.
+        """
+
+        i_signature = self._signature_dossier()
+        d_fichiers = self._fichiers_tournois()
+
+        d_tournois = {
+            s_identifiant: d_entree
+            for s_identifiant, d_entree in p_tournois.items()
+            if d_fichiers.get(d_entree["fichier"]) == s_identifiant
+        }
+        for s_nom_fichier, s_identifiant in d_fichiers.items():
+            if d_tournois.get(s_identifiant, {}).get("fichier") != s_nom_fichier:
+                d_tournois[s_identifiant] = self._indexer_fichier(s_nom_fichier, s_identifiant)
+
+        if d_tournois != p_tournois:
+            self._ecrire(d_tournois)
+        else:
+            # Rien n'a changé pour l'index (fichier temporaire, réécriture d'un tournoi) : il n'est pas réécrit
+            self.d_tournois = d_tournois
+            self.i_signature_dossier = i_signature
+
+        return d_tournois
+
+    #
+    def _fichiers_tournois(self) -> dict:
+        """
+        Liste les fichiers de tournois du dossier, par ordre de nom.
+
+        Returns:
+            dict: Nom du fichier -> identifiant du tournoi (str).
+        """
+
+        d_fichiers = {}
+        for fichier in sorted(self.dossier_tournois.iterdir()):
+            match = self.regex_fichier_tournoi.match(fichier.name)
+            if match and fichier.is_file():
+                d_fichiers[fichier.name] = match.group(1)
+
+        return d_fichiers
+
+    #
+    def _indexer_fichier(self, p_nom_fichier: str, p_identifiant_tournoi: str) -> dict:
+        """
+        Lit le fichier d'un tournoi et construit son entrée d'index.
+
+        Args:
+            p_nom_fichier (str): Nom du fichier JSON du tournoi.
+            p_identifiant_tournoi (str): Identifiant du tournoi.
+
+        Returns:
+            dict: L'entrée d'index du tournoi.
+        """
+
+        try:
+            d_tournoi = self.lire_tournoi(self.dossier_tournois / p_nom_fichier, p_identifiant_tournoi)
+        except (OSError, ValueError, KeyError):
+            # Fichier vide ou en cours de création : seul le chemin est indexé
+            d_tournoi = {}
+
+        return self._creer_entree(p_nom_fichier, d_tournoi)
+
+    #
+    def _lire_fichier_tournoi(self, p_fichier_tournoi: Path, p_identifiant_tournoi: str) -> dict:
+        """
+        Lit directement le document d'un tournoi dans son fichier JSON TinyDB.
+
+        Args:
+            p_fichier_tournoi (Path): Chemin du fichier JSON du tournoi.
+            p_identifiant_tournoi (str): Identifiant du tournoi (non utilisé).
+
+        Returns:
+            dict: Le document du tournoi.
+        """
+
+        with open(p_fichier_tournoi, encoding="utf-8") as contenu:
+            d_tables = json.load(contenu)
+
+        return d_tables["_default"]["1"]
+
+    #
+    def _creer_entree(self, p_nom_fichier: str, p_tournoi: dict) -> dict:
+        """
+        Construit l'entrée d'index d'un tournoi.
+
+        Args:
+            p_nom_fichier (str): Nom du fichier JSON du tournoi.
+            p_tournoi (dict): Données du tournoi.
+
+        Returns:
+            dict: L'entrée d'index (fichier et en-tête du tournoi).
+        """
+
+        l_tours = p_tournoi.get("liste_tours") or []
+
+        return {
+            "fichier": p_nom_fichier,
+            "nom_tournoi": p_tournoi.get("nom_tournoi"),
+            "lieu_tournoi": p_tournoi.get("lieu_tournoi"),
+            "date_debut_tournoi": p_tournoi.get("date_debut_tournoi"),
+            "date_fin_tournoi": p_tournoi.get("date_fin_tournoi"),
+            "nombre_tours": self.normaliser_nombre_tours(p_tournoi.get("nombre_tours")),
+            "nombre_joueurs": len(p_tournoi.get("liste_joueurs") or []),
+            "tours_joues": len(l_tours),
+            "tours_termines": sum(1 for d_tour in l_tours if d_tour.get("statut") == "Terminé"),
+            "tour_courant": l_tours[-1].get("nom") if l_tours else None,
+            "statut": self._calculer_statut(p_tournoi),
+        }
+
+    #
+    def _calculer_statut(self, p_tournoi: dict) -> str:
+        """
+        Déduit le statut d'un tournoi à partir de ses tours.
+
+        Args:
+            p_tournoi (dict): Données du tournoi.
+
+        Returns:
+            str: "Non commencé", "En cours" ou "Terminé".
+        """
+
+        l_tours = p_tournoi.get("liste_tours") or []
+        if not l_tours:
+            return "Non commencé"
+
+        # Le nombre de tours vaut "A déterminer" tant que les joueurs ne sont pas inscrits
+        s_nombre_tours = str(p_tournoi.get("nombre_tours", ""))
+        if (
+            l_tours[-1].get("statut") == "Terminé"
+            and s_nombre_tours.isdigit()
+            and len(l_tours) >= int(s_nombre_tours)
+        ):
+            return "Terminé"
+
+        return "En cours"
+
+    #
+    def _ecrire(self, p_tournois: dict) -> None:
+        """
+        Écrit l'index sur le disque via un fichier temporaire renommé, pour ne jamais laisser un index tronqué.
+
+        Args:
+            p_tournois (dict): Entrées de l'index.
+
+        Returns:
+            None
+        """
+
+        self.i_signature_dossier = self._signature_dossier()
+        d_index = {
+            "version": self.version_format,
+            "signature_dossier": self.i_signature_dossier,
+            "tournois": p_tournois,
+        }
+
+        fichier_temporaire = self.fichier_index.with_name(self.fichier_index.name + ".tmp")
+        with open(fichier_temporaire, "w", encoding="utf-8") as fichier:
+            json.dump(d_index, fichier, ensure_ascii=False)
+        os.replace(fichier_temporaire, self.fichier_index)
+
+        self.d_tournois = p_tournois
+        self.t_empreinte_index = self._empreinte_fichier_index()
+
+    #
+    def _signature_dossier(self) -> int:
+        """
+        Retourne la date de modification du dossier des tournois, qui change à chaque ajout ou suppression de fichier.
+
+        Elle sert seulement à savoir s'il faut comparer le dossier à l'index (voir `_synchroniser`).
+
+        Returns:
+            int: Date de modification du dossier en nanosecondes.
+        """
+
+        return self.dossier_tournois.stat().st_mtime_ns
+
+    #
+    def _empreinte_fichier_index(self) -> tuple | None:
+        """
+        Retourne l'empreinte du fichier d'index, pour savoir s'il a été réécrit depuis le dernier chargement.
+
+        Returns:
+            tuple | None: (inode, date de modification, taille) ou None si le fichier n'existe pas.
+        """
+
+        try:
+            stat_index = self.fichier_index.stat()
+        except OSError:
+            return None
+
+        return (stat_index.st_ino, stat_index.st_mtime_ns, stat_index.st_size)
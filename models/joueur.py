@@ -1,8 +1,22 @@
 
 
+import re
+
+
 class Joueur:
     """Représente un joueur d'échecs avec son identité et son identifiant national d'échec."""
 
+    # Classement Elo d'un joueur qui n'a pas encore joué de partie classée
+    elo_initial: int = 1500
+
+    # Règles de validation des informations d'un joueur, partagées par la saisie et l'import de fichiers
+    # Identifiant national d'échecs : 2 lettres suivies de 5 chiffres (exemple : AB12345)
+    regex_identifiant_national = re.compile(r"^[A-Za-z]{2}\d{5}$")
+    # Nom et prénom : lettres (avec accents), tirets et espaces
+    regex_nom = re.compile(r"^[A-Za-zÀ-ÖØ-öø-ÿ\s-]+$")
+    # Date de naissance : JJ-MM-AAAA
+    format_date_naissance: str = "%d-%m-%Y"
+
     def __init__(
         self,
         p_identifiant_national_echec: str,
@@ -11,6 +25,8 @@ class Joueur:
         p_date_naissance: str,
         p_identifiant_tinydb: int = None,
         p_score: float = 0,
+        p_elo: float | None = None,
+        p_parties_classees: int = 0,
     ) -> None:
         """Initialise un joueur avec ses informations.
 
@@ -19,6 +35,8 @@ class Joueur:
             p_nom (str): Nom de famille du joueur.
             p_prenom (str): Prénom du joueur.
             p_date_naissance (str): Date de naissance du joueur (format JJ/MM/AAAA).
+            p_elo (float | None, optional): Classement Elo du joueur. Par défaut, `elo_initial`.
+            p_parties_classees (int, optional): Nombre de parties prises en compte dans son classement Elo.
         """
         self.identifiant_national_echec = p_identifiant_national_echec
         self.nom_famille = p_nom_famille
@@ -26,3 +44,5 @@ class Joueur:
         self.date_naissance = p_date_naissance
         self.identifiant_tinydb = p_identifiant_tinydb
         self.score = p_score
+        self.elo = p_elo if p_elo is not None else Joueur.elo_initial
+        self.parties_classees = p_parties_classees
@@ -0,0 +1,151 @@
+from pathlib import Path
+import json
+import os
+
+
+class JournalTournoi:
+    """
+    Journal en ajout seul des modifications d'un tournoi (nouveaux tours, appariements et résultats).
+
+    Chaque opération est écrite sur une ligne JSON à la fin du fichier journal : le coût d'une écriture
+    est proportionnel à la modification et non à la taille du tournoi.
+    Chaque opération porte un numéro croissant. Le document principal du tournoi mémorise dans
+    `numero_journal` la dernière opération qu'il contient déjà : au rechargement, seules les opérations
+    suivantes sont rejouées. Le compactage réécrit le document principal avec toutes les opérations,
+    puis vide le journal.
+    """
+
+    # Nombre d'opérations en attente au-delà duquel le journal est compacté dans le document principal
+    nombre_operations_compactage: int = 16
+
+    def __init__(self, p_fichier_journal: Path) -> None:
+        """
+        Initialise le journal d'un tournoi.
+
+        Args:
+            p_fichier_journal (Path): Chemin du fichier journal (`data/journaux/tournoi_<id>.jsonl`).
+        """
+        self.fichier_journal = Path(p_fichier_journal)
+
+    #
+    def lire(self) -> list[dict]:
+        """
+        Lit toutes les opérations du journal.
+
+        Une dernière ligne incomplète (écriture interrompue) est ignorée.
+
+        Returns:
+            list[dict]: Les opérations dans l'ordre où elles ont été écrites.
+        """
+
+        l_operations = []
+
+        try:
+            with open(self.fichier_journal, encoding="utf-8") as fichier:
+                for s_ligne in fichier:
+                    try:
+                        l_operations.append(json.loads(s_ligne))
+                    except ValueError:
+                        break
+        except FileNotFoundError:
+            pass
+
+        return l_operations
+
+    #
+    def ajouter(self, p_operation: dict) -> int:
+        """
+        Ajoute une opération à la fin du journal et force son écriture sur le disque.
+
+        Args:
+            p_operation (dict): Opération à enregistrer (doit contenir `numero` et `operation`).
+
+        Returns:
+            int: Nombre d'octets écrits.
+        """
+
+        self.fichier_journal.parent.mkdir(parents=True, exist_ok=True)
+        b_ligne = (json.dumps(p_operation, ensure_ascii=False) + "\n").encode("utf-8")
+
+        with open(self.fichier_journal, "ab") as fichier:
+            fichier.write(b_ligne)
+            fichier.flush()
+            os.fsync(fichier.fileno())
+
+        return len(b_ligne)
+
+    #
+    def vider(self) -> None:
+        """
+        Supprime le journal une fois ses opérations intégrées au document principal.
+
+        Returns:
+            None
+        """
+
+        try:
+            self.fichier_journal.unlink()
+        except FileNotFoundError:
+            pass
+
+    #
+    def rejouer(self, p_tournoi: dict) -> int:
+        """
+        Applique au document du tournoi les opérations du journal qu'il ne contient pas encore.
+
+        Args:
+            p_tournoi (dict): Document principal du tournoi, modifié sur place.
+
+        Returns:
+            int: Nombre d'opérations du journal en attente de compactage.
+        """
+
+        i_numero_document = p_tournoi.get("numero_journal", 0)
+        i_operations_en_attente = 0
+
+        for d_operation in self.lire():
+            if d_operation["numero"] > i_numero_document:
+                self.appliquer(p_tournoi, d_operation)
+                i_operations_en_attente += 1
+
+        return i_operations_en_attente
+
+    #
+    def appliquer(self, p_tournoi: dict, p_operation: dict) -> None:
+        """
+        Applique une opération au document d'un tournoi.
+
+        Opérations connues :
+            - "ajout_tour" : ajoute le tour `tour` (avec ses appariements) à `liste_tours`.
+            - "resultats_tour" : enregistre les `resultats` des matchs du dernier tour, met à jour
+              les scores de `liste_joueurs` et clôture le tour à `date_heure_fin`.
+
+        Args:
+            p_tournoi (dict): Document du tournoi, modifié sur place.
+            p_operation (dict): Opération à appliquer.
+
+        Returns:
+            None
+        """
+
+        if p_operation["operation"] == "ajout_tour":
+            p_tournoi.setdefault("liste_tours", []).append(p_operation["tour"])
+
+        elif p_operation["operation"] == "resultats_tour":
+            d_dernier_tour = p_tournoi["liste_tours"][-1]
+
+            for i, d_resultat in enumerate(p_operation["resultats"]):
+                d_match = d_dernier_tour["liste_matchs"][i]
+                # Fusion des 2 dictionnaires avec ** pour déballer les informations
+                d_dernier_tour["liste_matchs"][i] = {**d_match, **d_resultat}
+
+                p_tournoi["liste_joueurs"][d_match["joueur_blanc"]] += d_resultat["score_blanc"]
+                p_tournoi["liste_joueurs"][d_match["joueur_noir"]] += d_resultat["score_noir"]
+
+            d_dernier_tour["statut"] = "Terminé"
+            d_dernier_tour["date_heure_fin"] = p_operation["date_heure_fin"]
+
+        else:
+            raise ValueError(f"Opération de journal inconnue : {p_operation['operation']}")
+
+        p_tournoi["numero_journal"] = p_operation["numero"]
@@ -0,0 +1,137 @@
+from models.recherche_joueurs import RechercheJoueurs
+from pathlib import Path
+import codecs
+import csv
+import re
+
+
+class LecteurCsv:
+    """
+    Lit un fichier CSV ou TSV ligne par ligne, sans le charger en entier, et repère ses colonnes par leur en-tête.
+
+    - Le séparateur (`;`, `,`, tabulation ou `|`) et l'encodage (UTF-8 ou Windows-1252, celui des exports
+      de la fédération) sont détectés sur le début du fichier.
+    - Les en-têtes sont comparés sans accents, majuscules ni ponctuation : "Né(e) le", "date_naissance"
+      et "Date de naissance" se lisent "ne e le", "date naissance" et "date de naissance".
+    """
+
+    # Taille du début du fichier lu pour détecter l'encodage et le séparateur
+    taille_echantillon: int = 64 * 1024
+    # Encodages essayés, dans l'ordre
+    encodages: tuple = ("utf-8-sig", "cp1252")
+    # Séparateurs reconnus
+    separateurs: str = ";,\t|"
+
+    def __init__(self, p_fichier: str | Path) -> None:
+        """
+        Prépare la lecture d'un fichier.
+
+        Args:
+            p_fichier (str | Path): Chemin du fichier.
+        """
+        self.fichier = Path(p_fichier)
+        # Champs reconnus dans l'en-tête, dans l'ordre des valeurs produites par `lignes`
+        self.l_champs = []
+
+    #
+    def lignes(self, p_colonnes: dict, p_champs_obligatoires=()):
+        """
+        Parcourt les lignes du fichier et ne garde que les valeurs des colonnes reconnues.
+
+        L'en-tête est lu à la première ligne demandée : `l_champs` est alors renseigné.
+
+        Args:
+            p_colonnes (dict): En-tête normalisé (voir `normaliser_entete`) -> nom du champ.
+            p_champs_obligatoires (iterable, optional): Champs qui doivent figurer dans l'en-tête.
+
+        Returns:
+            Iterator[tuple[int, list[str] | None]]: Numéro de la ligne dans le fichier et valeurs des champs
+                                                     (sans espaces autour), dans l'ordre de `l_champs` ;
+                                                     None si la ligne n'a pas toutes les colonnes reconnues.
+
+        Raises:
+            FileNotFoundError: Si le fichier n'existe pas.
+            ValueError: Si le fichier est vide, illisible ou s'il lui manque un champ obligatoire.
+        """
+
+        with open(self.fichier, "rb") as fichier:
+            echantillon = fichier.read(self.taille_echantillon)
+        if not echantillon.strip():
+            raise ValueError(f"Le fichier {self.fichier.name} est vide.")
+
+        s_encodage, s_echantillon = self._detecter_encodage(echantillon)
+        try:
+            s_separateur = csv.Sniffer().sniff(s_echantillon.split("\n", 1)[0], self.separateurs).delimiter
+        except csv.Error:
+            s_separateur = ";"
+
+        with open(self.fichier, encoding=s_encodage, newline="") as fichier:
+            lecteur = csv.reader(fichier, delimiter=s_separateur)
+            l_entete = next(lecteur)
+
+            # Position de chaque champ reconnu dans les lignes (première colonne trouvée)
+            d_positions = {}
+            for i_position, s_entete in enumerate(l_entete):
+                s_champ = p_colonnes.get(self.normaliser_entete(s_entete))
+                if s_champ is not None:
+                    d_positions.setdefault(s_champ, i_position)
+
+            l_manquants = [s_champ for s_champ in p_champs_obligatoires if s_champ not in d_positions]
+            if l_manquants:
+                raise ValueError(
+                    f"Colonne(s) manquante(s) dans {self.fichier.name} : {', '.join(l_manquants)} "
+                    f"(en-tête lu : {s_separateur.join(l_entete)})"
+                )
+
+            self.l_champs = list(d_positions)
+            l_positions = list(d_positions.values())
+            i_derniere_position = max(l_positions, default=-1)
+
+            for l_valeurs in lecteur:
+                if not l_valeurs:
+                    continue
+                if len(l_valeurs) <= i_derniere_position:
+                    yield lecteur.line_num, None
+                    continue
+                yield lecteur.line_num, [l_valeurs[i_position].strip() for i_position in l_positions]
+
+    #
+    @staticmethod
+    def normaliser_entete(p_entete: str) -> str:
+        """
+        Normalise un en-tête de colonne : mots sans accents ni majuscules, séparés par une espace.
+
+        Args:
+            p_entete (str): En-tête lu dans le fichier.
+
+        Returns:
+            str: L'en-tête normalisé.
+        """
+
+        return RechercheJoueurs.normaliser(re.sub(r"[\W_]+", " ", p_entete))
+
+    #
+    # METHODES PRIVEES
+    #
+    def _detecter_encodage(self, p_echantillon: bytes) -> tuple:
+        """
+        Retourne le premier encodage de `encodages` capable de décoder le début du fichier.
+
+        Args:
+            p_echantillon (bytes): Début du fichier.
+
+        Returns:
+            tuple: (encodage, début du fichier décodé).
+
+        Raises:
+            ValueError: Si aucun encodage ne convient.
+        """
+
+        for s_encodage in self.encodages:
+            try:
+                # Décodage incrémental : un caractère coupé à la fin de l'échantillon n'est pas une erreur
+                return s_encodage, codecs.getincrementaldecoder(s_encodage)().decode(p_echantillon, final=False)
+            except UnicodeDecodeError:
+                continue
+
+        raise ValueError(f"Encodage du fichier non reconnu (encodages essayés : {', '.join(self.encodages)})")
@@ -0,0 +1,48 @@
+from models.gestionnaire_persistance import GestionnairePersistance
+from models.gestionnaire_persistance_sqlite import GestionnairePersistanceSqlite
+import sys
+
+
+def migrer_vers_sqlite() -> tuple:
+    """
+    Copie en une fois les joueurs et les tournois du stockage TinyDB (JSON) dans la base SQLite.
+
+    Les identifiants des joueurs et des tournois sont conservés. Les tournois sont lus avec
+    leur journal, pour ne perdre aucun tour ni aucun résultat non encore compacté.
+    Les fichiers JSON ne sont pas modifiés. La migration est refusée si la base SQLite
+    contient déjà des données.
+
+    Returns:
+        tuple: Un message de succès ou d'erreur, et "success" ou "error".
+    """
+
+    o_source = GestionnairePersistance()
+    o_destination = GestionnairePersistanceSqlite()
+
+    if not o_destination.est_vide():
+        return (f"La base {o_destination.fichier_base} contient déjà des données : migration annulée.", "error")
+
+    l_joueurs = o_source.charger_joueurs()
+    o_destination.importer_joueurs(l_joueurs)
+
+    i_nombre_tournois = 0
+    for s_identifiant, d_entree in sorted(o_source.o_index_tournois.entrees().items(), key=lambda x: int(x[0])):
+        if d_entree.get("nom_tournoi") is None:
+            # Fichier illisible : rien à migrer
+            continue
+
+        fichier_tournoi, d_tournoi, i_operations_en_attente = o_source._charger_document_tournoi(s_identifiant)
+        o_destination.importer_document_tournoi(s_identifiant, d_tournoi)
+        i_nombre_tournois += 1
+
+    return (
+        f"{len(l_joueurs)} joueur(s) et {i_nombre_tournois} tournoi(s) migrés dans {o_destination.fichier_base}.",
+        "success",
+    )
+
+
+if __name__ == "__main__":
+    # Utilisation : python -m models.migration_sqlite
+    s_message, s_statut = migrer_vers_sqlite()
+    print(s_message)
+    sys.exit(0 if s_statut == "success" else 1)
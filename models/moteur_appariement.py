@@ -0,0 +1,817 @@
+from concurrent.futures import ProcessPoolExecutor
+from itertools import groupby
+from models.couplage_poids_maximum import couplage_poids_maximum
+from models.paires_jouees import PairesJouees
+from models.recherche_appariements import RechercheAppariements
+import multiprocessing
+import os
+import random
+
+
+class MoteurAppariement:
+    """
+    Calcule les appariements d'un tour de système suisse, sans interface utilisateur.
+
+    Les joueurs forment les sommets d'un graphe dont les arêtes sont les paires autorisées
+    (jamais de revanche). Le poids d'une arête est d'autant plus élevé que les deux joueurs ont
+    un score proche et que leurs historiques de couleurs sont compatibles. Les appariements sont
+    le couplage parfait de poids maximum de ce graphe (algorithme d'Edmonds, temps polynomial).
+
+    Au-delà de `seuil_graphe_complet` joueurs, chaque joueur n'est relié qu'à ses voisins proches
+    dans le classement (`taille_voisinage`) : le voisinage est élargi tant qu'il ne permet pas
+    d'apparier tout le monde. Si aucun appariement sans revanche n'existe, les revanches sont
+    autorisées avec un poids minimal, pour en jouer le moins possible.
+
+    Avec un nombre impair de joueurs, un sommet « exempt » est ajouté : il est relié de préférence
+    au joueur le moins bien classé qui n'a pas encore été exempté.
+
+    Au-delà de `seuil_groupes_de_score` joueurs, le classement est découpé en groupes de même score,
+    appariés du haut vers le bas (voir `_former_groupes`) :
+    - un groupe impair, ou un joueur qui a déjà rencontré tout son groupe, « flotte » vers le groupe suivant ;
+    - un groupe se résout d'abord par le pliage hollandais (première moitié contre deuxième moitié),
+      sinon par un couplage limité au groupe ; les gros groupes sont couplés en parallèle
+      (`ProcessPoolExecutor`) ;
+    - les joueurs qu'un groupe n'a pas pu apparier sont appariés ensemble à la fin (avec leurs groupes,
+      puis les groupes voisins, si cela évite une revanche).
+    Le temps de calcul dépend alors de la taille du plus gros groupe, et non plus de tout le tournoi.
+
+    Quand des tours doivent suivre, le moteur vérifie que le tour proposé n'empêche pas de les apparier
+    sans revanche ; sinon il cherche, avec retour arrière, un tour qui les laisse possibles
+    (`RechercheAppariements`, dans la limite de `budget_anticipation` secondes).
+    """
+
+    # Pénalité par (demi-point d'écart)² entre deux joueurs : le critère principal
+    poids_ecart_score: int = 1000
+    # Pénalité par unité de conflit de couleur (les deux joueurs attendent la même couleur)
+    poids_couleur: int = 10
+    # Nombre de joueurs à partir duquel le graphe est limité aux voisins proches dans le classement
+    seuil_graphe_complet: int = 150
+    # Nombre de voisins suivants reliés à chaque joueur dans le graphe limité
+    taille_voisinage: int = 24
+    # Nombre de joueurs à partir duquel les appariements se font par groupes de score
+    seuil_groupes_de_score: int = 150
+    # Taille de groupe à partir de laquelle le couplage est confié à un processus séparé
+    seuil_parallele: int = 400
+    # Nombre de processus pour les gros groupes (None : un par processeur)
+    nombre_processus: int | None = None
+    # Budget de temps, en secondes, de la recherche d'un tour qui évite les impasses des tours suivants
+    budget_anticipation: float = 2.0
+
+    def __init__(self, p_scores: dict, p_tours: list[list[tuple[str, str]]]) -> None:
+        """
+        Initialise le moteur à partir des scores et de l'historique du tournoi.
+
+        Args:
+            p_scores (dict): Identifiant du joueur (str) -> score dans le tournoi.
+            p_tours (list[list[tuple[str, str]]]): Matchs déjà joués, tour par tour,
+                                                   sous forme de paires (joueur blanc, joueur noir).
+        """
+        self.d_scores = {str(id_joueur): score for id_joueur, score in p_scores.items()}
+
+        self.o_paires_jouees = PairesJouees(self.d_scores)
+        self.d_soldes_couleurs = dict.fromkeys(self.d_scores, 0)
+        self.d_dernieres_couleurs = {}
+        self.s_exemptes = set()
+        self.d_flottements = {}
+        self.i_tours_joues = len(p_tours)
+
+        for l_matchs in p_tours:
+            s_joueurs_tour = set()
+            for id_blanc, id_noir in l_matchs:
+                id_blanc, id_noir = str(id_blanc), str(id_noir)
+                self.o_paires_jouees.ajouter(id_blanc, id_noir)
+                self.d_soldes_couleurs[id_blanc] = self.d_soldes_couleurs.get(id_blanc, 0) + 1
+                self.d_soldes_couleurs[id_noir] = self.d_soldes_couleurs.get(id_noir, 0) - 1
+                self.d_dernieres_couleurs[id_blanc] = "blanc"
+                self.d_dernieres_couleurs[id_noir] = "noir"
+                s_joueurs_tour.update((id_blanc, id_noir))
+
+            # Un joueur inscrit absent d'un tour a été exempté
+            self.s_exemptes.update(set(self.d_scores) - s_joueurs_tour)
+
+        self.i_revanches = 0
+        self.i_tours_sans_revanche = None
+        self.d_statistiques = {}
+
+    #
+    @staticmethod
+    def apparier_premier_tour(p_joueurs: list, p_aleatoire: random.Random | None = None) -> tuple[list[tuple], object]:
+        """
+        Apparie le premier tour par tirage au sort.
+
+        Les joueurs sont mélangés, puis pris deux par deux en partant de la fin : le premier
+        tiré a les blancs. Avec un nombre impair de joueurs, le dernier restant est exempté.
+
+        Args:
+            p_joueurs (list): Les joueurs (identifiants ou objets `Joueur`), non modifiés.
+            p_aleatoire (random.Random | None, optional): Générateur utilisé pour le tirage.
+                                                          Par défaut, le générateur global du module `random`.
+
+        Returns:
+            tuple:
+                - list[tuple]: Les paires (joueur blanc, joueur noir), dans l'ordre des tables.
+                - Le joueur exempté, ou None.
+        """
+
+        l_joueurs = list(p_joueurs)
+        (p_aleatoire or random).shuffle(l_joueurs)
+
+        l_paires = []
+        while len(l_joueurs) >= 2:
+            joueur_blanc = l_joueurs.pop()
+            joueur_noir = l_joueurs.pop()
+            l_paires.append((joueur_blanc, joueur_noir))
+
+        return l_paires, l_joueurs[0] if l_joueurs else None
+
+    #
+    @classmethod
+    def depuis_etat(cls, p_etat) -> "MoteurAppariement":
+        """
+        Crée le moteur à partir de l'état d'appariement enregistré d'un tournoi, sans reparcourir ses tours.
+
+        Args:
+            p_etat (EtatAppariement): État du tournoi après son dernier tour terminé.
+
+        Returns:
+            MoteurAppariement: Le moteur prêt à apparier le tour suivant.
+        """
+
+        o_moteur = cls({}, [])
+        o_moteur.d_scores = {str(id_joueur): score for id_joueur, score in p_etat.d_scores.items()}
+        o_moteur.o_paires_jouees = p_etat.o_paires_jouees
+        for id_joueur in o_moteur.d_scores:
+            o_moteur.o_paires_jouees.ajouter_joueur(id_joueur)
+        o_moteur.d_soldes_couleurs = p_etat.d_soldes_couleurs
+        o_moteur.d_dernieres_couleurs = p_etat.d_dernieres_couleurs
+        o_moteur.s_exemptes = p_etat.s_exemptes
+        o_moteur.d_flottements = p_etat.d_flottements
+        o_moteur.i_tours_joues = p_etat.i_tours_integres
+
+        return o_moteur
+
+    #
+    def classement(self) -> list[str]:
+        """
+        Classe les joueurs par score décroissant, puis par identifiant.
+
+        Returns:
+            list[str]: Identifiants des joueurs, du premier au dernier.
+        """
+
+        return sorted(self.d_scores, key=self._cle_classement)
+
+    #
+    def apparier(self, p_tours_suivants: int = 0) -> tuple[list[tuple[str, str]], str | None]:
+        """
+        Calcule les appariements du prochain tour.
+
+        Après l'appel, `i_revanches` donne le nombre de revanches du tour et `i_tours_sans_revanche`
+        le nombre de tours, celui-ci compris, qui peuvent être appariés sans revanche (au plus
+        `p_tours_suivants + 1`).
+
+        Args:
+            p_tours_suivants (int, optional): Nombre de tours qui suivront celui-ci : le tour proposé doit
+                                              les laisser possibles sans revanche. Par défaut, 0.
+
+        Returns:
+            tuple:
+                - list[tuple[str, str]]: Les paires (joueur blanc, joueur noir), de la première à la dernière table.
+                - str | None: Le joueur exempté (nombre impair de joueurs), ou None.
+        """
+
+        l_classement = self.classement()
+        self.i_revanches = 0
+        self.i_tours_sans_revanche = 0
+        self.d_statistiques = {
+            "groupes": 0,
+            "groupes_plies": 0,
+            "groupes_paralleles": 0,
+            "joueurs_residuels": 0,
+            "tour_anticipe": False,
+        }
+
+        if len(l_classement) < 2:
+            return [], l_classement[0] if l_classement else None
+
+        if len(l_classement) <= self.seuil_groupes_de_score:
+            l_paires, id_exempte, _ = self._apparier_joueurs(l_classement)
+        else:
+            l_paires, id_exempte = self._apparier_par_groupes(l_classement)
+
+        # Un tour avec revanche signifie qu'aucun tour n'est plus possible sans revanche
+        if self.i_revanches == 0:
+            if p_tours_suivants > 0:
+                l_paires, id_exempte = self._anticiper(l_classement, l_paires, id_exempte, p_tours_suivants)
+            else:
+                self.i_tours_sans_revanche = 1
+
+        return l_paires, id_exempte
+
+    #
+    # METHODES PRIVEES
+    #
+    def _cle_classement(self, p_joueur: str) -> tuple:
+        """
+        Clé de tri du classement : score décroissant, puis identifiant.
+
+        Args:
+            p_joueur (str): Identifiant du joueur.
+
+        Returns:
+            tuple: La clé de tri.
+        """
+
+        return -self.d_scores[p_joueur], int(p_joueur)
+
+    #
+    def _apparier_joueurs(self, p_classement: list[str]) -> tuple:
+        """
+        Apparie un ensemble de joueurs par un seul couplage parfait de poids maximum.
+
+        Le voisinage est élargi jusqu'à obtenir un couplage parfait sans revanche ; à défaut,
+        les revanches sont autorisées.
+
+        Args:
+            p_classement (list[str]): Joueurs classés.
+
+        Returns:
+            tuple: Les paires (joueur blanc, joueur noir), le joueur exempté (ou None)
+                   et les joueurs restés sans adversaire (liste vide).
+        """
+
+        i_nombre_joueurs = len(p_classement)
+
+        # Sommet « exempt » après les joueurs si leur nombre est impair
+        i_nombre_sommets = i_nombre_joueurs + i_nombre_joueurs % 2
+
+        i_voisinage = i_nombre_joueurs
+        if i_nombre_joueurs > self.seuil_graphe_complet:
+            i_voisinage = self.taille_voisinage
+
+        # Élargit le voisinage jusqu'à obtenir un couplage parfait sans revanche
+        while True:
+            l_aretes = self._construire_aretes(p_classement, i_voisinage, p_revanches_autorisees=False)
+            l_partenaires = couplage_poids_maximum(l_aretes, p_cardinalite_maximale=True)
+            if self._est_parfait(l_partenaires, i_nombre_sommets):
+                break
+            if i_voisinage >= i_nombre_joueurs:
+                # Aucun appariement sans revanche : les revanches deviennent possibles
+                l_aretes = self._construire_aretes(p_classement, i_nombre_joueurs, p_revanches_autorisees=True)
+                l_partenaires = couplage_poids_maximum(l_aretes, p_cardinalite_maximale=True)
+                break
+            i_voisinage = min(2 * i_voisinage, i_nombre_joueurs)
+
+        return self._construire_paires(p_classement, l_partenaires)
+
+    #
+    def _apparier_par_groupes(self, p_classement: list[str]) -> tuple:
+        """
+        Apparie le tournoi groupe de score par groupe de score.
+
+        Args:
+            p_classement (list[str]): Joueurs classés.
+
+        Returns:
+            tuple: Les paires (joueur blanc, joueur noir), de la première à la dernière table,
+                   et le joueur exempté (ou None).
+        """
+
+        l_groupes = self._former_groupes(p_classement)
+        self.d_statistiques["groupes"] = len(l_groupes)
+
+        l_paires_groupes = [None] * len(l_groupes)
+        l_groupes_a_coupler = []
+        for i_groupe, l_groupe in enumerate(l_groupes):
+            l_paires_groupes[i_groupe] = self._plier_groupe(l_groupe)
+            if l_paires_groupes[i_groupe] is None:
+                l_groupes_a_coupler.append(i_groupe)
+            else:
+                self.d_statistiques["groupes_plies"] += 1
+
+        l_aretes_groupes = []
+        for i_groupe in l_groupes_a_coupler:
+            l_groupe = l_groupes[i_groupe]
+            i_voisinage = len(l_groupe)
+            if len(l_groupe) > self.seuil_graphe_complet:
+                i_voisinage = self.taille_voisinage
+            l_aretes_groupes.append(self._construire_aretes(l_groupe, i_voisinage, p_revanches_autorisees=False))
+
+        l_exemptes_groupes = [None] * len(l_groupes)
+        d_residuels_groupes = {}
+        l_tailles = [len(l_groupes[i_groupe]) for i_groupe in l_groupes_a_coupler]
+        for i_groupe, l_partenaires in zip(l_groupes_a_coupler, self._coupler_groupes(l_aretes_groupes, l_tailles)):
+            l_paires, id_exempte, l_non_apparies = self._construire_paires(l_groupes[i_groupe], l_partenaires)
+            l_paires_groupes[i_groupe] = l_paires
+            l_exemptes_groupes[i_groupe] = id_exempte
+            if l_non_apparies:
+                d_residuels_groupes[i_groupe] = l_non_apparies
+
+        if d_residuels_groupes:
+            self._apparier_residuels(l_groupes, l_paires_groupes, l_exemptes_groupes, d_residuels_groupes)
+
+        l_paires = [t_paire for l_paires_groupe in l_paires_groupes for t_paire in l_paires_groupe]
+        self.i_revanches = sum(self.o_paires_jouees.contient(id_blanc, id_noir) for id_blanc, id_noir in l_paires)
+
+        # Les tables suivent le classement du mieux classé des deux joueurs
+        d_rangs = {id_joueur: i_rang for i_rang, id_joueur in enumerate(p_classement)}
+        l_paires.sort(key=lambda t_paire: min(d_rangs[t_paire[0]], d_rangs[t_paire[1]]))
+
+        return l_paires, next((id_joueur for id_joueur in l_exemptes_groupes if id_joueur is not None), None)
+
+    #
+    def _apparier_residuels(
+        self, p_groupes: list, p_paires_groupes: list, p_exemptes_groupes: list, p_residuels_groupes: dict
+    ) -> None:
+        """
+        Apparie les joueurs que leur groupe n'a pas pu apparier.
+
+        Ils sont d'abord appariés entre eux ; si cela impose une revanche, leurs groupes entiers sont
+        appariés de nouveau ensemble, puis les groupes voisins, jusqu'à ce que la revanche disparaisse
+        (ou que tout le tournoi soit concerné).
+
+        Args:
+            p_groupes (list[list[str]]): Les groupes de score.
+            p_paires_groupes (list[list[tuple[str, str]]]): Paires de chaque groupe, modifiées sur place.
+            p_exemptes_groupes (list[str | None]): Exempté de chaque groupe, modifiés sur place.
+            p_residuels_groupes (dict): Indice du groupe -> joueurs restés sans adversaire.
+
+        Returns:
+            None
+        """
+
+        l_joueurs = [id_joueur for l_residuels in p_residuels_groupes.values() for id_joueur in l_residuels]
+        self.d_statistiques["joueurs_residuels"] = len(l_joueurs)
+        s_groupes_rouverts = set()
+
+        while True:
+            l_paires, id_exempte, _ = self._apparier_joueurs(sorted(l_joueurs, key=self._cle_classement))
+            if len(s_groupes_rouverts) == len(p_groupes) or not any(
+                self.o_paires_jouees.contient(id_blanc, id_noir) for id_blanc, id_noir in l_paires
+            ):
+                break
+
+            if s_groupes_rouverts:
+                s_groupes_rouverts |= {
+                    i_voisin
+                    for i_groupe in s_groupes_rouverts
+                    for i_voisin in (i_groupe - 1, i_groupe + 1)
+                    if 0 <= i_voisin < len(p_groupes)
+                }
+            else:
+                s_groupes_rouverts = set(p_residuels_groupes)
+            l_joueurs = [id_joueur for i_groupe in s_groupes_rouverts for id_joueur in p_groupes[i_groupe]]
+
+        for i_groupe in s_groupes_rouverts:
+            p_paires_groupes[i_groupe] = []
+            p_exemptes_groupes[i_groupe] = None
+        p_paires_groupes.append(l_paires)
+        p_exemptes_groupes.append(id_exempte)
+
+    #
+    def _anticiper(
+        self, p_classement: list[str], p_paires: list, p_exempte: str | None, p_tours_suivants: int
+    ) -> tuple:
+        """
+        Vérifie que les tours suivants pourront être appariés sans revanche après le tour proposé,
+        et cherche sinon un autre tour qui le permet.
+
+        Args:
+            p_classement (list[str]): Joueurs classés.
+            p_paires (list[tuple[str, str]]): Paires du tour proposé.
+            p_exempte (str | None): Joueur exempté du tour proposé.
+            p_tours_suivants (int): Nombre de tours qui suivront celui-ci.
+
+        Returns:
+            tuple: Les paires (joueur blanc, joueur noir) et le joueur exempté (ou None) retenus.
+        """
+
+        i_nombre_joueurs = len(p_classement)
+        i_nombre_sommets = i_nombre_joueurs + i_nombre_joueurs % 2
+
+        # Sans revanche, chaque tour joué retire au plus un adversaire possible à chacun :
+        # pour les grands tournois, le théorème de Dirac suffit, sans construire le graphe
+        if RechercheAppariements.garanti_par_degre(
+            i_nombre_sommets, i_nombre_sommets - 2 - self.i_tours_joues, p_tours_suivants
+        ):
+            self.i_tours_sans_revanche = 1 + p_tours_suivants
+            return p_paires, p_exempte
+
+        d_rangs = {id_joueur: i_rang for i_rang, id_joueur in enumerate(p_classement)}
+        l_couplage = [(d_rangs[id_blanc], d_rangs[id_noir]) for id_blanc, id_noir in p_paires]
+        if p_exempte is not None:
+            l_couplage.append((d_rangs[p_exempte], i_nombre_joueurs))
+
+        o_recherche = RechercheAppariements(self._masques_adversaires(p_classement), self.budget_anticipation)
+        i_tours_suivants_possibles = o_recherche.tours_possibles(p_tours_suivants, l_couplage)
+
+        if i_tours_suivants_possibles < p_tours_suivants:
+            l_couplage_anticipe = o_recherche.chercher_tour(self._preferences(p_classement), p_tours_suivants)
+            if l_couplage_anticipe is not None:
+                l_partenaires = [-1] * i_nombre_sommets
+                for i_sommet, i_adversaire in l_couplage_anticipe:
+                    l_partenaires[i_sommet] = i_adversaire
+                    l_partenaires[i_adversaire] = i_sommet
+                p_paires, p_exempte, _ = self._construire_paires(p_classement, l_partenaires)
+                i_tours_suivants_possibles = p_tours_suivants
+                self.d_statistiques["tour_anticipe"] = True
+
+        self.i_tours_sans_revanche = 1 + i_tours_suivants_possibles
+        return p_paires, p_exempte
+
+    #
+    def _masques_adversaires(self, p_classement: list[str]) -> list[int]:
+        """
+        Construit, pour chaque joueur (par rang) et pour l'éventuel sommet « exempt », l'ensemble
+        en bits des adversaires qu'il peut encore rencontrer.
+
+        Args:
+            p_classement (list[str]): Joueurs classés.
+
+        Returns:
+            list[int]: Les masques d'adversaires possibles, par sommet.
+        """
+
+        i_nombre_joueurs = len(p_classement)
+        l_emplacements = [self.o_paires_jouees.emplacement(id_joueur) for id_joueur in p_classement]
+        l_masques = [0] * (i_nombre_joueurs + i_nombre_joueurs % 2)
+
+        for i_rang in range(i_nombre_joueurs):
+            for i_rang_adversaire in range(i_rang + 1, i_nombre_joueurs):
+                i_emplacement_adversaire = l_emplacements[i_rang_adversaire]
+                if not self.o_paires_jouees.contient_emplacements(l_emplacements[i_rang], i_emplacement_adversaire):
+                    l_masques[i_rang] |= 1 << i_rang_adversaire
+                    l_masques[i_rang_adversaire] |= 1 << i_rang
+
+        if i_nombre_joueurs % 2 == 1:
+            # Le sommet « exempt » ne peut être associé qu'aux joueurs pas encore exemptés
+            for i_rang, id_joueur in enumerate(p_classement):
+                if id_joueur not in self.s_exemptes:
+                    l_masques[i_rang] |= 1 << i_nombre_joueurs
+                    l_masques[i_nombre_joueurs] |= 1 << i_rang
+
+        return l_masques
+
+    #
+    def _preferences(self, p_classement: list[str]) -> list[list[int]]:
+        """
+        Ordonne les adversaires de chaque sommet : écart de score croissant, puis écart de classement.
+
+        L'exempt est traité comme un adversaire classé juste après le dernier joueur, avec un
+        demi-point de moins.
+
+        Args:
+            p_classement (list[str]): Joueurs classés.
+
+        Returns:
+            list[list[int]]: Pour chaque sommet, les autres sommets du plus au moins souhaitable.
+        """
+
+        i_nombre_joueurs = len(p_classement)
+        l_scores = [self.d_scores[id_joueur] for id_joueur in p_classement]
+        if i_nombre_joueurs % 2 == 1:
+            l_scores.append(l_scores[-1] - 0.5)
+
+        return [
+            sorted(
+                (i_autre for i_autre in range(len(l_scores)) if i_autre != i_sommet),
+                key=lambda i_autre, i_sommet=i_sommet: (
+                    abs(l_scores[i_sommet] - l_scores[i_autre]),
+                    abs(i_sommet - i_autre),
+                ),
+            )
+            for i_sommet in range(len(l_scores))
+        ]
+
+    #
+    def _former_groupes(self, p_classement: list[str]) -> list[list[str]]:
+        """
+        Découpe le classement en groupes de score, du haut vers le bas, en faisant flotter les joueurs.
+
+        Chaque groupe reçoit en tête les flottants du groupe précédent. Flottent ensuite vers le groupe
+        suivant :
+        - les joueurs qui ont déjà rencontré tous les autres membres du groupe ;
+        - si le groupe reste impair, son joueur le moins bien classé qui n'a pas déjà flotté vers le bas
+          au tour précédent (historique `d_flottements`, connu quand le moteur vient d'un état enregistré).
+        Le dernier groupe garde tous ses joueurs (il contient l'exempt si le tournoi est impair).
+
+        Args:
+            p_classement (list[str]): Joueurs classés.
+
+        Returns:
+            list[list[str]]: Les groupes, du premier au dernier, chacun dans l'ordre du classement.
+        """
+
+        l_groupes_scores = [list(iter_groupe) for _, iter_groupe in groupby(p_classement, key=self.d_scores.get)]
+
+        l_groupes = []
+        l_flottants = []
+        for i_groupe, l_joueurs_score in enumerate(l_groupes_scores):
+            l_groupe = sorted(l_flottants, key=self._cle_classement) + l_joueurs_score
+            l_flottants = []
+
+            if i_groupe < len(l_groupes_scores) - 1:
+                l_emplacements = [self.o_paires_jouees.emplacement(id_joueur) for id_joueur in l_groupe]
+                for id_joueur, i_emplacement in zip(l_groupe, l_emplacements):
+                    if all(
+                        self.o_paires_jouees.contient_emplacements(i_emplacement, i_emplacement_autre)
+                        for i_emplacement_autre in l_emplacements
+                        if i_emplacement_autre != i_emplacement
+                    ):
+                        l_flottants.append(id_joueur)
+                if l_flottants:
+                    s_flottants = set(l_flottants)
+                    l_groupe = [id_joueur for id_joueur in l_groupe if id_joueur not in s_flottants]
+                if len(l_groupe) % 2 == 1:
+                    i_flottant = next(
+                        (
+                            i_position
+                            for i_position in range(len(l_groupe) - 1, -1, -1)
+                            if not self.d_flottements.get(l_groupe[i_position], "").endswith("B")
+                        ),
+                        len(l_groupe) - 1,
+                    )
+                    l_flottants.append(l_groupe.pop(i_flottant))
+
+            if l_groupe:
+                l_groupes.append(l_groupe)
+
+        return l_groupes
+
+    #
+    def _plier_groupe(self, p_groupe: list[str]) -> list[tuple[str, str]] | None:
+        """
+        Apparie un groupe pair par le pliage hollandais : la première moitié contre la deuxième moitié.
+
+        Chaque joueur de la première moitié, dans l'ordre, reçoit le premier joueur encore libre de
+        la deuxième moitié qu'il n'a pas rencontré et dont les couleurs sont compatibles (à défaut,
+        le premier qu'il n'a pas rencontré) : ce sont les transpositions du système hollandais.
+
+        Args:
+            p_groupe (list[str]): Joueurs du groupe, dans l'ordre du classement.
+
+        Returns:
+            list[tuple[str, str]] | None: Les paires (joueur blanc, joueur noir), ou None si le groupe est
+                                          impair ou si un joueur a déjà rencontré toute la deuxième moitié.
+        """
+
+        if len(p_groupe) % 2 == 1:
+            return None
+
+        i_moitie = len(p_groupe) // 2
+        l_deuxieme_moitie = p_groupe[i_moitie:]
+        l_couples = []
+
+        for id_joueur in p_groupe[:i_moitie]:
+            i_choix = None
+            for i_position, id_adversaire in enumerate(l_deuxieme_moitie):
+                if self.o_paires_jouees.contient(id_joueur, id_adversaire):
+                    continue
+                if i_choix is None:
+                    i_choix = i_position
+                if not self._conflit_couleur(id_joueur, id_adversaire):
+                    i_choix = i_position
+                    break
+            if i_choix is not None:
+                l_couples.append([id_joueur, l_deuxieme_moitie.pop(i_choix)])
+            elif not self._echanger_adversaire(id_joueur, l_couples, l_deuxieme_moitie):
+                return None
+
+        return [self._attribuer_couleurs(id_joueur, id_adversaire) for id_joueur, id_adversaire in l_couples]
+
+    #
+    def _echanger_adversaire(self, p_joueur: str, p_couples: list[list[str]], p_libres: list[str]) -> bool:
+        """
+        Trouve un adversaire à un joueur qui a déjà rencontré tous les joueurs encore libres, en lui
+        cédant l'adversaire d'une paire déjà formée (la plus basse possible) dont le premier joueur
+        reprend un joueur libre.
+
+        Args:
+            p_joueur (str): Identifiant du joueur sans adversaire.
+            p_couples (list[list[str]]): Paires déjà formées [joueur, adversaire], complétées sur place.
+            p_libres (list[str]): Joueurs de la deuxième moitié encore libres, modifiés sur place.
+
+        Returns:
+            bool: True si l'échange a réussi.
+        """
+
+        for l_couple in reversed(p_couples):
+            id_premier, id_adversaire = l_couple
+            if self.o_paires_jouees.contient(p_joueur, id_adversaire):
+                continue
+            for i_position, id_libre in enumerate(p_libres):
+                if not self.o_paires_jouees.contient(id_premier, id_libre):
+                    l_couple[1] = p_libres.pop(i_position)
+                    p_couples.append([p_joueur, id_adversaire])
+                    return True
+
+        return False
+
+    #
+    def _coupler_groupes(self, p_aretes_groupes: list[list[tuple[int, int, int]]], p_tailles: list[int]) -> list:
+        """
+        Calcule le couplage de chaque groupe, les gros groupes en parallèle dans des processus séparés.
+
+        Les processus sont créés par duplication (« fork ») : sans cette méthode (Windows), ou avec
+        un seul processeur, tous les groupes sont couplés dans le processus courant.
+
+        Args:
+            p_aretes_groupes (list[list[tuple[int, int, int]]]): Arêtes du graphe de chaque groupe.
+            p_tailles (list[int]): Nombre de joueurs de chaque groupe.
+
+        Returns:
+            list[list[int]]: Résultat de `couplage_poids_maximum` pour chaque groupe, dans le même ordre.
+        """
+
+        l_gros_groupes = [i_groupe for i_groupe, i_taille in enumerate(p_tailles) if i_taille >= self.seuil_parallele]
+        i_nombre_processus = min(self.nombre_processus or os.cpu_count() or 1, len(l_gros_groupes))
+
+        if i_nombre_processus < 2 or "fork" not in multiprocessing.get_all_start_methods():
+            return [couplage_poids_maximum(l_aretes, p_cardinalite_maximale=True) for l_aretes in p_aretes_groupes]
+
+        self.d_statistiques["groupes_paralleles"] = len(l_gros_groupes)
+        l_resultats = [None] * len(p_aretes_groupes)
+        with ProcessPoolExecutor(
+            max_workers=i_nombre_processus, mp_context=multiprocessing.get_context("fork")
+        ) as executeur:
+            d_taches = {
+                i_groupe: executeur.submit(couplage_poids_maximum, p_aretes_groupes[i_groupe], True)
+                for i_groupe in l_gros_groupes
+            }
+            # Les petits groupes sont couplés ici pendant que les processus travaillent
+            for i_groupe, l_aretes in enumerate(p_aretes_groupes):
+                if i_groupe not in d_taches:
+                    l_resultats[i_groupe] = couplage_poids_maximum(l_aretes, p_cardinalite_maximale=True)
+            for i_groupe, tache in d_taches.items():
+                l_resultats[i_groupe] = tache.result()
+
+        return l_resultats
+
+    def _construire_aretes(
+        self, p_classement: list[str], p_voisinage: int, p_revanches_autorisees: bool
+    ) -> list[tuple[int, int, int]]:
+        """
+        Construit les arêtes pondérées du graphe d'appariement.
+
+        Les sommets sont les rangs des joueurs dans le classement (et le rang `len(p_classement)` pour l'exempt).
+
+        Args:
+            p_classement (list[str]): Joueurs classés.
+            p_voisinage (int): Nombre de joueurs suivants dans le classement reliés à chaque joueur.
+            p_revanches_autorisees (bool): Ajoute les paires déjà jouées, avec un poids minimal.
+
+        Returns:
+            list[tuple[int, int, int]]: Arêtes (rang 1, rang 2, poids).
+        """
+
+        i_nombre_joueurs = len(p_classement)
+        f_score_minimum = self.d_scores[p_classement[-1]]
+        i_ecart_maximum = round(2 * (self.d_scores[p_classement[0]] - f_score_minimum)) + 1
+
+        # Poids de base : toute arête autorisée (exempt compris) pèse au moins 2, une revanche pèse 1
+        i_poids_base = self.poids_ecart_score * ((2 * i_ecart_maximum) ** 2 + 1) + self.poids_couleur * (
+            max((abs(solde) for solde in self.d_soldes_couleurs.values()), default=0) + 1
+        ) + 2
+
+        # Emplacement de chaque joueur dans la matrice des paires jouées, par rang
+        l_emplacements = [self.o_paires_jouees.emplacement(id_joueur) for id_joueur in p_classement]
+
+        l_aretes = []
+        for i_rang, id_joueur in enumerate(p_classement):
+            for i_rang_adversaire in range(i_rang + 1, min(i_nombre_joueurs, i_rang + 1 + p_voisinage)):
+                id_adversaire = p_classement[i_rang_adversaire]
+
+                i_emplacement_adversaire = l_emplacements[i_rang_adversaire]
+                if self.o_paires_jouees.contient_emplacements(l_emplacements[i_rang], i_emplacement_adversaire):
+                    if p_revanches_autorisees:
+                        l_aretes.append((i_rang, i_rang_adversaire, 1))
+                    continue
+
+                i_ecart = round(2 * abs(self.d_scores[id_joueur] - self.d_scores[id_adversaire]))
+                i_poids = (
+                    i_poids_base
+                    - self.poids_ecart_score * i_ecart ** 2
+                    - self.poids_couleur * self._conflit_couleur(id_joueur, id_adversaire)
+                )
+                l_aretes.append((i_rang, i_rang_adversaire, i_poids))
+
+        if i_nombre_joueurs % 2 == 1:
+            # L'exempt se comporte comme un adversaire classé juste après le dernier joueur ;
+            # à score égal, les derniers du classement sont préférés (écart inférieur à une pénalité de couleur)
+            for i_rang, id_joueur in enumerate(p_classement):
+                i_ecart = round(2 * (self.d_scores[id_joueur] - f_score_minimum)) + 1
+                if id_joueur in self.s_exemptes:
+                    i_ecart += i_ecart_maximum
+                i_poids = (
+                    i_poids_base
+                    - self.poids_ecart_score * i_ecart ** 2
+                    - min(i_nombre_joueurs - 1 - i_rang, self.poids_couleur - 1)
+                )
+                l_aretes.append((i_rang, i_nombre_joueurs, i_poids))
+
+        return l_aretes
+
+    #
+    def _conflit_couleur(self, p_joueur_1: str, p_joueur_2: str) -> int:
+        """
+        Mesure à quel point deux joueurs attendent la même couleur.
+
+        Args:
+            p_joueur_1 (str): Identifiant du premier joueur.
+            p_joueur_2 (str): Identifiant du deuxième joueur.
+
+        Returns:
+            int: 0 si l'un des deux peut recevoir la couleur qu'il attend, sinon l'écart le plus faible
+                 des deux soldes de couleurs (nombre de blancs - nombre de noirs).
+        """
+
+        i_solde_1 = self.d_soldes_couleurs.get(p_joueur_1, 0)
+        i_solde_2 = self.d_soldes_couleurs.get(p_joueur_2, 0)
+
+        if i_solde_1 * i_solde_2 <= 0:
+            return 0
+
+        return min(abs(i_solde_1), abs(i_solde_2))
+
+    #
+    def _est_parfait(self, p_partenaires: list[int], p_nombre_sommets: int) -> bool:
+        """
+        Indique si un couplage apparie tous les sommets.
+
+        Args:
+            p_partenaires (list[int]): Résultat de `couplage_poids_maximum`.
+            p_nombre_sommets (int): Nombre de sommets du graphe.
+
+        Returns:
+            bool: True si chaque sommet a un partenaire.
+        """
+
+        return len(p_partenaires) == p_nombre_sommets and -1 not in p_partenaires
+
+    #
+    def _construire_paires(self, p_classement: list[str], p_partenaires: list[int]) -> tuple:
+        """
+        Transforme un couplage en paires (blanc, noir) triées par table, et attribue les couleurs.
+
+        Args:
+            p_classement (list[str]): Joueurs classés (les rangs sont les sommets du couplage).
+            p_partenaires (list[int]): Résultat de `couplage_poids_maximum`.
+
+        Returns:
+            tuple: Les paires (joueur blanc, joueur noir), le joueur exempté (ou None)
+                   et les joueurs que le couplage a laissés sans adversaire.
+        """
+
+        i_nombre_joueurs = len(p_classement)
+        l_paires = []
+        id_exempte = None
+        l_non_apparies = []
+
+        for i_rang, id_joueur in enumerate(p_classement):
+            i_rang_partenaire = p_partenaires[i_rang] if i_rang < len(p_partenaires) else -1
+
+            if i_rang_partenaire == -1:
+                l_non_apparies.append(id_joueur)
+                continue
+            if i_rang_partenaire == i_nombre_joueurs:
+                id_exempte = id_joueur
+                continue
+            if i_rang_partenaire < i_rang:
+                continue
+
+            id_adversaire = p_classement[i_rang_partenaire]
+            if self.o_paires_jouees.contient(id_joueur, id_adversaire):
+                self.i_revanches += 1
+
+            l_paires.append(self._attribuer_couleurs(id_joueur, id_adversaire))
+
+        return l_paires, id_exempte, l_non_apparies
+
+    #
+    def _attribuer_couleurs(self, p_joueur: str, p_adversaire: str) -> tuple[str, str]:
+        """
+        Attribue les couleurs d'une paire.
+
+        Le joueur dont le solde de couleurs est le plus faible reçoit les blancs ; à égalité,
+        celui qui avait les noirs au tour précédent, sinon le mieux classé (`p_joueur`).
+
+        Args:
+            p_joueur (str): Identifiant du joueur le mieux classé.
+            p_adversaire (str): Identifiant de son adversaire.
+
+        Returns:
+            tuple[str, str]: (joueur blanc, joueur noir).
+        """
+
+        t_ordre_joueur = (
+            self.d_soldes_couleurs.get(p_joueur, 0),
+            self.d_dernieres_couleurs.get(p_joueur) == "blanc",
+        )
+        t_ordre_adversaire = (
+            self.d_soldes_couleurs.get(p_adversaire, 0),
+            self.d_dernieres_couleurs.get(p_adversaire) == "blanc",
+        )
+        if t_ordre_adversaire < t_ordre_joueur:
+            return p_adversaire, p_joueur
+
+        return p_joueur, p_adversaire
@@ -0,0 +1,160 @@
+from models.joueur import Joueur
+import numpy as np
+
+
+class MoteurElo:
+    """
+    Calcule les classements Elo des joueurs, tour par tour, sur des tableaux NumPy.
+
+    Toutes les parties d'un tour sont calculées en une fois à partir des classements d'avant le tour :
+    résultat attendu `1 / (1 + 10 ** ((Elo adverse - Elo) / 400))`, puis variation `K x (résultat - attendu)`.
+
+    Le coefficient K suit les règles de la FIDE :
+    - `facteur_k_debutant` tant que le joueur a joué moins de `parties_debutant` parties classées ;
+    - `facteur_k_elite` à partir de `seuil_elite` points Elo ;
+    - `facteur_k` sinon.
+    Ces règles se règlent par les attributs de classe, ou en redéfinissant `facteurs_k`.
+
+    Un joueur exempté n'a pas de partie : son classement ne change pas.
+    """
+
+    # Règles du coefficient K
+    facteur_k_debutant: int = 40
+    parties_debutant: int = 30
+    facteur_k: int = 20
+    facteur_k_elite: int = 10
+    seuil_elite: int = 2400
+
+    #
+    def facteurs_k(self, p_elos: np.ndarray, p_parties: np.ndarray) -> np.ndarray:
+        """
+        Retourne le coefficient K de chaque joueur.
+
+        Args:
+            p_elos (np.ndarray): Classements Elo des joueurs.
+            p_parties (np.ndarray): Nombre de parties classées déjà jouées par chaque joueur.
+
+        Returns:
+            np.ndarray: Le coefficient K de chaque joueur.
+        """
+
+        return np.where(
+            p_parties < self.parties_debutant,
+            self.facteur_k_debutant,
+            np.where(p_elos >= self.seuil_elite, self.facteur_k_elite, self.facteur_k),
+        )
+
+    #
+    def calculer_tour(self, p_classements: dict, p_matchs: list[dict]) -> dict:
+        """
+        Calcule les nouveaux classements des joueurs d'un tour.
+
+        Args:
+            p_classements (dict): Identifiant du joueur (str) -> (Elo, parties classées) avant le tour.
+                                  Un joueur absent commence à `Joueur.elo_initial`, sans partie.
+            p_matchs (list[dict]): Matchs du tour, avec `joueur_blanc`, `joueur_noir`, `score_blanc`
+                                   et `score_noir`.
+
+        Returns:
+            dict: Identifiant du joueur (str) -> (nouvel Elo, parties classées), pour les joueurs du tour.
+        """
+
+        if not p_matchs:
+            return {}
+
+        # Joueurs rangés par paires (blanc, noir) : l'adversaire du joueur i est i ^ 1
+        l_joueurs = [
+            str(id_joueur) for d_match in p_matchs for id_joueur in (d_match["joueur_blanc"], d_match["joueur_noir"])
+        ]
+        l_classements = [p_classements.get(id_joueur, (Joueur.elo_initial, 0)) for id_joueur in l_joueurs]
+        a_elos = np.array([t_classement[0] for t_classement in l_classements], dtype=float)
+        a_parties = np.array([t_classement[1] for t_classement in l_classements], dtype=np.int64)
+        a_points = np.array(
+            [d_match.get(s_score, 0) for d_match in p_matchs for s_score in ("score_blanc", "score_noir")], dtype=float
+        )
+
+        a_adversaires = np.arange(len(l_joueurs)) ^ 1
+        a_nouveaux_elos = np.round(a_elos + self._variations(a_elos, a_elos[a_adversaires], a_parties, a_points), 1)
+
+        return {
+            id_joueur: (f_elo, i_parties + 1)
+            for id_joueur, f_elo, i_parties in zip(l_joueurs, a_nouveaux_elos.tolist(), a_parties.tolist())
+        }
+
+    #
+    def recalculer_archive(self, p_tournois: list[dict], p_joueurs=()) -> dict:
+        """
+        Recalcule les classements de tous les joueurs à partir de tous les tournois, depuis le début.
+
+        Les tours terminés de tous les tournois sont rejoués dans l'ordre de leur clôture (`date_heure_fin`),
+        chacun en une opération vectorisée sur les tableaux de tous les joueurs.
+
+        Args:
+            p_tournois (list[dict]): Documents des tournois, chacun avec son `identifiant` et sa `liste_tours`.
+            p_joueurs (iterable, optional): Identifiants des joueurs à classer même sans partie.
+
+        Returns:
+            dict: Identifiant du joueur (str) -> (Elo, parties classées).
+        """
+
+        l_tours = sorted(
+            (
+                (d_tour.get("date_heure_fin") or "", int(d_tournoi["identifiant"]), d_tour["identifiant"], d_tour)
+                for d_tournoi in p_tournois
+                for d_tour in d_tournoi.get("liste_tours", [])
+                if d_tour["statut"] == "Terminé" and d_tour["liste_matchs"]
+            ),
+            key=lambda t_tour: t_tour[:3],
+        )
+
+        d_indices = {str(id_joueur): i_indice for i_indice, id_joueur in enumerate(p_joueurs)}
+        for *_, d_tour in l_tours:
+            for d_match in d_tour["liste_matchs"]:
+                for id_joueur in (d_match["joueur_blanc"], d_match["joueur_noir"]):
+                    d_indices.setdefault(str(id_joueur), len(d_indices))
+
+        a_elos = np.full(len(d_indices), float(Joueur.elo_initial))
+        a_parties = np.zeros(len(d_indices), dtype=np.int64)
+
+        for *_, d_tour in l_tours:
+            l_matchs = d_tour["liste_matchs"]
+            a_blancs = np.array([d_indices[str(d_match["joueur_blanc"])] for d_match in l_matchs])
+            a_noirs = np.array([d_indices[str(d_match["joueur_noir"])] for d_match in l_matchs])
+            a_points_blancs = np.array([d_match.get("score_blanc", 0) for d_match in l_matchs], dtype=float)
+
+            a_joueurs = np.concatenate((a_blancs, a_noirs))
+            a_adversaires = np.concatenate((a_noirs, a_blancs))
+            a_points = np.concatenate((a_points_blancs, [d_match.get("score_noir", 0) for d_match in l_matchs]))
+
+            # Toutes les variations sont calculées avec les classements d'avant le tour, puis appliquées
+            a_variations = self._variations(a_elos[a_joueurs], a_elos[a_adversaires], a_parties[a_joueurs], a_points)
+            a_elos[a_joueurs] = np.round(a_elos[a_joueurs] + a_variations, 1)
+            a_parties[a_joueurs] += 1
+
+        return {
+            id_joueur: (f_elo, i_parties)
+            for id_joueur, f_elo, i_parties in zip(d_indices, a_elos.tolist(), a_parties.tolist())
+        }
+
+    #
+    # METHODES PRIVEES
+    #
+    def _variations(
+        self, p_elos: np.ndarray, p_elos_adversaires: np.ndarray, p_parties: np.ndarray, p_points: np.ndarray
+    ) -> np.ndarray:
+        """
+        Calcule la variation de classement de chaque joueur pour une partie.
+
+        Args:
+            p_elos (np.ndarray): Classements des joueurs.
+            p_elos_adversaires (np.ndarray): Classements de leurs adversaires.
+            p_parties (np.ndarray): Parties classées déjà jouées par les joueurs.
+            p_points (np.ndarray): Points marqués (1, 0.5 ou 0).
+
+        Returns:
+            np.ndarray: Les variations, arrondies au dixième.
+        """
+
+        a_attendus = 1 / (1 + 10 ** ((p_elos_adversaires - p_elos) / 400))
+
+        return np.round(self.facteurs_k(p_elos, p_parties) * (p_points - a_attendus), 1)
@@ -0,0 +1,221 @@
+import base64
+
+
+class PairesJouees:
+    """
+    Mémorise les paires de joueurs qui se sont déjà rencontrées, dans une matrice de bits compacte.
+
+    Chaque joueur reçoit un emplacement (0, 1, 2...) dans l'ordre où il est ajouté. La paire
+    d'emplacements (i, j), avec i < j, occupe le bit `j * (j - 1) // 2 + i` : c'est le triangle
+    inférieur de la matrice des rencontres, rangé ligne par ligne. Ajouter un joueur n'allonge
+    que la fin du tableau, sans déplacer les bits existants.
+
+    Le test et l'ajout d'une paire se font en temps constant ; 2 000 joueurs occupent environ 250 Ko.
+    """
+
+    def __init__(self, p_joueurs=()) -> None:
+        """
+        Initialise une matrice vide pour les joueurs donnés.
+
+        Args:
+            p_joueurs (iterable, optional): Identifiants des joueurs (convertis en str).
+        """
+        self.d_emplacements = {}
+        self.b_bits = bytearray()
+
+        for id_joueur in p_joueurs:
+            self.ajouter_joueur(id_joueur)
+
+    #
+    @classmethod
+    def depuis_tours(cls, p_joueurs, p_tours: list[list[tuple[str, str]]]) -> "PairesJouees":
+        """
+        Construit la matrice à partir de l'historique d'un tournoi.
+
+        Args:
+            p_joueurs (iterable): Identifiants des joueurs inscrits.
+            p_tours (list[list[tuple[str, str]]]): Matchs joués, tour par tour : (joueur blanc, joueur noir).
+
+        Returns:
+            PairesJouees: La matrice des paires déjà jouées.
+        """
+
+        o_paires_jouees = cls(p_joueurs)
+        for l_matchs in p_tours:
+            for id_blanc, id_noir in l_matchs:
+                o_paires_jouees.ajouter(id_blanc, id_noir)
+
+        return o_paires_jouees
+
+    #
+    def ajouter_joueur(self, p_joueur) -> int:
+        """
+        Attribue un emplacement à un joueur (s'il n'en a pas déjà un).
+
+        Args:
+            p_joueur: Identifiant du joueur.
+
+        Returns:
+            int: L'emplacement du joueur.
+        """
+
+        s_joueur = str(p_joueur)
+        i_emplacement = self.d_emplacements.get(s_joueur)
+
+        if i_emplacement is None:
+            i_emplacement = len(self.d_emplacements)
+            self.d_emplacements[s_joueur] = i_emplacement
+            # La ligne du nouveau joueur contient i_emplacement bits
+            i_octets_necessaires = (i_emplacement * (i_emplacement + 1) // 2 + 7) // 8
+            self.b_bits.extend(bytes(i_octets_necessaires - len(self.b_bits)))
+
+        return i_emplacement
+
+    #
+    def emplacement(self, p_joueur) -> int | None:
+        """
+        Retourne l'emplacement d'un joueur.
+
+        Args:
+            p_joueur: Identifiant du joueur.
+
+        Returns:
+            int | None: L'emplacement, ou None si le joueur est inconnu.
+        """
+
+        return self.d_emplacements.get(str(p_joueur))
+
+    #
+    def ajouter(self, p_joueur_1, p_joueur_2) -> None:
+        """
+        Enregistre que deux joueurs se sont rencontrés.
+
+        Args:
+            p_joueur_1: Identifiant du premier joueur.
+            p_joueur_2: Identifiant du deuxième joueur.
+
+        Returns:
+            None
+        """
+
+        self.ajouter_emplacements(self.ajouter_joueur(p_joueur_1), self.ajouter_joueur(p_joueur_2))
+
+    #
+    def contient(self, p_joueur_1, p_joueur_2) -> bool:
+        """
+        Indique si deux joueurs se sont déjà rencontrés.
+
+        Args:
+            p_joueur_1: Identifiant du premier joueur.
+            p_joueur_2: Identifiant du deuxième joueur.
+
+        Returns:
+            bool: True si la paire a déjà été jouée.
+        """
+
+        i_emplacement_1 = self.d_emplacements.get(str(p_joueur_1))
+        i_emplacement_2 = self.d_emplacements.get(str(p_joueur_2))
+
+        if i_emplacement_1 is None or i_emplacement_2 is None:
+            return False
+
+        return self.contient_emplacements(i_emplacement_1, i_emplacement_2)
+
+    #
+    def ajouter_emplacements(self, p_emplacement_1: int, p_emplacement_2: int) -> None:
+        """
+        Enregistre une rencontre à partir des emplacements des deux joueurs.
+
+        Args:
+            p_emplacement_1 (int): Emplacement du premier joueur.
+            p_emplacement_2 (int): Emplacement du deuxième joueur (différent du premier).
+
+        Returns:
+            None
+        """
+
+        i_bit = self._numero_bit(p_emplacement_1, p_emplacement_2)
+        self.b_bits[i_bit >> 3] |= 1 << (i_bit & 7)
+
+    #
+    def contient_emplacements(self, p_emplacement_1: int, p_emplacement_2: int) -> bool:
+        """
+        Indique si deux joueurs, désignés par leurs emplacements, se sont déjà rencontrés.
+
+        Args:
+            p_emplacement_1 (int): Emplacement du premier joueur.
+            p_emplacement_2 (int): Emplacement du deuxième joueur.
+
+        Returns:
+            bool: True si la paire a déjà été jouée.
+        """
+
+        if p_emplacement_1 == p_emplacement_2:
+            return False
+
+        i_bit = self._numero_bit(p_emplacement_1, p_emplacement_2)
+        return bool(self.b_bits[i_bit >> 3] & (1 << (i_bit & 7)))
+
+    #
+    def vers_dict(self) -> dict:
+        """
+        Exporte la matrice dans un dictionnaire sérialisable en JSON.
+
+        Returns:
+            dict: "joueurs" (identifiants dans l'ordre des emplacements) et "bits" (matrice encodée en base64).
+        """
+
+        return {
+            "joueurs": list(self.d_emplacements),
+            "bits": base64.b64encode(self.b_bits).decode("ascii"),
+        }
+
+    #
+    @classmethod
+    def depuis_dict(cls, p_donnees: dict) -> "PairesJouees":
+        """
+        Recrée une matrice exportée par `vers_dict`, sans rejouer les rencontres.
+
+        Args:
+            p_donnees (dict): Les données exportées.
+
+        Returns:
+            PairesJouees: La matrice des paires déjà jouées.
+        """
+
+        o_paires_jouees = cls(p_donnees["joueurs"])
+        b_bits = base64.b64decode(p_donnees["bits"])
+        o_paires_jouees.b_bits[: len(b_bits)] = b_bits
+
+        return o_paires_jouees
+
+    #
+    def taille_octets(self) -> int:
+        """
+        Retourne la mémoire occupée par la matrice de bits.
+
+        Returns:
+            int: Nombre d'octets de la matrice.
+        """
+
+        return len(self.b_bits)
+
+    #
+    # METHODES PRIVEES
+    #
+    def _numero_bit(self, p_emplacement_1: int, p_emplacement_2: int) -> int:
+        """
+        Calcule la position du bit d'une paire dans le triangle inférieur de la matrice.
+
+        Args:
+            p_emplacement_1 (int): Emplacement du premier joueur.
+            p_emplacement_2 (int): Emplacement du deuxième joueur.
+
+        Returns:
+            int: Numéro du bit.
+        """
+
+        if p_emplacement_1 > p_emplacement_2:
+            p_emplacement_1, p_emplacement_2 = p_emplacement_2, p_emplacement_1
+
+        return p_emplacement_2 * (p_emplacement_2 - 1) // 2 + p_emplacement_1
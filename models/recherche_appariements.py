@@ -0,0 +1,311 @@
+from models.couplage_poids_maximum import couplage_poids_maximum
+import time
+
+
+class BudgetEpuise(Exception):
+    """
+    Levée quand la recherche dépasse son budget de temps.
+    """
+
+
+class RechercheAppariements:
+    """
+    Vérifie, par une recherche avec retour arrière, que plusieurs tours peuvent encore être appariés
+    sans revanche, et trouve au besoin un tour qui ne mène pas à une impasse.
+
+    Les sommets sont numérotés de 0 à N - 1 (les joueurs, puis l'éventuel sommet « exempt ») ;
+    `l_masques[i]` est l'ensemble, en bits, des sommets que i peut encore rencontrer.
+
+    La recherche est élaguée par :
+    - le théorème de Dirac : si chaque sommet peut encore rencontrer au moins N / 2 + k - 1 sommets,
+      k tours sont possibles sans revanche (chaque tour ne retire qu'un adversaire à chacun) ;
+    - un test d'existence d'un couplage parfait après chaque paire choisie ;
+    - la mémorisation des états (adversaires possibles, tours à apparier) déjà reconnus sans issue ;
+    - un budget de temps, au-delà duquel la recherche abandonne (`BudgetEpuise`).
+    """
+
+    # Budget de temps par défaut d'une recherche, en secondes
+    budget_secondes: float = 2.0
+
+    def __init__(self, p_masques: list[int], p_budget_secondes: float | None = None) -> None:
+        """
+        Initialise la recherche.
+
+        Args:
+            p_masques (list[int]): Pour chaque sommet, les sommets qu'il peut encore rencontrer (bits).
+            p_budget_secondes (float | None, optional): Budget de temps de chaque recherche, en secondes.
+                                                        Par défaut, `budget_secondes`.
+        """
+        self.l_masques = list(p_masques)
+        self.f_budget_secondes = p_budget_secondes if p_budget_secondes is not None else self.budget_secondes
+        self.f_echeance = 0.0
+        self.s_echecs = set()
+
+    #
+    @staticmethod
+    def garanti_par_degre(p_nombre_sommets: int, p_degre_minimum: int, p_nombre_tours: int) -> bool:
+        """
+        Indique si le théorème de Dirac garantit qu'un nombre de tours peut être apparié sans revanche.
+
+        Args:
+            p_nombre_sommets (int): Nombre de sommets (pair).
+            p_degre_minimum (int): Nombre minimum d'adversaires encore possibles d'un sommet.
+            p_nombre_tours (int): Nombre de tours à apparier.
+
+        Returns:
+            bool: True si la garantie s'applique.
+        """
+
+        return p_nombre_tours <= 0 or 2 * (p_degre_minimum - p_nombre_tours + 1) >= p_nombre_sommets
+
+    #
+    def tours_possibles(self, p_maximum: int, p_couplage: list[tuple[int, int]] | None = None) -> int:
+        """
+        Compte les tours qui peuvent encore être appariés sans revanche.
+
+        Args:
+            p_maximum (int): Nombre de tours au-delà duquel il est inutile de compter.
+            p_couplage (list[tuple[int, int]] | None, optional): Tour à jouer d'abord (paires de sommets).
+
+        Returns:
+            int: Le nombre de tours possibles, entre 0 et `p_maximum` (une borne inférieure si le budget
+                 de temps est épuisé).
+        """
+
+        l_masques = self._appliquer(self.l_masques, p_couplage) if p_couplage else self.l_masques
+        self.f_echeance = time.perf_counter() + self.f_budget_secondes
+
+        if self.garanti_par_degre(len(l_masques), self._degre_minimum(l_masques), p_maximum):
+            return p_maximum
+
+        i_tours = 0
+        try:
+            while i_tours < p_maximum and self._completer(l_masques, i_tours + 1):
+                i_tours += 1
+        except BudgetEpuise:
+            pass
+
+        return i_tours
+
+    #
+    def chercher_tour(self, p_preferences: list[list[int]], p_tours_suivants: int) -> list[tuple[int, int]] | None:
+        """
+        Cherche un tour sans revanche après lequel `p_tours_suivants` tours restent possibles.
+
+        Les tours candidats sont parcourus dans l'ordre des préférences : le premier sommet libre
+        reçoit d'abord son adversaire préféré, et ainsi de suite.
+
+        Args:
+            p_preferences (list[list[int]]): Pour chaque sommet, ses adversaires du plus au moins souhaitable.
+            p_tours_suivants (int): Nombre de tours qui doivent rester possibles après celui-ci.
+
+        Returns:
+            list[tuple[int, int]] | None: Les paires de sommets du tour, ou None si aucun tour ne convient
+                                          (ou si le budget de temps est épuisé).
+        """
+
+        self.f_echeance = time.perf_counter() + self.f_budget_secondes
+
+        try:
+            for l_couplage in self._couplages(self.l_masques, p_preferences):
+                if self._completer(self._appliquer(self.l_masques, l_couplage), p_tours_suivants):
+                    return l_couplage
+        except BudgetEpuise:
+            pass
+
+        return None
+
+    #
+    # METHODES PRIVEES
+    #
+    def _completer(self, p_masques: list[int], p_nombre_tours: int) -> bool:
+        """
+        Indique si `p_nombre_tours` tours peuvent être appariés sans revanche.
+
+        Args:
+            p_masques (list[int]): Adversaires encore possibles de chaque sommet.
+            p_nombre_tours (int): Nombre de tours à apparier.
+
+        Returns:
+            bool: True si c'est possible.
+        """
+
+        if p_nombre_tours == 0:
+            return True
+        if time.perf_counter() > self.f_echeance:
+            raise BudgetEpuise()
+
+        i_degre_minimum = self._degre_minimum(p_masques)
+        if i_degre_minimum < p_nombre_tours:
+            # Chaque tour retire un adversaire possible à chaque sommet
+            return False
+        if self.garanti_par_degre(len(p_masques), i_degre_minimum, p_nombre_tours):
+            return True
+
+        t_etat = (tuple(p_masques), p_nombre_tours)
+        if t_etat in self.s_echecs:
+            return False
+
+        for l_couplage in self._couplages(p_masques):
+            if self._completer(self._appliquer(p_masques, l_couplage), p_nombre_tours - 1):
+                return True
+
+        self.s_echecs.add(t_etat)
+        return False
+
+    #
+    def _couplages(self, p_masques: list[int], p_preferences: list[list[int]] | None = None):
+        """
+        Énumère les couplages parfaits du graphe des adversaires possibles, sans jamais entrer
+        dans une branche qui ne peut pas être complétée.
+
+        Sans préférences, le sommet libre qui a le moins d'adversaires possibles est apparié en premier.
+
+        Args:
+            p_masques (list[int]): Adversaires encore possibles de chaque sommet.
+            p_preferences (list[list[int]] | None, optional): Ordre des adversaires de chaque sommet.
+
+        Returns:
+            generator: Chaque couplage, sous forme de liste de paires de sommets.
+        """
+
+        i_tous = (1 << len(p_masques)) - 1
+        if not self._couplage_parfait_existe(p_masques, i_tous):
+            return
+
+        # Parcours en profondeur sans récursion : une pile d'itérateurs de candidats
+        l_paires = []
+        l_pile = [self._candidats(p_masques, i_tous, p_preferences)]
+        while l_pile:
+            t_candidat = next(l_pile[-1], None)
+            if t_candidat is None:
+                l_pile.pop()
+                if l_paires:
+                    l_paires.pop()
+                continue
+
+            i_sommet, i_adversaire, i_libres = t_candidat
+            l_paires.append((i_sommet, i_adversaire))
+            if i_libres == 0:
+                yield list(l_paires)
+                l_paires.pop()
+                continue
+            l_pile.append(self._candidats(p_masques, i_libres, p_preferences))
+
+    #
+    def _candidats(self, p_masques: list[int], p_libres: int, p_preferences: list[list[int]] | None):
+        """
+        Énumère les adversaires du prochain sommet à apparier qui laissent un couplage parfait possible.
+
+        Args:
+            p_masques (list[int]): Adversaires encore possibles de chaque sommet.
+            p_libres (int): Sommets pas encore appariés dans ce tour (bits).
+            p_preferences (list[list[int]] | None): Ordre des adversaires de chaque sommet.
+
+        Returns:
+            generator: Triplets (sommet, adversaire, sommets encore libres ensuite).
+        """
+
+        if time.perf_counter() > self.f_echeance:
+            raise BudgetEpuise()
+
+        if p_preferences is not None:
+            # Le mieux classé des sommets libres
+            i_sommet = (p_libres & -p_libres).bit_length() - 1
+            l_adversaires = [i_adversaire for i_adversaire in p_preferences[i_sommet] if p_libres >> i_adversaire & 1]
+        else:
+            i_sommet = min(self._sommets(p_libres), key=lambda i_libre: (p_masques[i_libre] & p_libres).bit_count())
+            l_adversaires = self._sommets(p_masques[i_sommet] & p_libres)
+
+        for i_adversaire in l_adversaires:
+            if not p_masques[i_sommet] >> i_adversaire & 1:
+                continue
+            i_reste = p_libres & ~(1 << i_sommet) & ~(1 << i_adversaire)
+            if self._couplage_parfait_existe(p_masques, i_reste):
+                yield i_sommet, i_adversaire, i_reste
+
+    #
+    def _couplage_parfait_existe(self, p_masques: list[int], p_sommets: int) -> bool:
+        """
+        Indique si les sommets donnés peuvent tous être appariés entre eux.
+
+        Args:
+            p_masques (list[int]): Adversaires encore possibles de chaque sommet.
+            p_sommets (int): Les sommets à apparier (bits).
+
+        Returns:
+            bool: True si un couplage parfait existe.
+        """
+
+        l_sommets = self._sommets(p_sommets)
+        if len(l_sommets) % 2 == 1:
+            return False
+        if any(p_masques[i_sommet] & p_sommets == 0 for i_sommet in l_sommets):
+            return False
+        if len(l_sommets) <= 2:
+            return True
+
+        d_indices = {i_sommet: i_indice for i_indice, i_sommet in enumerate(l_sommets)}
+        l_aretes = [
+            (d_indices[i_sommet], d_indices[i_adversaire], 1)
+            for i_sommet in l_sommets
+            for i_adversaire in self._sommets(p_masques[i_sommet] & p_sommets)
+            if i_sommet < i_adversaire
+        ]
+        l_partenaires = couplage_poids_maximum(l_aretes, p_cardinalite_maximale=True)
+
+        return len(l_partenaires) == len(l_sommets) and -1 not in l_partenaires
+
+    #
+    def _appliquer(self, p_masques: list[int], p_couplage: list[tuple[int, int]]) -> list[int]:
+        """
+        Retire les paires d'un tour des adversaires possibles.
+
+        Args:
+            p_masques (list[int]): Adversaires encore possibles de chaque sommet.
+            p_couplage (list[tuple[int, int]]): Les paires du tour.
+
+        Returns:
+            list[int]: Les nouveaux adversaires possibles (`p_masques` n'est pas modifié).
+        """
+
+        l_masques = list(p_masques)
+        for i_sommet, i_adversaire in p_couplage:
+            l_masques[i_sommet] &= ~(1 << i_adversaire)
+            l_masques[i_adversaire] &= ~(1 << i_sommet)
+
+        return l_masques
+
+    #
+    def _degre_minimum(self, p_masques: list[int]) -> int:
+        """
+        Retourne le plus petit nombre d'adversaires encore possibles d'un sommet.
+
+        Args:
+            p_masques (list[int]): Adversaires encore possibles de chaque sommet.
+
+        Returns:
+            int: Le degré minimum du graphe.
+        """
+
+        return min((i_masque.bit_count() for i_masque in p_masques), default=0)
+
+    #
+    def _sommets(self, p_ensemble: int) -> list[int]:
+        """
+        Liste les sommets d'un ensemble codé en bits.
+
+        Args:
+            p_ensemble (int): L'ensemble de sommets.
+
+        Returns:
+            list[int]: Les numéros des sommets, par ordre croissant.
+        """
+
+        l_sommets = []
+        while p_ensemble:
+            i_bit = p_ensemble & -p_ensemble
+            l_sommets.append(i_bit.bit_length() - 1)
+            p_ensemble ^= i_bit
+
+        return l_sommets
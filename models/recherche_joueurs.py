@@ -0,0 +1,353 @@
+from models.joueur import Joueur
+from bisect import bisect_left
+from collections import Counter
+import re
+import unicodedata
+
+
+class RechercheJoueurs:
+    """
+    Recherche de joueurs au fil de la saisie, sur des index construits une fois en mémoire.
+
+    - Identifiant national d'échecs (INE) : table de hachage, recherche exacte.
+    - Nom et prénom : arbre des préfixes (trie) de chaque mot, sans accents ni majuscules. Chaque nœud
+      garde les rangs alphabétiques des joueurs dont un mot commence par ce préfixe, dans l'ordre : les
+      premiers résultats se lisent sans tri. Avec plusieurs mots saisis, chaque mot doit être le début
+      d'un mot du nom ou du prénom ; les listes des mots sont croisées en sautant d'un rang à l'autre,
+      et le parcours s'arrête dès que les premiers résultats sont trouvés.
+    - Correspondance approchée (fautes de frappe) : index des trigrammes du nom complet. Elle ne sert
+      qu'à compléter les résultats quand les préfixes en donnent trop peu, classés par proportion
+      des trigrammes de la saisie retrouvés dans le nom complet (une faute sur le seul nom de famille
+      suffit à retrouver le joueur, sans que le prénom absent de la saisie ne le pénalise). Seuls les
+      trigrammes les plus rares de la saisie sont parcourus ; les plus courants ne sont que vérifiés,
+      pour les candidats retenus.
+
+    Les joueurs exclus (déjà inscrits ou déjà choisis) ne sont jamais proposés.
+    """
+
+    # Nombre de résultats retournés par défaut
+    nombre_resultats: int = 10
+    # Proportion minimale des trigrammes de la saisie retrouvés pour une correspondance approchée
+    seuil_trigrammes: float = 0.4
+    # Identifiant national entre parenthèses à la fin d'un libellé : "Nom Prénom (AB12345)"
+    regex_identifiant_libelle = re.compile(r"\(([^()]+)\)\s*$")
+
+    def __init__(self, p_joueurs: list[Joueur], p_exclus=()) -> None:
+        """
+        Construit les index de recherche des joueurs.
+
+        Args:
+            p_joueurs (list[Joueur]): Joueurs parmi lesquels chercher.
+            p_exclus (iterable, optional): Identifiants TinyDB des joueurs à ne jamais proposer.
+        """
+        l_joueurs = sorted(p_joueurs, key=lambda o_joueur: (o_joueur.nom_famille, o_joueur.prenom))
+
+        self.d_joueurs = {str(o_joueur.identifiant_tinydb): o_joueur for o_joueur in l_joueurs}
+        self.s_exclus = {str(id_joueur) for id_joueur in p_exclus}
+        self.d_identifiants_nationaux = {}
+        # Rang alphabétique -> identifiant du joueur : les index ne gardent que les rangs, toujours croissants
+        self.l_identifiants = list(self.d_joueurs)
+        # Nœud du trie : (enfants : caractère -> nœud, rangs des joueurs dont un mot a ce préfixe)
+        self.t_racine = ({}, [])
+        # Trigramme -> rangs des joueurs dont le nom complet le contient
+        self.d_trigrammes = {}
+
+        for i_rang, (id_joueur, o_joueur) in enumerate(self.d_joueurs.items()):
+            s_identifiant_national = self._normaliser_identifiant(o_joueur.identifiant_national_echec)
+            self.d_identifiants_nationaux[s_identifiant_national] = id_joueur
+
+            s_nom_complet = self.normaliser(f"{o_joueur.nom_famille} {o_joueur.prenom}")
+            for s_mot in s_nom_complet.split():
+                self._inserer_mot(s_mot, i_rang)
+
+            for s_trigramme in self._trigrammes(s_nom_complet):
+                self.d_trigrammes.setdefault(s_trigramme, []).append(i_rang)
+
+    #
+    def exclure(self, p_identifiant_joueur: str) -> None:
+        """
+        Exclut un joueur des résultats (par exemple, dès qu'il est inscrit).
+
+        Args:
+            p_identifiant_joueur (str): Identifiant TinyDB du joueur.
+
+        Returns:
+            None
+        """
+
+        self.s_exclus.add(str(p_identifiant_joueur))
+
+    #
+    def rechercher(self, p_saisie: str, p_limite: int | None = None) -> list[Joueur]:
+        """
+        Retourne les meilleurs joueurs correspondant à une saisie.
+
+        Ordre des résultats : identifiant national exact, puis joueurs dont les mots commencent par ceux
+        de la saisie (ordre alphabétique), puis correspondances approchées (les plus proches d'abord).
+        Une saisie vide retourne les premiers joueurs dans l'ordre alphabétique.
+
+        Args:
+            p_saisie (str): Texte saisi (nom, prénom, début de l'un ou de l'autre, ou identifiant national).
+            p_limite (int | None, optional): Nombre maximal de résultats. Par défaut, `nombre_resultats`.
+
+        Returns:
+            list[Joueur]: Les joueurs trouvés, sans les joueurs exclus.
+        """
+
+        i_limite = p_limite if p_limite is not None else self.nombre_resultats
+        l_resultats = []
+
+        id_exact = self.d_identifiants_nationaux.get(self._normaliser_identifiant(p_saisie))
+        if id_exact is not None and id_exact not in self.s_exclus:
+            l_resultats.append(id_exact)
+
+        s_saisie = self.normaliser(p_saisie)
+        for id_joueur in self._rechercher_prefixes(s_saisie.split()):
+            if len(l_resultats) >= i_limite:
+                break
+            if id_joueur not in self.s_exclus and id_joueur != id_exact:
+                l_resultats.append(id_joueur)
+
+        if len(l_resultats) < i_limite and len(s_saisie) >= 3:
+            s_deja_trouves = set(l_resultats)
+            for id_joueur in self._rechercher_trigrammes(s_saisie, i_limite + len(s_deja_trouves)):
+                if len(l_resultats) >= i_limite:
+                    break
+                if id_joueur not in s_deja_trouves:
+                    l_resultats.append(id_joueur)
+
+        return [self.d_joueurs[id_joueur] for id_joueur in l_resultats]
+
+    #
+    def resoudre(self, p_saisie: str) -> Joueur | None:
+        """
+        Retrouve le joueur désigné par une saisie validée.
+
+        La saisie désigne un joueur si elle contient son identifiant national (seul, ou entre parenthèses
+        à la fin d'un libellé proposé), ou si elle ne correspond qu'à un seul joueur : par les préfixes,
+        ou à défaut de préfixe par la correspondance approchée.
+
+        Args:
+            p_saisie (str): Texte validé par l'utilisateur.
+
+        Returns:
+            Joueur | None: Le joueur désigné, ou None s'il n'y en a pas ou s'il est exclu.
+        """
+
+        match = self.regex_identifiant_libelle.search(p_saisie)
+        s_identifiant = match.group(1) if match else p_saisie
+
+        id_joueur = self.d_identifiants_nationaux.get(self._normaliser_identifiant(s_identifiant))
+        if id_joueur is not None:
+            return None if id_joueur in self.s_exclus else self.d_joueurs[id_joueur]
+
+        s_saisie = self.normaliser(p_saisie)
+        l_resultats = []
+        for id_joueur in self._rechercher_prefixes(s_saisie.split()):
+            if id_joueur not in self.s_exclus:
+                l_resultats.append(id_joueur)
+                if len(l_resultats) > 1:
+                    return None
+
+        if not l_resultats and len(s_saisie) >= 3:
+            l_resultats = self._rechercher_trigrammes(s_saisie, 2)
+
+        return self.d_joueurs[l_resultats[0]] if len(l_resultats) == 1 else None
+
+    #
+    @staticmethod
+    def normaliser(p_texte: str) -> str:
+        """
+        Normalise un texte pour la recherche : sans accents, en minuscules, tirets remplacés par des espaces.
+
+        Args:
+            p_texte (str): Texte à normaliser.
+
+        Returns:
+            str: Le texte normalisé, mots séparés par une seule espace.
+        """
+
+        s_decompose = unicodedata.normalize("NFKD", p_texte)
+        s_sans_accents = "".join(s_caractere for s_caractere in s_decompose if not unicodedata.combining(s_caractere))
+
+        return " ".join(s_sans_accents.casefold().replace("-", " ").split())
+
+    #
+    # METHODES PRIVEES
+    #
+    def _inserer_mot(self, p_mot: str, p_rang: int) -> None:
+        """
+        Ajoute un joueur à tous les nœuds du trie correspondant aux préfixes d'un mot.
+
+        Args:
+            p_mot (str): Mot normalisé du nom ou du prénom.
+            p_rang (int): Rang alphabétique du joueur.
+
+        Returns:
+            None
+        """
+
+        t_noeud = self.t_racine
+        self._ajouter_au_noeud(t_noeud, p_rang)
+
+        for s_caractere in p_mot:
+            t_noeud = t_noeud[0].setdefault(s_caractere, ({}, []))
+            self._ajouter_au_noeud(t_noeud, p_rang)
+
+    #
+    @staticmethod
+    def _ajouter_au_noeud(p_noeud: tuple, p_rang: int) -> None:
+        """
+        Ajoute un joueur à un nœud du trie, une seule fois même si plusieurs de ses mots y passent.
+
+        Les joueurs sont insérés dans l'ordre de leur rang et leurs mots à la suite : il suffit de comparer
+        au dernier rang du nœud, et les rangs de chaque nœud restent croissants.
+
+        Args:
+            p_noeud (tuple): Nœud du trie.
+            p_rang (int): Rang alphabétique du joueur.
+
+        Returns:
+            None
+        """
+
+        if not p_noeud[1] or p_noeud[1][-1] != p_rang:
+            p_noeud[1].append(p_rang)
+
+    #
+    def _rechercher_prefixes(self, p_mots: list[str]):
+        """
+        Parcourt, dans l'ordre alphabétique, les joueurs dont chaque mot saisi commence un mot du nom ou du prénom.
+
+        Les listes de rangs des mots saisis sont croisées sans être copiées : chaque liste saute directement
+        (recherche dichotomique) au plus grand rang atteint par les autres, jusqu'à un rang commun à toutes.
+
+        Args:
+            p_mots (list[str]): Mots normalisés de la saisie.
+
+        Returns:
+            Iterator[str]: Les identifiants des joueurs, au fur et à mesure (seuls les premiers sont lus).
+        """
+
+        l_listes = []
+        for s_mot in p_mots or [""]:
+            t_noeud = self.t_racine
+            for s_caractere in s_mot:
+                t_noeud = t_noeud[0].get(s_caractere)
+                if t_noeud is None:
+                    return
+            l_listes.append(t_noeud[1])
+
+        # La liste la plus courte mène le parcours
+        l_listes.sort(key=len)
+        if not l_listes[0]:
+            return
+        if len(l_listes) == 1:
+            yield from (self.l_identifiants[i_rang] for i_rang in l_listes[0])
+            return
+
+        l_positions = [0] * len(l_listes)
+        i_rang = l_listes[0][0]
+        while True:
+            for i_liste, l_rangs in enumerate(l_listes):
+                i_position = bisect_left(l_rangs, i_rang, l_positions[i_liste])
+                if i_position == len(l_rangs):
+                    return
+                l_positions[i_liste] = i_position
+                if l_rangs[i_position] != i_rang:
+                    # Rang absent de cette liste : le parcours reprend à son rang suivant
+                    i_rang = l_rangs[i_position]
+                    break
+            else:
+                yield self.l_identifiants[i_rang]
+                l_positions[0] += 1
+                if l_positions[0] == len(l_listes[0]):
+                    return
+                i_rang = l_listes[0][l_positions[0]]
+
+    #
+    def _rechercher_trigrammes(self, p_saisie: str, p_limite: int) -> list[str]:
+        """
+        Retourne les joueurs dont le nom complet contient la plus grande part des trigrammes de la saisie.
+
+        Un joueur qui atteint `seuil_trigrammes` contient au moins un des trigrammes les plus rares de la saisie
+        (tous sauf les `i_requis - 1` plus courants) : seuls ces trigrammes font entrer des candidats. Les
+        trigrammes les plus courants ne font que compléter le compte des candidats déjà retenus.
+
+        Args:
+            p_saisie (str): Saisie normalisée.
+            p_limite (int): Nombre maximal de joueurs.
+
+        Returns:
+            list[str]: Les identifiants des joueurs atteignant `seuil_trigrammes`, les plus proches d'abord
+                       (à égalité, dans l'ordre alphabétique).
+        """
+
+        # Listes des trigrammes de la saisie, de la plus rare à la plus courante
+        l_listes = sorted(
+            (self.d_trigrammes.get(s_trigramme, []) for s_trigramme in self._trigrammes(p_saisie)), key=len
+        )
+        i_total = len(l_listes)
+        # Nombre minimal de trigrammes communs pour atteindre le seuil (au moins un)
+        i_requis = next(
+            i_communs for i_communs in range(1, i_total + 1) if i_communs / i_total >= self.seuil_trigrammes
+        )
+
+        c_communs = Counter()
+        for l_rangs in l_listes[:i_total - i_requis + 1]:
+            c_communs.update(l_rangs)
+        for l_rangs in l_listes[i_total - i_requis + 1:]:
+            c_communs.update(filter(c_communs.__contains__, l_rangs))
+
+        # Clé entière : nombre de trigrammes communs d'abord, puis ordre alphabétique
+        i_joueurs = len(self.l_identifiants)
+        l_cles = sorted(
+            (
+                i_communs * i_joueurs + i_joueurs - 1 - i_rang
+                for i_rang, i_communs in c_communs.items()
+                if i_communs >= i_requis
+            ),
+            reverse=True,
+        )
+
+        l_resultats = []
+        for i_cle in l_cles:
+            id_joueur = self.l_identifiants[i_joueurs - 1 - i_cle % i_joueurs]
+            if id_joueur not in self.s_exclus:
+                l_resultats.append(id_joueur)
+                if len(l_resultats) == p_limite:
+                    break
+
+        return l_resultats
+
+    #
+    @staticmethod
+    def _trigrammes(p_texte: str) -> set[str]:
+        """
+        Retourne les trigrammes d'un texte normalisé, encadré d'espaces pour marquer le début et la fin des mots.
+
+        Args:
+            p_texte (str): Texte normalisé.
+
+        Returns:
+            set[str]: Les trigrammes.
+        """
+
+        s_texte = f"  {p_texte} "
+
+        return {s_texte[i:i + 3] for i in range(len(s_texte) - 2)}
+
+    #
+    @staticmethod
+    def _normaliser_identifiant(p_identifiant: str) -> str:
+        """
+        Normalise un identifiant national d'échecs : majuscules, sans espaces.
+
+        Args:
+            p_identifiant (str): Identifiant saisi ou enregistré.
+
+        Returns:
+            str: L'identifiant normalisé.
+        """
+
+        return "".join(str(p_identifiant).split()).upper()
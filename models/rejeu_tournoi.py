@@ -0,0 +1,186 @@
+from models.etat_appariement import EtatAppariement
+from models.moteur_appariement import MoteurAppariement
+from models.tournoi import Tournoi
+import time
+
+
+class RejeuTournoi:
+    """
+    Rejoue les appariements d'un tournoi à partir de ses résultats enregistrés, sans interface.
+
+    Chaque tour est apparié de nouveau, comme l'a fait `TourControleur` : le premier avec le générateur
+    tiré de la graine du tournoi, les suivants par le `MoteurAppariement` à partir de l'état
+    d'appariement laissé par les tours précédents. Les résultats enregistrés (et non ceux du rejeu)
+    sont ensuite intégrés à l'état : chaque tour est rejoué dans les conditions où il a été apparié,
+    même si un tour précédent diffère.
+
+    Le rejeu permet de mesurer l'appariement sur de vrais tournois et de vérifier qu'une modification
+    du moteur donne les mêmes tours, ou de chiffrer les différences.
+
+    Le premier tour d'un tournoi sans graine (créé avant leur enregistrement) n'est pas comparé. La
+    recherche d'anticipation du moteur est bornée dans le temps : sur une machine beaucoup plus lente,
+    un tour difficile peut donc être apparié autrement.
+    """
+
+    def __init__(self, p_tournoi: dict) -> None:
+        """
+        Initialise le rejeu d'un tournoi.
+
+        Args:
+            p_tournoi (dict): Document du tournoi (`graine`, `nombre_tours`, `liste_joueurs` : identifiant
+                              -> score, `liste_tours` avec leurs matchs), tel que retourné par
+                              `recuperer_document_tournoi`.
+        """
+        self.d_tournoi = p_tournoi
+        self.l_joueurs = [str(id_joueur) for id_joueur in p_tournoi["liste_joueurs"]]
+
+    #
+    def rejouer(self) -> dict:
+        """
+        Rejoue tous les tours enregistrés du tournoi et compare leurs appariements.
+
+        Returns:
+            dict: `tours_rejoues`, `tours_compares`, `tours_identiques`, `paires_differentes` (total),
+                  `duree_totale_ms` et `liste_tours` (le détail de chaque tour, voir `_comparer`).
+        """
+
+        l_tours_enregistres = self.d_tournoi.get("liste_tours", [])
+        i_nombre_tours = self._nombre_tours(len(l_tours_enregistres))
+        o_etat = EtatAppariement(self.l_joueurs)
+
+        l_tours = []
+        for i_numero_tour, d_tour in enumerate(l_tours_enregistres, start=1):
+            f_debut = time.perf_counter()
+            t_appariement = self._apparier_tour(i_numero_tour, o_etat, max(i_nombre_tours - i_numero_tour, 0))
+            f_duree_ms = (time.perf_counter() - f_debut) * 1000
+
+            d_comparaison = self._comparer(d_tour["liste_matchs"], t_appariement)
+            d_comparaison["tour"] = i_numero_tour
+            d_comparaison["duree_ms"] = round(f_duree_ms, 3)
+            l_tours.append(d_comparaison)
+
+            if d_tour["statut"] == "Terminé":
+                o_etat.integrer_tour(d_tour["liste_matchs"])
+
+        l_tours_compares = [d_tour for d_tour in l_tours if d_tour["compare"]]
+
+        return {
+            "tours_rejoues": len(l_tours),
+            "tours_compares": len(l_tours_compares),
+            "tours_identiques": sum(1 for d_tour in l_tours_compares if d_tour["identique"]),
+            "paires_differentes": sum(d_tour["paires_differentes"] for d_tour in l_tours_compares),
+            "duree_totale_ms": round(sum(d_tour["duree_ms"] for d_tour in l_tours), 3),
+            "liste_tours": l_tours,
+        }
+
+    #
+    # METHODES PRIVEES
+    #
+    def _nombre_tours(self, p_tours_enregistres: int) -> int:
+        """
+        Retourne le nombre de tours prévu du tournoi.
+
+        Args:
+            p_tours_enregistres (int): Nombre de tours enregistrés, utilisé si le nombre prévu n'est pas un entier.
+
+        Returns:
+            int: Le nombre de tours du tournoi.
+        """
+
+        try:
+            return int(self.d_tournoi.get("nombre_tours"))
+        except (TypeError, ValueError):
+            return p_tours_enregistres
+
+    #
+    def _apparier_tour(self, p_numero_tour: int, p_etat: EtatAppariement, p_tours_suivants: int) -> tuple | None:
+        """
+        Apparie de nouveau un tour.
+
+        Args:
+            p_numero_tour (int): Numéro du tour (1 pour le premier).
+            p_etat (EtatAppariement): État d'appariement après les tours précédents.
+            p_tours_suivants (int): Nombre de tours prévus après celui-ci.
+
+        Returns:
+            tuple | None: (paires (blanc, noir), exempté ou None), ou None si le tour ne peut pas être
+                          reproduit (premier tour d'un tournoi sans graine).
+        """
+
+        if p_numero_tour == 1:
+            if self.d_tournoi.get("graine") is None:
+                return None
+            return MoteurAppariement.apparier_premier_tour(
+                self.l_joueurs, Tournoi.generateur_aleatoire(self.d_tournoi["graine"], 1)
+            )
+
+        return MoteurAppariement.depuis_etat(p_etat).apparier(p_tours_suivants)
+
+    #
+    def _comparer(self, p_matchs: list[dict], p_appariement: tuple | None) -> dict:
+        """
+        Compare les matchs enregistrés d'un tour à son appariement rejoué.
+
+        Args:
+            p_matchs (list[dict]): Matchs enregistrés du tour.
+            p_appariement (tuple | None): Appariement rejoué, tel que retourné par `_apparier_tour`.
+
+        Returns:
+            dict: `compare` (False si le tour n'a pas pu être rejoué), `identique`, `paires`,
+                  `paires_identiques`, `couleurs_inversees`, `paires_differentes`, `exempte_enregistre`,
+                  `exempte_rejoue`, et les paires propres à chaque version (`paires_enregistrees_seules`,
+                  `paires_rejouees_seules`).
+        """
+
+        l_paires_enregistrees = [(str(d_match["joueur_blanc"]), str(d_match["joueur_noir"])) for d_match in p_matchs]
+        s_joueurs_tour = {id_joueur for t_paire in l_paires_enregistrees for id_joueur in t_paire}
+        id_exempte_enregistre = next(
+            (id_joueur for id_joueur in self.l_joueurs if id_joueur not in s_joueurs_tour), None
+        )
+
+        if p_appariement is None:
+            return {
+                "compare": False,
+                "paires": len(l_paires_enregistrees),
+                "exempte_enregistre": id_exempte_enregistre,
+            }
+
+        l_paires_rejouees, id_exempte_rejoue = p_appariement
+        l_paires_rejouees = [(str(id_blanc), str(id_noir)) for id_blanc, id_noir in l_paires_rejouees]
+
+        s_paires_enregistrees = set(l_paires_enregistrees)
+        s_paires_rejouees = set(l_paires_rejouees)
+        s_rencontres_rejouees = {frozenset(t_paire) for t_paire in l_paires_rejouees}
+
+        i_identiques = len(s_paires_enregistrees & s_paires_rejouees)
+        i_couleurs_inversees = sum(
+            1
+            for t_paire in s_paires_enregistrees - s_paires_rejouees
+            if frozenset(t_paire) in s_rencontres_rejouees
+        )
+        l_enregistrees_seules = [
+            list(t_paire) for t_paire in l_paires_enregistrees if frozenset(t_paire) not in s_rencontres_rejouees
+        ]
+        s_rencontres_enregistrees = {frozenset(t_paire) for t_paire in l_paires_enregistrees}
+        l_rejouees_seules = [
+            list(t_paire) for t_paire in l_paires_rejouees if frozenset(t_paire) not in s_rencontres_enregistrees
+        ]
+
+        if id_exempte_rejoue is not None:
+            id_exempte_rejoue = str(id_exempte_rejoue)
+
+        return {
+            "compare": True,
+            "identique": (
+                i_identiques == len(l_paires_enregistrees) == len(l_paires_rejouees)
+                and id_exempte_enregistre == id_exempte_rejoue
+            ),
+            "paires": len(l_paires_enregistrees),
+            "paires_identiques": i_identiques,
+            "couleurs_inversees": i_couleurs_inversees,
+            "paires_differentes": len(l_enregistrees_seules),
+            "exempte_enregistre": id_exempte_enregistre,
+            "exempte_rejoue": id_exempte_rejoue,
+            "paires_enregistrees_seules": l_enregistrees_seules,
+            "paires_rejouees_seules": l_rejouees_seules,
+        }
@@ -0,0 +1,198 @@
+from pathlib import Path
+import os
+import re
+
+try:
+    import fcntl
+except ImportError:
+    # Windows : pas de fcntl, le verrou est posé avec msvcrt
+    fcntl = None
+    import msvcrt
+
+
+class SequenceIdentifiants:
+    """
+    Distribue des identifiants uniques et croissants à partir d'un petit fichier compteur.
+
+    Le fichier compteur contient le dernier identifiant attribué. Chaque attribution se fait
+    sous verrou, ce qui évite que deux arbitres qui créent un tournoi en même temps obtiennent
+    le même identifiant. Le verrou est posé par le système sur le fichier `.lock` (`fcntl.flock`,
+    ou `msvcrt.locking` sous Windows) : il est libéré à la fin du processus qui le tient, même
+    interrompu, et le fichier `.lock` n'est jamais supprimé.
+    Si le fichier compteur est absent, il est recréé en parcourant une seule fois le dossier
+    des fichiers numérotés.
+    """
+
+    def __init__(self, p_fichier_compteur: Path, p_dossier_a_scanner: Path, p_regex_identifiant: str) -> None:
+        """
+        Initialise la séquence.
+
+        Args:
+            p_fichier_compteur (Path): Fichier contenant le dernier identifiant attribué.
+            p_dossier_a_scanner (Path): Dossier parcouru pour recréer le compteur s'il est absent.
+            p_regex_identifiant (str): Regex dont le premier groupe extrait l'identifiant d'un nom de fichier.
+        """
+        self.fichier_compteur = Path(p_fichier_compteur)
+        self.dossier_a_scanner = Path(p_dossier_a_scanner)
+        self.regex_identifiant = re.compile(p_regex_identifiant)
+        self.fichier_verrou = self.fichier_compteur.with_name(self.fichier_compteur.name + ".lock")
+        self.descripteur_verrou = None
+
+    #
+    def allouer(self) -> int:
+        """
+        Attribue le prochain identifiant de la séquence.
+
+        Returns:
+            int: Nouvel identifiant unique.
+        """
+
+        return self.reserver_bloc(1)[0]
+
+    #
+    def reserver_bloc(self, p_taille_bloc: int) -> range:
+        """
+        Réserve d'un coup un bloc d'identifiants consécutifs, par exemple pour un import en masse.
+
+        Args:
+            p_taille_bloc (int): Nombre d'identifiants à réserver (au moins 1).
+
+        Returns:
+            range: Les identifiants réservés.
+        """
+
+        if p_taille_bloc < 1:
+            raise ValueError("La taille du bloc doit être supérieure ou égale à 1.")
+
+        self._prendre_verrou()
+        try:
+            i_dernier_identifiant = self._lire_compteur()
+            i_nouveau_dernier = i_dernier_identifiant + p_taille_bloc
+            self._ecrire_compteur(i_nouveau_dernier)
+        finally:
+            self._liberer_verrou()
+
+        return range(i_dernier_identifiant + 1, i_nouveau_dernier + 1)
+
+    #
+    def aligner(self, p_dernier_identifiant_utilise: int) -> None:
+        """
+        S'assure que le compteur n'est pas inférieur à un identifiant déjà utilisé ailleurs.
+
+        Utile lorsque les identifiants existants ne sont pas visibles dans le dossier scanné
+        (tournois stockés dans une base SQLite par exemple).
+
+        Args:
+            p_dernier_identifiant_utilise (int): Plus grand identifiant déjà utilisé.
+
+        Returns:
+            None
+        """
+
+        self._prendre_verrou()
+        try:
+            if self._lire_compteur() < p_dernier_identifiant_utilise:
+                self._ecrire_compteur(p_dernier_identifiant_utilise)
+        finally:
+            self._liberer_verrou()
+
+    #
+    # METHODES PRIVEES
+    #
+    def _lire_compteur(self) -> int:
+        """
+        Lit le dernier identifiant attribué, ou le recalcule en parcourant le dossier si le compteur est absent.
+
+        Returns:
+            int: Dernier identifiant attribué (0 si aucun).
+        """
+
+        try:
+            return int(self.fichier_compteur.read_text(encoding="utf-8").strip())
+        except (OSError, ValueError):
+            return self._scanner_dossier()
+
+    #
+    def _scanner_dossier(self) -> int:
+        """
+        Retrouve le plus grand identifiant présent dans les noms de fichiers du dossier.
+
+        Returns:
+            int: Plus grand identifiant trouvé (0 si aucun).
+        """
+
+        i_maximum = 0
+
+        if self.dossier_a_scanner.is_dir():
+            for fichier in self.dossier_a_scanner.iterdir():
+                match = self.regex_identifiant.match(fichier.name)
+                if fichier.is_file() and match:
+                    # group(1) récupère la partie capturée entre les parenthèses de la regex
+                    i_maximum = max(i_maximum, int(match.group(1)))
+
+        return i_maximum
+
+    #
+    def _ecrire_compteur(self, p_dernier_identifiant: int) -> None:
+        """
+        Écrit le compteur via un fichier temporaire renommé, pour ne jamais laisser un compteur tronqué.
+
+        Args:
+            p_dernier_identifiant (int): Dernier identifiant attribué.
+
+        Returns:
+            None
+        """
+
+        fichier_temporaire = self.fichier_compteur.with_name(self.fichier_compteur.name + ".tmp")
+        with open(fichier_temporaire, "w", encoding="utf-8") as fichier:
+            fichier.write(str(p_dernier_identifiant))
+            fichier.flush()
+            os.fsync(fichier.fileno())
+        os.replace(fichier_temporaire, self.fichier_compteur)
+
+    #
+    def _prendre_verrou(self) -> None:
+        """
+        Prend le verrou de la séquence, en attendant si un autre processus le tient.
+
+        Returns:
+            None
+        """
+
+        self.fichier_verrou.parent.mkdir(parents=True, exist_ok=True)
+        self.descripteur_verrou = os.open(self.fichier_verrou, os.O_CREAT | os.O_RDWR)
+
+        if fcntl is not None:
+            fcntl.flock(self.descripteur_verrou, fcntl.LOCK_EX)
+            return
+
+        while True:
+            try:
+                # msvcrt.locking n'attend qu'une dizaine de secondes avant d'abandonner
+                msvcrt.locking(self.descripteur_verrou, msvcrt.LK_LOCK, 1)
+                return
+            except OSError:
+                continue
+
+    #
+    def _liberer_verrou(self) -> None:
+        """
+        Libère le verrou de la séquence.
+
+        Returns:
+            None
+        """
+
+        if self.descripteur_verrou is None:
+            return
+
+        try:
+            if fcntl is not None:
+                fcntl.flock(self.descripteur_verrou, fcntl.LOCK_UN)
+            else:
+                os.lseek(self.descripteur_verrou, 0, os.SEEK_SET)
+                msvcrt.locking(self.descripteur_verrou, msvcrt.LK_UNLCK, 1)
+        finally:
+            os.close(self.descripteur_verrou)
+            self.descripteur_verrou = None
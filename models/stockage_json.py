@@ -0,0 +1,168 @@
+from tinydb.storages import Storage, touch
+from pathlib import Path
+import json
+import os
+
+try:
+    import orjson
+except ImportError:
+    # orjson est facultatif : sans lui, le module json de la bibliothèque standard est utilisé
+    orjson = None
+
+
+class StockageJsonRapide(Storage):
+    """
+    Stockage TinyDB au format JSON, plus rapide que le `JSONStorage` par défaut.
+
+    - Utilise `orjson` s'il est installé, sinon le module `json` réglé pour écrire vite
+      (pas d'échappement ASCII, pas de contrôle des références circulaires).
+    - Écrit un JSON compact (sans indentation ni espaces) via un fichier temporaire renommé :
+      un fichier n'est jamais laissé à moitié écrit. Le fichier temporaire peut être créé dans un autre
+      dossier (`p_dossier_temporaire`, sur le même système de fichiers), et `p_apres_ecriture` est appelé
+      après chaque remplacement : l'index des tournois s'en sert pour ignorer les réécritures du processus.
+    - Ouvre le fichier à chaque opération au lieu de garder un descripteur ouvert, ce qui permet
+      de remplacer le dossier `data/` (restauration) sans laisser de descripteur périmé.
+    - Avec `p_memoriser=True`, garde en mémoire le contenu déjà décodé et ne relit pas le fichier
+      tant que son empreinte (inode, date de modification, taille) n'a pas changé.
+      À réserver aux bases dont les documents sont plats (joueurs) : TinyDB ne fait qu'une copie
+      superficielle des documents, les listes imbriquées d'un tournoi seraient partagées avec le cache.
+    """
+
+    # Contenu décodé des fichiers mémorisés, partagé par toutes les instances :
+    # chemin absolu (str) -> (empreinte du fichier, données)
+    d_cache_fichiers: dict = {}
+
+    # Encodeur de la bibliothèque standard réglé pour une sortie compacte
+    encodeur_json = json.JSONEncoder(ensure_ascii=False, check_circular=False, separators=(",", ":"))
+
+    def __init__(
+        self,
+        path: str,
+        create_dirs: bool = False,
+        p_memoriser: bool = False,
+        p_dossier_temporaire: str | Path | None = None,
+        p_apres_ecriture=None,
+        **kwargs,
+    ) -> None:
+        """
+        Initialise le stockage et crée le fichier s'il n'existe pas (comme `JSONStorage`).
+
+        Args:
+            path (str): Chemin du fichier JSON (nom imposé par TinyDB).
+            create_dirs (bool, optional): Crée les dossiers parents si besoin. Par défaut, False.
+            p_memoriser (bool, optional): Garde le contenu décodé en mémoire entre deux lectures. Par défaut, False.
+            p_dossier_temporaire (str | Path | None, optional): Dossier du fichier temporaire d'écriture, créé
+                                                                si besoin. Par défaut, le dossier du fichier.
+            p_apres_ecriture (callable, optional): Fonction (chemin du fichier) appelée après chaque écriture.
+            **kwargs: Options de `JSONStorage` (encoding, access_mode...), ignorées.
+        """
+        super().__init__()
+
+        touch(path, create_dirs=create_dirs)
+
+        self.fichier = Path(path)
+        self.s_cle_cache = str(self.fichier.resolve())
+        self.b_memoriser = p_memoriser
+        if p_dossier_temporaire is not None:
+            dossier_temporaire = Path(p_dossier_temporaire)
+            dossier_temporaire.mkdir(parents=True, exist_ok=True)
+        else:
+            dossier_temporaire = self.fichier.parent
+        self.fichier_temporaire = dossier_temporaire / (self.fichier.name + ".tmp")
+        self.apres_ecriture = p_apres_ecriture
+
+    #
+    def read(self) -> dict | None:
+        """
+        Lit et décode le fichier, sauf s'il est mémorisé et n'a pas changé depuis la dernière lecture.
+
+        Returns:
+            dict | None: Les tables de la base, ou None si le fichier est vide.
+        """
+
+        t_empreinte = self._empreinte_fichier()
+        if t_empreinte is None or t_empreinte[2] == 0:
+            return None
+
+        if self.b_memoriser:
+            t_cache = StockageJsonRapide.d_cache_fichiers.get(self.s_cle_cache)
+            if t_cache is not None and t_cache[0] == t_empreinte:
+                return t_cache[1]
+
+        with open(self.fichier, "rb") as fichier:
+            contenu = fichier.read()
+
+        d_donnees = orjson.loads(contenu) if orjson is not None else json.loads(contenu)
+
+        if self.b_memoriser:
+            StockageJsonRapide.d_cache_fichiers[self.s_cle_cache] = (t_empreinte, d_donnees)
+
+        return d_donnees
+
+    #
+    def write(self, data: dict) -> None:
+        """
+        Encode les tables en JSON compact et remplace le fichier de manière atomique.
+
+        Args:
+            data (dict): Les tables de la base.
+
+        Returns:
+            None
+        """
+
+        if orjson is not None:
+            contenu = orjson.dumps(data)
+        else:
+            contenu = self.encodeur_json.encode(data).encode("utf-8")
+
+        with open(self.fichier_temporaire, "wb") as fichier:
+            fichier.write(contenu)
+            fichier.flush()
+            os.fsync(fichier.fileno())
+        os.replace(self.fichier_temporaire, self.fichier)
+
+        if self.apres_ecriture is not None:
+            self.apres_ecriture(self.fichier)
+
+        if self.b_memoriser:
+            StockageJsonRapide.d_cache_fichiers[self.s_cle_cache] = (self._empreinte_fichier(), data)
+
+    #
+    def close(self) -> None:
+        """
+        Aucun descripteur n'est gardé ouvert : rien à fermer.
+
+        Returns:
+            None
+        """
+
+    #
+    @classmethod
+    def vider_cache(cls) -> None:
+        """
+        Oublie le contenu mémorisé de tous les fichiers (par exemple après une restauration).
+
+        Returns:
+            None
+        """
+
+        cls.d_cache_fichiers.clear()
+
+    #
+    # METHODES PRIVEES
+    #
+    def _empreinte_fichier(self) -> tuple | None:
+        """
+        Retourne l'empreinte du fichier, qui change à chaque réécriture.
+
+        Returns:
+            tuple | None: (inode, date de modification, taille) ou None si le fichier n'existe pas.
+        """
+
+        try:
+            stat_fichier = self.fichier.stat()
+        except OSError:
+            return None
+
+        return (stat_fichier.st_ino, stat_fichier.st_mtime_ns, stat_fichier.st_size)
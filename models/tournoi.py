@@ -1,4 +1,6 @@
+from models.sequence_identifiants import SequenceIdentifiants
 from pathlib import Path
+import random
 import re
 
 
@@ -6,9 +8,15 @@ class Tournoi:
     # Attribut de classe pour y accéder de partout
     nombre_tours_defaut: int = "4"
 
+    # Règles de validation des informations d'un tournoi, partagées par la saisie et la ligne de commande
+    # Nom, lieu et description : lettres (avec accents), chiffres, tirets et espaces
+    regex_nom = re.compile(r"^[A-Za-zÀ-ÖØ-öø-ÿ0-9\s-]+$")
+    # Dates de début et de fin : JJ-MM-AAAA
+    format_date: str = "%d-%m-%Y"
+
     def __init__(
         self,
-        p_identifiant: int,
+        p_identifiant: int | None,
         p_nom_tournoi: str,
         p_lieu_tournoi: str,
         p_date_debut_tournoi: str,
@@ -17,17 +25,21 @@ class Tournoi:
         p_description: str | None = None,
         p_liste_tours: list = [],
         p_liste_joueurs: list = [],
+        p_graine: int | None = None,
     ) -> None:
         """Initialise un tournoi avec ses détails.
 
         Args:
-            p_identifiant (int): Identifiant unique du tournoi.
+            p_identifiant (int | None): Identifiant unique du tournoi, ou None pour un nouveau tournoi
+                                        (attribué par `sauvegarder_tournoi`).
             p_nom_tournoi (str): Nom du tournoi.
             p_lieu_tournoi (str): Lieu où se déroule le tournoi.
             p_date_debut_tournoi (str): Date de début du tournoi (format JJ/MM/AAAA).
             p_date_fin_tournoi (str): Date de fin du tournoi (format JJ/MM/AAAA).
             p_nombre_tours (int, optional): Nombre total de tours dans le tournoi. Par défaut à 4.
             p_description (str | None, optional): Description optionnelle du tournoi. Par défaut à None.
+            p_graine (int | None, optional): Graine des tirages aléatoires du tournoi (voir `generateur_aleatoire`).
+                                             None pour un tournoi créé avant l'enregistrement des graines.
         """
         self.identifiant = p_identifiant
         self.nom_tournoi = p_nom_tournoi
@@ -38,38 +50,83 @@ class Tournoi:
         self.liste_joueurs = p_liste_joueurs
         self.description = p_description
         self.liste_tours = p_liste_tours
+        self.graine = p_graine
 
 #
     @classmethod
     def generer_identifiant(cls) -> int:
         """Génère un identifiant unique pour un nouveau tournoi.
 
-        Cette méthode recherche les fichiers existants dans le dossier `data/tournaments/`
-        et extrait les identifiants numériques des tournois déjà créés.
-        Elle attribue ensuite le plus grand identifiant + 1 au prochain tournoi.
+        Appelée par `sauvegarder_tournoi` au moment d'enregistrer un tournoi qui n'a pas encore d'identifiant.
+        Cette méthode s'appuie sur la séquence des tournois (`data/sequence_tournois`), qui contient
+        le dernier identifiant attribué et est protégée par un verrou : deux tournois créés en même temps
+        ne peuvent pas recevoir le même identifiant.
+        Si le fichier de séquence est absent, il est recréé à partir du plus grand identifiant
+        trouvé dans les noms de fichiers du dossier `data/tournaments/`.
         @classmethod → Permet d’appeler cette méthode sans instancier un objet de la classe Tournoi
 
         Returns:
             int: Nouvel identifiant unique du tournoi.
         """
 
+        return cls.sequence_identifiants().allouer()
+
+    #
+    @staticmethod
+    def generer_graine() -> int:
+        """Tire la graine d'un nouveau tournoi.
+
+        Returns:
+            int: Graine sur 32 bits, tirée par le générateur du système.
+        """
+
+        return random.SystemRandom().getrandbits(32)
+
+    #
+    @staticmethod
+    def generateur_aleatoire(p_graine: int, p_numero_tour: int) -> random.Random:
+        """Retourne le générateur aléatoire d'un tour, déterminé par la graine du tournoi.
+
+        Chaque tour a son propre générateur : rejouer un tour donne le même tirage, quels que
+        soient les tirages des autres tours.
+
+        Args:
+            p_graine (int): Graine du tournoi.
+            p_numero_tour (int): Numéro du tour (1 pour le premier).
+
+        Returns:
+            random.Random: Générateur du tour.
+        """
+
+        return random.Random(f"{p_graine}:{p_numero_tour}")
+
+    #
+    @classmethod
+    def reserver_identifiants(cls, p_nombre_tournois: int) -> range:
+        """Réserve un bloc d'identifiants consécutifs pour un import de plusieurs tournois.
+
+        Args:
+            p_nombre_tournois (int): Nombre d'identifiants à réserver.
+
+        Returns:
+            range: Les identifiants réservés.
+        """
+
+        return cls.sequence_identifiants().reserver_bloc(p_nombre_tournois)
+
+    #
+    @classmethod
+    def sequence_identifiants(cls) -> SequenceIdentifiants:
+        """Retourne la séquence utilisée pour numéroter les tournois.
+
+        Returns:
+            SequenceIdentifiants: Séquence adossée au fichier `data/sequence_tournois`.
+        """
+
         # Préparation de la regex pour extraire le numéro du tournoi à partir du nom du fichier
         regex = r"tournoi_(\d+)_.*\.json"
-        dossier_tournois = Path("data/tournaments")
-        identifiants = []
-
-        # Liste les fichiers dans le dossier `data/tournaments`
-        o_iter_fichiers = dossier_tournois.iterdir()
-
-        for fichier in o_iter_fichiers:
-            if fichier.is_file() and fichier.name != ".gitkeep":
-                id_tournoi = re.search(regex, fichier.name)
-                if id:
-                    # group(1) récupère la partie capturée entre les parenthèses de la regex
-                    identifiants.append(int(id_tournoi.group(1)))
-
-        # return identifiant_a_attribuer
-        if not identifiants:
-            return 1  # Premier tournoi
-        else:
-            return max(identifiants) + 1  # Prochain ID disponible
+
+        # Dossier des données, situé à partir de la racine du projet et non du dossier courant
+        dossier_donnees = Path(__file__).parent.parent / "data"
+
+        return SequenceIdentifiants(dossier_donnees / "sequence_tournois", dossier_donnees / "tournaments", regex)
@@ -0,0 +1,57 @@
+from prompt_toolkit.completion import Completer, Completion
+from models.joueur import Joueur
+from models.recherche_joueurs import RechercheJoueurs
+
+
+class CompleteurJoueurs(Completer):
+    """
+    Propose les joueurs correspondant à la saisie en cours, pour `questionary.autocomplete`.
+
+    Chaque frappe interroge les index de `RechercheJoueurs` : seuls les meilleurs résultats sont
+    calculés et affichés, quelle que soit la taille de la base des joueurs.
+    """
+
+    def __init__(self, p_recherche: RechercheJoueurs) -> None:
+        """
+        Initialise le compléteur.
+
+        Args:
+            p_recherche (RechercheJoueurs): Index de recherche des joueurs.
+        """
+        self.o_recherche = p_recherche
+
+    #
+    def get_completions(self, document, complete_event):
+        """
+        Retourne les propositions pour le texte situé avant le curseur (méthode imposée par prompt_toolkit).
+
+        Args:
+            document (Document): Saisie en cours.
+            complete_event (CompleteEvent): Événement à l'origine de la complétion.
+
+        Returns:
+            Iterator[Completion]: Un libellé par joueur trouvé, qui remplace toute la saisie.
+        """
+
+        s_saisie = document.text_before_cursor
+        for o_joueur in self.o_recherche.rechercher(s_saisie):
+            yield Completion(
+                self.libelle(o_joueur),
+                start_position=-len(s_saisie),
+                display_meta=f"Elo {o_joueur.elo:.0f}",
+            )
+
+    #
+    @staticmethod
+    def libelle(p_joueur: Joueur) -> str:
+        """
+        Retourne le libellé proposé pour un joueur, terminé par son identifiant national entre parenthèses.
+
+        Args:
+            p_joueur (Joueur): Le joueur.
+
+        Returns:
+            str: Le libellé "Nom Prénom (identifiant national)".
+        """
+
+        return f"{p_joueur.nom_famille} {p_joueur.prenom} ({p_joueur.identifiant_national_echec})"
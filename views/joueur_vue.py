@@ -1,8 +1,9 @@
 from rich.table import Table
+from pathlib import Path
 import questionary
-import re
 from views.vue import Vue
 from models.joueur import Joueur
+from models.recherche_joueurs import RechercheJoueurs
 
 
 class JoueurVue(Vue):
@@ -13,10 +14,17 @@ class JoueurVue(Vue):
     Cette classe permet :
     - De valider les données saisies par l'utilisateur (nom, prénom, identifiant d'échecs, date de naissance).
     - D'afficher des messages de confirmation lors de l'ajout d'un joueur.
-    - De présenter la liste des joueurs sous forme de tableau stylisé avec la bibliothèque `Rich`.
+    - De présenter la liste des joueurs page par page, sous forme de tableau stylisé avec la bibliothèque `Rich`.
+    - D'afficher l'historique des parties d'un joueur.
+    - De demander un fichier de joueurs à importer et d'afficher le bilan de l'import.
 
     """
 
+    # Libellé de chaque ordre de tri de la liste des joueurs
+    libelles_tris: dict = {"nom": "nom", "score": "score", "ine": "identifiant national"}
+    # Nombre maximal de lignes rejetées affichées après un import
+    nombre_rejets_affiches: int = 20
+
     #
     def valider_identifiant_echec(self, p_saisie: str) -> bool:
         """
@@ -33,7 +41,7 @@ class JoueurVue(Vue):
         Returns:
             str | bool: Un message d'erreur si invalide, sinon `True` si la saisie est correcte.
         """
-        if not re.match(r"^[A-Za-z]{2}\d{5}$", p_saisie):
+        if not Joueur.regex_identifiant_national.match(p_saisie):
             return "Format invalide, doit contenir 2 lettres au début suivi de 5 chiffres. Exemple valide : AB12345."
         return True
 
@@ -92,23 +100,38 @@ class JoueurVue(Vue):
         )
 
     #
-    def render_lister_joueur(self, p_liste_joueur: list[Joueur]) -> None:
-        """Affiche la liste des joueurs trié par ordre alphabétique sous forme de tableau dans la console.
+    def render_lister_joueur(
+        self,
+        p_liste_joueur: list[Joueur],
+        p_page: int = 0,
+        p_nombre_pages: int = 1,
+        p_nombre_joueurs: int | None = None,
+        p_tri: str = "nom",
+    ) -> None:
+        """Affiche une page de la liste des joueurs sous forme de tableau dans la console.
+
+        Les joueurs sont affichés dans l'ordre où ils sont donnés (ordre de tri de la page).
 
         Args:
-            p_liste_joueur (list[Joueur]): Liste des objets Joueur contenant les informations des joueurs.
+            p_liste_joueur (list[Joueur]): Liste des objets Joueur de la page.
+            p_page (int, optional): Numéro de la page, à partir de 0. Par défaut, 0.
+            p_nombre_pages (int, optional): Nombre total de pages. Par défaut, 1.
+            p_nombre_joueurs (int | None, optional): Nombre total de joueurs. Par défaut, ceux de la page.
+            p_tri (str, optional): Ordre de tri de la liste ("nom", "score" ou "ine"). Par défaut, "nom".
 
         Returns:
             None: Cette méthode affiche uniquement le tableau dans la console.
         """
 
-        # Trie par ordre alphabétique de nom et prénom
-        joueurs_trie_nom_prenom = sorted(
-            p_liste_joueur, key=lambda joueur: (joueur.nom_famille, joueur.prenom)
-        )
+        if p_nombre_joueurs is None:
+            p_nombre_joueurs = len(p_liste_joueur)
 
         # Création de la table
-        table = Table(title="\n 🏅 Liste des joueurs", title_style="bold blue")
+        table = Table(
+            title=f"\n 🏅 Liste des joueurs (page {p_page + 1}/{p_nombre_pages})",
+            title_style="bold blue",
+            caption=f"{p_nombre_joueurs} joueur(s), triés par {self.libelles_tris[p_tri]}",
+        )
 
         # Définir les colonnes
         table.add_column("Id Echec", justify="center")
@@ -116,11 +139,12 @@ class JoueurVue(Vue):
         table.add_column("Prénom", justify="center")
         table.add_column("Date de naissance", justify="center")
         table.add_column("Score", justify="center")
+        table.add_column("Elo", justify="center")
 
         # Couleurs alternées pour chaque ligne
         couleurs_lignes = ["cyan", "magenta"]
 
-        for i, o_joueur in enumerate(joueurs_trie_nom_prenom):
+        for i, o_joueur in enumerate(p_liste_joueur):
             couleur = couleurs_lignes[i % len(couleurs_lignes)]  # Alterner les couleurs
             table.add_row(
                 f"[{couleur}]{o_joueur.identifiant_national_echec}[/{couleur}]",
@@ -128,7 +152,155 @@ class JoueurVue(Vue):
                 f"[{couleur}]{o_joueur.prenom}[/{couleur}]",
                 f"[{couleur}]{o_joueur.date_naissance}[/{couleur}]",
                 f"[{couleur}]{o_joueur.score:.1f}[/{couleur}]",
+                f"[{couleur}]{o_joueur.elo:.0f}[/{couleur}]",
                 # Pour garder un chiffre après la virgule : :.1f
                 # : indique un formatage spécial, .1 pour garder 1 chiffre, f pour float
             )
         self.console.print(table)
+
+    #
+    def render_navigation_joueurs(self, p_page: int, p_nombre_pages: int, p_tri: str) -> str | None:
+        """Propose de changer de page ou d'ordre de tri dans la liste des joueurs.
+
+        Args:
+            p_page (int): Numéro de la page affichée, à partir de 0.
+            p_nombre_pages (int): Nombre total de pages.
+            p_tri (str): Ordre de tri actuel.
+
+        Returns:
+            str | None: "suivante", "precedente", un ordre de tri ("nom", "score", "ine"), "retour",
+                        ou None si l'utilisateur a annulé.
+        """
+
+        l_choix = []
+        if p_page + 1 < p_nombre_pages:
+            l_choix.append(questionary.Choice("Page suivante", "suivante"))
+        if p_page > 0:
+            l_choix.append(questionary.Choice("Page précédente", "precedente"))
+        for s_tri, s_libelle in self.libelles_tris.items():
+            if s_tri != p_tri:
+                l_choix.append(questionary.Choice(f"Trier par {s_libelle}", s_tri))
+        l_choix.append(questionary.Choice("Retour", "retour"))
+
+        return questionary.select("Que souhaitez-vous faire ?", choices=l_choix).ask()
+
+    #
+    def render_choix_joueur(self, p_liste_joueur: list[Joueur]) -> Joueur | None:
+        """Demande un joueur par une recherche au fil de la saisie (nom, prénom ou identifiant national).
+
+        Args:
+            p_liste_joueur (list[Joueur]): Liste des objets Joueur parmi lesquels choisir.
+
+        Returns:
+            Joueur | None: Le joueur choisi, ou None si l'utilisateur a annulé.
+        """
+
+        return self.render_recherche_joueur(
+            RechercheJoueurs(p_liste_joueur), "Rechercher un joueur (nom, prénom ou identifiant national) :"
+        )
+
+    #
+    def render_historique_joueur(
+        self, p_joueur: Joueur, p_parties: list[dict], p_joueurs: dict, p_noms_tournois: dict
+    ) -> None:
+        """Affiche les parties d'un joueur dans tous les tournois, puis son bilan.
+
+        Args:
+            p_joueur (Joueur): Le joueur.
+            p_parties (list[dict]): Ses parties, telles que retournées par `recuperer_historique_joueur`.
+            p_joueurs (dict): Identifiant du joueur (str) -> objet Joueur, pour le nom des adversaires.
+            p_noms_tournois (dict): Identifiant du tournoi (str) -> nom du tournoi.
+
+        Returns:
+            None: Cette méthode affiche uniquement le tableau dans la console.
+        """
+
+        if not p_parties:
+            self.afficher_message(
+                f"{p_joueur.nom_famille} {p_joueur.prenom} n'a encore joué aucune partie.", "info"
+            )
+            return
+
+        i_victoires = sum(1 for d_partie in p_parties if d_partie["resultat"] == 1)
+        i_nulles = sum(1 for d_partie in p_parties if d_partie["resultat"] == 0.5)
+        f_points = sum(d_partie["resultat"] for d_partie in p_parties)
+
+        table = Table(
+            title=f"\n 📜 Historique de {p_joueur.nom_famille} {p_joueur.prenom}",
+            title_style="bold blue",
+            caption=f"{len(p_parties)} partie(s) : {i_victoires} victoire(s), {i_nulles} nulle(s), "
+            f"{len(p_parties) - i_victoires - i_nulles} défaite(s), {f_points:g} point(s)",
+        )
+
+        table.add_column("Tournoi", justify="left")
+        table.add_column("Tour", justify="center")
+        table.add_column("Couleur", justify="center")
+        table.add_column("Adversaire", justify="left")
+        table.add_column("Résultat", justify="center")
+
+        # Couleurs du résultat : victoire, nulle, défaite
+        d_styles_resultats = {1: "green", 0.5: "yellow", 0: "red"}
+
+        for d_partie in p_parties:
+            o_adversaire = p_joueurs.get(d_partie["adversaire"])
+            s_adversaire = (
+                f"{o_adversaire.nom_famille} {o_adversaire.prenom}" if o_adversaire else d_partie["adversaire"]
+            )
+            s_style = d_styles_resultats.get(d_partie["resultat"], "white")
+            table.add_row(
+                p_noms_tournois.get(d_partie["tournoi"], d_partie["tournoi"]),
+                str(d_partie["tour"]),
+                d_partie["couleur"].capitalize(),
+                s_adversaire,
+                f"[{s_style}]{d_partie['resultat']:g}[/{s_style}]",
+            )
+
+        self.console.print(table)
+
+    #
+    def render_saisie_fichier_import(self) -> str | None:
+        """Demande le chemin du fichier de joueurs à importer (CSV ou export de la fédération).
+
+        Returns:
+            str | None: Le chemin du fichier, ou None si l'utilisateur a annulé.
+        """
+
+        return questionary.path(
+            "Chemin du fichier de joueurs à importer (CSV ou export de la fédération) :",
+            validate=lambda s_chemin: Path(s_chemin).is_file() or "Ce fichier n'existe pas.",
+        ).ask()
+
+    #
+    def render_bilan_import(self, p_bilan: dict) -> None:
+        """Affiche le bilan d'un import de joueurs, puis les premières lignes rejetées.
+
+        Args:
+            p_bilan (dict): Bilan retourné par `importer_fichier_joueurs`.
+
+        Returns:
+            None: Cette méthode affiche uniquement le bilan dans la console.
+        """
+
+        self.afficher_message(
+            f"{p_bilan['importes']} joueur(s) importé(s) sur {p_bilan['lignes']} ligne(s) en "
+            f"{p_bilan['duree']:.2f} s ({p_bilan['debit']:.0f} lignes/s, {p_bilan['lots']} écriture(s)) : "
+            f"{len(p_bilan['rejets'])} ligne(s) rejetée(s) dont {p_bilan['doublons']} doublon(s).",
+            "success" if p_bilan["importes"] else "info",
+        )
+
+        if not p_bilan["rejets"]:
+            return
+
+        table = Table(
+            title="\n ⚠️ Lignes rejetées",
+            title_style="bold red",
+            caption=f"{min(len(p_bilan['rejets']), self.nombre_rejets_affiches)} ligne(s) affichée(s) "
+            f"sur {len(p_bilan['rejets'])}",
+        )
+        table.add_column("Ligne", justify="right")
+        table.add_column("Motif", justify="left")
+
+        for i_numero, s_motif in p_bilan["rejets"][:self.nombre_rejets_affiches]:
+            table.add_row(str(i_numero), s_motif)
+
+        self.console.print(table)
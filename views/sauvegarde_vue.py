@@ -32,6 +32,23 @@ class SauvegardeVue(Vue):
             "Choisissez une sauvegarde à restaurer :", choices=p_sauvegardes
         ).ask()
 
+    #
+    def demander_element_a_restaurer(self, p_elements: list[str]) -> str | None:
+        """
+        Demande à l'utilisateur s'il veut restaurer toute la sauvegarde ou un seul élément.
+
+        Args:
+            p_elements (list[str]): Éléments de la sauvegarde restaurables seuls
+                                    (base des joueurs, fichiers des tournois...).
+
+        Returns:
+            str | None: "Toute la sauvegarde", l'élément choisi, ou `None` si l'utilisateur annule.
+        """
+
+        return questionary.select(
+            "Que voulez-vous restaurer ?", choices=["Toute la sauvegarde", *p_elements]
+        ).ask()
+
     #
     def confirmer_restaurer_sauvegarde(self) -> bool:
         """
@@ -47,7 +64,9 @@ class SauvegardeVue(Vue):
             "remplacera les données actuelles ![/bold orange3]"
         )
         self.console.print(
-            "[bold orange3]Cette action est **IRRÉVERSIBLE**. Voulez-vous continuer ?[/bold orange3]\n"
+            "[bold orange3]Pour une restauration complète, les données remplacées sont conservées "
+            "dans `data_avant_restauration/` jusqu'à la restauration suivante. "
+            "Voulez-vous continuer ?[/bold orange3]\n"
         )
 
         # Demande de confirmation avec questionary
@@ -1,5 +1,6 @@
 from rich.table import Table
 from rich.panel import Panel
+from pathlib import Path
 import questionary
 from models.tournoi import Tournoi
 from views.vue import Vue
@@ -14,9 +15,18 @@ class TourVue(Vue):
     Cette classe hérite de `Vue` et utilise la bibliothèque `rich` pour afficher
     des messages formatés dans la console. Elle permet d'afficher les différentes
     étapes du tournoi, comme la création des tours, l'affichage des matchs et
-    la saisie des résultats.
+    la saisie des résultats (match par match, en grille ou par fichier).
     """
 
+    # Modes de saisie des résultats d'un tour : valeur -> libellé
+    modes_saisie: dict = {
+        "match": "Match par match",
+        "grille": "Grille : tous les résultats sur une ligne",
+        "fichier": "Fichier de résultats (CSV ou TSV)",
+    }
+    # Nombre maximal d'erreurs affichées pour une feuille de résultats refusée
+    nombre_erreurs_affichees: int = 30
+
     #
     def render_confirmation_ajout_tour(
         self,
@@ -67,6 +77,29 @@ class TourVue(Vue):
             f"Veuillez d'abord saisir les résultats des matchs avant de continuer.\n"
         )
 
+    #
+    def render_bilan_ecriture(self, p_nom_tour: str, p_bilan_ecriture: dict) -> None:
+        """Affiche le volume de données écrit lors de la clôture d'un tour.
+
+        Args:
+            p_nom_tour (str): Nom du tour clôturé.
+            p_bilan_ecriture (dict): Bilan retourné par `enregistrer_resultat_match` : en octets pour le stockage
+                                     JSON (`octets_joueurs`, `octets_tournoi`, `octets_total`), en lignes
+                                     modifiées pour SQLite (`lignes_joueurs`, `lignes_tournoi`, `lignes_total`).
+
+        Returns:
+            None: Affiche un message informatif dans la console.
+        """
+        s_unite, s_libelle = ("octets", "octets écrits") if "octets_total" in p_bilan_ecriture else (
+            "lignes", "lignes modifiées"
+        )
+        self.console.print(
+            f"\n[bold green] Résultats du {p_nom_tour} enregistrés.[/bold green] "
+            f"[cyan]{p_bilan_ecriture[f'{s_unite}_total']} {s_libelle} "
+            f"(joueurs : {p_bilan_ecriture[f'{s_unite}_joueurs']}, "
+            f"tournoi : {p_bilan_ecriture[f'{s_unite}_tournoi']})[/cyan]\n"
+        )
+
     #
     def render_visualiser_matchs(
         self,
@@ -180,3 +213,104 @@ class TourVue(Vue):
             l_resultats.append(resultat_score)
 
         return l_resultats
+
+    #
+    def render_choix_mode_saisie(self) -> str | None:
+        """Demande comment saisir les résultats du tour.
+
+        Returns:
+            str | None: "match", "grille" ou "fichier", ou None si l'utilisateur a annulé.
+        """
+
+        return questionary.select(
+            "Comment voulez-vous saisir les résultats ?",
+            choices=[questionary.Choice(s_libelle, s_mode) for s_mode, s_libelle in self.modes_saisie.items()],
+        ).ask()
+
+    #
+    def render_grille_resultats(
+        self, p_objet_tournoi: Tournoi, p_dernier_tour: dict, p_objets_matchs: list[Match], p_valider
+    ) -> str | None:
+        """
+        Affiche tous les matchs du tour dans une grille compacte et demande tous les résultats en une saisie.
+
+        Pensé pour une saisie au clavier seul : une ligne par échiquier, puis une seule invite où les
+        résultats se tapent à la suite ("1-0 = 0-1 ..." ou "1 0 2 ...", ou "1021..." avec un code par
+        échiquier), "N=résultat" visant l'échiquier N.
+
+        Args:
+            p_objet_tournoi (Tournoi): Le tournoi.
+            p_dernier_tour (dict): Le tour en cours.
+            p_objets_matchs (list[Match]): Les matchs du tour.
+            p_valider (Callable[[str], bool | str]): Validation de la saisie : True, ou le message d'erreur.
+
+        Returns:
+            str | None: Les résultats saisis, ou None si l'utilisateur a annulé.
+        """
+
+        table = Table(
+            title=f"\n {p_dernier_tour['nom']} du tournoi {p_objet_tournoi.nom_tournoi}",
+            title_style="bold blue",
+            caption="1 ou 1-0 : victoire des blancs   2 ou 0-1 : victoire des noirs   0, = ou 1/2-1/2 : nulle",
+        )
+        table.add_column("Éch.", justify="right", style="bold yellow")
+        table.add_column("⚪ Blancs", justify="left")
+        table.add_column("Elo", justify="right")
+        table.add_column("⚫ Noirs", justify="left")
+        table.add_column("Elo", justify="right")
+
+        for o_match in p_objets_matchs:
+            table.add_row(
+                str(o_match.identifiant),
+                f"{o_match.joueur_blanc.nom_famille} {o_match.joueur_blanc.prenom}",
+                f"{o_match.joueur_blanc.elo:.0f}",
+                f"{o_match.joueur_noir.nom_famille} {o_match.joueur_noir.prenom}",
+                f"{o_match.joueur_noir.elo:.0f}",
+            )
+
+        self.console.print(table)
+
+        return questionary.text(
+            f"Résultats des {len(p_objets_matchs)} échiquiers, dans l'ordre (N=résultat pour un échiquier précis) :",
+            validate=p_valider,
+        ).ask()
+
+    #
+    def render_saisie_fichier_resultats(self) -> str | None:
+        """Demande le chemin de la feuille de résultats du tour.
+
+        Returns:
+            str | None: Le chemin du fichier, ou None si l'utilisateur a annulé.
+        """
+
+        return questionary.path(
+            "Chemin de la feuille de résultats (colonnes Échiquier ou Blanc/Noir/INE, et Résultat) :",
+            validate=lambda s_chemin: Path(s_chemin).is_file() or "Ce fichier n'existe pas.",
+        ).ask()
+
+    #
+    def render_erreurs_feuille(self, p_erreurs: list[tuple]) -> None:
+        """Affiche les erreurs d'une feuille de résultats refusée.
+
+        Args:
+            p_erreurs (list[tuple]): (ligne, message) de chaque erreur ; la ligne vaut None pour un match
+                                     sans résultat.
+
+        Returns:
+            None: Affiche les erreurs dans la console.
+        """
+
+        self.afficher_message(
+            f"Feuille de résultats refusée ({len(p_erreurs)} erreur(s)) : aucun résultat n'a été enregistré.", "error"
+        )
+
+        table = Table(
+            caption=f"{min(len(p_erreurs), self.nombre_erreurs_affichees)} erreur(s) affichée(s) sur {len(p_erreurs)}"
+        )
+        table.add_column("Ligne", justify="right")
+        table.add_column("Erreur", justify="left")
+
+        for i_ligne, s_message in p_erreurs[:self.nombre_erreurs_affichees]:
+            table.add_row("" if i_ligne is None else str(i_ligne), s_message)
+
+        self.console.print(table)
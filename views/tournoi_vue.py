@@ -3,8 +3,8 @@ import questionary
 from typing import List
 from models.tournoi import Tournoi
 from models.joueur import Joueur
+from models.recherche_joueurs import RechercheJoueurs
 from views.vue import Vue
-import re
 from datetime import datetime
 
 
@@ -37,7 +37,7 @@ class TournoiVue(Vue):
 
         if not p_saisie.strip():
             return "Le champ ne peut pas être vide."
-        if not re.match(r"^[A-Za-zÀ-ÖØ-öø-ÿ0-9\s-]+$", p_saisie):
+        if not Tournoi.regex_nom.match(p_saisie):
             return (
                 "La saisie ne doit contenir que des lettres, des tirets et des espaces."
             )
@@ -88,22 +88,23 @@ class TournoiVue(Vue):
         self.console.print(table)
 
     #
-    def render_lister_tournois(self, p_liste_objets_tournois: list[Tournoi]) -> None:
+    def render_lister_tournois(self, p_catalogue_tournois: list[dict]) -> None:
         """Affiche la liste des tournois enregistrés dans la base de données.
 
         Les tournois sont triés par date de début avant affichage.
 
         Args:
-            p_liste_objets_tournois (list[Tournoi]): Liste d'objets tournoi
+            p_catalogue_tournois (list[dict]): En-têtes des tournois issus du catalogue
+                                               (voir `GestionnairePersistance.recuperer_catalogue_tournois`).
 
         Returns:
             None
         """
         # Range les tournois par ordre croissant de date
-        p_liste_objets_tournois = sorted(
-            p_liste_objets_tournois,
+        p_catalogue_tournois = sorted(
+            p_catalogue_tournois,
             key=lambda tournoi: datetime.strptime(
-                tournoi.date_debut_tournoi, "%d-%m-%Y"
+                tournoi["date_debut_tournoi"], "%d-%m-%Y"
             ),
         )
 
@@ -111,28 +112,38 @@ class TournoiVue(Vue):
 
         table.add_column("ID", style="bold cyan", justify="center")
         table.add_column("Nom du tournoi", style="bold white", justify="left")
+        table.add_column("Lieu", style="bold white", justify="left")
         table.add_column("Date de début", style="bold magenta", justify="center")
         table.add_column("Date de fin", style="bold magenta", justify="center")
+        table.add_column("Joueurs", justify="center")
+        table.add_column("Tours", justify="center")
+        table.add_column("Tour courant", justify="center")
+        table.add_column("Statut", justify="center")
 
         # Couleurs alternées pour chaque ligne
         couleurs_lignes = ["cyan", "magenta"]
 
-        for i, o_tournoi in enumerate(p_liste_objets_tournois):
+        for i, d_tournoi in enumerate(p_catalogue_tournois):
             couleur = couleurs_lignes[i % len(couleurs_lignes)]
 
             # Reformater les dates pour forcer les 0 initiaux
             date_debut = datetime.strptime(
-                o_tournoi.date_debut_tournoi, "%d-%m-%Y"
+                d_tournoi["date_debut_tournoi"], "%d-%m-%Y"
             ).strftime("%d-%m-%Y")
             date_fin = datetime.strptime(
-                o_tournoi.date_fin_tournoi, "%d-%m-%Y"
+                d_tournoi["date_fin_tournoi"], "%d-%m-%Y"
             ).strftime("%d-%m-%Y")
 
             table.add_row(
-                f"[{couleur}]{o_tournoi.identifiant}[/{couleur}]",
-                f"[{couleur}]{o_tournoi.nom_tournoi}[/{couleur}]",
+                f"[{couleur}]{d_tournoi['identifiant']}[/{couleur}]",
+                f"[{couleur}]{d_tournoi['nom_tournoi']}[/{couleur}]",
+                f"[{couleur}]{d_tournoi['lieu_tournoi']}[/{couleur}]",
                 f"[{couleur}]{date_debut}[/{couleur}]",
                 f"[{couleur}]{date_fin}[/{couleur}]",
+                f"[{couleur}]{d_tournoi['nombre_joueurs']}[/{couleur}]",
+                f"[{couleur}]{d_tournoi['nombre_tours']}[/{couleur}]",
+                f"[{couleur}]{d_tournoi['tour_courant'] or '-'}[/{couleur}]",
+                f"[{couleur}]{d_tournoi['statut']}[/{couleur}]",
             )
 
         self.console.print(table)
@@ -159,32 +170,20 @@ class TournoiVue(Vue):
         self, p_objet_joueurs: List[Joueur], p_objet_tournoi: Tournoi
     ) -> List[str]:
         """
-        Affiche la liste des joueurs disponibles et permet à l'utilisateur d'en choisir plusieurs.
+        Demande les joueurs à inscrire au tournoi, chacun par une recherche au fil de la saisie.
+
+        Les index de recherche (nom, prénom, identifiant national) sont construits une seule fois pour
+        toutes les inscriptions ; chaque joueur choisi est aussitôt exclu des propositions suivantes.
 
         Args:
-            p_liste_joueurs (list[dict]): Liste des joueurs disponibles sous forme de dictionnaires
+            p_objet_joueurs (list[Joueur]): Liste des joueurs disponibles.
             p_objet_tournoi (Tournoi): L'objet tournoi auquel les joueurs seront inscrits.
 
         Returns:
             list[str]: Liste des identifiants des joueurs sélectionnés par l'utilisateur.
         """
-        # Trie par ordre alphabétique de nom et prénom
-        joueurs_trie_nom_prenom = sorted(
-            p_objet_joueurs,
-            key=lambda joueur: (joueur.nom_famille, joueur.prenom),
-        )
-
-        liste_choix = []
-        for joueur in joueurs_trie_nom_prenom:
 
-            identifiant_joueur = joueur.identifiant_tinydb
-            nom_joueur = joueur.nom_famille
-            prenom_joueur = joueur.prenom
-            identifiant_echec = joueur.identifiant_national_echec
-
-            liste_choix.append(
-                f"{identifiant_joueur} - {nom_joueur} {prenom_joueur} {identifiant_echec}"
-            )
+        o_recherche = RechercheJoueurs(p_objet_joueurs)
 
         l_choix_joueur = []
 
@@ -193,23 +192,21 @@ class TournoiVue(Vue):
             validate=self._valider_nombre_joueurs,
         ).ask()
 
-        for _ in range(int(nombre_joueurs)):
-            joueur = questionary.select(
-                "Veuillez choisir un joueur parmi la liste :", choices=liste_choix
-            ).ask()
-            joueur_sans_numero = joueur.split(" - ", 1)[1]
+        for i_numero in range(int(nombre_joueurs)):
+            o_joueur = self.render_recherche_joueur(
+                o_recherche,
+                f"Joueur {i_numero + 1}/{nombre_joueurs} (nom, prénom ou identifiant national) :",
+            )
 
             self.console.print(
-                f"\n [bold green] {joueur_sans_numero} ajouté au tournoi {p_objet_tournoi.nom_tournoi}!\n[/bold green]"
+                f"\n [bold green] {o_joueur.nom_famille} {o_joueur.prenom} {o_joueur.identifiant_national_echec} "
+                f"ajouté au tournoi {p_objet_tournoi.nom_tournoi}!\n[/bold green]"
             )
 
-            identifiant_choisi = joueur.split(" - ")[0]
-            print(identifiant_choisi)
+            l_choix_joueur.append(str(o_joueur.identifiant_tinydb))
 
-            l_choix_joueur.append(identifiant_choisi)
-
-            # Enleve le joueur qui vient d'être choisi pour éviter qu'il ne soit choisi à nouveau
-            liste_choix.remove(joueur)
+            # Exclut le joueur qui vient d'être choisi pour éviter qu'il ne soit choisi à nouveau
+            o_recherche.exclure(o_joueur.identifiant_tinydb)
 
         return l_choix_joueur
 
@@ -287,6 +284,50 @@ class TournoiVue(Vue):
 
         self.console.print(table_tournoi)
 
+    #
+    def render_classement_tournoi(self, p_objet_tournoi: Tournoi, p_classement: list[dict]) -> None:
+        """
+        Affiche le classement du tournoi avec ses départages.
+
+        Args:
+            p_objet_tournoi (Tournoi): L'objet tournoi, dont les joueurs donnent les noms.
+            p_classement (list[dict]): Classement retourné par `ClassementTournoi.classer`.
+
+        Returns:
+            None
+        """
+
+        d_joueurs = {str(o_joueur.identifiant_tinydb): o_joueur for o_joueur in p_objet_tournoi.liste_joueurs}
+
+        table_classement = Table(
+            title=f"🏅 Classement - {p_objet_tournoi.nom_tournoi}",
+            title_style="bold blue",
+            caption="CD : confrontation directe, Bu-1 : Buchholz tronqué, Bu : Buchholz, "
+            "SB : Sonneborn-Berger, Prog : progressif",
+        )
+
+        table_classement.add_column("Rang", style="bold white", justify="right")
+        table_classement.add_column("Joueur", style="bold cyan", justify="left")
+        table_classement.add_column("Points", style="bold green", justify="right")
+        for s_colonne in ("CD", "Bu-1", "Bu", "SB", "Prog"):
+            table_classement.add_column(s_colonne, justify="right")
+
+        for d_ligne in p_classement:
+            o_joueur = d_joueurs.get(d_ligne["identifiant"])
+            s_joueur = f"{o_joueur.nom_famille} {o_joueur.prenom}" if o_joueur else d_ligne["identifiant"]
+            table_classement.add_row(
+                str(d_ligne["rang"]),
+                s_joueur,
+                f"{d_ligne['score']:g}",
+                f"{d_ligne['confrontation_directe']:g}",
+                f"{d_ligne['buchholz_tronque']:g}",
+                f"{d_ligne['buchholz']:g}",
+                f"{d_ligne['sonneborn_berger']:g}",
+                f"{d_ligne['progressif']:g}",
+            )
+
+        self.console.print(table_classement)
+
     #
     def render_visualiser_tour_match_tournoi(self, p_objet_tournoi: Tournoi) -> None:
         """
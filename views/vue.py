@@ -2,6 +2,9 @@ from rich.console import Console
 import re
 from datetime import datetime
 import questionary
+from models.joueur import Joueur
+from models.recherche_joueurs import RechercheJoueurs
+from views.completeur_joueurs import CompleteurJoueurs
 
 
 class Vue:
@@ -9,7 +12,7 @@ class Vue:
     Classe parente pour les vues, utilisée pour gérer l'affichage et la validation des saisies utilisateur.
 
     Cette classe fournit des méthodes pour afficher les interfaces interactives et valider
-    les entrées utilisateur, notamment les noms, les dates et la sélection de tournois.
+    les entrées utilisateur, notamment les noms, les dates, la sélection de tournois et la recherche de joueurs.
     """
 
     def __init__(self):
@@ -39,7 +42,7 @@ class Vue:
     """
         if not p_saisie.strip():
             return "Le champ ne peut pas être vide."
-        if not re.match(r"^[A-Za-zÀ-ÖØ-öø-ÿ\s-]+$", p_saisie):
+        if not Joueur.regex_nom.match(p_saisie):
             return "La saisie ne doit contenir que des lettres, des tirets et des espaces."
         return True
 
@@ -131,6 +134,34 @@ class Vue:
         # Retourner uniquement l'ID du tournoi selectionné
         return liste_tournoi_identifiant[choix_utilisateur]
 
+    #
+    def render_recherche_joueur(self, p_recherche: RechercheJoueurs, p_message: str) -> Joueur | None:
+        """Demande un joueur par une recherche au fil de la saisie (nom, prénom ou identifiant national).
+
+        Les meilleurs joueurs correspondant à la saisie sont proposés à chaque frappe ; la saisie n'est
+        acceptée que si elle désigne un seul joueur non exclu.
+
+        Args:
+            p_recherche (RechercheJoueurs): Index de recherche des joueurs proposés.
+            p_message (str): Question affichée.
+
+        Returns:
+            Joueur | None: Le joueur choisi, ou None si l'utilisateur a annulé.
+        """
+
+        s_saisie = questionary.autocomplete(
+            p_message,
+            choices=[],
+            completer=CompleteurJoueurs(p_recherche),
+            validate=lambda s_texte: p_recherche.resoudre(s_texte) is not None
+            or "Aucun joueur disponible ne correspond à cette saisie, choisissez-en un dans la liste.",
+        ).ask()
+
+        if s_saisie is None:
+            return None
+
+        return p_recherche.resoudre(s_saisie)
+
     #
     def afficher_message(self, p_message: str, p_message_type: str) -> None:
         """